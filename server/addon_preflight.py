@@ -0,0 +1,272 @@
+"""Out-of-Blender preflight for generated addons.
+
+Byte-compiles every module of an addon (in a process pool when there is enough work) and
+statically checks the entry module for `bl_info`, `register` and `unregister`, so broken
+addons fail without a Blender launch. Verdicts are cached by file content hash. With
+--write-pycs the compile writes checked-hash `__pycache__` entries, so a Blender with the same
+interpreter tag imports warm bytecode:
+
+    python server/addon_preflight.py generated_addons/runs/<run>/addon --cache data/addon_preflight_cache.json --write-pycs
+
+Prints one JSON report and exits 1 when the addon fails preflight.
+"""
+import argparse
+import ast
+import functools
+import hashlib
+import json
+import os
+import sys
+import time
+
+from aether_bridge import bytecode
+
+CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 20000
+PARALLEL_MIN_FILES = 8
+SKIP_DIRS = {'__pycache__', '.git', '.venv', 'venv'}
+REQUIRED_FUNCTIONS = ('register', 'unregister')
+
+
+def _interpreter_tag():
+    return sys.implementation.cache_tag or sys.implementation.name
+
+
+def file_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def discover_modules(addon_path):
+    """(entry module, [python files]) for a package directory or a single-file addon."""
+    addon_path = os.path.abspath(addon_path)
+    if os.path.isfile(addon_path):
+        return addon_path, [addon_path]
+    entry = os.path.join(addon_path, '__init__.py')
+    files = []
+    for root, dirs, names in os.walk(addon_path):
+        dirs[:] = sorted(name for name in dirs if name not in SKIP_DIRS)
+        files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith('.py'))
+    return entry, files
+
+
+def compile_file(path, write_pyc=False):
+    """Compile verdict for one file; runs in pool workers, so it only takes and returns plain data."""
+    started = time.perf_counter()
+    verdict = {'path': path, 'ok': True}
+    try:
+        with open(path, 'rb') as handle:
+            source = handle.read()
+        verdict['hash'] = file_hash(source)
+        if write_pyc:
+            bytecode.compile_pyc(path)
+            verdict['pyc'] = True
+        else:
+            compile(source, path, 'exec', dont_inherit=True)
+    except SyntaxError as exc:
+        verdict.update(ok=False, code='ADDON_SYNTAX_ERROR', message=str(exc.msg or exc), line=exc.lineno, col=exc.offset)
+    except (OSError, ValueError) as exc:
+        verdict.update(ok=False, code='ADDON_COMPILE_ERROR', message=str(exc))
+    verdict['ms'] = round((time.perf_counter() - started) * 1000.0, 3)
+    return verdict
+
+
+def _is_dict_literal(node):
+    return isinstance(node, ast.Dict) or (
+        isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'dict'
+    )
+
+
+def _assigned_names(target):
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, (ast.Tuple, ast.List)):
+        names = []
+        for element in target.elts:
+            names.extend(_assigned_names(element))
+        return names
+    return []
+
+
+def check_entry_module(source, path):
+    """Static bl_info/register/unregister checks on the addon's entry module."""
+    problems = []
+    tree = ast.parse(source, path, mode='exec')
+    defined = set()
+    bl_info = None
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            defined.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                names = _assigned_names(target)
+                defined.update(names)
+                if 'bl_info' in names and node.value is not None:
+                    bl_info = node.value
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            defined.update((alias.asname or alias.name).split('.')[0] for alias in node.names)
+
+    if bl_info is None:
+        problems.append({'code': 'ADDON_BL_INFO_MISSING', 'message': 'bl_info is not assigned at module level'})
+    elif not _is_dict_literal(bl_info):
+        problems.append({'code': 'ADDON_BL_INFO_INVALID', 'message': 'bl_info must be a dict literal'})
+    elif isinstance(bl_info, ast.Dict):
+        keys = {key.value for key in bl_info.keys if isinstance(key, ast.Constant)}
+        if 'name' not in keys:
+            problems.append({'code': 'ADDON_BL_INFO_INVALID', 'message': 'bl_info is missing "name"'})
+    for name in REQUIRED_FUNCTIONS:
+        if name not in defined:
+            problems.append({'code': 'ADDON_REGISTER_MISSING', 'message': f'{name}() is not defined at module level'})
+    return problems
+
+
+class PreflightCache:
+    """JSON file of verdicts keyed by content hash, scoped to the interpreter's bytecode tag."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        if path and os.path.isfile(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as handle:
+                    stored = json.load(handle)
+                if stored.get('version') == CACHE_VERSION and stored.get('interpreter') == _interpreter_tag():
+                    self.entries = stored.get('entries') or {}
+            except (OSError, ValueError, AttributeError):
+                self.entries = {}
+
+    def get(self, kind, digest):
+        return self.entries.get(f'{kind}:{digest}')
+
+    def put(self, kind, digest, verdict):
+        self.entries[f'{kind}:{digest}'] = verdict
+        self.dirty = True
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Entries are insertion ordered; keep the most recent ones.
+        if len(self.entries) > MAX_CACHE_ENTRIES:
+            self.entries = dict(list(self.entries.items())[-MAX_CACHE_ENTRIES:])
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            json.dump({'version': CACHE_VERSION, 'interpreter': _interpreter_tag(), 'entries': self.entries}, handle)
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+
+def _compile_all(paths, workers, write_pycs=False):
+    task = functools.partial(compile_file, write_pyc=write_pycs)
+    if len(paths) < PARALLEL_MIN_FILES or workers <= 1:
+        return [task(path) for path in paths]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(task, paths, chunksize=max(1, len(paths) // (workers * 4))))
+
+
+def preflight(addon_path, cache=None, workers=None, write_pycs=False):
+    started = time.perf_counter()
+    cache = cache or PreflightCache()
+    workers = workers or os.cpu_count() or 1
+    addon_path = os.path.abspath(addon_path)
+    report = {'addonPath': addon_path, 'ok': True, 'files': [], 'problems': [], 'cacheHits': 0, 'compiled': 0}
+
+    if not os.path.exists(addon_path):
+        report['ok'] = False
+        report['problems'].append({'code': 'ADDON_NOT_FOUND', 'message': f'Addon path not found: {addon_path}'})
+        report['ms'] = round((time.perf_counter() - started) * 1000.0, 3)
+        return report
+
+    entry, paths = discover_modules(addon_path)
+    verdicts = {}
+    uncached = []
+    hashes = {}
+    for path in paths:
+        try:
+            with open(path, 'rb') as handle:
+                digest = file_hash(handle.read())
+        except OSError:
+            uncached.append(path)
+            continue
+        hashes[path] = digest
+        cached = cache.get('compile', digest)
+        if cached is not None:
+            verdicts[path] = dict(cached, path=path, hash=digest, cached=True)
+            report['cacheHits'] += 1
+        else:
+            uncached.append(path)
+
+    compile_started = time.perf_counter()
+    for verdict in _compile_all(uncached, workers, write_pycs):
+        verdict['cached'] = False
+        verdicts[verdict['path']] = verdict
+        if verdict.get('hash'):
+            cache.put('compile', verdict['hash'], {
+                key: value for key, value in verdict.items() if key not in ('path', 'hash', 'cached', 'ms', 'pyc')
+            })
+    report['compiled'] = len(uncached)
+
+    if write_pycs:
+        # A cached verdict says the source compiles, but its pyc may be missing from this folder.
+        for path, verdict in verdicts.items():
+            if verdict.get('cached') and verdict['ok'] and not bytecode.pyc_is_current(path):
+                try:
+                    bytecode.compile_pyc(path)
+                    verdict['pyc'] = True
+                except (OSError, SyntaxError, ValueError):
+                    pass
+        report['pycs'] = {
+            'cacheTag': bytecode.cache_tag(),
+            'written': sum(1 for verdict in verdicts.values() if verdict.get('pyc')),
+        }
+    report['compileMs'] = round((time.perf_counter() - compile_started) * 1000.0, 3)
+
+    for path in paths:
+        verdict = verdicts[path]
+        report['files'].append(verdict)
+        if not verdict['ok']:
+            report['problems'].append({
+                key: verdict.get(key) for key in ('code', 'message', 'path', 'line', 'col') if verdict.get(key) is not None
+            })
+
+    if not os.path.isfile(entry):
+        report['problems'].append({'code': 'ADDON_ENTRY_MISSING', 'message': f'Addon entry module not found: {entry}'})
+    elif verdicts.get(entry, {}).get('ok'):
+        digest = hashes.get(entry)
+        entry_problems = cache.get('entry', digest) if digest else None
+        if entry_problems is None:
+            with open(entry, 'rb') as handle:
+                entry_problems = check_entry_module(handle.read(), entry)
+            if digest:
+                cache.put('entry', digest, entry_problems)
+        report['problems'].extend(dict(problem, path=entry) for problem in entry_problems)
+
+    report['ok'] = not report['problems']
+    report['ms'] = round((time.perf_counter() - started) * 1000.0, 3)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Preflight a Blender addon without launching Blender.')
+    parser.add_argument('addon_path')
+    parser.add_argument('--cache', default='', help='JSON verdict cache keyed by file hash.')
+    parser.add_argument('--workers', type=int, default=0, help='Compile worker processes (default: CPU count).')
+    parser.add_argument('--write-pycs', action='store_true', help='Write checked-hash __pycache__ bytecode.')
+    args = parser.parse_args(argv)
+
+    cache = PreflightCache(args.cache or None)
+    report = preflight(args.addon_path, cache=cache, workers=args.workers or None, write_pycs=args.write_pycs)
+    try:
+        cache.save()
+    except OSError:
+        pass
+    print(json.dumps(report))
+    return 0 if report['ok'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Helpers resident in the Blender RPC bridge process."""
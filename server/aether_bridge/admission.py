@@ -0,0 +1,178 @@
+import json
+import os
+import queue
+import threading
+import time
+from http.server import HTTPServer
+
+OVERLOADED_CODE = 'RPC_OVERLOADED'
+DEFAULT_RETRY_AFTER_MS = 250
+SHED_QUEUE_SIZE = 256
+SHED_SOCKET_TIMEOUT_S = 2.0
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+INVALID_LENGTH_CODE = 'RPC_INVALID_LENGTH'
+
+
+def content_length(value):
+    """Parse a Content-Length header (missing means 0); None when it is not a non-negative integer."""
+    text = str(value if value is not None else '').strip() or '0'
+    if not (text.isascii() and text.isdigit()):
+        return None
+    return int(text)
+
+
+def invalid_length_response(value):
+    return {'ok': False, 'error': f'Invalid Content-Length header: {value!r}', 'code': INVALID_LENGTH_CODE}
+
+
+def overloaded_response(retry_after_ms=DEFAULT_RETRY_AFTER_MS):
+    """Body for a request that was refused before it ran; it is always safe to retry."""
+    return {
+        'ok': False,
+        'error': 'Bridge is at capacity; retry later',
+        'code': OVERLOADED_CODE,
+        'retryAfterMs': int(retry_after_ms),
+    }
+
+
+def write_overloaded(handler, retry_after_ms=DEFAULT_RETRY_AFTER_MS):
+    body = json.dumps(overloaded_response(retry_after_ms)).encode('utf-8')
+    handler.send_response(503)
+    handler.send_header('Content-Type', 'application/json; charset=utf-8')
+    handler.send_header('Content-Length', str(len(body)))
+    handler.send_header('Retry-After', str(max(1, -(-int(retry_after_ms) // 1000))))
+    handler.send_header('Connection', 'close')
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+class BoundedHTTPServer(HTTPServer):
+    """HTTP server with a fixed worker pool behind a bounded accept queue.
+
+    Accepted connections wait in the queue for a worker. When the queue is full the
+    connection goes to `overload_handler_class` on a single shedding thread, which answers
+    without touching Blender; if even that backlog is full the connection is dropped.
+    Admitted sockets get `idle_timeout` seconds per read or write, so an idle or trickling
+    client releases its worker instead of holding it indefinitely.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, server_address, handler_class, overload_handler_class, workers=4, queue_size=64, idle_timeout=10.0,
+    ):
+        self.workers = max(1, int(workers))
+        self.queue_size = max(1, int(queue_size))
+        self.idle_timeout = float(idle_timeout) if idle_timeout and float(idle_timeout) > 0 else None
+        # Keep the kernel backlog at least as deep as ours so bursts are not lost to SYN retries.
+        self.request_queue_size = max(self.queue_size, 128)
+        self.overload_handler_class = overload_handler_class
+        self.pending = queue.Queue(maxsize=self.queue_size)
+        self.shedding = queue.Queue(maxsize=SHED_QUEUE_SIZE)
+        self.stats_lock = threading.Lock()
+        self.accepted = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.busy = 0
+        self.peak_queued = 0
+        self.max_queue_wait_ms = 0.0
+        # Per worker thread: when the connection being handled was queued and picked up.
+        self.admitted = threading.local()
+        HTTPServer.__init__(self, server_address, handler_class)
+        self.threads = [
+            threading.Thread(target=self._work, name=f'aether-rpc-worker-{index}', daemon=True)
+            for index in range(self.workers)
+        ]
+        self.threads.append(threading.Thread(target=self._shed, name='aether-rpc-shed', daemon=True))
+        for thread in self.threads:
+            thread.start()
+
+    @classmethod
+    def from_env(cls, server_address, handler_class, overload_handler_class):
+        return cls(
+            server_address,
+            handler_class,
+            overload_handler_class,
+            workers=_env_int('AETHER_RPC_WORKERS', 4),
+            queue_size=_env_int('AETHER_RPC_QUEUE_SIZE', 64),
+            idle_timeout=_env_float('AETHER_RPC_IDLE_TIMEOUT', 10.0),
+        )
+
+    def process_request(self, request, client_address):
+        try:
+            self.pending.put_nowait((request, client_address, time.perf_counter()))
+        except queue.Full:
+            with self.stats_lock:
+                self.rejected += 1
+            try:
+                self.shedding.put_nowait((request, client_address))
+            except queue.Full:
+                with self.stats_lock:
+                    self.dropped += 1
+                self.shutdown_request(request)
+            return
+        with self.stats_lock:
+            self.accepted += 1
+            self.peak_queued = max(self.peak_queued, self.pending.qsize())
+
+    def _work(self):
+        while True:
+            request, client_address, enqueued_at = self.pending.get()
+            dequeued_at = time.perf_counter()
+            self.admitted.enqueued_at, self.admitted.dequeued_at = enqueued_at, dequeued_at
+            with self.stats_lock:
+                self.busy += 1
+                self.max_queue_wait_ms = max(self.max_queue_wait_ms, (dequeued_at - enqueued_at) * 1000.0)
+            try:
+                request.settimeout(self.idle_timeout)
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                with self.stats_lock:
+                    self.busy -= 1
+
+    def admission_times(self):
+        """(enqueued_at, dequeued_at) perf_counter stamps for the calling worker's connection."""
+        return getattr(self.admitted, 'enqueued_at', None), getattr(self.admitted, 'dequeued_at', None)
+
+    def _shed(self):
+        while True:
+            request, client_address = self.shedding.get()
+            try:
+                request.settimeout(SHED_SOCKET_TIMEOUT_S)
+                self.overload_handler_class(request, client_address, self)
+            except Exception:
+                pass
+            finally:
+                self.shutdown_request(request)
+
+    def stats(self):
+        with self.stats_lock:
+            return {
+                'workers': self.workers,
+                'busy': self.busy,
+                'queueSize': self.queue_size,
+                'queued': self.pending.qsize(),
+                'peakQueued': self.peak_queued,
+                'maxQueueWaitMs': round(self.max_queue_wait_ms, 3),
+                'accepted': self.accepted,
+                'rejected': self.rejected,
+                'dropped': self.dropped,
+            }
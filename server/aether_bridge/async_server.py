@@ -0,0 +1,265 @@
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http import HTTPStatus
+from urllib.parse import urlparse
+
+from . import admission, tracing
+
+MAX_HEADER_BYTES = 64 * 1024
+SERVER_HEADER = 'AetherBlenderRPC/1.0 asyncio'
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+class MainThreadExecutor:
+    """Runs submitted callables on whichever thread calls `run_forever` (Blender's main thread)."""
+
+    def __init__(self):
+        self.tasks = queue.Queue()
+        self.stopped = threading.Event()
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.tasks.put((future, fn, args))
+        return future
+
+    def pending(self):
+        return self.tasks.qsize()
+
+    def run_pending(self, timeout=None):
+        """Run queued work until the queue is empty; waits up to `timeout` for the first item."""
+        ran = 0
+        try:
+            item = self.tasks.get(timeout=timeout)
+        except queue.Empty:
+            return ran
+        while item is not None:
+            future, fn, args = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as exc:
+                    future.set_exception(exc)
+            ran += 1
+            try:
+                item = self.tasks.get_nowait()
+            except queue.Empty:
+                item = None
+        return ran
+
+    def run_forever(self, poll_interval=0.1):
+        while not self.stopped.is_set():
+            self.run_pending(timeout=poll_interval)
+
+    def stop(self):
+        self.stopped.set()
+
+
+class _HttpError(Exception):
+    def __init__(self, status, body):
+        Exception.__init__(self, body.get('error'))
+        self.status = status
+        self.body = body
+
+
+class AsyncBridgeServer:
+    """asyncio-streams HTTP/1.1 front end with the same /health and /rpc contract as `Handler`.
+
+    Connections are kept alive between requests and cost no thread while idle; only the RPC
+    itself is handed to `executor`. When more than `queue_size` RPCs are waiting for the
+    executor, new ones are answered with 503 RPC_OVERLOADED like the threaded server does.
+    """
+
+    def __init__(self, handle_rpc, executor, token='', health=None, queue_size=64, idle_timeout=300.0, access_log=None):
+        self.handle_rpc = handle_rpc
+        self.executor = executor
+        self.token = token
+        self.health = health
+        self.queue_size = max(1, int(queue_size))
+        self.idle_timeout = float(idle_timeout)
+        self.access_log = access_log
+        self.loop = None
+        self.server = None
+        self.port = None
+        self.connections = 0
+        self.peak_connections = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls, handle_rpc, executor, token='', health=None, access_log=None):
+        return cls(
+            handle_rpc,
+            executor,
+            token=token,
+            health=health,
+            queue_size=_env_int('AETHER_RPC_QUEUE_SIZE', 64),
+            idle_timeout=_env_float('AETHER_RPC_IDLE_TIMEOUT_S', 300.0),
+            access_log=access_log,
+        )
+
+    def stats(self):
+        return {
+            'mode': 'asyncio',
+            'connections': self.connections,
+            'peakConnections': self.peak_connections,
+            'queued': self.executor.pending(),
+            'queueSize': self.queue_size,
+            'rejected': self.rejected,
+        }
+
+    async def _read_request(self, reader):
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.idle_timeout)
+        except asyncio.LimitOverrunError:
+            raise _HttpError(431, {'ok': False, 'error': 'Request headers too large'}) from None
+        lines = head.decode('latin-1').split('\r\n')
+        parts = lines[0].split()
+        if len(parts) != 3:
+            raise _HttpError(400, {'ok': False, 'error': 'Malformed request line'})
+        headers = {}
+        for line in lines[1:]:
+            name, separator, value = line.partition(':')
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+        length = admission.content_length(headers.get('content-length'))
+        if length is None:
+            raise _HttpError(400, admission.invalid_length_response(headers.get('content-length')))
+        body = await reader.readexactly(length) if length > 0 else b''
+        return parts[0].upper(), parts[1], parts[2].upper(), headers, body
+
+    def _authorized(self, headers):
+        return not self.token or headers.get('x-aether-token', '') == self.token
+
+    def _run_rpc(self, payload, idempotency_key, trace, submitted_at):
+        """Executor-side wrapper: closes the queue-wait span and makes `trace` current for the RPC."""
+        if trace is None:
+            return self.handle_rpc(payload, idempotency_key)
+        trace.add('bridge.queue_wait', submitted_at, time.perf_counter())
+        with tracing.activate(trace):
+            return self.handle_rpc(payload, idempotency_key)
+
+    def _write_response(self, writer, status, payload, keep_alive, extra_headers=(), trace=None):
+        body = tracing.encode_response(payload, trace)
+        reason = HTTPStatus(status).phrase
+        lines = [
+            f'HTTP/1.1 {status} {reason}',
+            f'Server: {SERVER_HEADER}',
+            'Content-Type: application/json; charset=utf-8',
+            f'Content-Length: {len(body)}',
+            f'Connection: {"keep-alive" if keep_alive else "close"}',
+        ]
+        lines.extend(f'{name}: {value}' for name, value in extra_headers)
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+
+    async def _respond(self, method, target, headers, body, trace=None):
+        path = urlparse(target).path
+        if method == 'GET':
+            if path == '/health':
+                health = {'ok': True, 'pid': os.getpid()}
+                if self.health is not None:
+                    health.update(self.health())
+                health['admission'] = self.stats()
+                return 200, health, ()
+            return 404, {'ok': False, 'error': 'Not found'}, ()
+        if method != 'POST' or path != '/rpc':
+            return 404, {'ok': False, 'error': 'Not found'}, ()
+        if not self._authorized(headers):
+            return 401, {'ok': False, 'error': 'Unauthorized'}, ()
+        try:
+            with tracing.span('bridge.decode', trace=trace, bytes=len(body)):
+                payload = json.loads(body.decode('utf-8')) if body else {}
+        except Exception as exc:
+            return 400, {'ok': False, 'error': f'Invalid JSON body: {exc}', 'code': 'RPC_INVALID_JSON'}, ()
+        if self.executor.pending() >= self.queue_size:
+            self.rejected += 1
+            retry_after = (('Retry-After', '1'),)
+            return 503, admission.overloaded_response(), retry_after
+        future = self.executor.submit(
+            self._run_rpc, payload, headers.get('x-aether-idempotency-key'), trace, time.perf_counter()
+        )
+        status, response = await asyncio.wrap_future(future)
+        return status, response, ()
+
+    async def _serve_connection(self, reader, writer):
+        self.connections += 1
+        self.peak_connections = max(self.peak_connections, self.connections)
+        try:
+            while True:
+                try:
+                    method, target, version, headers, body = await self._read_request(reader)
+                    started = time.perf_counter()
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except _HttpError as exc:
+                    self._write_response(writer, exc.status, exc.body, False)
+                    await writer.drain()
+                    return
+                trace = None
+                if method == 'POST' and self._authorized(headers):
+                    trace = tracing.RequestTrace.from_header(headers.get('traceparent'), started_at=started)
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                try:
+                    status, payload, extra = await self._respond(method, target, headers, body, trace)
+                except Exception as exc:
+                    status, payload, extra = 500, {'ok': False, 'error': str(exc)}, ()
+                if status == 503:
+                    keep_alive = False
+                self._write_response(writer, status, payload, keep_alive, extra, trace)
+                await writer.drain()
+                if self.access_log is not None:
+                    self.access_log(method, urlparse(target).path, status, (time.perf_counter() - started) * 1000.0)
+                if not keep_alive:
+                    return
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _start(self, host, port):
+        self.server = await asyncio.start_server(self._serve_connection, host, port, limit=MAX_HEADER_BYTES)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def start_in_thread(self, host='127.0.0.1', port=0):
+        """Run the event loop on a daemon thread; returns once the socket is listening."""
+        started = threading.Event()
+        failure = []
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            try:
+                self.loop.run_until_complete(self._start(host, port))
+            except BaseException as exc:
+                failure.append(exc)
+                started.set()
+                return
+            started.set()
+            self.loop.run_forever()
+
+        threading.Thread(target=run, name='aether-rpc-asyncio', daemon=True).start()
+        started.wait()
+        if failure:
+            raise failure[0]
+        return self
+
+    def close(self):
+        if self.loop is not None and self.server is not None:
+            self.loop.call_soon_threadsafe(self.server.close)
+            self.loop.call_soon_threadsafe(self.loop.stop)
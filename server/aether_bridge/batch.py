@@ -0,0 +1,125 @@
+import contextlib
+import threading
+import time
+
+DEPSGRAPH_HANDLER_LISTS = ('depsgraph_update_pre', 'depsgraph_update_post')
+
+# Each worker thread sees only its own batch; the lock keeps a whole batch (handlers parked,
+# modifiers hidden) from interleaving with another thread's.
+_LOCAL = threading.local()
+_BATCH_LOCK = threading.RLock()
+
+
+class BatchEdit:
+    """Holds deferred state for one batch: hidden modifiers and parked depsgraph handlers."""
+
+    def __init__(self, bpy):
+        self.bpy = bpy
+        self.depth = 0
+        self.modifiers = {}
+        self.handlers = {}
+        self.started = None
+        self.mutation_ms = 0.0
+        self.evaluation_ms = 0.0
+        self.deferred_modifiers = 0
+
+    def defer_modifier(self, modifier):
+        key = id(modifier)
+        if modifier is None or key in self.modifiers:
+            return
+        try:
+            visible = bool(modifier.show_viewport)
+        except Exception:
+            return
+        self.modifiers[key] = (modifier, visible)
+        if visible:
+            modifier.show_viewport = False
+            self.deferred_modifiers += 1
+
+    def _park_handlers(self):
+        handlers = getattr(getattr(self.bpy, 'app', None), 'handlers', None)
+        if handlers is None:
+            return
+        for name in DEPSGRAPH_HANDLER_LISTS:
+            registered = getattr(handlers, name, None)
+            if registered is None:
+                continue
+            self.handlers[name] = list(registered)
+            registered.clear()
+
+    def _restore(self):
+        for modifier, visible in self.modifiers.values():
+            try:
+                modifier.show_viewport = visible
+            except Exception:
+                pass
+        self.modifiers.clear()
+        handlers = getattr(getattr(self.bpy, 'app', None), 'handlers', None)
+        for name, parked in self.handlers.items():
+            registered = getattr(handlers, name, None)
+            if registered is not None:
+                registered.extend(parked)
+        self.handlers.clear()
+
+    def _evaluate(self):
+        view_layer = getattr(getattr(self.bpy, 'context', None), 'view_layer', None)
+        if view_layer is not None:
+            view_layer.update()
+
+    def open(self):
+        self.started = time.perf_counter()
+        self._park_handlers()
+
+    def close(self):
+        mutated = time.perf_counter()
+        self.mutation_ms = (mutated - self.started) * 1000.0
+        try:
+            self._restore()
+            self._evaluate()
+        finally:
+            self.evaluation_ms = (time.perf_counter() - mutated) * 1000.0
+
+    def report(self):
+        return {
+            'mutationMs': round(self.mutation_ms, 3),
+            'evaluationMs': round(self.evaluation_ms, 3),
+            'deferredModifiers': self.deferred_modifiers,
+        }
+
+
+def active_batch():
+    return getattr(_LOCAL, 'batch', None)
+
+
+def defer_modifier(modifier):
+    """Hide a modifier from evaluation until the calling thread's batch ends; no-op outside one."""
+    batch = active_batch()
+    if batch is not None:
+        batch.defer_modifier(modifier)
+
+
+@contextlib.contextmanager
+def batch_edit(bpy):
+    """Apply mutations with depsgraph handlers parked and one evaluation at exit.
+
+    Nested batches on the same thread join the outermost one, which owns the single
+    evaluation. A batch on another thread waits until this one has closed.
+    """
+    _BATCH_LOCK.acquire()
+    try:
+        batch = active_batch()
+        owner = batch is None
+        if owner:
+            batch = BatchEdit(bpy)
+            batch.open()
+            _LOCAL.batch = batch
+        batch.depth += 1
+        try:
+            yield batch
+        finally:
+            batch.depth -= 1
+            if owner:
+                _LOCAL.batch = None
+                batch.close()
+    finally:
+        _BATCH_LOCK.release()
@@ -0,0 +1,170 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40}
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+FLUSH_INTERVAL_S = 1.0
+FLUSH_BUFFER_BYTES = 64 * 1024
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+class RotatingJsonLog:
+    """Buffered JSON-lines file that rotates to `path.1 .. path.N` past `max_bytes`."""
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, backups=DEFAULT_BACKUPS, flush_interval=FLUSH_INTERVAL_S):
+        self.path = os.path.abspath(path)
+        self.max_bytes = max(0, int(max_bytes))
+        self.backups = max(0, int(backups))
+        self.lock = threading.Lock()
+        self.buffer = []
+        self.buffered_bytes = 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.handle = open(self.path, 'a', encoding='utf-8')
+        self.size = self.handle.tell()
+        self.closed = threading.Event()
+        if flush_interval and flush_interval > 0:
+            threading.Thread(target=self._flush_periodically, args=(flush_interval,), name='aether-rpc-log', daemon=True).start()
+
+    def write(self, line):
+        with self.lock:
+            self.buffer.append(line)
+            self.buffered_bytes += len(line)
+            if self.buffered_bytes >= FLUSH_BUFFER_BYTES:
+                self._flush_locked()
+
+    def _rotate_locked(self):
+        self.handle.close()
+        if self.backups:
+            for index in range(self.backups - 1, 0, -1):
+                source = f'{self.path}.{index}'
+                if os.path.exists(source):
+                    os.replace(source, f'{self.path}.{index + 1}')
+            os.replace(self.path, f'{self.path}.1')
+        self.handle = open(self.path, 'w', encoding='utf-8')
+        self.size = 0
+
+    def _flush_locked(self):
+        if not self.buffer or self.handle.closed:
+            return
+        for line in self.buffer:
+            if self.max_bytes and self.size and self.size + len(line) > self.max_bytes:
+                self._rotate_locked()
+            self.handle.write(line)
+            self.size += len(line)
+        self.handle.flush()
+        self.buffer = []
+        self.buffered_bytes = 0
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_periodically(self, interval):
+        while not self.closed.wait(interval):
+            self.flush()
+
+    def close(self):
+        self.closed.set()
+        with self.lock:
+            self._flush_locked()
+            self.handle.close()
+
+
+class BridgeLogger:
+    """Leveled JSON-lines logger; stdout is reserved for lifecycle markers the session manager reads.
+
+    Without a file sink, warnings and errors go to stderr so failures stay visible. Successful
+    access-log records are sampled at `access_sample` (0..1); 4xx/5xx are always kept.
+    """
+
+    def __init__(self, level='info', sink=None, access_sample=1.0, stream=None, rng=None):
+        self.threshold = LEVELS.get(str(level or 'info').strip().lower(), LEVELS['info'])
+        self.sink = sink
+        self.access_sample = min(1.0, max(0.0, float(access_sample)))
+        self.stream = stream
+        self.rng = rng or random.Random()
+        self.sampled_out = 0
+
+    @classmethod
+    def from_env(cls):
+        path = str(os.environ.get('AETHER_RPC_LOG_PATH', '') or '').strip()
+        sink = None
+        if path:
+            sink = RotatingJsonLog(
+                path,
+                max_bytes=int(_env_float('AETHER_RPC_LOG_MAX_BYTES', DEFAULT_MAX_BYTES)),
+                backups=int(_env_float('AETHER_RPC_LOG_BACKUPS', DEFAULT_BACKUPS)),
+            )
+        return cls(
+            level=os.environ.get('AETHER_RPC_LOG_LEVEL', 'info'),
+            sink=sink,
+            access_sample=_env_float('AETHER_RPC_ACCESS_LOG_SAMPLE', 1.0),
+        )
+
+    def enabled(self, level):
+        return LEVELS.get(level, 0) >= self.threshold
+
+    def log(self, level, event, **fields):
+        if not self.enabled(level):
+            return
+        if self.sink is None and LEVELS[level] < LEVELS['warning']:
+            return
+        record = {'ts': round(time.time(), 6), 'level': level, 'event': event}
+        record.update(fields)
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False, default=str) + '\n'
+        if self.sink is not None:
+            self.sink.write(line)
+        else:
+            stream = self.stream or sys.stderr
+            stream.write(line)
+            stream.flush()
+
+    def debug(self, event, **fields):
+        self.log('debug', event, **fields)
+
+    def info(self, event, **fields):
+        self.log('info', event, **fields)
+
+    def warning(self, event, **fields):
+        self.log('warning', event, **fields)
+
+    def error(self, event, **fields):
+        self.log('error', event, **fields)
+
+    def access(self, method, path, status, duration_ms=None, **fields):
+        status = int(status) if str(status).isdigit() else 0
+        if status < 400 and self.access_sample < 1.0 and self.rng.random() >= self.access_sample:
+            self.sampled_out += 1
+            return
+        if duration_ms is not None:
+            fields['ms'] = round(duration_ms, 3)
+        if self.access_sample < 1.0:
+            fields['sample'] = self.access_sample
+        self.log('warning' if status >= 500 else 'info', 'http.access', method=method, path=path, status=status, **fields)
+
+    def lifecycle(self, marker, **fields):
+        """Print a marker line to stdout (the session manager's contract) and record it."""
+        text = ' '.join([marker] + [f'{key}={value}' for key, value in fields.items()])
+        print(text, flush=True)
+        self.info('lifecycle', marker=marker, **fields)
+
+    def flush(self):
+        if self.sink is not None:
+            self.sink.flush()
+
+    def close(self):
+        if self.sink is not None:
+            self.sink.close()
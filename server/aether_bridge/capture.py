@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+CAPTURE_VERSION = 1
+
+# Fields that legitimately differ between two executions of the same command.
+VOLATILE_RESULT_KEYS = frozenset({
+    'watchdog',
+    'batch',
+    'elapsedMs',
+    'pid',
+    'cwd',
+    'version',
+    'pythonVersion',
+    'rssBytes',
+    'cached',
+    'idempotency',
+})
+
+
+def _stable_json(value):
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def _strip_volatile(value):
+    if isinstance(value, dict):
+        return {key: _strip_volatile(item) for key, item in value.items() if key not in VOLATILE_RESULT_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+def result_hash(status, body):
+    """Hash a response so a replay can tell a changed result from changed timings."""
+    stripped = _strip_volatile(body if isinstance(body, dict) else {'body': body})
+    digest = hashlib.sha256(_stable_json({'status': int(status), 'body': stripped}).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+class TrafficRecorder:
+    """Appends one JSON line per RPC request to a capture file."""
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.lock = threading.Lock()
+        self.origin = None
+        self.sequence = 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.handle = open(self.path, 'a', encoding='utf-8', buffering=1)
+        self._write({'capture': CAPTURE_VERSION, 'pid': os.getpid(), 'startedAt': time.time()})
+
+    def _write(self, record):
+        self.handle.write(_stable_json(record) + '\n')
+
+    def record(self, command, payload, started, duration_ms, status, body):
+        with self.lock:
+            if self.origin is None:
+                self.origin = started
+            self.sequence += 1
+            self._write({
+                'seq': self.sequence,
+                'at': round(started - self.origin, 6),
+                'cmd': command,
+                'payload': payload,
+                'ms': round(duration_ms, 3),
+                'status': int(status),
+                'hash': result_hash(status, body),
+            })
+
+    def close(self):
+        with self.lock:
+            self.handle.close()
+
+
+def recorder_from_env():
+    path = str(os.environ.get('AETHER_RPC_CAPTURE_PATH', '') or '').strip()
+    return TrafficRecorder(path) if path else None
+
+
+def read_capture(path):
+    """Yield request records from a capture file, skipping headers and torn trailing lines."""
+    with open(path, 'r', encoding='utf-8') as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if 'seq' in record and 'cmd' in record:
+                yield record
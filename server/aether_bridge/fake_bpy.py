@@ -0,0 +1,1167 @@
+"""Pure-Python stand-in for the parts of `bpy` the bridge and generated scripts touch.
+
+Load it with AETHER_RPC_FAKE_BPY=1 (see `install`) to run the bridge outside Blender for
+hermetic benchmarks. It models datablock collections, objects, Geometry Nodes modifiers and
+node trees (nodes, sockets, links, group interface) plus `foreach_get`/`foreach_set` on mesh
+element collections. Evaluation and operators are not simulated.
+"""
+import itertools
+import math
+import sys
+import types
+
+FAKE_BLENDER_VERSION = (4, 2, 0)
+_SESSION_UIDS = itertools.count(1)
+
+
+def _unique_name(existing, name, hints=None):
+    base = str(name or 'Data')
+    if base not in existing:
+        return base
+    # Resume from the last suffix handed out for this base so bulk creation stays linear.
+    suffix = hints.get(base, 1) if hints is not None else 1
+    while f'{base}.{suffix:03d}' in existing:
+        suffix += 1
+    if hints is not None:
+        hints[base] = suffix + 1
+    return f'{base}.{suffix:03d}'
+
+
+class _Struct:
+    def as_pointer(self):
+        return id(self)
+
+
+class _PropertyOwner(_Struct):
+    """ID-style custom properties (`owner['key']`, `owner.get('key')`)."""
+
+    def _props(self):
+        props = self.__dict__.get('_custom_props')
+        if props is None:
+            props = {}
+            self.__dict__['_custom_props'] = props
+        return props
+
+    def __getitem__(self, key):
+        return self._props()[key]
+
+    def __setitem__(self, key, value):
+        self._props()[key] = value
+
+    def __delitem__(self, key):
+        del self._props()[key]
+
+    def __contains__(self, key):
+        return key in self._props()
+
+    def get(self, key, default=None):
+        return self._props().get(key, default)
+
+    def keys(self):
+        return list(self._props().keys())
+
+
+class ID(_PropertyOwner):
+    def __init__(self, name):
+        self.name = name
+        self.session_uid = next(_SESSION_UIDS)
+        self.users = 0
+        self.use_fake_user = False
+        self.library = None
+
+    def user_add(self):
+        self.users += 1
+
+    def user_remove(self):
+        self.users = max(0, self.users - 1)
+
+
+def _retarget_user(previous, current):
+    if previous is current:
+        return
+    if previous is not None:
+        previous.user_remove()
+    if current is not None:
+        current.user_add()
+
+
+class _NamedCollection(_Struct):
+    """Ordered, name-addressable collection shared by `bpy.data.*` and `nodes`."""
+
+    def __init__(self):
+        self._items = {}
+        self._suffix_hints = {}
+
+    def _add(self, item):
+        item.name = _unique_name(self._items, item.name, self._suffix_hints)
+        self._items[item.name] = item
+        return item
+
+    def _discard(self, item):
+        if self._items.get(item.name) is item:
+            del self._items[item.name]
+        else:
+            for key, candidate in list(self._items.items()):
+                if candidate is item:
+                    del self._items[key]
+
+    def _rename(self, item, name):
+        self._discard(item)
+        item.__dict__['name'] = _unique_name(self._items, name, self._suffix_hints)
+        self._items[item.name] = item
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in self._items
+        return any(item is key for item in self._items.values())
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self._items.values())[key]
+        return self._items[key]
+
+    def get(self, key, default=None):
+        return self._items.get(key, default)
+
+    def keys(self):
+        return list(self._items.keys())
+
+    def values(self):
+        return list(self._items.values())
+
+    def items(self):
+        return list(self._items.items())
+
+    def find(self, key):
+        try:
+            return list(self._items.keys()).index(key)
+        except ValueError:
+            return -1
+
+
+class _Renamable:
+    """Keeps the owning collection's name index in sync when `.name` is assigned."""
+
+    _owner_collection = None
+
+    def __setattr__(self, key, value):
+        owner = self.__dict__.get('_owner_collection')
+        if key == 'name' and owner is not None and 'name' in self.__dict__:
+            if value != self.__dict__['name']:
+                owner._rename(self, str(value))
+            return
+        object.__setattr__(self, key, value)
+
+
+# --- mesh data ----------------------------------------------------------------------------
+
+
+class _Element(_Struct):
+    def __init__(self, owner, index):
+        self._owner = owner
+        self.index = index
+
+    def __getattr__(self, name):
+        values = self.__dict__['_owner']._attributes
+        if name in values:
+            width = self.__dict__['_owner']._widths[name]
+            start = self.__dict__['index'] * width
+            chunk = values[name][start:start + width]
+            return chunk[0] if width == 1 else list(chunk)
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in ('_owner', 'index'):
+            object.__setattr__(self, name, value)
+            return
+        owner = self.__dict__['_owner']
+        if name not in owner._attributes:
+            raise AttributeError(name)
+        width = owner._widths[name]
+        start = self.index * width
+        owner._attributes[name][start:start + width] = list(value) if width > 1 else [value]
+
+
+class _ElementCollection(_Struct):
+    """Flat per-attribute storage so `foreach_get`/`foreach_set` stay O(n) like Blender's."""
+
+    def __init__(self, attributes):
+        self._widths = dict(attributes)
+        self._attributes = {name: [] for name in attributes}
+        self._defaults = {name: 0.0 for name in attributes}
+        self._count = 0
+
+    def add(self, count):
+        count = int(count)
+        for name, width in self._widths.items():
+            self._attributes[name].extend([self._defaults[name]] * (count * width))
+        self._count += count
+
+    def clear(self):
+        for name in self._attributes:
+            self._attributes[name] = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (_Element(self, index) for index in range(self._count))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('element index out of range')
+        return _Element(self, index)
+
+    def _check(self, attribute, length):
+        if attribute not in self._attributes:
+            raise AttributeError(f'foreach: unknown attribute {attribute!r}')
+        expected = self._count * self._widths[attribute]
+        if length != expected:
+            raise RuntimeError(f'foreach: array length mismatch (expected {expected}, got {length})')
+
+    def foreach_get(self, attribute, seq):
+        self._check(attribute, len(seq))
+        seq[:] = self._attributes[attribute]
+
+    def foreach_set(self, attribute, seq):
+        self._check(attribute, len(seq))
+        self._attributes[attribute] = list(seq)
+
+
+class Mesh(ID, _Renamable):
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.vertices = _ElementCollection({'co': 3, 'select': 1, 'hide': 1})
+        self.edges = _ElementCollection({'vertices': 2, 'select': 1})
+        self.polygons = _ElementCollection({'loop_start': 1, 'loop_total': 1, 'material_index': 1})
+        self.loops = _ElementCollection({'vertex_index': 1})
+        self.materials = []
+
+    def from_pydata(self, vertices, edges, faces):
+        for collection in (self.vertices, self.edges, self.polygons, self.loops):
+            collection.clear()
+        self.vertices.add(len(vertices))
+        self.vertices.foreach_set('co', [float(value) for vertex in vertices for value in vertex])
+        self.edges.add(len(edges))
+        self.edges.foreach_set('vertices', [int(value) for edge in edges for value in edge])
+        self.polygons.add(len(faces))
+        loop_starts = []
+        loop_totals = []
+        loop_vertices = []
+        for face in faces:
+            loop_starts.append(len(loop_vertices))
+            loop_totals.append(len(face))
+            loop_vertices.extend(int(value) for value in face)
+        self.polygons.foreach_set('loop_start', loop_starts)
+        self.polygons.foreach_set('loop_total', loop_totals)
+        self.loops.add(len(loop_vertices))
+        self.loops.foreach_set('vertex_index', loop_vertices)
+
+    def update(self, *args, **kwargs):
+        return None
+
+    def validate(self, *args, **kwargs):
+        return False
+
+    def copy(self):
+        duplicate = Mesh(self.name)
+        for source, target in (
+            (self.vertices, duplicate.vertices),
+            (self.edges, duplicate.edges),
+            (self.polygons, duplicate.polygons),
+            (self.loops, duplicate.loops),
+        ):
+            target.add(len(source))
+            for attribute, values in source._attributes.items():
+                target._attributes[attribute] = list(values)
+        return _DATA.meshes._link(duplicate)
+
+
+# --- node trees ---------------------------------------------------------------------------
+
+
+class NodeSocket(_Struct):
+    def __init__(self, node, name, is_output, socket_type='GEOMETRY', default=None, multi_input=False, identifier=None):
+        self.node = node
+        self.name = name
+        self.identifier = identifier or name
+        self.is_output = is_output
+        self.is_multi_input = multi_input
+        self.type = socket_type
+        self.enabled = True
+        self.hide = False
+        self.links_count = 0
+        if socket_type != 'GEOMETRY':
+            self.default_value = default
+
+    @property
+    def is_linked(self):
+        return self.links_count > 0
+
+    @property
+    def links(self):
+        tree = self.node.id_data
+        attribute = 'from_socket' if self.is_output else 'to_socket'
+        return [link for link in tree.links if getattr(link, attribute) is self]
+
+
+class _NodeSockets(_Struct):
+    def __init__(self, sockets):
+        self._sockets = list(sockets)
+
+    def __len__(self):
+        return len(self._sockets)
+
+    def __iter__(self):
+        return iter(list(self._sockets))
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._sockets[key]
+        for socket in self._sockets:
+            if socket.name == key or socket.identifier == key:
+                return socket
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [socket.name for socket in self._sockets]
+
+
+_VALUE_DEFAULTS = {
+    'VALUE': 0.0,
+    'INT': 0,
+    'BOOLEAN': False,
+    'VECTOR': (0.0, 0.0, 0.0),
+    'RGBA': (0.8, 0.8, 0.8, 1.0),
+    'STRING': '',
+    'ROTATION': (0.0, 0.0, 0.0),
+}
+
+_GEOMETRY_IO = ((('Geometry', 'GEOMETRY', None),), (('Geometry', 'GEOMETRY', None),))
+
+# Socket layouts for frequently generated node types; unknown types get Geometry in/out.
+NODE_SOCKET_TEMPLATES = {
+    'GeometryNodeMeshCube': (
+        (('Size', 'VECTOR', (1.0, 1.0, 1.0)), ('Vertices X', 'INT', 2), ('Vertices Y', 'INT', 2), ('Vertices Z', 'INT', 2)),
+        (('Mesh', 'GEOMETRY', None), ('UV Map', 'VECTOR', None)),
+    ),
+    'GeometryNodeMeshGrid': (
+        (('Size X', 'VALUE', 1.0), ('Size Y', 'VALUE', 1.0), ('Vertices X', 'INT', 3), ('Vertices Y', 'INT', 3)),
+        (('Mesh', 'GEOMETRY', None), ('UV Map', 'VECTOR', None)),
+    ),
+    'GeometryNodeMeshUVSphere': (
+        (('Segments', 'INT', 32), ('Rings', 'INT', 16), ('Radius', 'VALUE', 1.0)),
+        (('Mesh', 'GEOMETRY', None), ('UV Map', 'VECTOR', None)),
+    ),
+    'GeometryNodeMeshCylinder': (
+        (('Vertices', 'INT', 32), ('Side Segments', 'INT', 1), ('Fill Segments', 'INT', 1), ('Radius', 'VALUE', 1.0), ('Depth', 'VALUE', 2.0)),
+        (('Mesh', 'GEOMETRY', None), ('Top', 'BOOLEAN', None), ('Side', 'BOOLEAN', None), ('Bottom', 'BOOLEAN', None), ('UV Map', 'VECTOR', None)),
+    ),
+    'GeometryNodeSetPosition': (
+        (('Geometry', 'GEOMETRY', None), ('Selection', 'BOOLEAN', True), ('Position', 'VECTOR', (0.0, 0.0, 0.0)), ('Offset', 'VECTOR', (0.0, 0.0, 0.0))),
+        (('Geometry', 'GEOMETRY', None),),
+    ),
+    'GeometryNodeTransform': (
+        (('Geometry', 'GEOMETRY', None), ('Translation', 'VECTOR', (0.0, 0.0, 0.0)), ('Rotation', 'ROTATION', (0.0, 0.0, 0.0)), ('Scale', 'VECTOR', (1.0, 1.0, 1.0))),
+        (('Geometry', 'GEOMETRY', None),),
+    ),
+    'GeometryNodeJoinGeometry': (
+        (('Geometry', 'GEOMETRY', None, True),),
+        (('Geometry', 'GEOMETRY', None),),
+    ),
+    'GeometryNodeDistributePointsOnFaces': (
+        (('Mesh', 'GEOMETRY', None), ('Selection', 'BOOLEAN', True), ('Distance Min', 'VALUE', 0.0), ('Density Max', 'VALUE', 10.0), ('Density', 'VALUE', 10.0), ('Density Factor', 'VALUE', 1.0), ('Seed', 'INT', 0)),
+        (('Points', 'GEOMETRY', None), ('Normal', 'VECTOR', None), ('Rotation', 'ROTATION', None)),
+    ),
+    'GeometryNodeInstanceOnPoints': (
+        (('Points', 'GEOMETRY', None), ('Selection', 'BOOLEAN', True), ('Instance', 'GEOMETRY', None), ('Pick Instance', 'BOOLEAN', False), ('Instance Index', 'INT', 0), ('Rotation', 'ROTATION', (0.0, 0.0, 0.0)), ('Scale', 'VECTOR', (1.0, 1.0, 1.0))),
+        (('Instances', 'GEOMETRY', None),),
+    ),
+    'GeometryNodeRealizeInstances': _GEOMETRY_IO,
+    'GeometryNodeMeshToPoints': (
+        (('Mesh', 'GEOMETRY', None), ('Selection', 'BOOLEAN', True), ('Position', 'VECTOR', (0.0, 0.0, 0.0)), ('Radius', 'VALUE', 0.05)),
+        (('Points', 'GEOMETRY', None),),
+    ),
+    'GeometryNodeSetMaterial': (
+        (('Geometry', 'GEOMETRY', None), ('Selection', 'BOOLEAN', True), ('Material', 'MATERIAL', None)),
+        (('Geometry', 'GEOMETRY', None),),
+    ),
+    'GeometryNodeInputPosition': ((), (('Position', 'VECTOR', None),)),
+    'GeometryNodeInputIndex': ((), (('Index', 'INT', None),)),
+    'GeometryNodeInputNormal': ((), (('Normal', 'VECTOR', None),)),
+    'FunctionNodeRandomValue': (
+        (('Min', 'VALUE', 0.0), ('Max', 'VALUE', 1.0), ('ID', 'INT', 0), ('Seed', 'INT', 0)),
+        (('Value', 'VALUE', None),),
+    ),
+    'ShaderNodeValue': ((), (('Value', 'VALUE', None),)),
+    'ShaderNodeMath': (
+        (('Value', 'VALUE', 0.5), ('Value', 'VALUE', 0.5), ('Value', 'VALUE', 0.5)),
+        (('Value', 'VALUE', None),),
+    ),
+    'ShaderNodeVectorMath': (
+        (('Vector', 'VECTOR', (0.0, 0.0, 0.0)), ('Vector', 'VECTOR', (0.0, 0.0, 0.0)), ('Vector', 'VECTOR', (0.0, 0.0, 0.0)), ('Scale', 'VALUE', 1.0)),
+        (('Vector', 'VECTOR', None), ('Value', 'VALUE', None)),
+    ),
+    'ShaderNodeCombineXYZ': (
+        (('X', 'VALUE', 0.0), ('Y', 'VALUE', 0.0), ('Z', 'VALUE', 0.0)),
+        (('Vector', 'VECTOR', None),),
+    ),
+    'ShaderNodeSeparateXYZ': (
+        (('Vector', 'VECTOR', (0.0, 0.0, 0.0)),),
+        (('X', 'VALUE', None), ('Y', 'VALUE', None), ('Z', 'VALUE', None)),
+    ),
+    'ShaderNodeTexNoise': (
+        (('Vector', 'VECTOR', (0.0, 0.0, 0.0)), ('Scale', 'VALUE', 5.0), ('Detail', 'VALUE', 2.0), ('Roughness', 'VALUE', 0.5)),
+        (('Fac', 'VALUE', None), ('Color', 'RGBA', None)),
+    ),
+}
+
+# Enum properties carried by common nodes, with their default values.
+NODE_ENUM_DEFAULTS = {
+    'ShaderNodeMath': {'operation': 'ADD'},
+    'ShaderNodeVectorMath': {'operation': 'ADD'},
+    'FunctionNodeRandomValue': {'data_type': 'FLOAT'},
+    'GeometryNodeDistributePointsOnFaces': {'distribute_method': 'RANDOM'},
+}
+
+
+class _EnumProperty:
+    type = 'ENUM'
+    is_readonly = False
+
+    def __init__(self, identifier):
+        self.identifier = identifier
+
+
+class _NodeRNA:
+    def __init__(self, node):
+        self.properties = [_EnumProperty(name) for name in NODE_ENUM_DEFAULTS.get(node.bl_idname, {})]
+
+
+def _make_socket(node, spec, is_output):
+    name, socket_type, default = spec[0], spec[1], spec[2]
+    multi_input = len(spec) > 3 and bool(spec[3])
+    if default is None and socket_type in _VALUE_DEFAULTS:
+        default = _VALUE_DEFAULTS[socket_type]
+    return NodeSocket(node, name, is_output, socket_type, default, multi_input)
+
+
+class Node(_Renamable, _PropertyOwner):
+    def __init__(self, tree, bl_idname):
+        self.__dict__['id_data'] = tree
+        self.bl_idname = bl_idname
+        self.type = bl_idname
+        self.name = bl_idname
+        self.label = ''
+        self.location = [0.0, 0.0]
+        self.width = 140.0
+        self.mute = False
+        self.hide = False
+        self.select = True
+        self.parent = None
+        self.bl_rna = _NodeRNA(self)
+        for key, value in NODE_ENUM_DEFAULTS.get(bl_idname, {}).items():
+            object.__setattr__(self, key, value)
+        inputs, outputs = NODE_SOCKET_TEMPLATES.get(bl_idname, _GEOMETRY_IO)
+        self._inputs = _NodeSockets(_make_socket(self, spec, False) for spec in inputs)
+        self._outputs = _NodeSockets(_make_socket(self, spec, True) for spec in outputs)
+
+    @property
+    def inputs(self):
+        return self._inputs
+
+    @property
+    def outputs(self):
+        return self._outputs
+
+    def __setattr__(self, key, value):
+        if key == 'location':
+            value = [float(value[0]), float(value[1])]
+        _Renamable.__setattr__(self, key, value)
+
+
+class GroupIONode(Node):
+    """NodeGroupInput/Output whose sockets mirror the tree interface."""
+
+    def __init__(self, tree, bl_idname):
+        self._interface_sockets = {}
+        Node.__init__(self, tree, bl_idname)
+
+    def _mirror(self, in_out, is_output):
+        sockets = []
+        for item in self.id_data.interface.items_tree:
+            if item.item_type != 'SOCKET' or item.in_out != in_out:
+                continue
+            key = id(item)
+            socket = self._interface_sockets.get(key)
+            if socket is None:
+                socket_type = _INTERFACE_SOCKET_TYPES.get(item.socket_type, 'VALUE')
+                socket = _make_socket(self, (item.name, socket_type, None), is_output)
+                socket.identifier = item.identifier
+                self._interface_sockets[key] = socket
+            socket.name = item.name
+            sockets.append(socket)
+        return _NodeSockets(sockets)
+
+    @property
+    def inputs(self):
+        if self.bl_idname == 'NodeGroupOutput':
+            return self._mirror('OUTPUT', False)
+        return _NodeSockets(())
+
+    @property
+    def outputs(self):
+        if self.bl_idname == 'NodeGroupInput':
+            return self._mirror('INPUT', True)
+        return _NodeSockets(())
+
+
+_INTERFACE_SOCKET_TYPES = {
+    'NodeSocketGeometry': 'GEOMETRY',
+    'NodeSocketFloat': 'VALUE',
+    'NodeSocketInt': 'INT',
+    'NodeSocketBool': 'BOOLEAN',
+    'NodeSocketVector': 'VECTOR',
+    'NodeSocketColor': 'RGBA',
+    'NodeSocketString': 'STRING',
+    'NodeSocketRotation': 'ROTATION',
+    'NodeSocketMaterial': 'MATERIAL',
+    'NodeSocketObject': 'OBJECT',
+    'NodeSocketCollection': 'COLLECTION',
+}
+
+
+class _Nodes(_NamedCollection):
+    def __init__(self, tree):
+        _NamedCollection.__init__(self)
+        self._tree = tree
+        self.active = None
+
+    def new(self, type):
+        bl_idname = str(type or '')
+        if not bl_idname:
+            raise RuntimeError('Error: Node type  undefined')
+        node_class = GroupIONode if bl_idname in ('NodeGroupInput', 'NodeGroupOutput') else Node
+        node = node_class(self._tree, bl_idname)
+        self._add(node)
+        node.__dict__['_owner_collection'] = self
+        return node
+
+    def remove(self, node):
+        for link in [link for link in self._tree.links if link.from_node is node or link.to_node is node]:
+            self._tree.links.remove(link)
+        self._discard(node)
+        node.__dict__['_owner_collection'] = None
+
+    def clear(self):
+        for node in list(self):
+            self.remove(node)
+
+
+
+class NodeLink(_Struct):
+    def __init__(self, from_socket, to_socket):
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+        self.from_node = from_socket.node
+        self.to_node = to_socket.node
+        self.is_valid = True
+        self.is_muted = False
+
+
+class _Links(_Struct):
+    def __init__(self, tree):
+        self._tree = tree
+        self._links = []
+        self._incoming = {}
+
+    def new(self, input, output, verify_limits=True):
+        from_socket, to_socket = input, output
+        if not from_socket.is_output and to_socket.is_output:
+            from_socket, to_socket = to_socket, from_socket
+        if not from_socket.is_output or to_socket.is_output:
+            raise RuntimeError('Error: Cannot link two sockets of the same direction')
+        if verify_limits and not to_socket.is_multi_input:
+            for link in list(self._incoming.get(id(to_socket), ())):
+                self.remove(link)
+        link = NodeLink(from_socket, to_socket)
+        self._links.append(link)
+        self._incoming.setdefault(id(to_socket), []).append(link)
+        from_socket.links_count += 1
+        to_socket.links_count += 1
+        return link
+
+    def remove(self, link):
+        try:
+            self._links.remove(link)
+        except ValueError:
+            raise RuntimeError('Error: unable to remove link') from None
+        self._incoming[id(link.to_socket)].remove(link)
+        link.from_socket.links_count -= 1
+        link.to_socket.links_count -= 1
+        link.is_valid = False
+
+    def clear(self):
+        for link in list(self._links):
+            self.remove(link)
+
+    def __len__(self):
+        return len(self._links)
+
+    def __iter__(self):
+        return iter(list(self._links))
+
+    def __getitem__(self, index):
+        return self._links[index]
+
+
+class NodeTreeInterfaceSocket(_Struct):
+    item_type = 'SOCKET'
+
+    def __init__(self, name, in_out, socket_type, identifier):
+        self.name = name
+        self.in_out = in_out
+        self.socket_type = socket_type
+        self.identifier = identifier
+        self.description = ''
+        self.default_value = _VALUE_DEFAULTS.get(_INTERFACE_SOCKET_TYPES.get(socket_type, ''), None)
+
+
+class NodeTreeInterface(_Struct):
+    def __init__(self):
+        self.items_tree = []
+        self._next_identifier = 0
+
+    def new_socket(self, name, in_out='INPUT', socket_type='NodeSocketFloat', description='', parent=None):
+        if in_out not in ('INPUT', 'OUTPUT'):
+            raise TypeError(f'enum "{in_out}" not found in (\'INPUT\', \'OUTPUT\')')
+        if socket_type not in _INTERFACE_SOCKET_TYPES:
+            raise TypeError(f'Socket type {socket_type!r} is not supported')
+        item = NodeTreeInterfaceSocket(str(name), in_out, socket_type, f'Socket_{self._next_identifier}')
+        item.description = description
+        self._next_identifier += 1
+        self.items_tree.append(item)
+        return item
+
+    def remove(self, item):
+        self.items_tree.remove(item)
+
+    def clear(self):
+        self.items_tree.clear()
+
+
+class NodeTree(ID, _Renamable):
+    def __init__(self, name, bl_idname):
+        ID.__init__(self, name)
+        self.bl_idname = bl_idname
+        self.type = 'GEOMETRY' if bl_idname == 'GeometryNodeTree' else 'CUSTOM'
+        self.nodes = _Nodes(self)
+        self.links = _Links(self)
+        self.interface = NodeTreeInterface()
+        self.is_modifier = bl_idname == 'GeometryNodeTree'
+
+    def copy(self):
+        duplicate = _DATA.node_groups.new(self.name, self.bl_idname)
+        mapping = {}
+        for item in self.interface.items_tree:
+            duplicate.interface.new_socket(item.name, item.in_out, item.socket_type)
+        for node in self.nodes:
+            clone = duplicate.nodes.new(node.bl_idname)
+            clone.name = node.name
+            clone.location = node.location
+            clone._props().update(node._props())
+            for source, target in zip(node.inputs, clone.inputs):
+                if hasattr(source, 'default_value'):
+                    target.default_value = source.default_value
+            mapping[id(node)] = clone
+        for link in self.links:
+            from_node = mapping[id(link.from_node)]
+            to_node = mapping[id(link.to_node)]
+            duplicate.links.new(
+                from_node.outputs[list(link.from_node.outputs).index(link.from_socket)],
+                to_node.inputs[list(link.to_node.inputs).index(link.to_socket)],
+            )
+        return duplicate
+
+
+# --- objects, modifiers, collections ------------------------------------------------------
+
+
+class Modifier(_Struct, _Renamable):
+    def __init__(self, name, type):
+        self.name = name
+        self.type = type
+        self.show_viewport = True
+        self.show_render = True
+        self.show_expanded = True
+
+
+class NodesModifier(Modifier):
+    def __init__(self, name):
+        Modifier.__init__(self, name, 'NODES')
+        self._node_group = None
+
+    @property
+    def node_group(self):
+        return self._node_group
+
+    @node_group.setter
+    def node_group(self, tree):
+        _retarget_user(self._node_group, tree)
+        self._node_group = tree
+
+
+class _Modifiers(_NamedCollection):
+    def __init__(self, obj):
+        _NamedCollection.__init__(self)
+        self._object = obj
+        self.active = None
+
+    def new(self, name, type):
+        modifier = NodesModifier(name) if type == 'NODES' else Modifier(name, type)
+        self._add(modifier)
+        modifier.__dict__['_owner_collection'] = self
+        self.active = modifier
+        return modifier
+
+    def remove(self, modifier):
+        if isinstance(modifier, NodesModifier):
+            modifier.node_group = None
+        self._discard(modifier)
+        if self.active is modifier:
+            self.active = None
+
+    def clear(self):
+        for modifier in list(self):
+            self.remove(modifier)
+
+
+class Object(ID, _Renamable):
+    def __init__(self, name, data):
+        ID.__init__(self, name)
+        self._data = None
+        self.data = data
+        self.location = [0.0, 0.0, 0.0]
+        self.rotation_euler = [0.0, 0.0, 0.0]
+        self.scale = [1.0, 1.0, 1.0]
+        self.matrix_world = Matrix.Identity(4)
+        self.modifiers = _Modifiers(self)
+        self.instance_type = 'NONE'
+        self._instance_collection = None
+        self.hide_viewport = False
+        self.hide_render = False
+        self.parent = None
+        self.users_collection = []
+
+    @property
+    def type(self):
+        if self._data is None:
+            return 'EMPTY'
+        if isinstance(self._data, Mesh):
+            return 'MESH'
+        return 'UNKNOWN'
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        _retarget_user(self._data, value)
+        self._data = value
+
+    @property
+    def instance_collection(self):
+        return self._instance_collection
+
+    @instance_collection.setter
+    def instance_collection(self, value):
+        _retarget_user(self._instance_collection, value)
+        self._instance_collection = value
+
+    def copy(self):
+        duplicate = _DATA.objects.new(self.name, self.data)
+        duplicate.location = list(self.location)
+        duplicate.rotation_euler = list(self.rotation_euler)
+        duplicate.scale = list(self.scale)
+        return duplicate
+
+    def __setattr__(self, key, value):
+        if key in ('location', 'rotation_euler', 'scale'):
+            value = [float(component) for component in value]
+        _Renamable.__setattr__(self, key, value)
+
+
+class _CollectionObjects(_Struct):
+    def __init__(self, collection):
+        self._collection = collection
+        self._objects = {}
+
+    def link(self, obj):
+        if obj.name in self._objects:
+            raise RuntimeError(f"Object '{obj.name}' already in collection '{self._collection.name}'")
+        self._objects[obj.name] = obj
+        obj.users_collection.append(self._collection)
+        obj.user_add()
+
+    def unlink(self, obj):
+        if self._objects.pop(obj.name, None) is None:
+            raise RuntimeError(f"Object '{obj.name}' not in collection '{self._collection.name}'")
+        obj.users_collection.remove(self._collection)
+        obj.user_remove()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(list(self._objects.values()))
+
+    def __contains__(self, key):
+        return key in self._objects if isinstance(key, str) else any(obj is key for obj in self._objects.values())
+
+    def get(self, name, default=None):
+        return self._objects.get(name, default)
+
+    def __getitem__(self, name):
+        return self._objects[name]
+
+
+class _CollectionChildren(_Struct):
+    def __init__(self):
+        self._children = []
+
+    def link(self, collection):
+        if collection in self._children:
+            raise RuntimeError(f"Collection '{collection.name}' already in collection")
+        self._children.append(collection)
+        collection.user_add()
+
+    def unlink(self, collection):
+        self._children.remove(collection)
+        collection.user_remove()
+
+    def __len__(self):
+        return len(self._children)
+
+    def __iter__(self):
+        return iter(list(self._children))
+
+
+class Collection(ID, _Renamable):
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.objects = _CollectionObjects(self)
+        self.children = _CollectionChildren()
+        self.hide_viewport = False
+        self.hide_render = False
+
+    @property
+    def all_objects(self):
+        seen = list(self.objects)
+        for child in self.children:
+            seen.extend(child.all_objects)
+        return seen
+
+
+class Material(ID, _Renamable):
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.use_nodes = False
+        self.diffuse_color = [0.8, 0.8, 0.8, 1.0]
+
+
+class Image(ID, _Renamable):
+    def __init__(self, name, width=0, height=0):
+        ID.__init__(self, name)
+        self.size = [int(width), int(height)]
+        self.filepath = ''
+
+
+class _DataCollection(_NamedCollection):
+    def __init__(self, factory):
+        _NamedCollection.__init__(self)
+        self._factory = factory
+
+    def _link(self, block):
+        self._add(block)
+        block.__dict__['_owner_collection'] = self
+        return block
+
+    def new(self, name, *args, **kwargs):
+        return self._link(self._factory(str(name), *args, **kwargs))
+
+    def remove(self, block, do_unlink=True):
+        if block not in self:
+            raise ReferenceError(f"{type(block).__name__} '{block.name}' is not in this collection")
+        if isinstance(block, Object):
+            for collection in list(block.users_collection):
+                collection.objects.unlink(block)
+            block.data = None
+        self._discard(block)
+        block.__dict__['_owner_collection'] = None
+
+
+class _Scene(ID):
+    def __init__(self, name):
+        ID.__init__(self, name)
+        self.collection = Collection('Scene Collection')
+        self.frame_current = 1
+        self.frame_start = 1
+        self.frame_end = 250
+        self.render = types.SimpleNamespace(engine='BLENDER_EEVEE_NEXT', resolution_x=1920, resolution_y=1080)
+
+    @property
+    def objects(self):
+        return self.collection.all_objects
+
+
+class BlendData(_Struct):
+    def __init__(self):
+        self.filepath = ''
+        self.is_dirty = False
+        self.objects = _DataCollection(Object)
+        self.meshes = _DataCollection(Mesh)
+        self.node_groups = _DataCollection(NodeTree)
+        self.materials = _DataCollection(Material)
+        self.collections = _DataCollection(Collection)
+        self.images = _DataCollection(Image)
+        self.textures = _DataCollection(ID)
+        self.curves = _DataCollection(ID)
+        self.actions = _DataCollection(ID)
+        self.scenes = _DataCollection(_Scene)
+        self.scenes.new('Scene')
+
+    def orphans_purge(self, do_local_ids=True, do_linked_ids=True, do_recursive=False):
+        removed = 0
+        while True:
+            batch = 0
+            for collection in (self.objects, self.meshes, self.node_groups, self.materials, self.collections, self.images):
+                for block in list(collection):
+                    if block.users == 0 and not block.use_fake_user:
+                        collection.remove(block)
+                        batch += 1
+            removed += batch
+            if not batch or not do_recursive:
+                return removed
+
+
+# --- context, app, registration -----------------------------------------------------------
+
+
+class _ViewLayer(_Struct):
+    def __init__(self):
+        self.update_count = 0
+        self.objects = types.SimpleNamespace(active=None)
+
+    def update(self):
+        self.update_count += 1
+
+
+class _Context(_Struct):
+    def __init__(self, data):
+        self._data = data
+        self.view_layer = _ViewLayer()
+        self.preferences = types.SimpleNamespace(addons={})
+
+    @property
+    def scene(self):
+        return self._data.scenes[0]
+
+    @property
+    def collection(self):
+        return self.scene.collection
+
+    @property
+    def active_object(self):
+        return self.view_layer.objects.active
+
+    @property
+    def object(self):
+        return self.view_layer.objects.active
+
+    def evaluated_depsgraph_get(self):
+        self.view_layer.update()
+        return types.SimpleNamespace(update=self.view_layer.update)
+
+
+class Matrix(list):
+    """Row-major 4x4 matrix; enough for assignment to `matrix_world`."""
+
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = [[1.0 if column == row else 0.0 for column in range(4)] for row in range(4)]
+        list.__init__(self, [[float(value) for value in row] for row in rows])
+
+    @classmethod
+    def Identity(cls, size):
+        return cls([[1.0 if column == row else 0.0 for column in range(size)] for row in range(size)])
+
+    @classmethod
+    def Translation(cls, vector):
+        matrix = cls.Identity(4)
+        for axis in range(3):
+            matrix[axis][3] = float(vector[axis])
+        return matrix
+
+    def __matmul__(self, other):
+        size = len(self)
+        return Matrix([
+            [sum(self[row][k] * other[k][column] for k in range(size)) for column in range(size)]
+            for row in range(size)
+        ])
+
+    @property
+    def translation(self):
+        return [self[0][3], self[1][3], self[2][3]]
+
+
+class _RegisteredType:
+    bl_idname = ''
+    bl_label = ''
+
+
+def _type_namespace():
+    namespace = types.ModuleType('bpy.types')
+    for name in (
+        'Operator', 'Panel', 'Menu', 'Header', 'UIList', 'PropertyGroup', 'AddonPreferences',
+        'Macro', 'Gizmo', 'GizmoGroup', 'NodeTree', 'Node', 'NodeSocket',
+    ):
+        setattr(namespace, name, type(name, (_RegisteredType,), {}))
+    for name in ('Object', 'Mesh', 'Collection', 'Material', 'Scene', 'Image', 'ID'):
+        setattr(namespace, name, globals().get(name, ID))
+    namespace.GeometryNodeTree = NodeTree
+    namespace.NodesModifier = NodesModifier
+    namespace.Context = _Context
+    return namespace
+
+
+def _property(kind):
+    def factory(**kwargs):
+        return (kind, kwargs)
+
+    factory.__name__ = kind
+    return factory
+
+
+def _props_namespace():
+    namespace = types.ModuleType('bpy.props')
+    for kind in (
+        'BoolProperty', 'BoolVectorProperty', 'CollectionProperty', 'EnumProperty', 'FloatProperty',
+        'FloatVectorProperty', 'IntProperty', 'IntVectorProperty', 'PointerProperty', 'StringProperty',
+    ):
+        setattr(namespace, kind, _property(kind))
+    return namespace
+
+
+def _utils_namespace(registry):
+    namespace = types.ModuleType('bpy.utils')
+
+    def register_class(cls):
+        if cls in registry:
+            raise ValueError(f'register_class(...): already registered as a subclass {cls.__name__!r}')
+        registry.append(cls)
+
+    def unregister_class(cls):
+        if cls not in registry:
+            raise RuntimeError(f'unregister_class(...): missing bl_rna attribute from {cls.__name__!r}')
+        registry.remove(cls)
+
+    namespace.register_class = register_class
+    namespace.unregister_class = unregister_class
+    namespace.registered_classes = registry
+    namespace.script_paths = lambda *args, **kwargs: []
+    namespace.user_resource = lambda *args, **kwargs: ''
+    return namespace
+
+
+class _Ops:
+    """Operators need a real Blender; any call raises like a poll failure would."""
+
+    def __init__(self, path='bpy.ops'):
+        self._path = path
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _Ops(f'{self._path}.{name}')
+
+    def __call__(self, *args, **kwargs):
+        raise RuntimeError(f'{self._path} is not available in the fake bpy backend')
+
+
+_DATA = None
+
+
+def build_module():
+    """Return a fresh `bpy` module object with empty data."""
+    global _DATA
+    _DATA = BlendData()
+    module = types.ModuleType('bpy')
+    module.__file__ = __file__
+    module.__aether_fake__ = True
+    module.data = _DATA
+    module.context = _Context(_DATA)
+    module.app = types.SimpleNamespace(
+        version=FAKE_BLENDER_VERSION,
+        version_string='.'.join(str(part) for part in FAKE_BLENDER_VERSION) + ' (fake)',
+        background=True,
+        binary_path='',
+        handlers=types.SimpleNamespace(
+            depsgraph_update_pre=[],
+            depsgraph_update_post=[],
+            load_pre=[],
+            load_post=[],
+            undo_post=[],
+            redo_post=[],
+            save_pre=[],
+            save_post=[],
+            frame_change_pre=[],
+            frame_change_post=[],
+        ),
+        timers=types.SimpleNamespace(register=lambda *args, **kwargs: None, is_registered=lambda *args: False),
+    )
+    module.types = _type_namespace()
+    module.props = _props_namespace()
+    module.utils = _utils_namespace([])
+    module.ops = _Ops()
+    return module
+
+
+def _mathutils_module():
+    module = types.ModuleType('mathutils')
+    module.__aether_fake__ = True
+    module.Matrix = Matrix
+    module.Vector = lambda values=(0.0, 0.0, 0.0): [float(value) for value in values]
+    module.Euler = lambda values=(0.0, 0.0, 0.0), order='XYZ': [float(value) for value in values]
+    module.pi = math.pi
+    return module
+
+
+def install(force=False):
+    """Register the fake as `bpy` (and `mathutils` if missing); returns the installed module."""
+    existing = sys.modules.get('bpy')
+    if existing is not None and not force:
+        return existing
+    module = build_module()
+    sys.modules['bpy'] = module
+    sys.modules['bpy.types'] = module.types
+    sys.modules['bpy.props'] = module.props
+    sys.modules['bpy.utils'] = module.utils
+    if force or 'mathutils' not in sys.modules:
+        sys.modules['mathutils'] = _mathutils_module()
+    return module
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+MAX_KEY_LENGTH = 200
+
+
+class IdempotencyKeyError(Exception):
+    code = 'RPC_IDEMPOTENCY_KEY_REUSED'
+    status_code = 422
+
+
+def request_fingerprint(command, payload):
+    encoded = json.dumps(
+        {'command': str(command or '').strip().lower(), 'payload': payload or {}},
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class _Entry:
+    __slots__ = ('fingerprint', 'done', 'outcome', 'error', 'expires_at')
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.done = threading.Event()
+        self.outcome = None
+        self.error = None
+        self.expires_at = None
+
+
+class IdempotencyCache:
+    """Remembers in-flight and completed requests by key so retries never execute twice."""
+
+    def __init__(self, ttl_seconds=600.0, max_entries=1024, clock=time.monotonic):
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max(1, int(max_entries))
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        try:
+            ttl_seconds = float(os.environ.get('AETHER_RPC_IDEMPOTENCY_TTL_S', '') or 600)
+        except ValueError:
+            ttl_seconds = 600.0
+        return cls(ttl_seconds=ttl_seconds)
+
+    def _evict(self, now):
+        for key in [key for key, entry in self.entries.items() if entry.expires_at is not None and entry.expires_at <= now]:
+            del self.entries[key]
+        while len(self.entries) > self.max_entries:
+            oldest = next((key for key, entry in self.entries.items() if entry.done.is_set()), None)
+            if oldest is None:
+                break
+            del self.entries[oldest]
+
+    def run(self, key, fingerprint, execute):
+        """Return `(outcome, source)` where source is 'executed', 'attached' or 'cached'."""
+        key = str(key)[:MAX_KEY_LENGTH]
+        with self.lock:
+            now = self.clock()
+            self._evict(now)
+            entry = self.entries.get(key)
+            if entry is not None and entry.fingerprint != fingerprint:
+                raise IdempotencyKeyError(f'Idempotency key was already used for a different request: {key}')
+            owner = entry is None
+            if owner:
+                entry = _Entry(fingerprint)
+                self.entries[key] = entry
+            source = 'executed' if owner else ('cached' if entry.done.is_set() else 'attached')
+
+        if not owner:
+            entry.done.wait()
+            if entry.error is not None:
+                raise entry.error
+            return entry.outcome, source
+
+        try:
+            entry.outcome = execute()
+        except BaseException as exc:
+            # Failed executions are not cached; attached callers see the same error.
+            with self.lock:
+                self.entries.pop(key, None)
+            entry.error = exc
+            entry.done.set()
+            raise
+        with self.lock:
+            entry.expires_at = self.clock() + self.ttl_seconds
+        entry.done.set()
+        return entry.outcome, source
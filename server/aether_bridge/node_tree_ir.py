@@ -0,0 +1,208 @@
+import hashlib
+import json
+import threading
+
+from .node_trees import NodeTreeError, _node_tag, _pointer
+
+IR_VERSION = 1
+FLOAT_DIGITS = 5
+
+_IR_CACHE = {}
+_IR_CACHE_LOCK = threading.RLock()
+
+
+class _Interner:
+    def __init__(self):
+        self.values = []
+        self.positions = {}
+
+    def __call__(self, value):
+        key = str(value)
+        position = self.positions.get(key)
+        if position is None:
+            position = len(self.values)
+            self.positions[key] = position
+            self.values.append(key)
+        return position
+
+
+def _compact_value(value):
+    if isinstance(value, bool) or value is None or isinstance(value, (int, str)):
+        return value
+    if isinstance(value, float):
+        return round(value, FLOAT_DIGITS)
+    try:
+        items = tuple(value)
+    except TypeError:
+        return None
+    compact = [_compact_value(item) for item in items]
+    if any(item is None and raw is not None for item, raw in zip(compact, items)):
+        return None
+    return compact
+
+
+def _enum_properties(node):
+    rna = getattr(node, 'bl_rna', None)
+    if rna is None:
+        return {}
+    properties = {}
+    for prop in rna.properties:
+        if prop.type != 'ENUM' or prop.is_readonly:
+            continue
+        value = getattr(node, prop.identifier, None)
+        if isinstance(value, str):
+            properties[prop.identifier] = value
+    return properties
+
+
+def _interface_sockets(node_tree, names):
+    interface = getattr(node_tree, 'interface', None)
+    if interface is None:
+        return []
+    entries = []
+    for item in getattr(interface, 'items_tree', []):
+        if getattr(item, 'item_type', None) != 'SOCKET':
+            continue
+        entries.append([
+            0 if item.in_out == 'INPUT' else 1,
+            names(item.name),
+            str(getattr(item, 'socket_type', '')),
+        ])
+    return entries
+
+
+def build_node_tree_ir(node_tree):
+    """Serialize a node tree into the compact, hash-stable IR."""
+    types = _Interner()
+    names = _Interner()
+    node_positions = {}
+    nodes = []
+    properties = []
+    defaults = []
+
+    for position, node in enumerate(node_tree.nodes):
+        node_positions[_pointer(node)] = position
+        location = tuple(getattr(node, 'location', (0.0, 0.0)))[:2]
+        nodes.append([
+            types(node.bl_idname),
+            _node_tag(node) or node.name,
+            round(float(location[0]), 1) if location else 0.0,
+            round(float(location[1]), 1) if len(location) > 1 else 0.0,
+        ])
+        node_properties = _enum_properties(node)
+        if node_properties:
+            properties.append([position, node_properties])
+        for socket_position, socket in enumerate(node.inputs):
+            if getattr(socket, 'is_linked', False) or not hasattr(socket, 'default_value'):
+                continue
+            value = _compact_value(socket.default_value)
+            if value is not None:
+                defaults.append([position, socket_position, names(socket.name), value])
+
+    links = []
+    for link in node_tree.links:
+        from_position = node_positions.get(_pointer(link.from_node))
+        to_position = node_positions.get(_pointer(link.to_node))
+        if from_position is None or to_position is None:
+            continue
+        links.append([
+            from_position,
+            names(link.from_socket.name),
+            to_position,
+            names(link.to_socket.name),
+        ])
+    links.sort()
+
+    body = {
+        'v': IR_VERSION,
+        'types': types.values,
+        'names': names.values,
+        'nodes': nodes,
+        'links': links,
+        'defaults': defaults,
+        'properties': properties,
+        'interface': _interface_sockets(node_tree, names),
+    }
+    encoded = json.dumps(body, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return {
+        **body,
+        'tree': node_tree.name,
+        'hash': hashlib.sha256(encoded.encode('utf-8')).hexdigest(),
+        'bytes': len(encoded.encode('utf-8')),
+    }
+
+
+def _cache_signature(node_tree):
+    return len(node_tree.nodes), len(node_tree.links), node_tree.name
+
+
+def node_tree_ir(node_tree, force=False):
+    """Return `(ir, cached)`, reusing the last export until the tree is invalidated or drifts."""
+    pointer = _pointer(node_tree)
+    signature = _cache_signature(node_tree)
+    with _IR_CACHE_LOCK:
+        entry = _IR_CACHE.get(pointer)
+        if not force and entry is not None and entry[0] == signature:
+            return entry[1], True
+        ir = build_node_tree_ir(node_tree)
+        _IR_CACHE[pointer] = (signature, ir)
+        return ir, False
+
+
+def invalidate_node_tree_ir(node_tree=None):
+    with _IR_CACHE_LOCK:
+        if node_tree is None:
+            count = len(_IR_CACHE)
+            _IR_CACHE.clear()
+            return count
+        return 1 if _IR_CACHE.pop(_pointer(node_tree), None) is not None else 0
+
+
+def _active_nodes_modifier(bpy):
+    obj = getattr(getattr(bpy, 'context', None), 'active_object', None)
+    if obj is None:
+        return None
+    active = getattr(obj.modifiers, 'active', None)
+    if active is not None and active.type == 'NODES':
+        return active
+    for modifier in obj.modifiers:
+        if modifier.type == 'NODES':
+            return modifier
+    return None
+
+
+def resolve_ir_tree(bpy, target):
+    """Find the tree named by `target`, falling back to the active object's Geometry Nodes modifier."""
+    target = target if isinstance(target, dict) else {}
+    group_name = str(target.get('node_group_name') or '').strip()
+    object_name = str(target.get('object_name') or '').strip()
+
+    if object_name:
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            raise NodeTreeError('Object not found: ' + object_name)
+        modifier_name = str(target.get('modifier_name') or '').strip()
+        modifier = obj.modifiers.get(modifier_name) if modifier_name else None
+        if modifier is None or modifier.type != 'NODES' or modifier.node_group is None:
+            raise NodeTreeError('Geometry Nodes modifier not found: ' + (modifier_name or object_name))
+        return modifier.node_group
+
+    if group_name:
+        node_tree = bpy.data.node_groups.get(group_name)
+        if node_tree is None:
+            raise NodeTreeError('Node group not found: ' + group_name)
+        return node_tree
+
+    modifier = _active_nodes_modifier(bpy)
+    if modifier is None or modifier.node_group is None:
+        raise NodeTreeError('No active Geometry Nodes tree')
+    return modifier.node_group
+
+
+def export_node_tree_ir(bpy, payload):
+    node_tree = resolve_ir_tree(bpy, payload.get('target'))
+    ir, cached = node_tree_ir(node_tree, force=bool(payload.get('force')))
+    known_hash = str(payload.get('known_hash') or '')
+    if known_hash and known_hash == ir['hash']:
+        return {'hash': ir['hash'], 'cached': cached, 'unchanged': True}
+    return {'hash': ir['hash'], 'cached': cached, 'unchanged': False, 'ir': ir}
@@ -0,0 +1,564 @@
+import collections
+import threading
+
+from .batch import defer_modifier
+
+NODE_ID_PROPERTY = '_aether_node_id'
+GROUP_INPUT_ALIAS = 'group_input'
+GROUP_OUTPUT_ALIAS = 'group_output'
+
+_INDEXES = {}
+_INDEXES_LOCK = threading.RLock()
+
+
+class NodeTreeError(Exception):
+    code = 'NODE_TREE_INVALID'
+    status_code = 400
+
+
+def _pointer(struct):
+    try:
+        return struct.as_pointer()
+    except Exception:
+        return id(struct)
+
+
+def _session_uid(struct):
+    try:
+        return getattr(struct, 'session_uid', None)
+    except Exception:
+        return None
+
+
+def _node_tag(node):
+    try:
+        stored = node.get(NODE_ID_PROPERTY)
+    except Exception:
+        return None
+    return stored if isinstance(stored, str) and stored else None
+
+
+class NodeTreeIndex:
+    def __init__(self, node_tree):
+        self.node_tree = node_tree
+        self.tree_pointer = _pointer(node_tree)
+        self.rebuild()
+
+    def rebuild(self):
+        self.nodes = {}
+        self.ids_by_node = {}
+        self.sockets = {}
+        self.links = {}
+        self.links_by_node = {}
+        self.links_by_input = {}
+        self.rebuilds = getattr(self, 'rebuilds', -1) + 1
+        # Blender reuses freed memory, so a reloaded or undone tree can sit at the same pointer.
+        self.session_uid = _session_uid(self.node_tree)
+        self.node_names = collections.Counter()
+
+        node_count = 0
+        for node in self.node_tree.nodes:
+            node_count += 1
+            self.node_names[node.name] += 1
+            stored_id = _node_tag(node)
+            if stored_id:
+                self._remember(stored_id, node)
+            if node.bl_idname == 'NodeGroupInput':
+                self._remember(GROUP_INPUT_ALIAS, node)
+            if node.bl_idname == 'NodeGroupOutput':
+                self._remember(GROUP_OUTPUT_ALIAS, node)
+
+        link_count = 0
+        for link in self.node_tree.links:
+            link_count += 1
+            self._remember_link(link)
+
+        self.node_count = node_count
+        self.link_count = link_count
+
+    def is_current(self):
+        """Counts catch most edits; the tree's session_uid and node names catch swapped nodes."""
+        try:
+            if self.node_tree.name is None or _session_uid(self.node_tree) != self.session_uid:
+                return False
+            if len(self.node_tree.nodes) != self.node_count or len(self.node_tree.links) != self.link_count:
+                return False
+            return collections.Counter(node.name for node in self.node_tree.nodes) == self.node_names
+        except Exception:
+            return False
+
+    def _remember(self, node_id, node):
+        previous = self.nodes.get(node_id)
+        if previous is not None:
+            owner_ids = self.ids_by_node.get(_pointer(previous))
+            if owner_ids is not None:
+                owner_ids.discard(node_id)
+        self.nodes[node_id] = node
+        self.ids_by_node.setdefault(_pointer(node), set()).add(node_id)
+
+    def _remember_link(self, link):
+        key = (_pointer(link.from_socket), _pointer(link.to_socket))
+        node_pointers = (_pointer(link.from_node), _pointer(link.to_node))
+        self.links[key] = (link, node_pointers)
+        for node_pointer in node_pointers:
+            self.links_by_node.setdefault(node_pointer, set()).add(key)
+        self.links_by_input.setdefault(key[1], set()).add(key)
+        return key
+
+    def _forget_link(self, key):
+        entry = self.links.pop(key, None)
+        if entry is None:
+            return None
+        link, node_pointers = entry
+        for node_pointer in node_pointers:
+            node_keys = self.links_by_node.get(node_pointer)
+            if node_keys is not None:
+                node_keys.discard(key)
+        input_keys = self.links_by_input.get(key[1])
+        if input_keys is not None:
+            input_keys.discard(key)
+        return link
+
+    def _is_live(self, node_id, node):
+        try:
+            if node_id == GROUP_INPUT_ALIAS:
+                return node.bl_idname == 'NodeGroupInput'
+            if node_id == GROUP_OUTPUT_ALIAS:
+                return node.bl_idname == 'NodeGroupOutput'
+            return _node_tag(node) == node_id
+        except Exception:
+            return False
+
+    def __contains__(self, node_id):
+        return self.get(node_id) is not None
+
+    def get(self, node_id):
+        normalized = str(node_id or '').strip()
+        node = self.nodes.get(normalized)
+        if node is not None and not self._is_live(normalized, node):
+            self.rebuild()
+            node = self.nodes.get(normalized)
+        return node
+
+    def items(self):
+        return list(self.nodes.items())
+
+    def track(self, node_id, node):
+        normalized = str(node_id or '').strip()
+        if not normalized:
+            raise NodeTreeError('Node id is required')
+        try:
+            node[NODE_ID_PROPERTY] = normalized
+        except Exception:
+            pass
+        self._remember(normalized, node)
+        return normalized
+
+    def new_node(self, node_id, bl_idname):
+        node = self.node_tree.nodes.new(type=str(bl_idname or ''))
+        self.node_count += 1
+        self.node_names[node.name] += 1
+        self.track(node_id, node)
+        return node
+
+    def remove_node(self, node):
+        pointer = _pointer(node)
+        for node_id in self.ids_by_node.pop(pointer, set()):
+            self.nodes.pop(node_id, None)
+        for key in list(self.links_by_node.pop(pointer, set())):
+            if self._forget_link(key) is not None:
+                self.link_count -= 1
+        for side in (True, False):
+            self.sockets.pop((pointer, side), None)
+        self.node_names[node.name] -= 1
+        if self.node_names[node.name] <= 0:
+            del self.node_names[node.name]
+        self.node_tree.nodes.remove(node)
+        self.node_count -= 1
+
+    def invalidate_sockets(self, node):
+        pointer = _pointer(node)
+        self.sockets.pop((pointer, True), None)
+        self.sockets.pop((pointer, False), None)
+
+    def socket(self, node, socket_name, is_output):
+        collection = node.outputs if is_output else node.inputs
+        cache_key = (_pointer(node), bool(is_output))
+        cached = self.sockets.get(cache_key)
+        if cached is None or cached[0] != len(collection):
+            by_name = {}
+            for candidate in collection:
+                by_name.setdefault(str(candidate.name), candidate)
+            cached = (len(collection), by_name)
+            self.sockets[cache_key] = cached
+        return cached[1].get(str(socket_name or '').strip())
+
+    def is_linked(self, node):
+        return bool(self.links_by_node.get(_pointer(node)))
+
+    def link(self, from_socket, to_socket):
+        key = (_pointer(from_socket), _pointer(to_socket))
+        existing = self.links.get(key)
+        if existing is not None:
+            try:
+                existing[0].from_socket
+                return existing[0]
+            except Exception:
+                self._forget_link(key)
+                self.link_count -= 1
+
+        replaced = 0
+        if not getattr(to_socket, 'is_multi_input', False):
+            for stale_key in list(self.links_by_input.get(key[1], ())):
+                if self._forget_link(stale_key) is not None:
+                    replaced += 1
+        link = self.node_tree.links.new(from_socket, to_socket)
+        self.link_count += 1 - replaced
+        self._remember_link(link)
+        return link
+
+    def unlink(self, from_socket, to_socket):
+        key = (_pointer(from_socket), _pointer(to_socket))
+        link = self._forget_link(key)
+        if link is None:
+            return False
+        self.node_tree.links.remove(link)
+        self.link_count -= 1
+        return True
+
+
+def node_tree_index(node_tree):
+    pointer = _pointer(node_tree)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(pointer)
+        if index is not None and index.node_tree == node_tree and index.is_current():
+            return index
+        index = NodeTreeIndex(node_tree)
+        _INDEXES[pointer] = index
+        return index
+
+
+def drop_node_tree_index(node_tree):
+    with _INDEXES_LOCK:
+        return _INDEXES.pop(_pointer(node_tree), None) is not None
+
+
+def clear_node_tree_indexes():
+    with _INDEXES_LOCK:
+        count = len(_INDEXES)
+        _INDEXES.clear()
+        return count
+
+
+def ensure_group_io_nodes(node_tree):
+    group_input = None
+    group_output = None
+    for node in node_tree.nodes:
+        if node.bl_idname == 'NodeGroupInput' and group_input is None:
+            group_input = node
+        if node.bl_idname == 'NodeGroupOutput' and group_output is None:
+            group_output = node
+    if group_input is None:
+        group_input = node_tree.nodes.new(type='NodeGroupInput')
+    if group_output is None:
+        group_output = node_tree.nodes.new(type='NodeGroupOutput')
+    return group_input, group_output
+
+
+def resolve_target_tree(bpy, target, allow_create=True):
+    object_name = str(target.get('object_name') or '')
+    modifier_name = str(target.get('modifier_name') or '')
+    obj = bpy.data.objects.get(object_name)
+    if obj is None:
+        raise NodeTreeError('Object not found: ' + object_name)
+    modifier = obj.modifiers.get(modifier_name)
+    if modifier is None and allow_create:
+        modifier = obj.modifiers.new(name=modifier_name or 'GeometryNodes', type='NODES')
+    if modifier is None:
+        raise NodeTreeError('Modifier not found: ' + modifier_name)
+    if modifier.type != 'NODES':
+        raise NodeTreeError('Modifier is not Geometry Nodes: ' + modifier_name)
+
+    requested_name = target.get('node_group_name')
+    node_tree = modifier.node_group
+    if node_tree is None:
+        node_tree = bpy.data.node_groups.new(str(requested_name or modifier.name or 'GeometryNodes'), 'GeometryNodeTree')
+        modifier.node_group = node_tree
+    elif requested_name and node_tree.name != str(requested_name):
+        node_tree.name = str(requested_name)
+    if node_tree.bl_idname != 'GeometryNodeTree':
+        raise NodeTreeError('Node group is not GeometryNodeTree: ' + str(node_tree.name))
+    return obj, modifier, node_tree
+
+
+def values_equal(current, desired, tolerance=1e-6):
+    if isinstance(desired, (list, tuple)):
+        try:
+            current_items = tuple(current)
+        except TypeError:
+            return False
+        return len(current_items) == len(desired) and all(
+            values_equal(a, b, tolerance) for a, b in zip(current_items, desired)
+        )
+    if isinstance(desired, bool) or isinstance(current, bool):
+        return current == desired
+    if isinstance(desired, (int, float)) and isinstance(current, (int, float)):
+        return abs(float(current) - float(desired)) <= tolerance * max(1.0, abs(float(desired)))
+    return current == desired
+
+
+def assign_socket_default(socket, value):
+    if not hasattr(socket, 'default_value'):
+        raise NodeTreeError('Socket has no default_value: ' + str(socket.name))
+    try:
+        socket.default_value = value
+    except Exception:
+        if isinstance(value, list):
+            socket.default_value = tuple(value)
+            return
+        raise
+
+
+def _endpoint(spec):
+    spec = spec if isinstance(spec, dict) else {}
+    socket_name = spec.get('socket')
+    if socket_name is None:
+        socket_name = spec.get('socket_name')
+    return str(spec.get('node_id') or '').strip(), str(socket_name or '').strip()
+
+
+def _node_location(spec):
+    location = spec.get('location')
+    if isinstance(location, (list, tuple)) and len(location) >= 2 and None not in location[:2]:
+        return float(location[0]), float(location[1])
+    position = spec.get('position')
+    if isinstance(position, dict) and position.get('x') is not None and position.get('y') is not None:
+        return float(position['x']), float(position['y'])
+    return None
+
+
+def _input_value(value):
+    if isinstance(value, dict) and 'default' in value:
+        return value['default']
+    return value
+
+
+def _desired_nodes(payload):
+    nodes = payload.get('nodes') or {}
+    if isinstance(nodes, dict):
+        entries = []
+        for node_id, spec in nodes.items():
+            spec = dict(spec or {})
+            spec.setdefault('id', node_id)
+            entries.append(spec)
+        nodes = entries
+    desired = {}
+    for spec in nodes:
+        node_id = str((spec or {}).get('id') or (spec or {}).get('node_id') or '').strip()
+        if not node_id:
+            raise NodeTreeError('Desired node is missing an id')
+        desired[node_id] = spec
+    return desired
+
+
+def _resolve_socket(index, node_id, socket_name, is_output):
+    node = index.get(node_id)
+    if node is None:
+        raise NodeTreeError('Node not found: ' + node_id)
+    socket = index.socket(node, socket_name, is_output)
+    if socket is None:
+        raise NodeTreeError('Socket not found: ' + socket_name)
+    return socket
+
+
+def _interface_has_socket(interface, name, in_out):
+    for item in interface.items_tree:
+        if str(getattr(item, 'item_type', '')) == 'SOCKET' and str(item.name) == name and str(getattr(item, 'in_out', '')) == in_out:
+            return item
+    return None
+
+
+def _apply_group_io(node_tree, entries, summary):
+    if not entries:
+        return
+    interface = getattr(node_tree, 'interface', None)
+    if interface is None:
+        raise NodeTreeError('Node group interface is unavailable')
+    for entry in entries:
+        action = str(entry.get('action') or '').strip().lower()
+        name = str(entry.get('socket') or '').strip()
+        in_out = 'INPUT' if action.endswith('_input') else 'OUTPUT'
+        existing = _interface_has_socket(interface, name, in_out)
+        if action in ('add_input', 'add_output'):
+            if existing is None:
+                interface.new_socket(name=name, in_out=in_out, socket_type=str(entry.get('socket_type') or '').strip())
+                summary['groupIoChanged'] += 1
+        elif action in ('remove_input', 'remove_output'):
+            if existing is not None:
+                interface.remove(existing)
+                summary['groupIoChanged'] += 1
+        else:
+            raise NodeTreeError('Unsupported set_group_io action: ' + str(entry.get('action')))
+
+
+def _ensure_single_group_io(node_tree):
+    seen = set()
+    removed = 0
+    for node in list(node_tree.nodes):
+        if node.bl_idname in ('NodeGroupInput', 'NodeGroupOutput'):
+            if node.bl_idname in seen:
+                node_tree.nodes.remove(node)
+                removed += 1
+            seen.add(node.bl_idname)
+    ensure_group_io_nodes(node_tree)
+    return removed
+
+
+def reconcile_node_tree(bpy, payload):
+    target = payload.get('target') or {}
+    allow_create = payload.get('allow_create_modifier')
+    _obj, modifier, node_tree = resolve_target_tree(bpy, target, True if allow_create is None else bool(allow_create))
+    defer_modifier(modifier)
+    ensure_group_io_nodes(node_tree)
+
+    summary = {
+        'created': 0,
+        'recreated': 0,
+        'deleted': 0,
+        'moved': 0,
+        'propertiesChanged': 0,
+        'inputsChanged': 0,
+        'linked': 0,
+        'unlinked': 0,
+        'groupIoChanged': 0,
+        'unchangedNodes': 0,
+    }
+
+    if payload.get('single_group_io'):
+        summary['deleted'] += _ensure_single_group_io(node_tree)
+    index = node_tree_index(node_tree)
+    _apply_group_io(node_tree, payload.get('group_io') or [], summary)
+
+    desired = _desired_nodes(payload)
+    prune = bool(payload.get('prune'))
+
+    stale_ids = [str(node_id or '').strip() for node_id in payload.get('remove_nodes') or []]
+    if prune:
+        stale_ids.extend(
+            node_id for node_id, _node in index.items()
+            if node_id not in (GROUP_INPUT_ALIAS, GROUP_OUTPUT_ALIAS) and node_id not in desired
+        )
+    removed_ids = set()
+    for node_id in stale_ids:
+        if node_id in desired or node_id in (GROUP_INPUT_ALIAS, GROUP_OUTPUT_ALIAS):
+            continue
+        removed_ids.add(node_id)
+        node = index.get(node_id)
+        if node is not None:
+            index.remove_node(node)
+            summary['deleted'] += 1
+
+    for node_id, spec in desired.items():
+        if node_id in (GROUP_INPUT_ALIAS, GROUP_OUTPUT_ALIAS):
+            continue
+        bl_idname = str(spec.get('bl_idname') or '')
+        node = index.get(node_id)
+        node_changed = False
+        if node is not None and bl_idname and node.bl_idname != bl_idname:
+            index.remove_node(node)
+            node = index.new_node(node_id, bl_idname)
+            summary['recreated'] += 1
+            node_changed = True
+        elif node is None:
+            node = index.new_node(node_id, bl_idname)
+            summary['created'] += 1
+            node_changed = True
+
+        location = _node_location(spec)
+        if location is not None and not values_equal(tuple(node.location)[:2], location):
+            node.location = location
+            summary['moved'] += 1
+            node_changed = True
+
+        properties = spec.get('properties') or {}
+        for property_name, value in properties.items():
+            if not values_equal(getattr(node, property_name, None), value):
+                setattr(node, property_name, value)
+                index.invalidate_sockets(node)
+                summary['propertiesChanged'] += 1
+                node_changed = True
+
+        for socket_name, value in (spec.get('inputs') or {}).items():
+            socket = index.socket(node, socket_name, False)
+            if socket is None:
+                raise NodeTreeError('Socket not found: ' + str(socket_name))
+            desired_value = _input_value(value)
+            if not values_equal(getattr(socket, 'default_value', None), desired_value):
+                assign_socket_default(socket, desired_value)
+                summary['inputsChanged'] += 1
+                node_changed = True
+
+        if not node_changed:
+            summary['unchangedNodes'] += 1
+
+    for entry in payload.get('inputs') or []:
+        node_id, socket_name = _endpoint(entry)
+        if node_id in desired and socket_name in ((desired[node_id].get('inputs') or {})):
+            continue
+        # Replayed ops can set an input on a node a later op in the same step removed.
+        if node_id in removed_ids:
+            continue
+        socket = _resolve_socket(index, node_id, socket_name, False)
+        if not values_equal(getattr(socket, 'default_value', None), entry.get('value')):
+            assign_socket_default(socket, entry.get('value'))
+            summary['inputsChanged'] += 1
+
+    for entry in payload.get('remove_links') or []:
+        from_id, from_socket_name = _endpoint(entry.get('from'))
+        to_id, to_socket_name = _endpoint(entry.get('to'))
+        if index.get(from_id) is None or index.get(to_id) is None:
+            continue
+        if index.unlink(
+            _resolve_socket(index, from_id, from_socket_name, True),
+            _resolve_socket(index, to_id, to_socket_name, False),
+        ):
+            summary['unlinked'] += 1
+
+    desired_links = []
+    for entry in payload.get('links') or []:
+        from_id, from_socket_name = _endpoint(entry.get('from'))
+        to_id, to_socket_name = _endpoint(entry.get('to'))
+        desired_links.append((
+            _resolve_socket(index, from_id, from_socket_name, True),
+            _resolve_socket(index, to_id, to_socket_name, False),
+        ))
+    desired_keys = {(_pointer(a), _pointer(b)) for a, b in desired_links}
+
+    if prune:
+        managed = set(index.ids_by_node.keys())
+        for key, (link, node_pointers) in list(index.links.items()):
+            if key not in desired_keys and node_pointers[0] in managed and node_pointers[1] in managed:
+                index.unlink(link.from_socket, link.to_socket)
+                summary['unlinked'] += 1
+
+    for from_socket, to_socket in desired_links:
+        if (_pointer(from_socket), _pointer(to_socket)) not in index.links:
+            index.link(from_socket, to_socket)
+            summary['linked'] += 1
+
+    if payload.get('cleanup_unused'):
+        for node_id, node in index.items():
+            if node_id in (GROUP_INPUT_ALIAS, GROUP_OUTPUT_ALIAS) or index.get(node_id) is None:
+                continue
+            if not index.is_linked(node):
+                index.remove_node(node)
+                summary['deleted'] += 1
+
+    changed = any(value for key, value in summary.items() if key != 'unchangedNodes')
+    return {
+        'nodeTree': node_tree.name,
+        'changed': changed,
+        'summary': summary,
+        'nodeCount': index.node_count,
+        'linkCount': index.link_count,
+    }
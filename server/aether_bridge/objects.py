@@ -0,0 +1,154 @@
+import time
+
+MAX_BULK_OBJECTS = 200000
+IDENTITY_SCALE = (1.0, 1.0, 1.0)
+
+
+class ObjectBatchError(Exception):
+    code = 'OBJECT_BATCH_INVALID'
+    status_code = 400
+
+
+def _rows(values, width, count, label):
+    """Accept either nested rows or one flat list and return `count` tuples of `width` floats."""
+    if values is None:
+        return None
+    if len(values) == count * width and (not values or not isinstance(values[0], (list, tuple))):
+        flat = values
+    else:
+        if len(values) != count:
+            raise ObjectBatchError(f'{label} must have {count} entries, got {len(values)}')
+        flat = []
+        for row in values:
+            if isinstance(row, (list, tuple)) and row and isinstance(row[0], (list, tuple)):
+                for item in row:
+                    flat.extend(item)
+            else:
+                flat.extend(row)
+        if len(flat) != count * width:
+            raise ObjectBatchError(f'{label} entries must each have {width} values')
+    try:
+        floats = [float(value) for value in flat]
+    except (TypeError, ValueError) as exc:
+        raise ObjectBatchError(f'{label} must contain only numbers') from exc
+    return [tuple(floats[offset:offset + width]) for offset in range(0, count * width, width)]
+
+
+def _check_limit(count):
+    if count > MAX_BULK_OBJECTS:
+        raise ObjectBatchError(f'create_objects is limited to {MAX_BULK_OBJECTS} objects per call')
+
+
+def _names(payload):
+    names = payload.get('names')
+    if isinstance(names, list):
+        _check_limit(len(names))
+        return [str(name) for name in names]
+    count = payload.get('count')
+    if not isinstance(count, int) or isinstance(count, bool) or count < 0:
+        raise ObjectBatchError('create_objects requires names or a non-negative integer count')
+    _check_limit(count)
+    prefix = str(payload.get('name_prefix') or 'Object')
+    return [f'{prefix}.{position:05d}' for position in range(count)]
+
+
+def _per_object(value, count, label):
+    if isinstance(value, list):
+        if len(value) != count:
+            raise ObjectBatchError(f'{label} must have {count} entries, got {len(value)}')
+        return value
+    return [value] * count
+
+
+def _lookup(collection, name, label, cache):
+    if name in (None, ''):
+        return None
+    key = str(name)
+    if key not in cache:
+        found = collection.get(key)
+        if found is None:
+            raise ObjectBatchError(f'{label} not found: {key}')
+        cache[key] = found
+    return cache[key]
+
+
+def _target_collection(bpy, name):
+    if not name:
+        return bpy.context.scene.collection
+    collection = bpy.data.collections.get(str(name))
+    if collection is None:
+        collection = bpy.data.collections.new(str(name))
+        bpy.context.scene.collection.children.link(collection)
+    return collection
+
+
+def create_objects(bpy, payload):
+    """Create many objects or collection instances through the data API and link them in one pass.
+
+    Every argument and datablock reference is checked before the first object is created, so a
+    bad entry leaves the scene untouched.
+    """
+    started = time.perf_counter()
+    names = _names(payload)
+    count = len(names)
+
+    instance_refs = payload.get('instance_collection')
+    data_refs = _per_object(payload.get('data'), count, 'data')
+    instance_refs = _per_object(instance_refs, count, 'instance_collection')
+    copy_data = bool(payload.get('copy_data'))
+    data_kind = str(payload.get('data_type') or 'meshes')
+    data_source = getattr(bpy.data, data_kind, None)
+    if data_source is None:
+        raise ObjectBatchError('Unsupported data_type: ' + data_kind)
+
+    matrices = _rows(payload.get('matrices'), 16, count, 'matrices')
+    locations = _rows(payload.get('locations'), 3, count, 'locations')
+    rotations = _rows(payload.get('rotations'), 3, count, 'rotations')
+    scales = _rows(payload.get('scales'), 3, count, 'scales')
+    if matrices is not None and (locations or rotations or scales):
+        raise ObjectBatchError('Pass either matrices or locations/rotations/scales, not both')
+
+    Matrix = None
+    if matrices is not None:
+        from mathutils import Matrix
+
+    data_cache = {}
+    instance_cache = {}
+    datas = [_lookup(data_source, ref, 'data', data_cache) for ref in data_refs]
+    instances = [_lookup(bpy.data.collections, ref, 'instance_collection', instance_cache) for ref in instance_refs]
+
+    collection = _target_collection(bpy, payload.get('collection'))
+    link = collection.objects.link
+    new_object = bpy.data.objects.new
+    created = []
+
+    for position, name in enumerate(names):
+        data = datas[position]
+        if data is not None and copy_data:
+            data = data.copy()
+        obj = new_object(name, data)
+        instance = instances[position]
+        if instance is not None:
+            obj.instance_type = 'COLLECTION'
+            obj.instance_collection = instance
+        if matrices is not None:
+            row = matrices[position]
+            obj.matrix_world = Matrix((row[0:4], row[4:8], row[8:12], row[12:16]))
+        else:
+            if locations is not None:
+                obj.location = locations[position]
+            if rotations is not None:
+                obj.rotation_euler = rotations[position]
+            if scales is not None and scales[position] != IDENTITY_SCALE:
+                obj.scale = scales[position]
+        link(obj)
+        created.append(obj.name)
+
+    result = {
+        'collection': collection.name,
+        'created': len(created),
+        'elapsedMs': round((time.perf_counter() - started) * 1000.0, 3),
+    }
+    if payload.get('return_names', True):
+        result['names'] = created
+    return result
@@ -0,0 +1,82 @@
+"""Moves large exec_python stdout/stderr out of RPC responses and into artifact files.
+
+Output above the inline limit is written to the run's artifact directory and the response
+keeps only a head/tail preview plus `{path, bytes, sha256}`, so RPC replies, run events and
+runs.json stay small when scripts dump diagnostics.
+"""
+import hashlib
+import itertools
+import os
+import tempfile
+
+DEFAULT_INLINE_BYTES = 64 * 1024
+DEFAULT_PREVIEW_CHARS = 1024
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+class OutputSpiller:
+    def __init__(self, allowed_root='', inline_bytes=DEFAULT_INLINE_BYTES, preview_chars=DEFAULT_PREVIEW_CHARS):
+        self.allowed_root = os.path.realpath(allowed_root) if allowed_root else ''
+        self.inline_bytes = max(0, int(inline_bytes))
+        self.preview_chars = max(0, int(preview_chars))
+        self.sequence = itertools.count(1)
+        self.fallback_dir = os.path.join(tempfile.gettempdir(), 'aether_rpc_output', str(os.getpid()))
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            allowed_root=os.environ.get('AETHER_RPC_OUTPUT_ROOT', ''),
+            inline_bytes=_env_int('AETHER_RPC_OUTPUT_INLINE_BYTES', DEFAULT_INLINE_BYTES),
+        )
+
+    @property
+    def enabled(self):
+        return self.inline_bytes > 0
+
+    def _directory(self, output_dir):
+        """The caller's artifact dir when it is inside the allowed root; otherwise a per-process temp dir.
+
+        Without an allowed root no caller directory is trusted, so the bridge never writes where a
+        request merely asks it to.
+        """
+        if output_dir and self.allowed_root:
+            real_dir = os.path.realpath(str(output_dir))
+            try:
+                if os.path.commonpath([real_dir, self.allowed_root]) == self.allowed_root:
+                    return real_dir
+            except ValueError:
+                pass
+        return self.fallback_dir
+
+    def _preview(self, text, size, path):
+        head = text[:self.preview_chars]
+        tail = text[-self.preview_chars:] if self.preview_chars else ''
+        return f'{head}\n... [{size} bytes; full output in {path}] ...\n{tail}'
+
+    def spill(self, streams, output_dir=None):
+        """Replace oversized entries of `streams` ({'stdout': text, ...}) in place; returns the spill records."""
+        if not self.enabled:
+            return {}
+        records = {}
+        for stream, text in streams.items():
+            encoded = text.encode('utf-8', 'replace')
+            if len(encoded) <= self.inline_bytes:
+                continue
+            directory = self._directory(output_dir)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f'exec_{os.getpid()}_{next(self.sequence):05d}.{stream}.log')
+            with open(path, 'wb') as handle:
+                handle.write(encoded)
+            records[f'{stream}Spill'] = {
+                'path': path,
+                'bytes': len(encoded),
+                'sha256': hashlib.sha256(encoded).hexdigest(),
+            }
+            streams[stream] = self._preview(text, len(encoded), path)
+        return records
@@ -0,0 +1,214 @@
+"""SAF-004 safe-mode source policy, shared by the bridge and the out-of-Blender linter.
+
+Run as `python -m aether_bridge.safe_policy FILE...` to lint files, `--stdin` to lint a JSON
+array of snippets, or `--serve` for a long-running JSON-lines worker:
+
+    request:  {"id": 1, "snippets": ["import os", "x = 1"]}
+    response: {"id": 1, "verdicts": [{"hash": "...", "ok": false, "code": "SAF_004_BLOCKED_IMPORT", ...}, ...]}
+"""
+import json
+import sys
+from collections import OrderedDict
+
+SAF004_BLOCKED_MODULE_PREFIXES = (
+    'builtins',
+    'ctypes',
+    'http',
+    'importlib',
+    'inspect',
+    'multiprocessing',
+    'os',
+    'pathlib',
+    'pickle',
+    'resource',
+    'shutil',
+    'signal',
+    'site',
+    'socket',
+    'subprocess',
+    'sys',
+    'tempfile',
+    'threading',
+    'urllib',
+    'venv',
+    'zipfile',
+)
+
+SAF004_BLOCKED_BUILTINS = (
+    '__import__',
+    'breakpoint',
+    'compile',
+    'eval',
+    'exec',
+    'input',
+    'open',
+)
+
+BLOCKED_IMPORT = 'SAF_004_BLOCKED_IMPORT'
+BLOCKED_BUILTIN = 'SAF_004_BLOCKED_BUILTIN'
+SYNTAX_ERROR = 'PYTHON_SYNTAX_ERROR'
+DEFAULT_CACHE_ENTRIES = 4096
+
+
+def is_blocked_module(module_name):
+    if not module_name:
+        return False
+    normalized = str(module_name).strip().lower()
+    for prefix in SAF004_BLOCKED_MODULE_PREFIXES:
+        if normalized == prefix or normalized.startswith(prefix + '.'):
+            return True
+    return False
+
+
+def blocked_import_message(name):
+    return f'SAF-004 blocked module import in safe mode: {name}'
+
+
+def blocked_builtin_message(name):
+    return f'SAF-004 blocked builtin in safe mode: {name}'
+
+
+def _violation(code, message, name, node):
+    return {
+        'code': code,
+        'message': message,
+        'name': name,
+        'line': getattr(node, 'lineno', None),
+        'col': getattr(node, 'col_offset', None),
+    }
+
+
+def find_violation(code):
+    """First SAF-004 violation in `code` (ast.walk order), or None. Raises SyntaxError."""
+    import ast
+
+    tree = ast.parse(code, mode='exec')
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imported = str(alias.name or '').strip()
+                if is_blocked_module(imported):
+                    return _violation(BLOCKED_IMPORT, blocked_import_message(imported), imported, node)
+        elif isinstance(node, ast.ImportFrom):
+            imported_from = str(node.module or '').strip()
+            if is_blocked_module(imported_from):
+                return _violation(BLOCKED_IMPORT, blocked_import_message(imported_from), imported_from, node)
+        elif isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id in SAF004_BLOCKED_BUILTINS:
+                return _violation(BLOCKED_BUILTIN, blocked_builtin_message(func.id), func.id, node)
+    return None
+
+
+def code_hash(code):
+    import hashlib
+
+    return hashlib.sha256(str(code).encode('utf-8')).hexdigest()
+
+
+def lint_source(code):
+    """Verdict dict for one snippet; syntax errors are reported rather than raised."""
+    verdict = {'hash': code_hash(code), 'ok': True}
+    if not isinstance(code, str) or not code.strip():
+        verdict.update(ok=False, code=SYNTAX_ERROR, message='code must be a non-empty string')
+        return verdict
+    try:
+        violation = find_violation(code)
+    except SyntaxError as exc:
+        verdict.update(ok=False, code=SYNTAX_ERROR, message=str(exc.msg or exc), line=exc.lineno, col=exc.offset)
+        return verdict
+    except (ValueError, RecursionError) as exc:
+        verdict.update(ok=False, code=SYNTAX_ERROR, message=str(exc))
+        return verdict
+    if violation:
+        verdict['ok'] = False
+        verdict.update(violation)
+    return verdict
+
+
+class VerdictCache:
+    """LRU of lint verdicts keyed by the SHA-256 of the snippet."""
+
+    def __init__(self, max_entries=DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max(1, int(max_entries))
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lint(self, code):
+        key = code_hash(code) if isinstance(code, str) else None
+        cached = self.entries.get(key) if key else None
+        if cached is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return dict(cached, cached=True)
+        self.misses += 1
+        verdict = lint_source(code)
+        if key:
+            self.entries[key] = verdict
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return dict(verdict, cached=False)
+
+    def lint_many(self, snippets):
+        return [self.lint(code) for code in snippets]
+
+    def stats(self):
+        return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+
+def serve(stdin, stdout, cache):
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            snippets = request.get('snippets')
+            if not isinstance(snippets, list):
+                raise ValueError('snippets must be an array')
+            response = {'id': request_id, 'verdicts': cache.lint_many(snippets), 'cache': cache.stats()}
+        except Exception as exc:
+            response = {'id': request_id, 'error': str(exc)}
+        stdout.write(json.dumps(response, separators=(',', ':')) + '\n')
+        stdout.flush()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Lint Python snippets against the SAF-004 safe-mode policy.')
+    parser.add_argument('files', nargs='*', help='Python files to lint.')
+    parser.add_argument('--stdin', action='store_true', help='Read a JSON array of snippets from stdin.')
+    parser.add_argument('--serve', action='store_true', help='Answer JSON-lines lint requests on stdin until EOF.')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_ENTRIES)
+    args = parser.parse_args(argv)
+
+    cache = VerdictCache(args.cache_size)
+    if args.serve:
+        serve(sys.stdin, sys.stdout, cache)
+        return 0
+
+    if args.stdin:
+        snippets = json.load(sys.stdin)
+        if not isinstance(snippets, list):
+            parser.error('--stdin expects a JSON array of strings')
+        verdicts = cache.lint_many(snippets)
+    else:
+        if not args.files:
+            parser.error('pass files to lint, --stdin or --serve')
+        verdicts = []
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8') as handle:
+                verdict = cache.lint(handle.read())
+            verdict['path'] = path
+            verdicts.append(verdict)
+
+    print(json.dumps({'ok': all(verdict['ok'] for verdict in verdicts), 'verdicts': verdicts}, indent=2))
+    return 0 if all(verdict['ok'] for verdict in verdicts) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
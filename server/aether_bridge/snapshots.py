@@ -0,0 +1,218 @@
+"""Periodic .blend snapshots so a crashed session can be relaunched from its last checkpoint.
+
+The plan runner reports each completed step with the `snapshot_step` command; every N steps
+(or once the bridge has been idle for a while after a step) the scene is saved as a compressed
+copy and `latest.json` records which step it reflects. The session manager relaunches Blender
+on that file and the run resumes at the following step.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+MANIFEST_NAME = 'latest.json'
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+def save_copy(filepath):
+    """Write the open scene to `filepath` without changing the session's own file path."""
+    import bpy
+
+    bpy.ops.wm.save_as_mainfile(filepath=filepath, copy=True, compress=True, check_existing=False)
+
+
+class SnapshotManager:
+    def __init__(self, directory='', every_steps=0, idle_seconds=0.0, keep=2, saver=None):
+        self.directory = os.path.abspath(directory) if directory else ''
+        self.every_steps = max(0, int(every_steps))
+        self.idle_seconds = max(0.0, float(idle_seconds))
+        self.keep = max(1, int(keep))
+        self.saver = saver or save_copy
+        # Held while saving; RPCs wait on it before they start so a save never sees half a step.
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.last_activity = time.monotonic()
+        self.last_step = None
+        self.steps_since = 0
+        # Set by any RPC after the last reported step: the scene then no longer matches that step.
+        self.dirty = False
+        self.latest = self._read_manifest()
+        self.sequence = self.latest['sequence'] if self.latest else 0
+        self.saved = 0
+        self.failed = 0
+        self.last_error = None
+        self.idle_thread = None
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            directory=os.environ.get('AETHER_RPC_SNAPSHOT_DIR', ''),
+            every_steps=_env_int('AETHER_RPC_SNAPSHOT_EVERY', 0),
+            idle_seconds=_env_float('AETHER_RPC_SNAPSHOT_IDLE_S', 0.0),
+            keep=_env_int('AETHER_RPC_SNAPSHOT_KEEP', 2),
+        )
+
+    @property
+    def enabled(self):
+        return bool(self.directory) and (self.every_steps > 0 or self.idle_seconds > 0)
+
+    def _manifest_path(self):
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def _read_manifest(self):
+        if not self.directory:
+            return None
+        try:
+            with open(self._manifest_path(), 'r', encoding='utf-8') as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        return manifest if isinstance(manifest, dict) and isinstance(manifest.get('sequence'), int) else None
+
+    @contextlib.contextmanager
+    def activity(self, mutating=True):
+        """Wrap one RPC: waits out a running save and keeps idle snapshots from starting."""
+        with self.lock:
+            self.in_flight += 1
+            if mutating:
+                self.dirty = True
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+                self.last_activity = time.monotonic()
+
+    def step_completed(self, step_id, step_index=None, force=False, run_id=None):
+        """Record `step_id` of `run_id` as the last completed step; saves when N steps have accumulated."""
+        if not self.enabled:
+            return {'enabled': False, 'saved': False}
+        self.last_step = {
+            'runId': str(run_id or '') or None,
+            'stepId': str(step_id or '') or None,
+            'stepIndex': step_index,
+        }
+        self.steps_since += 1
+        self.dirty = False
+        saved = None
+        if force or (self.every_steps > 0 and self.steps_since >= self.every_steps):
+            # Runs inside the reporting RPC, which already owns the scene.
+            saved = self._write_snapshot('step')
+        return {
+            'enabled': True,
+            'saved': saved is not None,
+            'snapshot': saved,
+            'stepsSinceSnapshot': self.steps_since,
+            'error': self.last_error if saved is None and self.failed else None,
+        }
+
+    def _idle_due(self):
+        return (
+            self.enabled
+            and self.idle_seconds > 0
+            and self.steps_since > 0
+            and not self.dirty
+            and self.in_flight == 0
+            and time.monotonic() - self.last_activity >= self.idle_seconds
+        )
+
+    def idle_tick(self):
+        """Save when steps completed since the last snapshot and the bridge has since been idle."""
+        with self.lock:
+            return self._write_snapshot('idle') if self._idle_due() else None
+
+    def _write_snapshot(self, reason):
+        os.makedirs(self.directory, exist_ok=True)
+        sequence = self.sequence + 1
+        filepath = os.path.join(self.directory, f'snapshot_{sequence:05d}.blend')
+        started = time.perf_counter()
+        try:
+            self.saver(filepath)
+            size = os.path.getsize(filepath)
+        except Exception as exc:
+            self.failed += 1
+            self.last_error = str(exc)
+            return None
+        manifest = {
+            'sequence': sequence,
+            'path': filepath,
+            'runId': (self.last_step or {}).get('runId'),
+            'stepId': (self.last_step or {}).get('stepId'),
+            'stepIndex': (self.last_step or {}).get('stepIndex'),
+            'reason': reason,
+            'bytes': size,
+            'ms': round((time.perf_counter() - started) * 1000.0, 3),
+            'savedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        }
+        temp_path = f'{self._manifest_path()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            json.dump(manifest, handle)
+        os.replace(temp_path, self._manifest_path())
+        self.sequence = sequence
+        self.latest = manifest
+        self.steps_since = 0
+        self.saved += 1
+        self.last_error = None
+        self._prune()
+        return manifest
+
+    def _prune(self):
+        snapshots = sorted(
+            name for name in os.listdir(self.directory) if name.startswith('snapshot_') and name.endswith('.blend')
+        )
+        for name in snapshots[:-self.keep]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def start_idle_thread(self, dispatch=None):
+        """Poll for idle snapshots; `dispatch` runs the save elsewhere (e.g. on Blender's main thread)."""
+        if not self.enabled or self.idle_seconds <= 0 or self.idle_thread is not None:
+            return None
+        interval = min(1.0, max(0.05, self.idle_seconds / 4.0))
+
+        def loop():
+            while True:
+                time.sleep(interval)
+                if not self._idle_due():
+                    continue
+                try:
+                    if dispatch is None:
+                        self.idle_tick()
+                    else:
+                        dispatch(self.idle_tick)
+                except Exception as exc:
+                    self.last_error = str(exc)
+
+        self.idle_thread = threading.Thread(target=loop, name='aether-rpc-snapshots', daemon=True)
+        self.idle_thread.start()
+        return self.idle_thread
+
+    def report(self):
+        return {
+            'enabled': self.enabled,
+            'directory': self.directory or None,
+            'everySteps': self.every_steps,
+            'idleSeconds': self.idle_seconds,
+            'stepsSinceSnapshot': self.steps_since,
+            'lastStep': self.last_step,
+            'latest': self.latest,
+            'saved': self.saved,
+            'failed': self.failed,
+            'lastError': self.last_error,
+        }
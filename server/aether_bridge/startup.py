@@ -0,0 +1,80 @@
+import json
+import os
+import sys
+import time
+
+
+def process_started_at():
+    """Wall-clock time the current process started, where the platform exposes it."""
+    try:
+        with open('/proc/self/stat', 'r', encoding='ascii') as handle:
+            # Field 22 (starttime) follows the parenthesised command name, which may contain spaces.
+            fields = handle.read().rsplit(')', 1)[1].split()
+        start_ticks = int(fields[19])
+        with open('/proc/stat', 'r', encoding='ascii') as handle:
+            boot_time = next(int(line.split()[1]) for line in handle if line.startswith('btime '))
+        return boot_time + start_ticks / os.sysconf('SC_CLK_TCK')
+    except Exception:
+        pass
+    if sys.platform == 'win32':
+        try:
+            return _windows_process_started_at()
+        except Exception:
+            return None
+    return None
+
+
+def _windows_process_started_at():
+    import ctypes
+    from ctypes import wintypes
+
+    creation, exited, kernel, user = (wintypes.FILETIME() for _ in range(4))
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.kernel32.GetProcessTimes(
+        handle, ctypes.byref(creation), ctypes.byref(exited), ctypes.byref(kernel), ctypes.byref(user)
+    ):
+        return None
+    ticks = (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+    # FILETIME counts 100ns intervals since 1601-01-01.
+    return ticks / 1e7 - 11644473600
+
+
+class StartupTimeline:
+    """Wall-clock phase marks reported as millisecond offsets from process start."""
+
+    def __init__(self, origin=None):
+        self.process_started_at = process_started_at() if origin is None else origin
+        self.marks = {}
+
+    def mark(self, phase, at=None):
+        self.marks[phase] = time.time() if at is None else at
+
+    def report(self):
+        origin = self.process_started_at
+        if origin is None:
+            origin = min(self.marks.values()) if self.marks else time.time()
+        return {
+            'processStartedAt': self.process_started_at,
+            'phasesMs': {
+                phase: round((at - origin) * 1000.0, 3)
+                for phase, at in sorted(self.marks.items(), key=lambda item: item[1])
+            },
+        }
+
+
+def signal_ready(payload, fd=None):
+    """Write one JSON line to the readiness pipe named by AETHER_RPC_READY_FD and close it."""
+    if fd is None:
+        raw = str(os.environ.get('AETHER_RPC_READY_FD', '') or '').strip()
+        if not raw:
+            return False
+        try:
+            fd = int(raw)
+        except ValueError:
+            return False
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', closefd=True) as handle:
+            handle.write(json.dumps(payload, separators=(',', ':')) + '\n')
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,256 @@
+"""Registered template .blend files, loaded once per session and instantiated by link or copy.
+
+Registering a template appends (or links) its collections, objects, materials and node groups
+into the session and keeps them alive with fake users. Instantiating then only links those
+datablocks into a scene, or copies the objects, which replaces re-running scripted scene setup.
+"""
+import os
+import time
+
+TEMPLATE_DATA_KINDS = ('collections', 'objects', 'meshes', 'materials', 'node_groups')
+INSTANTIATE_MODES = ('link', 'copy')
+
+
+class TemplateError(Exception):
+    code = 'TEMPLATE_INVALID'
+    status_code = 400
+
+
+class TemplateNotFoundError(TemplateError):
+    code = 'TEMPLATE_NOT_FOUND'
+    status_code = 404
+
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000.0, 3)
+
+
+def _activate_scene(bpy, scene):
+    # Background Blender has no windows; the caller gets `activated: False` and must target the scene by name.
+    window = getattr(bpy.context, 'window', None)
+    if window is None:
+        window_manager = getattr(bpy.context, 'window_manager', None)
+        windows = list(getattr(window_manager, 'windows', None) or [])
+        window = windows[0] if windows else None
+    if window is None:
+        return False
+    window.scene = scene
+    return True
+
+
+def _alive(collection, block):
+    """True while `block` is still in `collection`; removed datablocks raise ReferenceError in Blender."""
+    try:
+        name = block.name
+        library = block.library
+    except ReferenceError:
+        return False
+    found = collection.get(name) if library is None else collection.get((name, library.filepath))
+    return found is not None and found == block
+
+
+class TemplateLibrary:
+    def __init__(self, allowed_root=''):
+        self.allowed_root = os.path.realpath(allowed_root) if allowed_root else ''
+        self.templates = {}
+
+    @classmethod
+    def from_env(cls):
+        return cls(os.environ.get('AETHER_TEMPLATE_ROOT', ''))
+
+    def _resolve_path(self, filepath):
+        filepath = str(filepath or '').strip()
+        if not filepath:
+            raise TemplateError('template path is required')
+        if not os.path.isabs(filepath) and self.allowed_root:
+            filepath = os.path.join(self.allowed_root, filepath)
+        real_path = os.path.realpath(filepath)
+        if self.allowed_root:
+            try:
+                inside = os.path.commonpath([real_path, self.allowed_root]) == self.allowed_root
+            except ValueError:
+                inside = False
+            if not inside:
+                raise TemplateError(f'template path is outside the template root: {real_path}')
+        if not real_path.lower().endswith('.blend'):
+            raise TemplateError(f'template must be a .blend file: {real_path}')
+        if not os.path.isfile(real_path):
+            raise TemplateNotFoundError(f'template file not found: {real_path}')
+        return real_path
+
+    def _entry(self, name):
+        entry = self.templates.get(str(name or '').strip())
+        if entry is None:
+            raise TemplateNotFoundError(f'template is not registered: {name}')
+        return entry
+
+    def register(self, bpy, name, filepath, link=False, preload=True):
+        """Register (or refresh) a template; re-registering an unchanged file keeps it loaded."""
+        name = str(name or '').strip()
+        if not name:
+            raise TemplateError('template name is required')
+        real_path = self._resolve_path(filepath)
+        mtime = os.path.getmtime(real_path)
+        previous = self.templates.get(name)
+        if previous and (previous['path'], previous['mtime'], previous['link']) == (real_path, mtime, bool(link)):
+            entry = previous
+        else:
+            if previous:
+                self._release(previous)
+            entry = {
+                'name': name,
+                'path': real_path,
+                'mtime': mtime,
+                'bytes': os.path.getsize(real_path),
+                'link': bool(link),
+                'blocks': None,
+                'loads': 0,
+                'loadMs': None,
+                'instantiations': 0,
+            }
+            self.templates[name] = entry
+        cache = self._ensure_loaded(bpy, entry) if preload else None
+        return dict(self.describe(entry), cache=cache)
+
+    def _loaded(self, bpy, entry):
+        blocks = entry['blocks']
+        if blocks is None:
+            return False
+        return all(
+            _alive(getattr(bpy.data, kind), block) for kind, kind_blocks in blocks.items() for block in kind_blocks
+        )
+
+    def _ensure_loaded(self, bpy, entry):
+        """'hit' when the template's datablocks are still in the session, else load them ('miss')."""
+        if self._loaded(bpy, entry):
+            return 'hit'
+        started = time.perf_counter()
+        with bpy.data.libraries.load(entry['path'], link=entry['link']) as (data_from, data_to):
+            for kind in TEMPLATE_DATA_KINDS:
+                setattr(data_to, kind, list(getattr(data_from, kind, []) or []))
+        blocks = {}
+        for kind in TEMPLATE_DATA_KINDS:
+            blocks[kind] = [block for block in getattr(data_to, kind, []) or [] if block is not None]
+            if not entry['link']:
+                # Appended datablocks are orphans until instantiated; keep orphan purges off them.
+                for block in blocks[kind]:
+                    block.use_fake_user = True
+        entry['blocks'] = blocks
+        entry['loads'] += 1
+        entry['loadMs'] = _elapsed_ms(started)
+        return 'miss'
+
+    def _release(self, entry):
+        """Let a replaced template's appended datablocks be purged once nothing uses them."""
+        if entry['link'] or not entry['blocks']:
+            return
+        for kind_blocks in entry['blocks'].values():
+            for block in kind_blocks:
+                try:
+                    block.use_fake_user = False
+                except ReferenceError:
+                    pass
+
+    def describe(self, entry):
+        blocks = entry['blocks'] or {}
+        return {
+            'name': entry['name'],
+            'path': entry['path'],
+            'bytes': entry['bytes'],
+            'link': entry['link'],
+            'loaded': entry['blocks'] is not None,
+            'loads': entry['loads'],
+            'loadMs': entry['loadMs'],
+            'instantiations': entry['instantiations'],
+            'datablocks': {kind: len(kind_blocks) for kind, kind_blocks in blocks.items()},
+        }
+
+    def list(self):
+        return [self.describe(entry) for entry in self.templates.values()]
+
+    def instantiate(self, bpy, name, mode='link', scene=None, into_current_scene=False, copy_data=False):
+        """Put a template's collections and loose objects into a new (or the current) scene.
+
+        `link` shares the template's datablocks; `copy` duplicates its objects (and, with
+        `copy_data`, their data) so the result can be edited without touching the template.
+        A new scene is shown in a window when one exists; `activated` says whether it was.
+        """
+        started = time.perf_counter()
+        mode = str(mode or 'link').strip().lower()
+        if mode not in INSTANTIATE_MODES:
+            raise TemplateError(f'mode must be one of {", ".join(INSTANTIATE_MODES)}')
+        entry = self._entry(name)
+        cache = self._ensure_loaded(bpy, entry)
+        if entry['link'] and mode == 'copy' and copy_data:
+            raise TemplateError('copy_data needs an appended template; linked data is read-only')
+
+        if into_current_scene:
+            target_scene = bpy.context.scene
+            activated = True
+        else:
+            target_scene = bpy.data.scenes.new(str(scene or entry['name']))
+            activated = _activate_scene(bpy, target_scene)
+
+        collections = entry['blocks']['collections']
+        child_pointers = {child.as_pointer() for parent in collections for child in parent.children}
+        roots = [collection for collection in collections if collection.as_pointer() not in child_pointers]
+        template_pointers = {collection.as_pointer() for collection in collections}
+        loose = [
+            obj for obj in entry['blocks']['objects']
+            if not any(owner.as_pointer() in template_pointers for owner in obj.users_collection)
+        ]
+
+        target = target_scene.collection
+        if mode == 'link':
+            linked = {child.as_pointer() for child in target.children}
+            for collection in roots:
+                if collection.as_pointer() not in linked:
+                    target.children.link(collection)
+            present = {obj.as_pointer() for obj in target.objects}
+            for obj in loose:
+                if obj.as_pointer() not in present:
+                    target.objects.link(obj)
+            created_collections = [collection.name for collection in roots]
+            object_count = sum(len(collection.all_objects) for collection in roots) + len(loose)
+        else:
+            copies = {}
+            created_collections = [
+                self._copy_collection(bpy, collection, target, copies, copy_data) for collection in roots
+            ]
+            for obj in loose:
+                target.objects.link(self._copy_object(obj, copies, copy_data))
+            # Re-point parents inside the template at their copies rather than the originals.
+            for original, duplicate in copies.values():
+                parent = original.parent
+                if parent is not None and parent.as_pointer() in copies:
+                    duplicate.parent = copies[parent.as_pointer()][1]
+            object_count = len(copies)
+
+        entry['instantiations'] += 1
+        return {
+            'template': entry['name'],
+            'scene': target_scene.name,
+            'activated': activated,
+            'mode': mode,
+            'cache': cache,
+            'loadMs': entry['loadMs'] if cache == 'miss' else 0.0,
+            'collections': created_collections,
+            'objects': object_count,
+            'elapsedMs': _elapsed_ms(started),
+        }
+
+    def _copy_object(self, obj, copies, copy_data):
+        duplicate = obj.copy()
+        if copy_data and duplicate.data is not None:
+            duplicate.data = duplicate.data.copy()
+        copies[obj.as_pointer()] = (obj, duplicate)
+        return duplicate
+
+    def _copy_collection(self, bpy, collection, parent, copies, copy_data):
+        duplicate = bpy.data.collections.new(collection.name)
+        parent.children.link(duplicate)
+        for obj in collection.objects:
+            duplicate.objects.link(self._copy_object(obj, copies, copy_data))
+        for child in collection.children:
+            self._copy_collection(bpy, child, duplicate, copies, copy_data)
+        return duplicate.name
@@ -0,0 +1,130 @@
+"""W3C trace-context child spans for one RPC, returned to the caller inside the response.
+
+The transport creates a `RequestTrace` when the request carries a sampled `traceparent`, records
+decode/queue-wait itself, and appends the report while encoding. Code running the command adds
+spans through `span()`, which is a no-op when the current request is not traced.
+"""
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+
+TRACEPARENT_PATTERN = re.compile(r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+_CURRENT = threading.local()
+
+
+def new_span_id():
+    return os.urandom(8).hex()
+
+
+def parse_traceparent(value):
+    """(trace_id, parent_id, sampled) for a valid version-00 header, else None."""
+    match = TRACEPARENT_PATTERN.match(str(value or '').strip().lower())
+    if not match:
+        return None
+    trace_id, parent_id, flags = match.groups()
+    if trace_id == '0' * 32 or parent_id == '0' * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 0x01)
+
+
+class RequestTrace:
+    def __init__(self, trace_id, parent_id, started_at=None):
+        self.trace_id = trace_id
+        self.parent_id = parent_id
+        self.span_id = new_span_id()
+        now = time.perf_counter()
+        self.origin = now if started_at is None else started_at
+        # perf_counter has no epoch; anchor it to wall time once so offsets convert to timestamps.
+        self.origin_unix_ms = (time.time() - (now - self.origin)) * 1000.0
+        self.spans = []
+        self.stack = []
+
+    @classmethod
+    def from_header(cls, value, started_at=None):
+        parsed = parse_traceparent(value)
+        if parsed is None or not parsed[2]:
+            return None
+        return cls(parsed[0], parsed[1], started_at=started_at)
+
+    def add(self, name, started_at, ended_at, parent_id=None, **attributes):
+        span = {
+            'spanId': new_span_id(),
+            'parentSpanId': parent_id or (self.stack[-1] if self.stack else self.span_id),
+            'name': name,
+            'startOffsetMs': round((started_at - self.origin) * 1000.0, 3),
+            'durationMs': round(max(0.0, ended_at - started_at) * 1000.0, 3),
+        }
+        if attributes:
+            span['attributes'] = attributes
+        self.spans.append(span)
+        return span
+
+    @contextlib.contextmanager
+    def span(self, name, **attributes):
+        started = time.perf_counter()
+        span_id = new_span_id()
+        parent_id = self.stack[-1] if self.stack else self.span_id
+        self.stack.append(span_id)
+        status = 'ok'
+        try:
+            yield
+        except BaseException:
+            status = 'error'
+            raise
+        finally:
+            self.stack.pop()
+            span = self.add(name, started, time.perf_counter(), parent_id=parent_id, **attributes)
+            span['spanId'] = span_id
+            if status != 'ok':
+                span['status'] = status
+
+    def report(self, ended_at=None):
+        ended_at = time.perf_counter() if ended_at is None else ended_at
+        return {
+            'traceId': self.trace_id,
+            'parentSpanId': self.parent_id,
+            'spanId': self.span_id,
+            'name': 'bridge.rpc',
+            'startedAtUnixMs': round(self.origin_unix_ms, 3),
+            'durationMs': round(max(0.0, ended_at - self.origin) * 1000.0, 3),
+            'spans': sorted(self.spans, key=lambda span: span['startOffsetMs']),
+        }
+
+
+@contextlib.contextmanager
+def activate(trace):
+    previous = getattr(_CURRENT, 'trace', None)
+    _CURRENT.trace = trace
+    try:
+        yield trace
+    finally:
+        _CURRENT.trace = previous
+
+
+def current():
+    return getattr(_CURRENT, 'trace', None)
+
+
+def span(name, trace=None, **attributes):
+    """Child span of the active span of `trace` (default: the thread's current trace), or a no-op."""
+    trace = trace or current()
+    if trace is None:
+        return contextlib.nullcontext()
+    return trace.span(name, **attributes)
+
+
+def encode_response(payload, trace=None):
+    """JSON bytes for `payload`; a traced response gets the encode span and a `trace` member."""
+    started = time.perf_counter()
+    body = json.dumps(payload)
+    if trace is None or not isinstance(payload, dict):
+        return body.encode('utf-8')
+    ended = time.perf_counter()
+    trace.add('bridge.encode', started, ended, parent_id=trace.span_id, bytes=len(body))
+    # Splice rather than re-encode, so the payload is serialized exactly once.
+    separator = ',' if payload else ''
+    encoded_trace = json.dumps(trace.report(ended), separators=(',', ':'))
+    return f'{body[:-1]}{separator}"trace":{encoded_trace}}}'.encode('utf-8')
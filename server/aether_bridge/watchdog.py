@@ -0,0 +1,178 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+DATABLOCK_COLLECTIONS = (
+    'objects',
+    'meshes',
+    'node_groups',
+    'materials',
+    'textures',
+    'images',
+    'collections',
+    'curves',
+    'actions',
+)
+UNTRACKED_COMMANDS = frozenset({'ping'})
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, '') or default)
+    except ValueError:
+        return default
+
+
+def _windows_rss_bytes():
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ('cb', wintypes.DWORD),
+            ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t),
+            ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t),
+            ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    return int(counters.WorkingSetSize)
+
+
+def rss_bytes():
+    """Current resident set size, or the peak where only that is available."""
+    try:
+        with open('/proc/self/statm', 'r', encoding='ascii') as handle:
+            return int(handle.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except Exception:
+        pass
+    if sys.platform == 'win32':
+        try:
+            return _windows_rss_bytes()
+        except Exception:
+            return None
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return int(peak if sys.platform == 'darwin' else peak * 1024)
+    except Exception:
+        return None
+
+
+def datablock_counts(bpy):
+    counts = {}
+    for name in DATABLOCK_COLLECTIONS:
+        collection = getattr(bpy.data, name, None)
+        if collection is not None:
+            counts[name] = len(collection)
+    return counts
+
+
+def purge_orphans(bpy):
+    """Remove datablocks with no users; returns how many were removed."""
+    before = sum(datablock_counts(bpy).values())
+    purge = getattr(bpy.data, 'orphans_purge', None)
+    if purge is not None:
+        purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+    else:
+        removed = True
+        while removed:
+            removed = False
+            for name in DATABLOCK_COLLECTIONS:
+                collection = getattr(bpy.data, name, None)
+                if collection is None:
+                    continue
+                for block in [block for block in collection if block.users == 0 and not block.use_fake_user]:
+                    collection.remove(block)
+                    removed = True
+    return max(0, before - sum(datablock_counts(bpy).values()))
+
+
+class Watchdog:
+    def __init__(self, purge_every=25, purge_growth=2000, memory_ceiling_mb=0, addon_module_limit=8):
+        self.purge_every = max(0, int(purge_every))
+        self.purge_growth = max(0, int(purge_growth))
+        self.memory_ceiling_bytes = max(0, int(memory_ceiling_mb)) * 1024 * 1024
+        self.addon_module_limit = max(1, int(addon_module_limit))
+        self.commands = 0
+        self.commands_since_purge = 0
+        self.datablocks_after_purge = None
+        self.recycle_reason = None
+        self.recycle_announced = False
+        self.addons = OrderedDict()
+        self.lock = threading.RLock()
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            purge_every=_env_int('AETHER_RPC_PURGE_EVERY', 25),
+            purge_growth=_env_int('AETHER_RPC_PURGE_GROWTH', 2000),
+            memory_ceiling_mb=_env_int('AETHER_RPC_MEMORY_CEILING_MB', 0),
+            addon_module_limit=_env_int('AETHER_RPC_ADDON_MODULE_LIMIT', 8),
+        )
+
+    def track_addon(self, module_name, parent_path):
+        with self.lock:
+            self.addons.pop(module_name, None)
+            self.addons[module_name] = parent_path
+
+    def prune_addon_modules(self):
+        """Forget the oldest validated addons beyond the limit, with their submodules and path entries."""
+        pruned = []
+        with self.lock:
+            while len(self.addons) > self.addon_module_limit:
+                module_name, parent_path = self.addons.popitem(last=False)
+                prefix = module_name + '.'
+                for name in [name for name in sys.modules if name == module_name or name.startswith(prefix)]:
+                    sys.modules.pop(name, None)
+                if parent_path not in self.addons.values():
+                    while parent_path in sys.path:
+                        sys.path.remove(parent_path)
+                pruned.append(module_name)
+        return pruned
+
+    def _should_purge(self, total):
+        if self.purge_every and self.commands_since_purge >= self.purge_every:
+            return True
+        baseline = self.datablocks_after_purge
+        return bool(self.purge_growth and baseline is not None and total - baseline >= self.purge_growth)
+
+    def after_command(self, command, bpy=None):
+        with self.lock:
+            if command not in UNTRACKED_COMMANDS:
+                self.commands += 1
+                self.commands_since_purge += 1
+
+            report = {'commands': self.commands, 'purged': 0, 'prunedModules': self.prune_addon_modules()}
+            if bpy is not None:
+                counts = datablock_counts(bpy)
+                total = sum(counts.values())
+                if self.datablocks_after_purge is None:
+                    self.datablocks_after_purge = total
+                if command not in UNTRACKED_COMMANDS and self._should_purge(total):
+                    report['purged'] = purge_orphans(bpy)
+                    counts = datablock_counts(bpy)
+                    self.datablocks_after_purge = sum(counts.values())
+                    self.commands_since_purge = 0
+                report['datablocks'] = counts
+
+            rss = rss_bytes()
+            report['rssBytes'] = rss
+            if self.recycle_reason is None and self.memory_ceiling_bytes and rss and rss >= self.memory_ceiling_bytes:
+                self.recycle_reason = 'memory_ceiling'
+            report['recycle'] = self.recycle_reason is not None
+            if self.recycle_reason:
+                report['recycleReason'] = self.recycle_reason
+            return report
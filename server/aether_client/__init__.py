@@ -0,0 +1,14 @@
+"""Python client for the Blender RPC bridge: `BridgeClient` (blocking) and `AsyncBridgeClient` (asyncio)."""
+from .async_client import AsyncBridgeClient
+from .client import BridgeClient
+from .core import BridgeError, BridgeTimeout, BridgeUnavailable, LatencyMetrics, RetryPolicy
+
+__all__ = [
+    'AsyncBridgeClient',
+    'BridgeClient',
+    'BridgeError',
+    'BridgeTimeout',
+    'BridgeUnavailable',
+    'LatencyMetrics',
+    'RetryPolicy',
+]
@@ -0,0 +1,171 @@
+"""asyncio bridge client over a pool of keep-alive stream connections (no third-party HTTP stack)."""
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from . import core
+
+
+class AsyncBridgeClient:
+    """Coroutine counterpart of `BridgeClient`; use from a single event loop."""
+
+    def __init__(
+        self,
+        host=core.DEFAULT_HOST,
+        port=None,
+        token=None,
+        timeout=core.DEFAULT_TIMEOUT_S,
+        pool_size=core.DEFAULT_POOL_SIZE,
+        retry=None,
+        metrics=None,
+        sleep=asyncio.sleep,
+    ):
+        self.host = host
+        self.port = int(port or core.env_port() or 0)
+        if not self.port:
+            raise ValueError('bridge port is required (pass port= or set AETHER_RPC_PORT)')
+        self.token = core.env_token() if token is None else token
+        self.timeout = float(timeout)
+        self.pool_size = max(1, int(pool_size))
+        self.retry = retry or core.RetryPolicy()
+        self.metrics = metrics if metrics is not None else core.LatencyMetrics()
+        self.sleep = sleep
+        self.connections_opened = 0
+        self._idle = []
+        self._slots = asyncio.Semaphore(self.pool_size)
+        self._closed = False
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        parts = urlsplit(url)
+        return cls(host=parts.hostname or core.DEFAULT_HOST, port=parts.port, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _roundtrip(self, connection, method, path, body, headers):
+        reader, writer = connection
+        lines = [f'{method} {path} HTTP/1.1', f'Host: {self.host}:{self.port}']
+        lines.extend(f'{name}: {value}' for name, value in (headers or {}).items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b''))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError('connection closed before a response')
+        version, status = status_line.decode('latin-1').split()[:2]
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+        length = response_headers.get('content-length')
+        if length is None:
+            return int(status), await reader.read(), False
+        raw = await reader.readexactly(int(length)) if int(length) else b''
+        connection_header = response_headers.get('connection', '').lower()
+        keep_alive = connection_header != 'close' if version == 'HTTP/1.1' else connection_header == 'keep-alive'
+        return int(status), raw, keep_alive
+
+    async def _exchange(self, method, path, body, headers, timeout, command):
+        await self._slots.acquire()
+        connection = self._idle.pop() if self._idle else None
+        reusable = False
+        try:
+            if connection is None:
+                self.connections_opened += 1
+                connection = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), timeout)
+            status, raw, reusable = await asyncio.wait_for(
+                self._roundtrip(connection, method, path, body, headers), timeout
+            )
+            return status, core.decode_body(raw)
+        except asyncio.TimeoutError as exc:
+            raise core.BridgeTimeout(f'{command} timed out after {timeout}s', command=command) from exc
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            raise core.BridgeUnavailable(f'{command} failed: {exc}', command=command) from exc
+        finally:
+            if connection is not None:
+                if reusable and not self._closed:
+                    self._idle.append(connection)
+                else:
+                    connection[1].close()
+            self._slots.release()
+
+    async def request(self, method, path, timeout=None):
+        headers = {'X-Aether-Token': self.token} if self.token else {}
+        return await self._exchange(method, path, None, headers, timeout or self.timeout, f'{method} {path}')
+
+    async def health(self, timeout=None):
+        status, body = await self.request('GET', '/health', timeout=timeout)
+        if status != 200:
+            raise core.BridgeError(f'health check failed with HTTP {status}', status_code=status, body=body)
+        return body
+
+    async def wait_until_ready(self, timeout=30.0, interval=0.1):
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return await self.health(timeout=max(interval, 1.0))
+            except core.BridgeError:
+                if time.monotonic() >= deadline:
+                    raise
+            await self.sleep(interval)
+
+    async def send(self, command, payload=None, timeout=None, idempotency_key=None, traceparent=None):
+        key = core.idempotency_key_for(command, idempotency_key, self.retry)
+        body, headers = core.build_rpc_request(command, payload, self.token, key, traceparent)
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            status = parsed = error = None
+            try:
+                status, parsed = await self._exchange('POST', '/rpc', body, headers, timeout or self.timeout, command)
+                if status == 503:
+                    error = core.BridgeError('bridge is overloaded', status_code=503, body=parsed, command=command)
+            except core.BridgeError as exc:
+                error = exc
+            if error is not None and attempt < self.retry.attempts and self.retry.retryable(error):
+                await self.sleep(self.retry.delay(attempt, error))
+                continue
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            ok = status == 200 and isinstance(parsed, dict) and parsed.get('ok') is not False
+            self.metrics.record(command, elapsed_ms, ok, retries=attempt - 1)
+            if status is None:
+                raise error
+            return status, parsed, elapsed_ms
+
+    async def call(self, command, payload=None, **options):
+        status, body, _elapsed_ms = await self.send(command, payload, **options)
+        return core.unwrap_response(command, status, body)
+
+    async def batch(self, calls, parallel=False, stop_on_error=False, timeout=None):
+        calls = [core.normalize_call(call) for call in calls]
+
+        async def run(call):
+            command, payload = call
+            started = time.perf_counter()
+            try:
+                status, body, elapsed_ms = await self.send(command, payload, timeout=timeout)
+                return core.batch_entry(status, core.unwrap_response(command, status, body), elapsed_ms)
+            except core.BridgeError as exc:
+                return core.batch_entry(None, None, (time.perf_counter() - started) * 1000.0, error=exc)
+
+        if parallel:
+            return list(await asyncio.gather(*(run(call) for call in calls)))
+        entries = []
+        for call in calls:
+            entries.append(await run(call))
+            if stop_on_error and not entries[-1]['ok']:
+                break
+        return entries
+
+    async def close(self):
+        self._closed = True
+        while self._idle:
+            self._idle.pop()[1].close()
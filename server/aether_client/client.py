@@ -0,0 +1,179 @@
+"""Blocking bridge client over a pool of keep-alive HTTP connections."""
+import http.client
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from . import core
+
+
+class BridgeClient:
+    """Talks to one bridge session; safe to share between threads.
+
+    `call()` returns a command's result and raises `BridgeError` otherwise; `send()` returns
+    `(status, body, elapsed_ms)` for callers that inspect error replies themselves.
+    """
+
+    def __init__(
+        self,
+        host=core.DEFAULT_HOST,
+        port=None,
+        token=None,
+        timeout=core.DEFAULT_TIMEOUT_S,
+        pool_size=core.DEFAULT_POOL_SIZE,
+        retry=None,
+        metrics=None,
+        sleep=time.sleep,
+    ):
+        self.host = host
+        self.port = int(port or core.env_port() or 0)
+        if not self.port:
+            raise ValueError('bridge port is required (pass port= or set AETHER_RPC_PORT)')
+        self.token = core.env_token() if token is None else token
+        self.timeout = float(timeout)
+        self.pool_size = max(1, int(pool_size))
+        self.retry = retry or core.RetryPolicy()
+        self.metrics = metrics if metrics is not None else core.LatencyMetrics()
+        self.sleep = sleep
+        self.connections_opened = 0
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        parts = urlsplit(url)
+        return cls(host=parts.hostname or core.DEFAULT_HOST, port=parts.port, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _checkout(self):
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self.connections_opened += 1
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _checkin(self, connection, reusable):
+        if reusable and not self._closed:
+            self._idle.put(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    def _exchange(self, method, path, body, headers, timeout, command):
+        connection = self._checkout()
+        reusable = False
+        try:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request(method, path, body=body, headers=headers or {})
+                response = connection.getresponse()
+                raw = response.read()
+            except socket.timeout as exc:
+                raise core.BridgeTimeout(f'{command} timed out after {timeout}s', command=command) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                raise core.BridgeUnavailable(f'{command} failed: {exc}', command=command) from exc
+            # The threaded server answers HTTP/1.0 and closes; the asyncio server keeps it open.
+            reusable = not response.will_close
+            return response.status, core.decode_body(raw)
+        finally:
+            self._checkin(connection, reusable)
+
+    def request(self, method, path, timeout=None):
+        """Plain request to a non-RPC endpoint such as `/health`; returns `(status, body)`."""
+        headers = {'X-Aether-Token': self.token} if self.token else {}
+        return self._exchange(method, path, None, headers, timeout or self.timeout, f'{method} {path}')
+
+    def health(self, timeout=None):
+        status, body = self.request('GET', '/health', timeout=timeout)
+        if status != 200:
+            raise core.BridgeError(f'health check failed with HTTP {status}', status_code=status, body=body)
+        return body
+
+    def wait_until_ready(self, timeout=30.0, interval=0.1):
+        """Poll `/health` until the bridge answers; raises the last error once `timeout` passes."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self.health(timeout=max(interval, 1.0))
+            except core.BridgeError:
+                if time.monotonic() >= deadline:
+                    raise
+            self.sleep(interval)
+
+    def send(self, command, payload=None, timeout=None, idempotency_key=None, traceparent=None):
+        """One RPC with retries; HTTP errors come back as `(status, body, elapsed_ms)`, transport errors raise."""
+        key = core.idempotency_key_for(command, idempotency_key, self.retry)
+        body, headers = core.build_rpc_request(command, payload, self.token, key, traceparent)
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            status = parsed = error = None
+            try:
+                status, parsed = self._exchange('POST', '/rpc', body, headers, timeout or self.timeout, command)
+                if status == 503:
+                    error = core.BridgeError('bridge is overloaded', status_code=503, body=parsed, command=command)
+            except core.BridgeError as exc:
+                error = exc
+            if error is not None and attempt < self.retry.attempts and self.retry.retryable(error):
+                self.sleep(self.retry.delay(attempt, error))
+                continue
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            ok = status == 200 and isinstance(parsed, dict) and parsed.get('ok') is not False
+            self.metrics.record(command, elapsed_ms, ok, retries=attempt - 1)
+            if status is None:
+                raise error
+            return status, parsed, elapsed_ms
+
+    def call(self, command, payload=None, **options):
+        status, body, _elapsed_ms = self.send(command, payload, **options)
+        return core.unwrap_response(command, status, body)
+
+    def batch(self, calls, parallel=False, stop_on_error=False, timeout=None):
+        """Run several `(command, payload)` calls and return one entry per call, in order.
+
+        Sequential batches keep scene edits ordered over a single pooled connection; `parallel`
+        spreads independent calls (e.g. read-only queries) across the pool.
+        """
+        calls = [core.normalize_call(call) for call in calls]
+
+        def run(call):
+            command, payload = call
+            started = time.perf_counter()
+            try:
+                status, body, elapsed_ms = self.send(command, payload, timeout=timeout)
+                return core.batch_entry(status, core.unwrap_response(command, status, body), elapsed_ms)
+            except core.BridgeError as exc:
+                return core.batch_entry(None, None, (time.perf_counter() - started) * 1000.0, error=exc)
+
+        if parallel and len(calls) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.pool_size, len(calls))) as pool:
+                return list(pool.map(run, calls))
+        entries = []
+        for call in calls:
+            entries.append(run(call))
+            if stop_on_error and not entries[-1]['ok']:
+                break
+        return entries
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
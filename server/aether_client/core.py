@@ -0,0 +1,200 @@
+"""Pieces shared by the sync and asyncio bridge clients: errors, retry policy and latency metrics."""
+import collections
+import json
+import os
+import random
+import threading
+import uuid
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_TIMEOUT_S = 120.0
+DEFAULT_POOL_SIZE = 4
+METRIC_SAMPLE_LIMIT = 2048
+# Commands that never change the scene; everything else gets an idempotency key so retries run once.
+READ_ONLY_COMMANDS = frozenset({'ping', 'get_context', 'export_node_tree_ir', 'list_templates'})
+
+
+class BridgeError(Exception):
+    """Non-200 reply (or `ok: false` body) from the bridge."""
+
+    code = 'RPC_ERROR'
+
+    def __init__(self, message, status_code=None, code=None, body=None, command=None):
+        super().__init__(message)
+        self.status_code = status_code
+        if code:
+            self.code = code
+        self.body = body
+        self.command = command
+
+
+class BridgeTimeout(BridgeError):
+    code = 'RPC_TIMEOUT'
+
+
+class BridgeUnavailable(BridgeError):
+    """The bridge refused or dropped the connection before answering."""
+
+    code = 'RPC_UNAVAILABLE'
+
+
+def env_port():
+    try:
+        return int(os.environ.get('AETHER_RPC_PORT', '') or 0) or None
+    except ValueError:
+        return None
+
+
+def env_token():
+    return os.environ.get('AETHER_RPC_TOKEN', '')
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return round(ordered[position], 3)
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for 503s, timeouts and dropped connections.
+
+    503 replies are shed before the command runs; timeouts and dropped connections are only
+    retried because mutating calls carry an idempotency key, so the bridge never runs them twice.
+    """
+
+    def __init__(self, attempts=3, backoff_s=0.05, max_backoff_s=2.0, retry_timeouts=True, rng=None):
+        self.attempts = max(1, int(attempts))
+        self.backoff_s = max(0.0, float(backoff_s))
+        self.max_backoff_s = max(self.backoff_s, float(max_backoff_s))
+        self.retry_timeouts = bool(retry_timeouts)
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def disabled(cls):
+        return cls(attempts=1)
+
+    def retryable(self, error):
+        if isinstance(error, BridgeTimeout):
+            return self.retry_timeouts
+        if isinstance(error, BridgeUnavailable):
+            return True
+        return isinstance(error, BridgeError) and error.status_code == 503
+
+    def delay(self, attempt, error=None):
+        """Seconds to wait before retry number `attempt` (1-based); honours the bridge's retryAfterMs."""
+        backoff = min(self.max_backoff_s, self.backoff_s * (2 ** (attempt - 1)))
+        backoff *= 0.5 + self.rng.random() / 2.0
+        body = getattr(error, 'body', None)
+        retry_after_ms = body.get('retryAfterMs') if isinstance(body, dict) else None
+        if isinstance(retry_after_ms, (int, float)) and retry_after_ms > 0:
+            backoff = max(backoff, min(self.max_backoff_s, retry_after_ms / 1000.0))
+        return backoff
+
+
+class LatencyMetrics:
+    """Per-command latency samples (bounded) plus call, error and retry counters."""
+
+    def __init__(self, sample_limit=METRIC_SAMPLE_LIMIT):
+        self.sample_limit = max(1, int(sample_limit))
+        self.lock = threading.Lock()
+        self.commands = {}
+
+    def _stats(self, command):
+        stats = self.commands.get(command)
+        if stats is None:
+            stats = self.commands[command] = {
+                'calls': 0,
+                'errors': 0,
+                'retries': 0,
+                'samples': collections.deque(maxlen=self.sample_limit),
+            }
+        return stats
+
+    def record(self, command, elapsed_ms, ok, retries=0):
+        with self.lock:
+            stats = self._stats(command)
+            stats['calls'] += 1
+            stats['retries'] += retries
+            if not ok:
+                stats['errors'] += 1
+            stats['samples'].append(float(elapsed_ms))
+
+    def report(self):
+        with self.lock:
+            snapshot = {command: (dict(stats), list(stats['samples'])) for command, stats in self.commands.items()}
+        report = {}
+        for command, (stats, samples) in sorted(snapshot.items()):
+            report[command] = {
+                'calls': stats['calls'],
+                'errors': stats['errors'],
+                'retries': stats['retries'],
+                'p50': percentile(samples, 0.50),
+                'p95': percentile(samples, 0.95),
+                'p99': percentile(samples, 0.99),
+                'max': round(max(samples), 3) if samples else None,
+                'mean': round(sum(samples) / len(samples), 3) if samples else None,
+            }
+        return report
+
+    def reset(self):
+        with self.lock:
+            self.commands = {}
+
+
+def build_rpc_request(command, payload, token, idempotency_key=None, traceparent=None):
+    """Return `(body, headers)` for one POST /rpc."""
+    body = json.dumps({'command': command, 'payload': payload or {}}).encode('utf-8')
+    headers = {'Content-Type': 'application/json', 'Content-Length': str(len(body))}
+    if token:
+        headers['X-Aether-Token'] = token
+    if idempotency_key:
+        headers['X-Aether-Idempotency-Key'] = idempotency_key
+    if traceparent:
+        headers['traceparent'] = traceparent
+    return body, headers
+
+
+def idempotency_key_for(command, idempotency_key, retry):
+    if idempotency_key:
+        return idempotency_key
+    if retry.attempts > 1 and str(command or '').strip().lower() not in READ_ONLY_COMMANDS:
+        return uuid.uuid4().hex
+    return None
+
+
+def decode_body(raw):
+    try:
+        return json.loads(raw.decode('utf-8')) if raw else {}
+    except ValueError:
+        return {'raw': raw.decode('utf-8', 'replace')}
+
+
+def unwrap_response(command, status, body):
+    """The command's result for a 200 reply; raises BridgeError for anything else."""
+    if status == 200 and isinstance(body, dict) and body.get('ok') is not False:
+        return body.get('result', body)
+    details = body if isinstance(body, dict) else {}
+    message = details.get('error') or f'{command} failed with HTTP {status}'
+    raise BridgeError(message, status_code=status, code=details.get('code'), body=details, command=command)
+
+
+def batch_entry(status, body, elapsed_ms, error=None):
+    if error is not None:
+        return {
+            'ok': False,
+            'status': getattr(error, 'status_code', None),
+            'error': str(error),
+            'code': getattr(error, 'code', None),
+            'elapsedMs': round(elapsed_ms, 3),
+        }
+    return {'ok': True, 'status': status, 'result': body, 'elapsedMs': round(elapsed_ms, 3)}
+
+
+def normalize_call(call):
+    """Accept `(command, payload)` tuples or `{'command', 'payload'}` dicts in batches."""
+    if isinstance(call, dict):
+        return call.get('command'), call.get('payload') or {}
+    command, payload = (tuple(call) + ({},))[:2]
+    return command, payload or {}
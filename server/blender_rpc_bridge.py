@@ -1,17 +1,53 @@
-import ast
+import atexit
 import builtins as py_builtins
 import contextlib
-import hashlib
 import io
 import json
 import os
 import sys
 import threading
-import traceback
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import time
+import types
+from http.server import BaseHTTPRequestHandler
 from urllib.parse import urlparse
 
+BRIDGE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BRIDGE_DIR not in sys.path:
+    sys.path.insert(0, BRIDGE_DIR)
+
+from aether_bridge import startup  # noqa: E402
+
+STARTUP = startup.StartupTimeline()
+STARTUP.mark('bridgeImportStart')
+
+if os.environ.get('AETHER_RPC_FAKE_BPY', '').strip().lower() in ('1', 'true', 'yes'):
+    # Benchmark/test mode: run under plain Python against the in-process bpy stand-in.
+    from aether_bridge import fake_bpy  # noqa: E402
+
+    fake_bpy.install()
+
+from aether_bridge import (  # noqa: E402
+    admission,
+    batch,
+    bridge_log,
+    bytecode,
+    capture,
+    idempotency,
+    node_tree_ir,
+    node_trees,
+    objects,
+    output_spill,
+    safe_policy,
+    snapshots,
+    templates,
+    tracing,
+    watchdog,
+)
+
+STARTUP.mark('bridgeImported')
+
 BRIDGE_PORT = int(os.environ.get('AETHER_RPC_PORT', '0') or '0')
+BRIDGE_SERVER_MODE = str(os.environ.get('AETHER_RPC_SERVER', 'threaded') or 'threaded').strip().lower()
 BRIDGE_TOKEN = os.environ.get('AETHER_RPC_TOKEN', '')
 ALLOWED_ADDON_ROOT = os.environ.get('AETHER_ALLOWED_ADDON_ROOT', '')
 
@@ -19,39 +55,8 @@ SAFE_MODE = 'safe'
 TRUSTED_MODE = 'trusted'
 ALLOWED_EXEC_MODES = {SAFE_MODE, TRUSTED_MODE}
 
-SAF004_BLOCKED_MODULE_PREFIXES = (
-    'builtins',
-    'ctypes',
-    'http',
-    'importlib',
-    'inspect',
-    'multiprocessing',
-    'os',
-    'pathlib',
-    'pickle',
-    'resource',
-    'shutil',
-    'signal',
-    'site',
-    'socket',
-    'subprocess',
-    'sys',
-    'tempfile',
-    'threading',
-    'urllib',
-    'venv',
-    'zipfile',
-)
-
-SAF004_BLOCKED_BUILTINS = (
-    '__import__',
-    'breakpoint',
-    'compile',
-    'eval',
-    'exec',
-    'input',
-    'open',
-)
+SAF004_BLOCKED_MODULE_PREFIXES = safe_policy.SAF004_BLOCKED_MODULE_PREFIXES
+SAF004_BLOCKED_BUILTINS = safe_policy.SAF004_BLOCKED_BUILTINS
 
 SAFE_ALLOWED_BUILTINS = (
     'abs',
@@ -99,6 +104,59 @@ CONTEXT_DROP_ORDER = (
 )
 
 
+WATCHDOG = watchdog.Watchdog.from_env()
+RECORDER = capture.recorder_from_env()
+IDEMPOTENCY = idempotency.IdempotencyCache.from_env()
+SNAPSHOTS = snapshots.SnapshotManager.from_env()
+TEMPLATES = templates.TemplateLibrary.from_env()
+OUTPUT_SPILL = output_spill.OutputSpiller.from_env()
+
+
+def _instantiate_template(name, **options):
+    import bpy
+
+    result = TEMPLATES.instantiate(bpy, name, **options)
+    node_tree_ir.invalidate_node_tree_ir()
+    return result
+
+
+# Resident helpers exposed to exec_python scripts as `aether`; state persists across calls.
+RESIDENT_HELPERS = types.SimpleNamespace(
+    node_tree_index=node_trees.node_tree_index,
+    node_tree_ir=node_tree_ir.node_tree_ir,
+    batch_edit=batch.batch_edit,
+    defer_modifier=batch.defer_modifier,
+    instantiate_template=_instantiate_template,
+)
+
+def _drop_resident_caches(*_args):
+    # Loading a file or stepping undo/redo replaces the datablocks the caches point at.
+    node_trees.clear_node_tree_indexes()
+    node_tree_ir.invalidate_node_tree_ir()
+
+
+def _install_cache_handlers():
+    try:
+        import bpy
+    except Exception:
+        return
+    handlers = getattr(getattr(bpy, 'app', None), 'handlers', None)
+    if handlers is None:
+        return
+    persistent = getattr(handlers, 'persistent', None)
+    callback = persistent(_drop_resident_caches) if callable(persistent) else _drop_resident_caches
+    for name in ('load_post', 'undo_post', 'redo_post'):
+        registered = getattr(handlers, name, None)
+        if registered is not None and _drop_resident_caches not in registered:
+            registered.append(callback)
+
+
+_install_cache_handlers()
+
+# Commands that leave the scene as it was, so a snapshot taken afterwards still matches the last step.
+SNAPSHOT_NEUTRAL_COMMANDS = frozenset({'ping', 'get_context', 'snapshot_step', 'list_templates'})
+
+
 class RpcPolicyError(Exception):
     def __init__(self, message, code='RPC_POLICY_VIOLATION', status_code=400):
         super().__init__(message)
@@ -106,8 +164,8 @@ class RpcPolicyError(Exception):
         self.status_code = status_code
 
 
-def _print(msg):
-    print(msg, flush=True)
+LOG = bridge_log.BridgeLogger.from_env()
+atexit.register(LOG.close)
 
 
 def _stable_json(value):
@@ -119,6 +177,8 @@ def _json_size_bytes(value):
 
 
 def _sha256_hex(value):
+    import hashlib
+
     return hashlib.sha256(_stable_json(value).encode('utf-8')).hexdigest()
 
 
@@ -177,13 +237,7 @@ def _slice_context_payload(slices, max_bytes=None):
 
 
 def _is_blocked_module(module_name):
-    if not module_name:
-        return False
-    normalized = str(module_name).strip().lower()
-    for prefix in SAF004_BLOCKED_MODULE_PREFIXES:
-        if normalized == prefix or normalized.startswith(prefix + '.'):
-            return True
-    return False
+    return safe_policy.is_blocked_module(module_name)
 
 
 def _normalize_exec_mode(mode):
@@ -200,8 +254,8 @@ def _normalize_exec_mode(mode):
 def _blocked_builtin_factory(name):
     def _blocked(*_args, **_kwargs):
         raise RpcPolicyError(
-            f'SAF-004 blocked builtin in safe mode: {name}',
-            code='SAF_004_BLOCKED_BUILTIN',
+            safe_policy.blocked_builtin_message(name),
+            code=safe_policy.BLOCKED_BUILTIN,
             status_code=403,
         )
 
@@ -211,42 +265,17 @@ def _blocked_builtin_factory(name):
 def _safe_import(name, globals=None, locals=None, fromlist=(), level=0):
     if _is_blocked_module(name):
         raise RpcPolicyError(
-            f'SAF-004 blocked module import in safe mode: {name}',
-            code='SAF_004_BLOCKED_IMPORT',
+            safe_policy.blocked_import_message(name),
+            code=safe_policy.BLOCKED_IMPORT,
             status_code=403,
         )
     return py_builtins.__import__(name, globals, locals, fromlist, level)
 
 
 def _assert_safe_exec_source(code):
-    tree = ast.parse(code, mode='exec')
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imported = str(alias.name or '').strip()
-                if _is_blocked_module(imported):
-                    raise RpcPolicyError(
-                        f'SAF-004 blocked module import in safe mode: {imported}',
-                        code='SAF_004_BLOCKED_IMPORT',
-                        status_code=403,
-                    )
-        elif isinstance(node, ast.ImportFrom):
-            imported_from = str(node.module or '').strip()
-            if _is_blocked_module(imported_from):
-                raise RpcPolicyError(
-                    f'SAF-004 blocked module import in safe mode: {imported_from}',
-                    code='SAF_004_BLOCKED_IMPORT',
-                    status_code=403,
-                )
-        elif isinstance(node, ast.Call):
-            func = node.func
-            if isinstance(func, ast.Name) and func.id in SAF004_BLOCKED_BUILTINS:
-                raise RpcPolicyError(
-                    f'SAF-004 blocked builtin in safe mode: {func.id}',
-                    code='SAF_004_BLOCKED_BUILTIN',
-                    status_code=403,
-                )
+    violation = safe_policy.find_violation(code)
+    if violation:
+        raise RpcPolicyError(violation['message'], code=violation['code'], status_code=403)
 
 
 def _addon_validate(addon_path):
@@ -275,22 +304,38 @@ def _addon_validate(addon_path):
 
     if parent not in sys.path:
         sys.path.insert(0, parent)
+    WATCHDOG.track_addon(module_name, parent)
 
-    _print(f'[AETHER_RPC] validate_addon start module={module_name} path={abs_path}')
+    LOG.info('validate_addon.start', module=module_name, path=abs_path)
 
+    bytecode_summary = bytecode.ensure_bytecode(abs_path)
+    import_started = time.perf_counter()
     if module_name in sys.modules:
         importlib.reload(sys.modules[module_name])
     else:
         importlib.import_module(module_name)
+    import_ms = round((time.perf_counter() - import_started) * 1000.0, 3)
 
-    _print(f'[AETHER_RPC] validate_addon success module={module_name}')
+    LOG.info('validate_addon.success', module=module_name, bytecodeMs=bytecode_summary['ms'], importMs=import_ms)
     return {
         'module': module_name,
         'addonPath': abs_path,
+        'bytecode': bytecode_summary,
+        'timingsMs': {'bytecode': bytecode_summary['ms'], 'import': import_ms},
     }
 
 
-def _exec_python(code, mode=SAFE_MODE):
+def _batch_scope(enabled):
+    if not enabled:
+        return contextlib.nullcontext(None)
+    try:
+        import bpy
+    except Exception:
+        return contextlib.nullcontext(None)
+    return batch.batch_edit(bpy)
+
+
+def _exec_python(code, mode=SAFE_MODE, batch_edit=False, output_dir=None):
     if not isinstance(code, str) or not code.strip():
         raise ValueError('code must be a non-empty string')
 
@@ -306,7 +351,8 @@ def _exec_python(code, mode=SAFE_MODE):
         pass
 
     if normalized_mode == SAFE_MODE:
-        _assert_safe_exec_source(code)
+        with tracing.span('bridge.safety'):
+            _assert_safe_exec_source(code)
         safe_builtins = {name: getattr(py_builtins, name) for name in SAFE_ALLOWED_BUILTINS}
         for name in SAF004_BLOCKED_BUILTINS:
             safe_builtins[name] = _blocked_builtin_factory(name)
@@ -316,15 +362,23 @@ def _exec_python(code, mode=SAFE_MODE):
         env['__builtins__'] = __builtins__
 
     env['__name__'] = '__aether_rpc__'
+    env['aether'] = RESIDENT_HELPERS
 
-    _print(f'[AETHER_RPC] exec_python start mode={normalized_mode}')
+    LOG.debug('exec_python.start', mode=normalized_mode)
+    exec_started = time.perf_counter()
+    succeeded = False
 
     stdout_buffer = io.StringIO()
     stderr_buffer = io.StringIO()
 
+    batch_report = None
     try:
         with contextlib.redirect_stdout(stdout_buffer), contextlib.redirect_stderr(stderr_buffer):
-            exec(code, env, env)
+            with _batch_scope(batch_edit) as active_batch:
+                exec(code, env, env)
+        succeeded = True
+        if active_batch is not None:
+            batch_report = active_batch.report()
     except Exception:
         # We re-raise to be caught by the main handler, which will output the error to the RPC log.
         # But we lose the stdout/stderr captured so far if we just raise.
@@ -333,14 +387,34 @@ def _exec_python(code, mode=SAFE_MODE):
         # For now, we assume successful execution capture is the priority.
         raise
     finally:
-        _print(f'[AETHER_RPC] exec_python success mode={normalized_mode}')
+        LOG.info(
+            'exec_python.end',
+            mode=normalized_mode,
+            ok=succeeded,
+            ms=round((time.perf_counter() - exec_started) * 1000.0, 3),
+        )
 
-    return {
+    streams = {'stdout': stdout_buffer.getvalue(), 'stderr': stderr_buffer.getvalue()}
+    spills = OUTPUT_SPILL.spill(streams, output_dir)
+    result = {
         'ok': True,
         'mode': normalized_mode,
-        'stdout': stdout_buffer.getvalue(),
-        'stderr': stderr_buffer.getvalue(),
+        **streams,
+        **spills,
     }
+    if batch_report is not None:
+        result['batch'] = batch_report
+    return result
+
+
+def _active_node_tree_ir(target):
+    try:
+        import bpy
+
+        ir, _cached = node_tree_ir.node_tree_ir(node_tree_ir.resolve_ir_tree(bpy, target))
+        return ir
+    except Exception:
+        return None
 
 
 def _dispatch(command, payload):
@@ -389,6 +463,11 @@ def _dispatch(command, payload):
                         'isBackground': ctx.get('isBackground'),
                     }
                     continue
+                if name == 'active_node_tree_ir' and name not in payload:
+                    active_ir = _active_node_tree_ir(payload.get('node_tree_target'))
+                    if active_ir is not None:
+                        selected_slices[name] = active_ir
+                    continue
                 if name not in selected_slices and name in payload and isinstance(payload.get(name), (dict, list, str, int, float, bool, type(None))):
                     selected_slices[name] = payload.get(name)
 
@@ -404,30 +483,208 @@ def _dispatch(command, payload):
         return ctx
 
     if cmd == 'validate_addon':
+        node_tree_ir.invalidate_node_tree_ir()
         return {
             'ok': True,
             **_addon_validate(payload.get('addonPath')),
         }
 
+    if cmd == 'snapshot_step':
+        return {
+            'ok': True,
+            **SNAPSHOTS.step_completed(
+                payload.get('step_id'),
+                payload.get('step_index'),
+                force=bool(payload.get('force')),
+                run_id=payload.get('run_id'),
+            ),
+        }
+
     if cmd == 'exec_python':
-        return _exec_python(payload.get('code'), payload.get('mode', SAFE_MODE))
+        # Arbitrary scripts can edit any tree without changing node/link counts.
+        node_tree_ir.invalidate_node_tree_ir()
+        return _exec_python(
+            payload.get('code'),
+            payload.get('mode', SAFE_MODE),
+            batch_edit=bool(payload.get('batch')),
+            output_dir=payload.get('output_dir'),
+        )
+
+    if cmd == 'reconcile_node_tree':
+        import bpy
+
+        with _batch_scope(bool(payload.get('batch'))) as active_batch:
+            result = node_trees.reconcile_node_tree(bpy, payload)
+        if active_batch is not None:
+            result['batch'] = active_batch.report()
+        if result['changed']:
+            node_tree_ir.invalidate_node_tree_ir()
+        return {
+            'ok': True,
+            **result,
+        }
+
+    if cmd == 'create_objects':
+        import bpy
+
+        with _batch_scope(bool(payload.get('batch'))) as active_batch:
+            result = objects.create_objects(bpy, payload)
+        if active_batch is not None:
+            result['batch'] = active_batch.report()
+        return {
+            'ok': True,
+            **result,
+        }
+
+    if cmd == 'register_template':
+        import bpy
+
+        return {
+            'ok': True,
+            **TEMPLATES.register(
+                bpy,
+                payload.get('name'),
+                payload.get('path'),
+                link=bool(payload.get('link')),
+                preload=payload.get('preload', True) is not False,
+            ),
+        }
+
+    if cmd == 'list_templates':
+        return {
+            'ok': True,
+            'templates': TEMPLATES.list(),
+        }
+
+    if cmd == 'instantiate_template':
+        return {
+            'ok': True,
+            **_instantiate_template(
+                payload.get('name'),
+                mode=payload.get('mode', 'link'),
+                scene=payload.get('scene'),
+                into_current_scene=bool(payload.get('into_current_scene')),
+                copy_data=bool(payload.get('copy_data')),
+            ),
+        }
+
+    if cmd == 'export_node_tree_ir':
+        import bpy
+
+        return {
+            'ok': True,
+            **node_tree_ir.export_node_tree_ir(bpy, payload),
+        }
 
     raise ValueError(f'Unknown command: {command}')
 
 
+def _watchdog_report(command):
+    try:
+        try:
+            import bpy
+        except Exception:
+            bpy = None
+        report = WATCHDOG.after_command(str(command or '').strip().lower(), bpy)
+        if report.get('purged'):
+            # Purged datablocks invalidate any pointers held by the resident caches.
+            node_trees.clear_node_tree_indexes()
+            node_tree_ir.invalidate_node_tree_ir()
+        if report.get('recycle') and not WATCHDOG.recycle_announced:
+            WATCHDOG.recycle_announced = True
+            LOG.lifecycle('[AETHER_RPC_RECYCLE]', reason=report.get('recycleReason'), rss=report.get('rssBytes'))
+        return report
+    except Exception as exc:
+        return {'error': str(exc)}
+
+
+def _execute_rpc(command, args):
+    try:
+        result = _dispatch(command, args)
+        if isinstance(result, dict):
+            result['watchdog'] = _watchdog_report(command)
+        return 200, {'ok': True, 'result': result}
+    except Exception as exc:
+        import traceback
+
+        LOG.error(
+            'rpc.error',
+            command=str(command or '').strip().lower(),
+            error=str(exc),
+            code=getattr(exc, 'code', None),
+            traceback=traceback.format_exc(),
+        )
+        response = {'ok': False, 'error': str(exc)}
+        if getattr(exc, 'code', None):
+            response['code'] = exc.code
+        response['watchdog'] = _watchdog_report(command)
+        return getattr(exc, 'status_code', 500), response
+
+
+def _handle_rpc(payload, idempotency_key=None):
+    """Run one decoded /rpc body and return `(status_code, response)`."""
+    started = time.time()
+    started_clock = time.perf_counter()
+    payload = payload if isinstance(payload, dict) else {}
+    command = payload.get('command')
+    args = payload.get('payload') if isinstance(payload.get('payload'), dict) else {}
+    key = str(payload.get('idempotency_key') or idempotency_key or '').strip()
+
+    normalized_command = str(command or '').strip().lower()
+    with SNAPSHOTS.activity(mutating=normalized_command not in SNAPSHOT_NEUTRAL_COMMANDS), tracing.span(
+        'bridge.exec', command=normalized_command
+    ):
+        if key:
+            try:
+                (status_code, response), source = IDEMPOTENCY.run(
+                    key,
+                    idempotency.request_fingerprint(command, args),
+                    lambda: _execute_rpc(command, args),
+                )
+                if source != 'executed':
+                    LOG.info('rpc.idempotent', source=source, key=key)
+                    response = {**response, 'idempotency': {'key': key, 'source': source}}
+            except idempotency.IdempotencyKeyError as exc:
+                status_code, response = exc.status_code, {'ok': False, 'error': str(exc), 'code': exc.code}
+        else:
+            status_code, response = _execute_rpc(command, args)
+
+    if RECORDER is not None:
+        try:
+            RECORDER.record(
+                str(command or '').strip().lower(),
+                args,
+                started,
+                (time.perf_counter() - started_clock) * 1000.0,
+                status_code,
+                response,
+            )
+        except Exception as exc:
+            LOG.warning('capture.write_failed', error=str(exc))
+    return status_code, response
+
+
 class Handler(BaseHTTPRequestHandler):
     server_version = 'AetherBlenderRPC/1.0'
 
-    def _write_json(self, status, payload):
-        body = json.dumps(payload).encode('utf-8')
+    def _write_json(self, status, payload, trace=None):
+        body = tracing.encode_response(payload, trace)
         self.send_response(status)
         self.send_header('Content-Type', 'application/json; charset=utf-8')
         self.send_header('Content-Length', str(len(body)))
         self.end_headers()
         self.wfile.write(body)
 
-    def _read_json(self):
-        length = int(self.headers.get('Content-Length', '0') or '0')
+    def _content_length(self):
+        """Body length, or None after answering 400; an unreadable length leaves the stream unusable."""
+        raw = self.headers.get('Content-Length')
+        length = admission.content_length(raw)
+        if length is None:
+            self.close_connection = True
+            self._write_json(400, admission.invalid_length_response(raw))
+        return length
+
+    def _read_json(self, length):
         if length <= 0:
             return {}
         raw = self.rfile.read(length)
@@ -435,19 +692,47 @@ class Handler(BaseHTTPRequestHandler):
             return {}
         return json.loads(raw.decode('utf-8'))
 
+    def _request_trace(self):
+        """Trace for a request carrying a sampled `traceparent`, starting when it was accepted."""
+        enqueued_at = dequeued_at = None
+        if isinstance(self.server, admission.BoundedHTTPServer):
+            enqueued_at, dequeued_at = self.server.admission_times()
+        trace = tracing.RequestTrace.from_header(
+            self.headers.get('traceparent'),
+            started_at=enqueued_at if enqueued_at is not None else getattr(self, '_started', None),
+        )
+        if trace is not None and enqueued_at is not None and dequeued_at is not None:
+            trace.add('bridge.queue_wait', enqueued_at, dequeued_at)
+        return trace
+
     def _is_authorized(self):
         if not BRIDGE_TOKEN:
             return True
         auth = self.headers.get('X-Aether-Token', '')
         return auth == BRIDGE_TOKEN
 
+    def parse_request(self):
+        self._started = time.perf_counter()
+        return BaseHTTPRequestHandler.parse_request(self)
+
+    def log_request(self, code='-', size='-'):
+        started = getattr(self, '_started', None)
+        duration_ms = (time.perf_counter() - started) * 1000.0 if started is not None else None
+        LOG.access(self.command, urlparse(self.path).path, code, duration_ms)
+
+    def log_error(self, fmt, *args):
+        LOG.warning('http.error', message=fmt % args)
+
     def log_message(self, fmt, *args):
-        _print(f'[AETHER_RPC_HTTP] {fmt % args}')
+        LOG.debug('http.message', message=fmt % args)
 
     def do_GET(self):
         path = urlparse(self.path).path
         if path == '/health':
-            self._write_json(200, {'ok': True, 'pid': os.getpid()})
+            health = {'ok': True, 'pid': os.getpid()}
+            if isinstance(self.server, admission.BoundedHTTPServer):
+                health['admission'] = self.server.stats()
+            self._write_json(200, health)
             return
 
         self._write_json(404, {'ok': False, 'error': 'Not found'})
@@ -462,36 +747,109 @@ class Handler(BaseHTTPRequestHandler):
             self._write_json(401, {'ok': False, 'error': 'Unauthorized'})
             return
 
+        length = self._content_length()
+        if length is None:
+            return
+
+        trace = self._request_trace()
         try:
-            payload = self._read_json()
-            command = payload.get('command')
-            args = payload.get('payload') if isinstance(payload.get('payload'), dict) else {}
-            result = _dispatch(command, args)
-            self._write_json(200, {'ok': True, 'result': result})
+            with tracing.span('bridge.decode', trace=trace):
+                payload = self._read_json(length)
         except Exception as exc:
-            _print(f'[AETHER_RPC_ERROR] {exc}')
-            _print(traceback.format_exc())
-            status_code = getattr(exc, 'status_code', 500)
-            response = {'ok': False, 'error': str(exc)}
-            if getattr(exc, 'code', None):
-                response['code'] = exc.code
-            self._write_json(status_code, response)
+            self._write_json(400, {'ok': False, 'error': f'Invalid JSON body: {exc}', 'code': 'RPC_INVALID_JSON'}, trace)
+            return
+
+        with tracing.activate(trace):
+            status_code, response = _handle_rpc(payload, self.headers.get('X-Aether-Idempotency-Key'))
+        self._write_json(status_code, response, trace)
+
+
+class OverloadHandler(Handler):
+    """Answers connections the worker pool had no room for; never runs a command."""
+
+    def do_POST(self):
+        length = self._content_length()
+        if length is None:
+            return
+        if length > 0:
+            # Drain the body so closing the socket does not reset the client before it reads the 503.
+            self.rfile.read(length)
+        admission.write_overloaded(self)
 
 
 def _start_server(port):
-    server = ThreadingHTTPServer(('127.0.0.1', int(port)), Handler)
+    server = admission.BoundedHTTPServer.from_env(('127.0.0.1', int(port)), Handler, OverloadHandler)
     t = threading.Thread(target=server.serve_forever, name='aether-rpc-server', daemon=True)
     t.start()
     return server
 
 
+def _start_async_server(port, executor):
+    from aether_bridge import async_server
+
+    server = async_server.AsyncBridgeServer.from_env(_handle_rpc, executor, token=BRIDGE_TOKEN, access_log=LOG.access)
+    return server.start_in_thread('127.0.0.1', int(port))
+
+
+def _touch_bpy():
+    try:
+        import bpy
+
+        len(bpy.data.objects)
+    except Exception:
+        return False
+    return True
+
+
+def _announce_ready(server_mode):
+    STARTUP.mark('serverBound')
+    if _touch_bpy():
+        STARTUP.mark('firstBpyAccess')
+    STARTUP.mark('ready')
+    report = STARTUP.report()
+    fields = {'port': BRIDGE_PORT, 'pid': os.getpid(), 'server': server_mode}
+    # The readiness pipe wakes the session manager directly; the stdout marker is the fallback.
+    startup.signal_ready({'ok': True, **fields, 'startup': report})
+    LOG.lifecycle('[AETHER_RPC_READY]', **fields, startup=json.dumps(report, separators=(',', ':')))
+
+
+def _report_start_failure(exc):
+    LOG.error('server.start_failed', port=BRIDGE_PORT, error=str(exc))
+    LOG.lifecycle('[AETHER_RPC_ERROR]', reason='server_start_failed', port=BRIDGE_PORT, error=str(exc))
+    startup.signal_ready({'ok': False, 'reason': 'server_start_failed', 'error': str(exc)})
+
+
 def main():
     if BRIDGE_PORT <= 0:
-        _print('[AETHER_RPC_DISABLED] invalid port')
+        LOG.lifecycle('[AETHER_RPC_DISABLED]', reason='invalid_port')
+        startup.signal_ready({'ok': False, 'reason': 'invalid_port'})
         return
 
-    _start_server(BRIDGE_PORT)
-    _print(f'[AETHER_RPC_READY] port={BRIDGE_PORT} pid={os.getpid()}')
+    if BRIDGE_SERVER_MODE == 'asyncio':
+        from aether_bridge import async_server
+
+        # Sockets live on the event loop thread; RPC work runs here, on Blender's main thread.
+        executor = async_server.MainThreadExecutor()
+        try:
+            _start_async_server(BRIDGE_PORT, executor)
+        except OSError as exc:
+            _report_start_failure(exc)
+            return
+        SNAPSHOTS.start_idle_thread(dispatch=executor.submit)
+        _announce_ready('asyncio')
+        try:
+            executor.run_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    try:
+        _start_server(BRIDGE_PORT)
+    except OSError as exc:
+        _report_start_failure(exc)
+        return
+    SNAPSHOTS.start_idle_thread()
+    _announce_ready('threaded')
     
     try:
         threading.Event().wait()
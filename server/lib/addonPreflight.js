@@ -0,0 +1,83 @@
+const path = require('path');
+const { spawn } = require('child_process');
+const { ADDON_PREFLIGHT_CACHE_FILE, PYTHON_BIN } = require('./constants');
+
+const PREFLIGHT_SCRIPT = path.resolve(__dirname, '..', 'addon_preflight.py');
+const DEFAULT_PREFLIGHT_TIMEOUT_MS = 30000;
+
+const createPreflightError = (report) => {
+  const problems = Array.isArray(report.problems) ? report.problems : [];
+  const first = problems[0] || {};
+  const location = first.path
+    ? ` (${path.basename(first.path)}${Number.isInteger(first.line) ? `:${first.line}` : ''})`
+    : '';
+  const error = new Error(`Addon preflight failed: ${first.message || 'unknown problem'}${location}`);
+  error.code = first.code || 'ADDON_PREFLIGHT_FAILED';
+  error.preflight = report;
+  return error;
+};
+
+// A preflight that could not run has checked nothing, so it fails like a problem report would.
+const unavailableReport = (reason) => ({
+  ok: false,
+  unavailable: true,
+  reason,
+  problems: [{ code: 'ADDON_PREFLIGHT_UNAVAILABLE', message: `preflight unavailable: ${reason}` }],
+});
+
+// Byte-compiles and statically checks an addon outside Blender, optionally leaving checked-hash
+// pycs behind for Blender to import. Resolves the JSON report; `report.unavailable` is set (and
+// `ok` is false) when the interpreter cannot be spawned, times out or returns no report.
+const runAddonPreflight = ({
+  addonPath,
+  pythonBin = PYTHON_BIN,
+  cachePath = ADDON_PREFLIGHT_CACHE_FILE,
+  writePycs = false,
+  timeoutMs = DEFAULT_PREFLIGHT_TIMEOUT_MS,
+} = {}) =>
+  new Promise((resolve) => {
+    const args = [PREFLIGHT_SCRIPT, addonPath];
+    if (cachePath) {
+      args.push('--cache', cachePath);
+    }
+    if (writePycs) {
+      args.push('--write-pycs');
+    }
+    const child = spawn(pythonBin, args, { stdio: ['ignore', 'pipe', 'pipe'], windowsHide: true });
+    let stdout = '';
+    let stderr = '';
+    let settled = false;
+    const finish = (report) => {
+      if (settled) return;
+      settled = true;
+      clearTimeout(timer);
+      resolve(report);
+    };
+    const timer = setTimeout(() => {
+      child.kill();
+      finish(unavailableReport(`timed out after ${timeoutMs}ms`));
+    }, timeoutMs);
+
+    child.stdout.setEncoding('utf8');
+    child.stderr.setEncoding('utf8');
+    child.stdout.on('data', (chunk) => {
+      stdout += chunk;
+    });
+    child.stderr.on('data', (chunk) => {
+      stderr += chunk;
+    });
+    child.on('error', (error) => finish(unavailableReport(error.message)));
+    child.on('close', (code) => {
+      try {
+        finish(JSON.parse(stdout.trim().split(/\r?\n/).pop()));
+      } catch {
+        finish(unavailableReport((stderr.trim() || `exited with code ${code}`).slice(-500)));
+      }
+    });
+  });
+
+module.exports = {
+  PREFLIGHT_SCRIPT,
+  createPreflightError,
+  runAddonPreflight,
+};
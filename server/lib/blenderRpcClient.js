@@ -34,13 +34,22 @@ const requestJson = ({ method, hostname, port, path, headers, body, timeoutMs =
           const error = new Error(message);
           error.statusCode = res.statusCode;
           error.payload = json;
+          if (json && typeof json.code === 'string') {
+            error.code = json.code;
+          }
+          const retryAfterSeconds = Number(res.headers && res.headers['retry-after']);
+          if (Number.isFinite(retryAfterSeconds)) {
+            error.retryAfterMs = retryAfterSeconds * 1000;
+          }
           reject(error);
         });
       },
     );
 
     req.setTimeout(timeoutMs, () => {
-      req.destroy(new Error(`RPC request timed out after ${timeoutMs}ms`));
+      const error = new Error(`RPC request timed out after ${timeoutMs}ms`);
+      error.code = 'RPC_TIMEOUT';
+      req.destroy(error);
     });
 
     req.on('error', reject);
@@ -64,22 +73,118 @@ const pingBridge = async ({ port, timeoutMs = 1000 }) => {
   return Boolean(result.payload && result.payload.ok);
 };
 
-const callBridge = async ({ port, token, command, payload = {}, timeoutMs = 120000 }) => {
-  const body = JSON.stringify({ command, payload });
-  const result = await requestJson({
-    method: 'POST',
-    hostname: '127.0.0.1',
-    port,
-    path: '/rpc',
-    headers: {
-      'Content-Type': 'application/json',
-      'Content-Length': Buffer.byteLength(body),
-      'X-Aether-Token': token || '',
-    },
-    body,
-    timeoutMs,
-  });
+// Only failures where the request never reached (or was cut off from) the bridge are resent. A
+// timed-out command may still be running in Blender, so resending it would only wait again.
+const RETRYABLE_TRANSPORT_CODES = new Set(['ECONNREFUSED', 'ECONNRESET', 'ECONNABORTED', 'EPIPE']);
+
+const isRetryableTransportError = (error) =>
+  Boolean(error) && !Number.isInteger(error.statusCode) && RETRYABLE_TRANSPORT_CODES.has(error.code);
+
+// Errors that mean the Blender process (or its bridge) is gone, as opposed to a command failing.
+const SESSION_LOST_CODES = new Set([
+  'ECONNRESET',
+  'ECONNREFUSED',
+  'ECONNABORTED',
+  'EPIPE',
+  'RPC_UNAVAILABLE',
+  'BLENDER_SESSION_NOT_RUNNING',
+  'BLENDER_NO_ACTIVE_SESSION',
+]);
+
+const isSessionLostError = (error) => Boolean(error && SESSION_LOST_CODES.has(error.code));
+
+const BRIDGE_OVERLOADED_CODE = 'RPC_OVERLOADED';
+const OVERLOAD_BACKOFF_MAX_MS = 5000;
+
+// A shed request never ran, so it is safe to resend with or without an idempotency key.
+const isOverloadedError = (error) =>
+  Boolean(error && error.statusCode === 503 && error.code === BRIDGE_OVERLOADED_CODE);
+
+const overloadBackoffMs = (error, attempt) => {
+  const hinted = error.payload && Number(error.payload.retryAfterMs);
+  const base = Number.isFinite(hinted) && hinted > 0 ? hinted : error.retryAfterMs || 250;
+  const exponential = Math.min(OVERLOAD_BACKOFF_MAX_MS, base * 2 ** (attempt - 1));
+  return Math.round(exponential / 2 + Math.random() * (exponential / 2));
+};
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// Bridge spans are diagnostics; a broken trace consumer must never fail the RPC itself.
+const reportTrace = (onTrace, payload) => {
+  if (typeof onTrace !== 'function' || !payload || !payload.trace) {
+    return;
+  }
+  try {
+    onTrace(payload.trace);
+  } catch {
+    // ignore trace consumer failures
+  }
+};
+
+const callBridge = async ({
+  port,
+  token,
+  command,
+  payload = {},
+  timeoutMs = 120000,
+  idempotencyKey,
+  retries = 0,
+  overloadRetries = 3,
+  traceparent,
+  onTrace,
+}) => {
+  const message = { command, payload };
+  const headers = {
+    'Content-Type': 'application/json',
+    'X-Aether-Token': token || '',
+  };
+  if (idempotencyKey) {
+    message.idempotency_key = String(idempotencyKey);
+    headers['X-Aether-Idempotency-Key'] = String(idempotencyKey);
+  }
+  if (traceparent) {
+    headers.traceparent = String(traceparent);
+  }
+  const body = JSON.stringify(message);
+  headers['Content-Length'] = Buffer.byteLength(body);
+
+  // Without a key a retried request could execute twice, so retries require one.
+  const maxAttempts = idempotencyKey ? Math.max(0, Number(retries) || 0) + 1 : 1;
+  const maxOverloadRetries = Math.max(0, Number(overloadRetries) || 0);
+  // Resends share the caller's deadline instead of each getting a fresh `timeoutMs`.
+  const deadline = Date.now() + timeoutMs;
+  let overloadAttempts = 0;
+  let result = null;
+  for (let attempt = 1; ; attempt += 1) {
+    try {
+      result = await requestJson({
+        method: 'POST',
+        hostname: '127.0.0.1',
+        port,
+        path: '/rpc',
+        headers,
+        body,
+        timeoutMs: Math.max(1, deadline - Date.now()),
+      });
+      break;
+    } catch (error) {
+      reportTrace(onTrace, error.payload);
+      if (isOverloadedError(error) && overloadAttempts < maxOverloadRetries) {
+        overloadAttempts += 1;
+        attempt -= 1;
+        await sleep(Math.min(overloadBackoffMs(error, overloadAttempts), Math.max(0, deadline - Date.now())));
+        if (Date.now() >= deadline) {
+          throw error;
+        }
+        continue;
+      }
+      if (attempt >= maxAttempts || !isRetryableTransportError(error) || Date.now() >= deadline) {
+        throw error;
+      }
+    }
+  }
 
+  reportTrace(onTrace, result.payload);
   if (!result.payload || result.payload.ok !== true) {
     throw new Error((result.payload && result.payload.error) || 'RPC command failed.');
   }
@@ -88,6 +193,9 @@ const callBridge = async ({ port, token, command, payload = {}, timeoutMs = 1200
 };
 
 module.exports = {
+  BRIDGE_OVERLOADED_CODE,
+  isOverloadedError,
+  isSessionLostError,
   pingBridge,
   callBridge,
 };
@@ -13,10 +13,31 @@ const splitLines = (buffered, chunk) => {
   };
 };
 
-const buildArgs = ({ mode, harnessPath, addonPath }) => {
+const HARNESS_REPORT_MARKER = '[AETHER_HARNESS_REPORT]';
+
+const parseHarnessReport = (line) => {
+  const text = String(line || '');
+  if (!text.startsWith(HARNESS_REPORT_MARKER)) return null;
+  try {
+    return JSON.parse(text.slice(HARNESS_REPORT_MARKER.length).trim());
+  } catch {
+    return null;
+  }
+};
+
+// One Blender launch validates every addon in `addonPaths` (or `addonPath`) plus any manifest.
+const buildArgs = ({ mode, harnessPath, addonPath, addonPaths, manifestPath, reportPath }) => {
   const resolvedHarness = path.resolve(harnessPath);
-  const resolvedAddon = path.resolve(addonPath);
-  const base = ['-P', resolvedHarness, '--', resolvedAddon];
+  const targets = (Array.isArray(addonPaths) ? addonPaths : [addonPath])
+    .filter(Boolean)
+    .map((target) => path.resolve(target));
+  if (manifestPath) {
+    targets.push('--manifest', path.resolve(manifestPath));
+  }
+  if (reportPath) {
+    targets.push('--report', path.resolve(reportPath));
+  }
+  const base = ['-P', resolvedHarness, '--'].concat(targets);
 
   if (mode === 'gui') {
     return base;
@@ -30,12 +51,15 @@ const runBlender = ({
   mode,
   harnessPath,
   addonPath,
+  addonPaths,
+  manifestPath,
+  reportPath,
   cwd,
   onStarted,
   onLog,
   onExit,
 }) => {
-  const args = buildArgs({ mode, harnessPath, addonPath });
+  const args = buildArgs({ mode, harnessPath, addonPath, addonPaths, manifestPath, reportPath });
   const command = toCommandText(blenderPath, args);
   const child = spawn(blenderPath, args, {
     cwd,
@@ -47,8 +71,12 @@ const runBlender = ({
   let stdoutBuf = '';
   let stderrBuf = '';
   let finished = false;
+  let report = null;
 
   const pushLogLine = (stream, line) => {
+    if (stream === 'stdout' && !report) {
+      report = parseHarnessReport(line);
+    }
     if (typeof onLog === 'function') {
       onLog({
         type: 'blender_log',
@@ -104,6 +132,7 @@ const runBlender = ({
         error,
         command,
         args,
+        report,
       };
       if (typeof onExit === 'function') {
         onExit(result);
@@ -126,6 +155,7 @@ const runBlender = ({
         error: null,
         command,
         args,
+        report,
       };
       if (typeof onExit === 'function') {
         onExit(result);
@@ -159,6 +189,8 @@ const runBlender = ({
 };
 
 module.exports = {
+  HARNESS_REPORT_MARKER,
   buildArgs,
+  parseHarnessReport,
   runBlender,
 };
@@ -1,4 +1,5 @@
 const { spawn } = require('child_process');
+const fs = require('fs/promises');
 const path = require('path');
 const net = require('net');
 const crypto = require('crypto');
@@ -6,6 +7,7 @@ const { killProcessTree, nowIso } = require('./utils');
 const runStore = require('./runStore');
 const { callBridge } = require('./blenderRpcClient');
 const { appendAuditRecord, AUDIT_EVENT_TYPES } = require('./auditLog');
+const { BRIDGE_LOG_DIR, RUNS_DIR, SESSION_SNAPSHOT_DIR } = require('./constants');
 
 const sessions = new Map();
 const subscribers = new Set();
@@ -13,6 +15,11 @@ const subscribers = new Set();
 const createId = () => `blender_${Date.now()}_${crypto.randomBytes(3).toString('hex')}`;
 const createRpcToken = () => crypto.randomBytes(24).toString('hex');
 const SAFE_EXEC_PYTHON_BLOCK_CODES = new Set(['SAF_004_BLOCKED_IMPORT', 'SAF_004_BLOCKED_BUILTIN']);
+const RECYCLE_READY_TIMEOUT_MS = 60000;
+const RPC_TRANSPORT_RETRIES = 1;
+// How long a session whose RPC just failed may take to report its process exit.
+const CRASH_SETTLE_MS = 2000;
+const SNAPSHOT_MANIFEST = 'latest.json';
 
 const allocateLocalPort = () =>
   new Promise((resolve, reject) => {
@@ -35,6 +42,51 @@ const allocateLocalPort = () =>
     });
   });
 
+// Extra pipe the bridge writes one JSON line to once it is listening (POSIX only).
+const READY_PIPE_FD = 3;
+const useReadyPipe = () => process.platform !== 'win32';
+
+const parseReadyMarkerStartup = (line) => {
+  const match = /\bstartup=(\{.*\})\s*$/.exec(line);
+  if (!match) return null;
+  try {
+    return JSON.parse(match[1]);
+  } catch {
+    return null;
+  }
+};
+
+const BRIDGE_FAILURE_MARKERS = new Set(['[AETHER_RPC_ERROR]', '[AETHER_RPC_DISABLED]']);
+
+// A bridge failure reaches the session logs either as a lifecycle marker on stdout
+// (`[AETHER_RPC_ERROR] reason=...`) or, when the bridge has no log file, as an error record of its
+// JSON-lines logger on stderr. Returns the message to surface, or null for any other line.
+const parseBridgeFailure = (line) => {
+  const text = String(line || '').trim();
+  if (BRIDGE_FAILURE_MARKERS.has(text.split(/\s/, 1)[0])) {
+    return text;
+  }
+  if (!text.startsWith('{')) {
+    return null;
+  }
+  let record = null;
+  try {
+    record = JSON.parse(text);
+  } catch {
+    return null;
+  }
+  if (!record || typeof record !== 'object') {
+    return null;
+  }
+  if (record.event === 'lifecycle' && BRIDGE_FAILURE_MARKERS.has(record.marker)) {
+    return [record.marker, record.reason, record.error].filter(Boolean).join(' ');
+  }
+  if (record.level === 'error') {
+    return [record.event, record.error].filter(Boolean).join(': ');
+  }
+  return null;
+};
+
 const splitLines = (buffered, chunk) => {
   const text = `${buffered}${String(chunk || '')}`;
   const lines = text.split(/\r?\n/);
@@ -44,7 +96,11 @@ const splitLines = (buffered, chunk) => {
   };
 };
 
-const launchSession = async ({ mode }) => {
+const snapshotsEnabled = (settings) =>
+  Number(settings && settings.sessionSnapshotEvery) > 0 || Number(settings && settings.sessionSnapshotIdleSeconds) > 0;
+
+// `blendFile` opens a scene (a snapshot) before the bridge starts; `resumedFrom` is that snapshot.
+const launchSession = async ({ mode, blendFile = null, resumedFrom = null } = {}) => {
   const settings = await runStore.getSettings();
   const blenderPath = settings.blenderPath || 'blender';
   const allowedAddonRoot = path.resolve(settings.addonOutputPath || path.resolve(__dirname, '..', '..', 'generated_addons'));
@@ -52,10 +108,18 @@ const launchSession = async ({ mode }) => {
   const bridgeScript = path.resolve(__dirname, '..', 'blender_rpc_bridge.py');
   const rpcPort = await allocateLocalPort();
   const rpcToken = createRpcToken();
-  const args = runMode === 'headless' ? ['-b', '--python', bridgeScript] : ['--python', bridgeScript];
+  const args = [
+    ...(runMode === 'headless' ? ['-b'] : []),
+    ...(blendFile ? [blendFile] : []),
+    '--python',
+    bridgeScript,
+  ];
+  const sessionId = createId();
+  const bridgeLogPath = path.join(BRIDGE_LOG_DIR, `${sessionId}.jsonl`);
+  const snapshotDir = snapshotsEnabled(settings) ? path.join(SESSION_SNAPSHOT_DIR, sessionId) : null;
 
   const session = {
-    id: createId(),
+    id: sessionId,
     status: 'starting',
     mode: runMode,
     createdAt: nowIso(),
@@ -71,17 +135,42 @@ const launchSession = async ({ mode }) => {
     rpcReady: false,
     bridgeError: null,
     supportsRpc: true,
+    recycleRequested: false,
+    lastWatchdog: null,
+    bridgeLogPath,
+    startup: null,
+    snapshotDir,
+    resumedFrom,
   };
 
+  const readyPipe = useReadyPipe();
   const child = spawn(blenderPath, args, {
     windowsHide: false,
-    stdio: ['ignore', 'pipe', 'pipe'],
+    stdio: readyPipe ? ['ignore', 'pipe', 'pipe', 'pipe'] : ['ignore', 'pipe', 'pipe'],
     detached: process.platform !== 'win32',
     env: {
       ...process.env,
       AETHER_RPC_PORT: String(rpcPort),
+      AETHER_RPC_READY_FD: readyPipe ? String(READY_PIPE_FD) : '',
+      AETHER_RPC_SERVER: settings.bridgeServerMode === 'asyncio' ? 'asyncio' : 'threaded',
       AETHER_RPC_TOKEN: rpcToken,
       AETHER_ALLOWED_ADDON_ROOT: allowedAddonRoot,
+      AETHER_TEMPLATE_ROOT: settings.templateLibraryPath || '',
+      AETHER_RPC_MEMORY_CEILING_MB: String(settings.sessionMemoryCeilingMb || 0),
+      AETHER_RPC_PURGE_EVERY: String(settings.sessionOrphanPurgeEvery || 0),
+      // Purging mid-plan can drop datablocks a later step still expects; the growth trigger
+      // only runs when periodic purges are opted into.
+      AETHER_RPC_PURGE_GROWTH: Number(settings.sessionOrphanPurgeEvery) > 0 ? '' : '0',
+      AETHER_RPC_LOG_PATH: bridgeLogPath,
+      AETHER_RPC_SNAPSHOT_DIR: snapshotDir || '',
+      AETHER_RPC_SNAPSHOT_EVERY: String(settings.sessionSnapshotEvery || 0),
+      AETHER_RPC_SNAPSHOT_IDLE_S: String(settings.sessionSnapshotIdleSeconds || 0),
+      AETHER_RPC_OUTPUT_ROOT: RUNS_DIR,
+      AETHER_RPC_OUTPUT_INLINE_BYTES: String(settings.execOutputInlineBytes ?? ''),
+      AETHER_RPC_LOG_LEVEL: settings.bridgeLogLevel || 'info',
+      AETHER_RPC_ACCESS_LOG_SAMPLE: String(
+        Number.isFinite(settings.bridgeAccessLogSampleRate) ? settings.bridgeAccessLogSampleRate : 0.1,
+      ),
     },
   });
 
@@ -115,6 +204,19 @@ const launchSession = async ({ mode }) => {
   let stdoutBuf = '';
   let stderrBuf = '';
 
+  const markRpcReady = (via, startup) => {
+    if (session.rpcReady) return;
+    session.rpcReady = true;
+    session.bridgeError = null;
+    session.startup = startup || null;
+    pushEvent({
+      type: 'blender_rpc_ready',
+      rpcPort: session.rpcPort,
+      via,
+      startup: session.startup,
+    });
+  };
+
   const addLog = (stream, line) => {
     const entry = {
       timestamp: nowIso(),
@@ -125,27 +227,41 @@ const launchSession = async ({ mode }) => {
     pushEvent({ type: 'blender_log', stream, line });
 
     if (!session.rpcReady && /\[AETHER_RPC_READY\]/.test(line)) {
-      session.rpcReady = true;
-      session.bridgeError = null;
-      pushEvent({
-        type: 'blender_rpc_ready',
-        rpcPort: session.rpcPort,
-      });
+      markRpcReady('stdout', parseReadyMarkerStartup(line));
       return;
     }
 
-    if (
-      !session.bridgeError &&
-      (/\[AETHER_RPC_ERROR\]/.test(line) || /\[AETHER_RPC_DISABLED\]/.test(line))
-    ) {
-      session.bridgeError = line;
+    const failure = session.bridgeError ? null : parseBridgeFailure(line);
+    if (failure) {
+      session.bridgeError = failure;
       pushEvent({
         type: 'blender_rpc_error',
-        message: line,
+        message: failure,
       });
     }
   };
 
+  const readyStream = child.stdio && child.stdio[READY_PIPE_FD];
+  if (readyStream) {
+    let readyBuf = '';
+    readyStream.on('data', (chunk) => {
+      const result = splitLines(readyBuf, chunk);
+      readyBuf = result.rest;
+      for (const line of result.lines) {
+        let message = null;
+        try {
+          message = JSON.parse(line);
+        } catch {
+          continue;
+        }
+        if (message && message.ok === true) {
+          markRpcReady('pipe', message.startup || null);
+        }
+      }
+    });
+    readyStream.on('error', () => {});
+  }
+
   child.stdout.on('data', (chunk) => {
     const result = splitLines(stdoutBuf, chunk);
     stdoutBuf = result.rest;
@@ -210,6 +326,12 @@ const buildSessionSummary = (session) => {
     rpcPort: session.rpcPort || null,
     supportsRpc: Boolean(session.supportsRpc),
     bridgeError: session.bridgeError || null,
+    recycleRequested: Boolean(session.recycleRequested),
+    lastWatchdog: session.lastWatchdog || null,
+    bridgeLogPath: session.bridgeLogPath || null,
+    startup: session.startup || null,
+    snapshotDir: session.snapshotDir || null,
+    resumedFrom: session.resumedFrom || null,
   };
 };
 
@@ -234,7 +356,7 @@ const getActiveSession = () => {
   return buildSessionSummary(sorted[0]);
 };
 
-const executeRpc = async (sessionId, command, payload = {}, timeoutMs = 120000) => {
+const executeRpc = async (sessionId, command, payload = {}, timeoutMs = 120000, options = {}) => {
   const id = String(sessionId);
   const session = sessions.get(id);
   if (!session) {
@@ -245,6 +367,7 @@ const executeRpc = async (sessionId, command, payload = {}, timeoutMs = 120000)
   if (session.status !== 'running') {
     const error = new Error('Blender session is not running.');
     error.statusCode = 409;
+    error.code = 'BLENDER_SESSION_NOT_RUNNING';
     throw error;
   }
   if (!session.supportsRpc || !session.rpcPort) {
@@ -290,11 +413,28 @@ const executeRpc = async (sessionId, command, payload = {}, timeoutMs = 120000)
       command: normalizedCommand,
       payload,
       timeoutMs,
+      idempotencyKey: options.idempotencyKey || crypto.randomUUID(),
+      retries: Number.isInteger(options.retries) ? options.retries : RPC_TRANSPORT_RETRIES,
+      traceparent: options.traceparent,
+      onTrace: options.onTrace,
     });
     pushEvent({
       type: 'blender_rpc_call_completed',
       command: normalizedCommand,
     });
+    const watchdog = result && typeof result === 'object' ? result.watchdog : null;
+    if (watchdog && typeof watchdog === 'object') {
+      session.lastWatchdog = watchdog;
+      if (watchdog.recycle === true && !session.recycleRequested) {
+        session.recycleRequested = true;
+        pushEvent({
+          type: 'blender_recycle_requested',
+          command: normalizedCommand,
+          reason: watchdog.recycleReason || null,
+          rssBytes: watchdog.rssBytes == null ? null : watchdog.rssBytes,
+        });
+      }
+    }
     return result;
   } catch (error) {
     const errorPayload = error && error.payload ? error.payload : null;
@@ -335,14 +475,197 @@ const executeRpc = async (sessionId, command, payload = {}, timeoutMs = 120000)
   }
 };
 
-const executeOnActive = async (command, payload = {}, timeoutMs = 120000) => {
-  const active = getActiveSession();
+// Resolves on the session's own events (readiness pipe or marker) instead of polling.
+const waitForRpcReady = (sessionId, timeoutMs = RECYCLE_READY_TIMEOUT_MS) =>
+  new Promise((resolve, reject) => {
+    const id = String(sessionId);
+    let timer = null;
+    const settle = (timedOut) => {
+      const session = sessions.get(id);
+      if (session && session.rpcReady && session.status === 'running') {
+        subscribers.delete(listener);
+        clearTimeout(timer);
+        resolve(buildSessionSummary(session));
+        return;
+      }
+      if (timedOut || !session || session.status !== 'running') {
+        subscribers.delete(listener);
+        clearTimeout(timer);
+        const error = new Error('Recycled Blender session did not become RPC-ready.');
+        error.statusCode = 503;
+        error.code = 'BLENDER_RECYCLE_FAILED';
+        reject(error);
+      }
+    };
+    const listener = (event) => {
+      if (event && event.sessionId === id) {
+        settle(false);
+      }
+    };
+    subscribers.add(listener);
+    timer = setTimeout(() => settle(true), timeoutMs);
+    settle(false);
+  });
+
+const recycleSession = async (id) => {
+  const session = sessions.get(String(id));
+  if (!session) return null;
+  await stopSession(session.id);
+  const replacement = await launchSession({ mode: session.mode });
+  const ready = await waitForRpcReady(replacement.id);
+  const next = sessions.get(replacement.id);
+  const evt = {
+    id: `${next.id}_${next.events.length + 1}`,
+    timestamp: nowIso(),
+    sessionId: next.id,
+    type: 'blender_recycled',
+    previousSessionId: session.id,
+    reason: session.lastWatchdog && session.lastWatchdog.recycleReason ? session.lastWatchdog.recycleReason : null,
+  };
+  next.events.push(evt);
+  for (const listener of subscribers) {
+    try {
+      listener(evt);
+    } catch {
+      // ignore listener failures
+    }
+  }
+  return ready;
+};
+
+const readLatestSnapshot = async (session) => {
+  if (!session || !session.snapshotDir) return null;
+  try {
+    const manifest = JSON.parse(await fs.readFile(path.join(session.snapshotDir, SNAPSHOT_MANIFEST), 'utf8'));
+    return manifest && typeof manifest.path === 'string' ? manifest : null;
+  } catch {
+    return null;
+  }
+};
+
+const snapshotExists = async (snapshot) => {
+  if (!snapshot || !snapshot.path) return false;
+  try {
+    return (await fs.stat(snapshot.path)).isFile();
+  } catch {
+    return false;
+  }
+};
+
+const waitForSessionExit = (sessionId, timeoutMs = CRASH_SETTLE_MS) =>
+  new Promise((resolve) => {
+    const id = String(sessionId);
+    let timer = null;
+    const settle = (timedOut) => {
+      const session = sessions.get(id);
+      const exited = !session || session.status !== 'running';
+      if (exited || timedOut) {
+        subscribers.delete(listener);
+        clearTimeout(timer);
+        resolve(exited);
+      }
+    };
+    const listener = (event) => {
+      if (event && event.sessionId === id) {
+        settle(false);
+      }
+    };
+    subscribers.add(listener);
+    timer = setTimeout(() => settle(true), timeoutMs);
+    settle(false);
+  });
+
+const latestSession = () =>
+  [...sessions.values()].sort(
+    (a, b) => (Date.parse(b.startedAt || b.createdAt || 0) || 0) - (Date.parse(a.startedAt || a.createdAt || 0) || 0),
+  )[0] || null;
+
+// Relaunches the most recent session from its latest snapshot if it crashed. Resolves
+// `{ session, snapshot }`, where `snapshot` is null for a blank relaunch because no snapshot of
+// `runId` exists yet, or null when there is nothing to recover: snapshots are off, or the session
+// is healthy or was stopped on purpose.
+const recoverFromSnapshot = async ({ runId = null } = {}) => {
+  const session = latestSession();
+  if (!session || (!session.snapshotDir && !session.resumedFrom)) return null;
+  if (session.status === 'running' && !(await waitForSessionExit(session.id))) {
+    return null;
+  }
+  if (session.status !== 'exited' && session.status !== 'failed') {
+    return null;
+  }
+  const usable = async (candidate) =>
+    (await snapshotExists(candidate)) && (!runId || candidate.runId === String(runId));
+  const latest = await readLatestSnapshot(session);
+  // A resumed session that crashes before its first snapshot falls back to the one it started from;
+  // with no snapshot of this run at all, a blank session lets the run start over from its first step.
+  const fallback = (await usable(latest)) ? latest : session.resumedFrom;
+  const snapshot = (await usable(fallback)) ? fallback : null;
+  const replacement = snapshot
+    ? await launchSession({ mode: session.mode, blendFile: snapshot.path, resumedFrom: snapshot })
+    : await launchSession({ mode: session.mode });
+  const ready = await waitForRpcReady(replacement.id);
+  const next = sessions.get(replacement.id);
+  const evt = {
+    id: `${next.id}_${next.events.length + 1}`,
+    timestamp: nowIso(),
+    sessionId: next.id,
+    type: 'blender_resumed',
+    previousSessionId: session.id,
+    snapshot,
+  };
+  next.events.push(evt);
+  for (const listener of subscribers) {
+    try {
+      listener(evt);
+    } catch {
+      // ignore listener failures
+    }
+  }
+  return { session: ready, snapshot };
+};
+
+const removeSnapshots = async (session) => {
+  const dirs = [session.snapshotDir, session.resumedFrom && path.dirname(String(session.resumedFrom.path || ''))];
+  for (const dir of dirs) {
+    if (dir && path.resolve(dir).startsWith(`${path.resolve(SESSION_SNAPSHOT_DIR)}${path.sep}`)) {
+      try {
+        await fs.rm(dir, { recursive: true, force: true });
+      } catch {
+        // snapshots are disposable
+      }
+    }
+  }
+};
+
+// Runs hold the session while they use it: a watchdog recycle restarts Blender on a blank
+// scene, so it waits until no run is building on the current one.
+let sessionHolds = 0;
+
+const holdSession = () => {
+  sessionHolds += 1;
+  let released = false;
+  return () => {
+    if (!released) {
+      released = true;
+      sessionHolds = Math.max(0, sessionHolds - 1);
+    }
+  };
+};
+
+const isSessionHeld = () => sessionHolds > 0;
+
+const executeOnActive = async (command, payload = {}, timeoutMs = 120000, options = {}) => {
+  let active = getActiveSession();
   if (!active) {
     const error = new Error('No active Blender session.');
     error.statusCode = 404;
+    error.code = 'BLENDER_NO_ACTIVE_SESSION';
     throw error;
   }
-  const result = await executeRpc(active.id, command, payload, timeoutMs);
+  if (active.recycleRequested && !isSessionHeld()) {
+    active = await recycleSession(active.id);
+  }
+  const result = await executeRpc(active.id, command, payload, timeoutMs, options);
   return {
     sessionId: active.id,
     result,
@@ -371,6 +694,8 @@ const stopSession = async (id) => {
   }
 
   await killProcessTree(session.child);
+  // A deliberate stop ends the session's lineage, so its snapshots can no longer be resumed.
+  await removeSnapshots(session);
 
   session.status = 'stopped';
   session.endedAt = nowIso();
@@ -398,6 +723,11 @@ module.exports = {
   stopSession,
   executeRpc,
   executeOnActive,
+  recycleSession,
+  recoverFromSnapshot,
+  holdSession,
+  isSessionHeld,
+  waitForRpcReady,
   subscribe: (listener) => {
     if (typeof listener !== 'function') return () => {};
     subscribers.add(listener);
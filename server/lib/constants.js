@@ -6,6 +6,12 @@ const RUNS_FILE = path.join(DATA_DIR, 'runs.json');
 const SETTINGS_FILE = path.join(DATA_DIR, 'settings.json');
 const PRESETS_FILE = path.join(DATA_DIR, 'presets.json');
 const AUDIT_LOG_FILE = path.join(DATA_DIR, 'audit.log.jsonl');
+const BRIDGE_LOG_DIR = path.join(DATA_DIR, 'bridge_logs');
+const ADDON_PREFLIGHT_CACHE_FILE = path.join(DATA_DIR, 'addon_preflight_cache.json');
+const SESSION_SNAPSHOT_DIR = path.join(DATA_DIR, 'session_snapshots');
+const RUNS_DIR = path.join(REPO_ROOT, 'generated_addons', 'runs');
+// Most Linux and macOS installs only ship `python3`; Windows installs register `python`.
+const PYTHON_BIN = process.env.AETHER_PYTHON_BIN || (process.platform === 'win32' ? 'python' : 'python3');
 
 const AUDIT_EVENT_TYPES = {
   AUTH_FAILURE: 'auth_failure',
@@ -21,9 +27,20 @@ const DEFAULT_SETTINGS = {
   blenderPath: 'blender',
   workspacePath: REPO_ROOT,
   addonOutputPath: path.join(REPO_ROOT, 'generated_addons'),
+  templateLibraryPath: path.join(REPO_ROOT, 'templates'),
   runMode: 'headless',
   timeoutMs: 120000,
   logVerbosity: 'normal',
+  nodeTreeApplyMode: 'replay',
+  nodeTreeBatchEdit: true,
+  sessionMemoryCeilingMb: 6144,
+  sessionOrphanPurgeEvery: 0,
+  sessionSnapshotEvery: 0,
+  sessionSnapshotIdleSeconds: 0,
+  execOutputInlineBytes: 65536,
+  bridgeServerMode: 'threaded',
+  bridgeLogLevel: 'info',
+  bridgeAccessLogSampleRate: 0.1,
   llmProvider: 'anthropic',
   llmModel: 'GLM-4.7',
   llmUseCustomEndpoint: false,
@@ -53,6 +70,11 @@ module.exports = {
   SETTINGS_FILE,
   PRESETS_FILE,
   AUDIT_LOG_FILE,
+  BRIDGE_LOG_DIR,
+  ADDON_PREFLIGHT_CACHE_FILE,
+  SESSION_SNAPSHOT_DIR,
+  RUNS_DIR,
+  PYTHON_BIN,
   DEFAULT_SETTINGS,
   REPO_ROOT,
   TRACE_STEPS,
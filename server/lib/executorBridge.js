@@ -1,3 +1,5 @@
+const fs = require('fs/promises');
+const path = require('path');
 const { executeOnActive, getActiveSession, stopSession } = require('./blenderSessionManager');
 const { assertExecPythonPayloadAllowed } = require('./securityPolicy');
 
@@ -5,11 +7,13 @@ const DEFAULT_EXEC_TIMEOUT_MS = 120000;
 
 const toPythonPayloadLiteral = (value) => JSON.stringify(JSON.stringify(value || {}));
 
-const buildRpcPrelude = (step, serializedPayloadLiteral) => `
+const FUSED_RESULTS_MARKER = '[AETHER_FUSED_STEPS]';
+
+const buildRpcPrelude = (stepId, serializedPayloadLiteral) => `
 import json
 import bpy
 
-_STEP_ID = ${JSON.stringify(step.id || 'protocol_step')}
+_STEP_ID = ${JSON.stringify(stepId || 'protocol_step')}
 _PAYLOAD = json.loads(${serializedPayloadLiteral})
 
 def _raise(message):
@@ -59,31 +63,8 @@ def _ensure_group_io_nodes(node_tree):
     return group_input, group_output
 
 def _index_nodes(node_tree):
-    node_index = {}
-    for node in node_tree.nodes:
-        stored_id = None
-        try:
-            stored_id = node.get("_aether_node_id")
-        except Exception:
-            stored_id = None
-        if isinstance(stored_id, str) and stored_id:
-            node_index[stored_id] = node
-        if node.bl_idname == 'NodeGroupInput':
-            node_index['group_input'] = node
-        if node.bl_idname == 'NodeGroupOutput':
-            node_index['group_output'] = node
-    return node_index
-
-def _track_node(node_index, node_id, node):
-    normalized = str(node_id or "").strip()
-    if not normalized:
-        _raise("Node id is required")
-    node_index[normalized] = node
-    try:
-        node["_aether_node_id"] = normalized
-    except Exception:
-        pass
-    return normalized
+    # Persistent bridge-side index; revalidated cheaply and rebuilt only when the tree drifted.
+    return aether.node_tree_index(node_tree)
 
 def _require_node(node_index, node_id):
     normalized = str(node_id or "").strip()
@@ -92,12 +73,11 @@ def _require_node(node_index, node_id):
         _raise("Node not found: " + normalized)
     return node
 
-def _find_socket(sockets, socket_name):
-    target_name = str(socket_name or "").strip()
-    for socket in sockets:
-        if str(socket.name) == target_name:
-            return socket
-    _raise("Socket not found: " + target_name)
+def _find_socket(node_index, node, socket_name, is_output):
+    socket = node_index.socket(node, socket_name, is_output)
+    if socket is None:
+        _raise("Socket not found: " + str(socket_name or "").strip())
+    return socket
 
 def _assign_socket_default(socket, value):
     if not hasattr(socket, "default_value"):
@@ -110,16 +90,11 @@ def _assign_socket_default(socket, value):
             return
         raise
 
-def _link_once(node_tree, from_socket, to_socket):
-    for link in node_tree.links:
-        if link.from_socket == from_socket and link.to_socket == to_socket:
-            return
-    node_tree.links.new(from_socket, to_socket)
+def _link_once(node_index, from_socket, to_socket):
+    node_index.link(from_socket, to_socket)
 
-def _remove_link(node_tree, from_socket, to_socket):
-    for link in list(node_tree.links):
-        if link.from_socket == from_socket and link.to_socket == to_socket:
-            node_tree.links.remove(link)
+def _remove_link(node_index, from_socket, to_socket):
+    node_index.unlink(from_socket, to_socket)
 
 def _set_group_interface_socket(node_tree, action, socket_name, socket_type):
     if not hasattr(node_tree, "interface") or node_tree.interface is None:
@@ -158,74 +133,179 @@ def _set_group_interface_socket(node_tree, action, socket_name, socket_type):
     _raise("Unsupported set_group_io action: " + str(action))
 `;
 
+const buildStepFunctions = () => `
+def _resolve_target(target_state, target, allow_create, node_group_name):
+    key = (str(target.get("object_name") or ""), str(target.get("modifier_name") or ""))
+    resolved = target_state.get(key)
+    if resolved is None:
+        obj = _ensure_object(key[0])
+        modifier = _ensure_nodes_modifier(obj, key[1], allow_create)
+        aether.defer_modifier(modifier)
+        node_tree = _ensure_geometry_node_tree(modifier, node_group_name)
+        _ensure_group_io_nodes(node_tree)
+        resolved = {
+            "modifier": modifier,
+            "node_tree": node_tree,
+            "node_index": _index_nodes(node_tree),
+        }
+        target_state[key] = resolved
+    else:
+        if node_group_name:
+            _ensure_geometry_node_tree(resolved["modifier"], node_group_name)
+        node_index = resolved["node_index"]
+        if "group_input" not in node_index or "group_output" not in node_index:
+            _ensure_group_io_nodes(resolved["node_tree"])
+            node_index.rebuild()
+    return resolved
+
+def _apply_node_tree_step(payload, target_state):
+    target = payload.get("target") or {}
+    operations = payload.get("operations") or []
+
+    resolved = _resolve_target(target_state, target, True, target.get("node_group_name"))
+    node_tree = resolved["node_tree"]
+    node_index = resolved["node_index"]
+
+    for operation in operations:
+        op = str(operation.get("op") or "").strip()
+        if op == "create_node":
+            node_id = str(operation.get("node_id") or "").strip()
+            if not node_id:
+                _raise("NODE_TREE create_node missing node_id")
+            if node_id in node_index:
+                _raise("NODE_TREE create_node node already exists: " + node_id)
+            node = node_index.new_node(node_id, operation.get("bl_idname"))
+            location = operation.get("location") or [0, 0]
+            if isinstance(location, list) and len(location) >= 2:
+                node.location = (float(location[0]), float(location[1]))
+        elif op == "delete_node":
+            node = _require_node(node_index, operation.get("node_id"))
+            node_index.remove_node(node)
+        elif op == "set_input_default":
+            node = _require_node(node_index, operation.get("node_id"))
+            socket = _find_socket(node_index, node, operation.get("socket"), False)
+            _assign_socket_default(socket, operation.get("value"))
+        elif op == "set_property":
+            node = _require_node(node_index, operation.get("node_id"))
+            property_name = str(operation.get("property") or "").strip()
+            if not property_name:
+                _raise("NODE_TREE set_property missing property")
+            node.__setattr__(property_name, operation.get("value"))
+            node_index.invalidate_sockets(node)
+        elif op == "link":
+            from_spec = operation.get("from") or {}
+            to_spec = operation.get("to") or {}
+            from_node = _require_node(node_index, from_spec.get("node_id"))
+            to_node = _require_node(node_index, to_spec.get("node_id"))
+            from_socket = _find_socket(node_index, from_node, from_spec.get("socket"), True)
+            to_socket = _find_socket(node_index, to_node, to_spec.get("socket"), False)
+            _link_once(node_index, from_socket, to_socket)
+        elif op == "unlink":
+            from_spec = operation.get("from") or {}
+            to_spec = operation.get("to") or {}
+            from_node = _require_node(node_index, from_spec.get("node_id"))
+            to_node = _require_node(node_index, to_spec.get("node_id"))
+            from_socket = _find_socket(node_index, from_node, from_spec.get("socket"), True)
+            to_socket = _find_socket(node_index, to_node, to_spec.get("socket"), False)
+            _remove_link(node_index, from_socket, to_socket)
+        elif op == "set_group_io":
+            _set_group_interface_socket(
+                node_tree,
+                operation.get("action"),
+                operation.get("socket"),
+                operation.get("socket_type"),
+            )
+        else:
+            _raise("Unsupported NODE_TREE op: " + op)
+
+def _apply_gn_ops_step(payload, target_state):
+    target = payload.get("target") or {}
+    ops = payload.get("ops") or []
+
+    allow_create_modifier = False
+    for operation in ops:
+        if str(operation.get("op") or "").strip() == "ensure_target" and bool(operation.get("allow_create_modifier")):
+            allow_create_modifier = True
+
+    resolved = _resolve_target(target_state, target, allow_create_modifier, None)
+    node_tree = resolved["node_tree"]
+    node_index = resolved["node_index"]
+
+    for operation in ops:
+        op = str(operation.get("op") or "").strip()
+        if op == "ensure_target":
+            continue
+        if op == "ensure_single_group_io":
+            first_input = None
+            first_output = None
+            for node in list(node_tree.nodes):
+                if node.bl_idname == "NodeGroupInput":
+                    if first_input is None:
+                        first_input = node
+                    else:
+                        node_tree.nodes.remove(node)
+                elif node.bl_idname == "NodeGroupOutput":
+                    if first_output is None:
+                        first_output = node
+                    else:
+                        node_tree.nodes.remove(node)
+            _ensure_group_io_nodes(node_tree)
+            node_index.rebuild()
+            continue
+        if op == "add_node":
+            node_id = str(operation.get("id") or "").strip()
+            if not node_id:
+                _raise("GN_OPS add_node missing id")
+            if node_id in node_index:
+                _raise("GN_OPS add_node node already exists: " + node_id)
+            node = node_index.new_node(node_id, operation.get("bl_idname"))
+            node.location = (float(operation.get("x") or 0), float(operation.get("y") or 0))
+            continue
+        if op == "remove_node":
+            node_id = str(operation.get("id") or "").strip()
+            node = node_index.get(node_id) if node_id else None
+            if node is not None:
+                node_index.remove_node(node)
+            continue
+        if op == "link":
+            from_spec = operation.get("from") or {}
+            to_spec = operation.get("to") or {}
+            from_node = _require_node(node_index, from_spec.get("node_id"))
+            to_node = _require_node(node_index, to_spec.get("node_id"))
+            from_socket = _find_socket(node_index, from_node, from_spec.get("socket_name"), True)
+            to_socket = _find_socket(node_index, to_node, to_spec.get("socket_name"), False)
+            _link_once(node_index, from_socket, to_socket)
+            continue
+        if op == "unlink":
+            from_spec = operation.get("from") or {}
+            to_spec = operation.get("to") or {}
+            from_node = _require_node(node_index, from_spec.get("node_id"))
+            to_node = _require_node(node_index, to_spec.get("node_id"))
+            from_socket = _find_socket(node_index, from_node, from_spec.get("socket_name"), True)
+            to_socket = _find_socket(node_index, to_node, to_spec.get("socket_name"), False)
+            _remove_link(node_index, from_socket, to_socket)
+            continue
+        if op == "set_input":
+            node = _require_node(node_index, operation.get("node_id"))
+            socket = _find_socket(node_index, node, operation.get("socket_name"), False)
+            _assign_socket_default(socket, operation.get("value"))
+            continue
+        if op == "cleanup_unused":
+            for key, node in node_index.items():
+                if key in ("group_input", "group_output") or node_index.get(key) is None:
+                    continue
+                if not node_index.is_linked(node):
+                    node_index.remove_node(node)
+            continue
+        _raise("Unsupported GN_OPS op: " + op)
+`;
+
 const buildNodeTreeScript = (step) => {
   const serializedPayloadLiteral = toPythonPayloadLiteral(step.payload || {});
   const script = `
-${buildRpcPrelude(step, serializedPayloadLiteral)}
-
-target = _PAYLOAD.get("target") or {}
-operations = _PAYLOAD.get("operations") or []
-
-obj = _ensure_object(target.get("object_name"))
-modifier = _ensure_nodes_modifier(obj, target.get("modifier_name"), True)
-node_tree = _ensure_geometry_node_tree(modifier, target.get("node_group_name"))
-_ensure_group_io_nodes(node_tree)
-node_index = _index_nodes(node_tree)
-
-for operation in operations:
-    op = str(operation.get("op") or "").strip()
-    if op == "create_node":
-        node_id = str(operation.get("node_id") or "").strip()
-        if not node_id:
-            _raise("NODE_TREE create_node missing node_id")
-        if node_id in node_index:
-            _raise("NODE_TREE create_node node already exists: " + node_id)
-        node = node_tree.nodes.new(type=str(operation.get("bl_idname") or ""))
-        location = operation.get("location") or [0, 0]
-        if isinstance(location, list) and len(location) >= 2:
-            node.location = (float(location[0]), float(location[1]))
-        _track_node(node_index, node_id, node)
-    elif op == "delete_node":
-        node = _require_node(node_index, operation.get("node_id"))
-        for key, candidate in list(node_index.items()):
-            if candidate == node:
-                del node_index[key]
-        node_tree.nodes.remove(node)
-    elif op == "set_input_default":
-        node = _require_node(node_index, operation.get("node_id"))
-        socket = _find_socket(node.inputs, operation.get("socket"))
-        _assign_socket_default(socket, operation.get("value"))
-    elif op == "set_property":
-        node = _require_node(node_index, operation.get("node_id"))
-        property_name = str(operation.get("property") or "").strip()
-        if not property_name:
-            _raise("NODE_TREE set_property missing property")
-        node.__setattr__(property_name, operation.get("value"))
-    elif op == "link":
-        from_spec = operation.get("from") or {}
-        to_spec = operation.get("to") or {}
-        from_node = _require_node(node_index, from_spec.get("node_id"))
-        to_node = _require_node(node_index, to_spec.get("node_id"))
-        from_socket = _find_socket(from_node.outputs, from_spec.get("socket"))
-        to_socket = _find_socket(to_node.inputs, to_spec.get("socket"))
-        _link_once(node_tree, from_socket, to_socket)
-    elif op == "unlink":
-        from_spec = operation.get("from") or {}
-        to_spec = operation.get("to") or {}
-        from_node = _require_node(node_index, from_spec.get("node_id"))
-        to_node = _require_node(node_index, to_spec.get("node_id"))
-        from_socket = _find_socket(from_node.outputs, from_spec.get("socket"))
-        to_socket = _find_socket(to_node.inputs, to_spec.get("socket"))
-        _remove_link(node_tree, from_socket, to_socket)
-    elif op == "set_group_io":
-        _set_group_interface_socket(
-            node_tree,
-            operation.get("action"),
-            operation.get("socket"),
-            operation.get("socket_type"),
-        )
-    else:
-        _raise("Unsupported NODE_TREE op: " + op)
+${buildRpcPrelude(step.id, serializedPayloadLiteral)}
+${buildStepFunctions()}
+_apply_node_tree_step(_PAYLOAD, {})
 `;
   return script.trim();
 };
@@ -233,110 +313,54 @@ for operation in operations:
 const buildGnOpsScript = (step) => {
   const serializedPayloadLiteral = toPythonPayloadLiteral(step.payload || {});
   const script = `
-${buildRpcPrelude(step, serializedPayloadLiteral)}
-
-target = _PAYLOAD.get("target") or {}
-ops = _PAYLOAD.get("ops") or []
-
-allow_create_modifier = False
-for operation in ops:
-    if str(operation.get("op") or "").strip() == "ensure_target" and bool(operation.get("allow_create_modifier")):
-        allow_create_modifier = True
-
-obj = _ensure_object(target.get("object_name"))
-modifier = _ensure_nodes_modifier(obj, target.get("modifier_name"), allow_create_modifier)
-node_tree = _ensure_geometry_node_tree(modifier, None)
-_ensure_group_io_nodes(node_tree)
-node_index = _index_nodes(node_tree)
-
-for operation in ops:
-    op = str(operation.get("op") or "").strip()
-    if op == "ensure_target":
-        continue
-    if op == "ensure_single_group_io":
-        first_input = None
-        first_output = None
-        for node in list(node_tree.nodes):
-            if node.bl_idname == "NodeGroupInput":
-                if first_input is None:
-                    first_input = node
-                else:
-                    node_tree.nodes.remove(node)
-            elif node.bl_idname == "NodeGroupOutput":
-                if first_output is None:
-                    first_output = node
-                else:
-                    node_tree.nodes.remove(node)
-        _ensure_group_io_nodes(node_tree)
-        node_index = _index_nodes(node_tree)
-        continue
-    if op == "add_node":
-        node_id = str(operation.get("id") or "").strip()
-        if not node_id:
-            _raise("GN_OPS add_node missing id")
-        if node_id in node_index:
-            _raise("GN_OPS add_node node already exists: " + node_id)
-        node = node_tree.nodes.new(type=str(operation.get("bl_idname") or ""))
-        node.location = (float(operation.get("x") or 0), float(operation.get("y") or 0))
-        _track_node(node_index, node_id, node)
-        continue
-    if op == "remove_node":
-        node_id = str(operation.get("id") or "").strip()
-        if node_id and node_id in node_index:
-            node = node_index[node_id]
-            for key, candidate in list(node_index.items()):
-                if candidate == node:
-                    del node_index[key]
-            node_tree.nodes.remove(node)
-        continue
-    if op == "link":
-        from_spec = operation.get("from") or {}
-        to_spec = operation.get("to") or {}
-        from_node = _require_node(node_index, from_spec.get("node_id"))
-        to_node = _require_node(node_index, to_spec.get("node_id"))
-        from_socket = _find_socket(from_node.outputs, from_spec.get("socket_name"))
-        to_socket = _find_socket(to_node.inputs, to_spec.get("socket_name"))
-        _link_once(node_tree, from_socket, to_socket)
-        continue
-    if op == "unlink":
-        from_spec = operation.get("from") or {}
-        to_spec = operation.get("to") or {}
-        from_node = _require_node(node_index, from_spec.get("node_id"))
-        to_node = _require_node(node_index, to_spec.get("node_id"))
-        from_socket = _find_socket(from_node.outputs, from_spec.get("socket_name"))
-        to_socket = _find_socket(to_node.inputs, to_spec.get("socket_name"))
-        _remove_link(node_tree, from_socket, to_socket)
-        continue
-    if op == "set_input":
-        node = _require_node(node_index, operation.get("node_id"))
-        socket = _find_socket(node.inputs, operation.get("socket_name"))
-        _assign_socket_default(socket, operation.get("value"))
-        continue
-    if op == "cleanup_unused":
-        linked_nodes = set()
-        for link in node_tree.links:
-            linked_nodes.add(link.from_node.name)
-            linked_nodes.add(link.to_node.name)
-        for key, node in list(node_index.items()):
-            if key in ("group_input", "group_output"):
-                continue
-            if node.name not in linked_nodes:
-                node_tree.nodes.remove(node)
-                del node_index[key]
-        continue
-    _raise("Unsupported GN_OPS op: " + op)
+${buildRpcPrelude(step.id, serializedPayloadLiteral)}
+${buildStepFunctions()}
+_apply_gn_ops_step(_PAYLOAD, {})
 `;
   return script.trim();
 };
 
-const executePython = async ({
-  code,
-  mode = 'safe',
+const buildFusedStepsScript = (entries) => {
+  const fusedSteps = entries.map(({ step, index }) => ({
+    index,
+    id: step.id || null,
+    type: step.type,
+    payload: step.payload || {},
+  }));
+  const serializedPayloadLiteral = toPythonPayloadLiteral({ steps: fusedSteps });
+  const script = `
+${buildRpcPrelude(fusedSteps[0] && fusedSteps[0].id, serializedPayloadLiteral)}
+${buildStepFunctions()}
+_fused_targets = {}
+_fused_results = []
+for _fused_step in _PAYLOAD.get("steps") or []:
+    _fused_result = {"index": _fused_step.get("index"), "stepId": _fused_step.get("id")}
+    try:
+        if _fused_step.get("type") == "NODE_TREE":
+            _apply_node_tree_step(_fused_step.get("payload") or {}, _fused_targets)
+        else:
+            _apply_gn_ops_step(_fused_step.get("payload") or {}, _fused_targets)
+        _fused_result["ok"] = True
+        _fused_results.append(_fused_result)
+    except Exception as exc:
+        _fused_result["ok"] = False
+        _fused_result["error"] = str(exc)
+        _fused_results.append(_fused_result)
+        break
+
+print(${JSON.stringify(FUSED_RESULTS_MARKER)} + " " + json.dumps(_fused_results))
+`;
+  return script.trim();
+};
+
+const executeBridgeCommand = async ({
+  command,
+  payload,
   timeoutMs,
-  settings,
   stepId,
   logEvent,
   registerCancelHandler,
+  trace,
 }) => {
   const session = getActiveSession();
   if (!session) {
@@ -349,11 +373,6 @@ const executePython = async ({
     return null;
   }
 
-  const payload = assertExecPythonPayloadAllowed(
-    { code, mode },
-    { allowTrustedPythonExecution: Boolean(settings && settings.allowTrustedPythonExecution) },
-  );
-
   let unregisterCancel = null;
   if (typeof registerCancelHandler === 'function') {
     unregisterCancel = registerCancelHandler(async () => {
@@ -379,9 +398,10 @@ const executePython = async ({
 
   try {
     const result = await executeOnActive(
-      'exec_python',
+      command,
       payload,
       Number.isInteger(timeoutMs) ? timeoutMs : DEFAULT_EXEC_TIMEOUT_MS,
+      trace ? { traceparent: trace.traceparent, onTrace: trace.onTrace } : {},
     );
     if (typeof logEvent === 'function') {
       await logEvent('protocol_rpc_result', { stepId, result });
@@ -402,37 +422,296 @@ const executePython = async ({
   }
 };
 
-const runNodeTreeStep = async ({ step, settings, logEvent, registerCancelHandler }) => {
+const isBatchEditEnabled = (settings) => !(settings && settings.nodeTreeBatchEdit === false);
+
+// Spilled output files are registered as run artifacts; the response only keeps a preview.
+const recordOutputSpills = async ({ response, stepId, repoRoot, addArtifact }) => {
+  if (typeof addArtifact !== 'function') {
+    return;
+  }
+  const result = (response && response.result) || {};
+  for (const stream of ['stdout', 'stderr']) {
+    const spill = result[`${stream}Spill`];
+    if (!spill || !spill.path) {
+      continue;
+    }
+    await addArtifact({
+      kind: 'exec_output',
+      path: repoRoot ? path.relative(repoRoot, spill.path) : spill.path,
+      description: `Full ${stream} of step ${stepId || 'unknown'} (${spill.bytes} bytes)`,
+      bytes: spill.bytes,
+      sha256: spill.sha256,
+    });
+  }
+};
+
+// `outputDir` is the step's artifact directory; the bridge writes oversized stdout/stderr there
+// and returns only a preview plus `stdoutSpill`/`stderrSpill` ({ path, bytes, sha256 }), which
+// are recorded through `addArtifact`.
+const executePython = async ({
+  code,
+  mode = 'safe',
+  batch = false,
+  timeoutMs,
+  settings,
+  stepId,
+  outputDir,
+  repoRoot,
+  addArtifact,
+  logEvent,
+  registerCancelHandler,
+  trace,
+}) => {
+  if (!getActiveSession()) {
+    return executeBridgeCommand({ command: 'exec_python', stepId, logEvent });
+  }
+
+  const payload = assertExecPythonPayloadAllowed(
+    {
+      code,
+      mode,
+      ...(batch ? { batch: true } : {}),
+      ...(outputDir ? { output_dir: outputDir } : {}),
+    },
+    { allowTrustedPythonExecution: Boolean(settings && settings.allowTrustedPythonExecution) },
+  );
+
+  const response = await executeBridgeCommand({
+    command: 'exec_python',
+    payload,
+    timeoutMs,
+    stepId,
+    logEvent,
+    registerCancelHandler,
+    trace,
+  });
+  await recordOutputSpills({ response, stepId, repoRoot, addArtifact });
+  return response;
+};
+
+const runNodeTreeStep = async ({
+  step,
+  settings,
+  artifactDir,
+  repoRoot,
+  addArtifact,
+  logEvent,
+  registerCancelHandler,
+  trace,
+}) => {
   const code = buildNodeTreeScript(step);
   await executePython({
     code,
     mode: 'safe',
+    batch: isBatchEditEnabled(settings),
     settings,
     stepId: step.id,
+    outputDir: artifactDir,
+    repoRoot,
+    addArtifact,
     logEvent,
     registerCancelHandler,
+    trace,
     timeoutMs: Number.isFinite(step.payload && step.payload.timeout_ms)
       ? step.payload.timeout_ms
       : undefined,
   });
 };
 
-const runGnOpsStep = async ({ step, settings, logEvent, registerCancelHandler }) => {
+const runGnOpsStep = async ({
+  step,
+  settings,
+  artifactDir,
+  repoRoot,
+  addArtifact,
+  logEvent,
+  registerCancelHandler,
+  trace,
+}) => {
   const code = buildGnOpsScript(step);
   await executePython({
     code,
     mode: 'safe',
+    batch: isBatchEditEnabled(settings),
     settings,
     stepId: step.id,
+    outputDir: artifactDir,
+    repoRoot,
+    addArtifact,
     logEvent,
     registerCancelHandler,
+    trace,
     timeoutMs: Number.isFinite(step.payload && step.payload.timeout_ms)
       ? step.payload.timeout_ms
       : undefined,
   });
 };
 
-const runUserPythonStep = async ({ step, settings, logEvent, registerCancelHandler }) => {
+// The fused call gets the budget its steps would have had as separate calls; a step without
+// `timeout_ms` counts the default, as it would on its own.
+const resolveFusedTimeoutMs = (entries) =>
+  entries.reduce((total, { step }) => {
+    const value = step.payload && step.payload.timeout_ms;
+    return total + (Number.isFinite(value) ? value : DEFAULT_EXEC_TIMEOUT_MS);
+  }, 0);
+
+// A spilled stdout only carries a preview inline, so the results marker is read from the file.
+const readFusedStdout = async (response) => {
+  const result = (response && response.result) || {};
+  if (result.stdoutSpill && result.stdoutSpill.path) {
+    return fs.readFile(result.stdoutSpill.path, 'utf8');
+  }
+  return typeof result.stdout === 'string' ? result.stdout : '';
+};
+
+const parseFusedStepResults = (stdout) => {
+  const lines = stdout.split(/\r?\n/);
+  for (let index = lines.length - 1; index >= 0; index -= 1) {
+    const line = lines[index].trim();
+    if (line.startsWith(FUSED_RESULTS_MARKER)) {
+      const parsed = JSON.parse(line.slice(FUSED_RESULTS_MARKER.length).trim());
+      return Array.isArray(parsed) ? parsed : [];
+    }
+  }
+  throw new Error('Fused bridge call did not report per-step results.');
+};
+
+const createFusedStepGroup = (entries) => {
+  const stepIds = entries.map(({ step, index }) => step.id || `protocol_step_${index + 1}`);
+  let pending = null;
+
+  const executeGroup = async ({
+    settings,
+    artifactDir,
+    repoRoot,
+    addArtifact,
+    logEvent,
+    registerCancelHandler,
+    trace,
+  }) => {
+    if (typeof logEvent === 'function') {
+      await logEvent('protocol_rpc_fused', {
+        stepIds,
+        fusedSteps: entries.length,
+      });
+    }
+    const response = await executePython({
+      code: buildFusedStepsScript(entries),
+      mode: 'safe',
+      batch: isBatchEditEnabled(settings),
+      settings,
+      stepId: stepIds[0],
+      outputDir: artifactDir,
+      repoRoot,
+      addArtifact,
+      logEvent,
+      registerCancelHandler,
+      trace,
+      timeoutMs: resolveFusedTimeoutMs(entries),
+    });
+    return response ? parseFusedStepResults(await readFusedStdout(response)) : null;
+  };
+
+  const runStep = async (index, bridgeContext) => {
+    if (!pending) {
+      // The one bridge call (and any output it spills) belongs to whichever step starts the group.
+      pending = executeGroup(bridgeContext);
+    }
+    const results = await pending;
+    if (!results) {
+      return;
+    }
+    const stepResult = results.find((candidate) => candidate.index === index);
+    if (!stepResult) {
+      throw new Error(`Fused step ${index + 1} was not executed because an earlier step in its group failed.`);
+    }
+    if (stepResult.ok !== true) {
+      throw new Error(stepResult.error || `Fused step ${stepResult.stepId || index + 1} failed.`);
+    }
+  };
+
+  return {
+    stepIds,
+    runStep,
+  };
+};
+
+const linkKey = (link) => JSON.stringify([link.from, link.to]);
+
+const buildReconcilePayload = (step, state) => {
+  const payload = step.payload || {};
+  const isGnOps = step.type === 'GN_OPS';
+  const operations = (isGnOps ? payload.ops : payload.operations) || [];
+  const desiredLinks = new Set((state.links || []).map(linkKey));
+
+  const removeNodes = [];
+  const removeLinks = [];
+  for (const operation of operations) {
+    const op = String(operation.op || '').trim();
+    if (op === 'delete_node' || op === 'remove_node') {
+      const nodeId = String((isGnOps ? operation.id : operation.node_id) || '').trim();
+      if (nodeId && !state.nodes[nodeId] && !removeNodes.includes(nodeId)) {
+        removeNodes.push(nodeId);
+      }
+    } else if (op === 'unlink') {
+      const link = { from: operation.from, to: operation.to };
+      if (!desiredLinks.has(linkKey(link))) {
+        removeLinks.push(link);
+      }
+    }
+  }
+
+  const reconcilePayload = {
+    target: state.target || payload.target || {},
+    nodes: state.nodes || {},
+    links: state.links || [],
+    remove_nodes: removeNodes,
+    remove_links: removeLinks,
+  };
+
+  if (isGnOps) {
+    return {
+      ...reconcilePayload,
+      allow_create_modifier: Object.values(state.targets || {}).some((entry) => entry.allow_create_modifier),
+      inputs: state.inputs || [],
+      single_group_io: Boolean(state.singleGroupIo),
+      cleanup_unused: Array.isArray(state.cleanup) && state.cleanup.length > 0,
+    };
+  }
+
+  return {
+    ...reconcilePayload,
+    allow_create_modifier: true,
+    group_io: state.group_io || [],
+  };
+};
+
+const reconcileNodeTreeStep = async ({ step, state, settings, logEvent, registerCancelHandler, trace }) =>
+  executeBridgeCommand({
+    command: 'reconcile_node_tree',
+    payload: {
+      ...buildReconcilePayload(step, state || {}),
+      batch: isBatchEditEnabled(settings),
+    },
+    stepId: step.id,
+    logEvent,
+    registerCancelHandler,
+    trace,
+    timeoutMs: Number.isFinite(step.payload && step.payload.timeout_ms)
+      ? step.payload.timeout_ms
+      : undefined,
+  });
+
+const runUserPythonStep = async ({
+  step,
+  settings,
+  artifactDir,
+  repoRoot,
+  addArtifact,
+  logEvent,
+  registerCancelHandler,
+  trace,
+}) => {
   const payload = step.payload || {};
   const code = String(payload.code || '').trim();
   if (!code) {
@@ -444,12 +723,52 @@ const runUserPythonStep = async ({ step, settings, logEvent, registerCancelHandl
     timeoutMs: Number.isFinite(payload.timeout_ms) ? payload.timeout_ms : undefined,
     settings,
     stepId: step.id,
+    outputDir: artifactDir,
+    repoRoot,
+    addArtifact,
     logEvent,
     registerCancelHandler,
+    trace,
   });
 };
 
+const isSnapshotEnabled = (settings) =>
+  Number(settings && settings.sessionSnapshotEvery) > 0 || Number(settings && settings.sessionSnapshotIdleSeconds) > 0;
+
+// Tells the bridge `stepId` of `runId` is complete so it can snapshot the scene for crash
+// recovery. Snapshots are best effort: failures are logged and never fail the step.
+const checkpointProtocolStep = async ({ runId, stepId, index, settings, logEvent }) => {
+  if (!isSnapshotEnabled(settings) || !getActiveSession()) {
+    return null;
+  }
+  try {
+    const { result } = await executeOnActive(
+      'snapshot_step',
+      { run_id: runId || null, step_id: stepId, step_index: index },
+      DEFAULT_EXEC_TIMEOUT_MS,
+    );
+    if (result && result.saved && typeof logEvent === 'function') {
+      await logEvent('session_snapshot', { snapshot: result.snapshot });
+    }
+    return result;
+  } catch (error) {
+    if (typeof logEvent === 'function') {
+      await logEvent('session_snapshot_error', {
+        error: String(error && error.message ? error.message : error),
+      });
+    }
+    return null;
+  }
+};
+
 module.exports = {
+  buildFusedStepsScript,
+  buildGnOpsScript,
+  buildNodeTreeScript,
+  buildReconcilePayload,
+  checkpointProtocolStep,
+  createFusedStepGroup,
+  reconcileNodeTreeStep,
   runNodeTreeStep,
   runGnOpsStep,
   runUserPythonStep,
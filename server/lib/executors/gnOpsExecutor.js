@@ -1,6 +1,6 @@
 const path = require('path');
 const BaseExecutor = require('./baseExecutor');
-const { runGnOpsStep } = require('../executorBridge');
+const { runGnOpsStep, reconcileNodeTreeStep } = require('../executorBridge');
 const { nowIso } = require('../utils');
 
 class GnOpsExecutor extends BaseExecutor {
@@ -19,7 +19,17 @@ class GnOpsExecutor extends BaseExecutor {
     this.applyOperations(state, ops);
 
     const serialized = this.serializeState(state);
-    await runGnOpsStep({ step, settings, logEvent, registerCancelHandler });
+    await this.resolveBridgeStep(context)({
+      step,
+      state: serialized,
+      settings,
+      artifactDir,
+      repoRoot,
+      addArtifact,
+      logEvent,
+      registerCancelHandler,
+      trace: context.trace,
+    });
     const artifactPath = this.path.join(artifactDir, 'gn_ops_state.json');
     await this.fs.writeFile(artifactPath, JSON.stringify(serialized, null, 2), 'utf8');
 
@@ -41,6 +51,16 @@ class GnOpsExecutor extends BaseExecutor {
     }
   }
 
+  resolveBridgeStep(context) {
+    if (typeof context.runBridgeStep === 'function') {
+      return context.runBridgeStep;
+    }
+    if (context.settings && context.settings.nodeTreeApplyMode === 'reconcile') {
+      return reconcileNodeTreeStep;
+    }
+    return runGnOpsStep;
+  }
+
   createState(target = {}) {
     return {
       target: {
@@ -1,6 +1,6 @@
 const path = require('path');
 const BaseExecutor = require('./baseExecutor');
-const { runNodeTreeStep } = require('../executorBridge');
+const { runNodeTreeStep, reconcileNodeTreeStep } = require('../executorBridge');
 
 class NodeTreeExecutor extends BaseExecutor {
   constructor(options = {}) {
@@ -19,7 +19,17 @@ class NodeTreeExecutor extends BaseExecutor {
     this.applyOperations(state, ops);
 
     const serialized = this.serializeState(state);
-    await runNodeTreeStep({ step, settings, logEvent, registerCancelHandler });
+    await this.resolveBridgeStep(context)({
+      step,
+      state: serialized,
+      settings,
+      artifactDir,
+      repoRoot,
+      addArtifact,
+      logEvent,
+      registerCancelHandler,
+      trace: context.trace,
+    });
     const artifactPath = this.path.join(artifactDir, 'node_tree_state.json');
     await this.fs.writeFile(artifactPath, JSON.stringify(serialized, null, 2), 'utf8');
 
@@ -41,6 +51,16 @@ class NodeTreeExecutor extends BaseExecutor {
     }
   }
 
+  resolveBridgeStep(context) {
+    if (typeof context.runBridgeStep === 'function') {
+      return context.runBridgeStep;
+    }
+    if (context.settings && context.settings.nodeTreeApplyMode === 'reconcile') {
+      return reconcileNodeTreeStep;
+    }
+    return runNodeTreeStep;
+  }
+
   createState(target = {}) {
     return {
       target: {
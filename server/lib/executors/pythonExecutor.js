@@ -21,7 +21,16 @@ class PythonExecutor extends BaseExecutor {
     const snippet = code.length > 256 ? `${code.slice(0, 256)}...` : code;
     const artifactPath = this.path.join(artifactDir, 'python_step.txt');
     await this.fs.writeFile(artifactPath, code, 'utf8');
-    await runUserPythonStep({ step, settings, logEvent, registerCancelHandler });
+    await runUserPythonStep({
+      step,
+      settings,
+      artifactDir,
+      repoRoot,
+      addArtifact,
+      logEvent,
+      registerCancelHandler,
+      trace: context.trace,
+    });
 
     if (typeof logEvent === 'function') {
       await logEvent('protocol_python', {
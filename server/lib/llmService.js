@@ -1,6 +1,6 @@
 const { resolveApiKey } = require('./settingsService');
 const {
-  validateProtocolPlan,
+  validateProtocolPlanWithSafeLint,
   DEFAULT_MAX_PYTHON_CODE_LENGTH,
 } = require('./protocolValidator');
 const { resolveAdapter } = require('./providers/registry');
@@ -343,7 +343,7 @@ const generateProtocolPlan = async ({ prompt, model, settings, onToolEvent, onTr
     maxRetries,
   });
 
-  const protocol = validateProtocolPlan(live.content, { maxPythonCodeLength });
+  const protocol = await validateProtocolPlanWithSafeLint(live.content, { maxPythonCodeLength });
   return {
     provider,
     model: resolvedModel,
@@ -2,8 +2,13 @@ const fs = require('fs/promises');
 const path = require('path');
 const { getExecutorForStep } = require('./executors/registry');
 const { recordExecutorCall } = require('./metricsExporter');
+const { compileProtocolPlan } = require('./protocolPlanCompiler');
+const { isSessionLostError } = require('./blenderRpcClient');
+const { checkpointProtocolStep, createFusedStepGroup } = require('./executorBridge');
+const { bridgeTraceToSpans, buildTraceparent, createSpanId } = require('./telemetry');
 
 const STEP_ID_SAFE_PATTERN = /^[A-Za-z0-9][A-Za-z0-9._-]{0,79}$/;
+const MAX_SESSION_RECOVERIES = 2;
 
 const createPathPolicyError = (message, code) => {
   const error = new Error(message);
@@ -90,6 +95,7 @@ const executeProtocolPlan = async ({
   executeWithCancellation,
   registerCancelHandler,
   traceSpanRecorder,
+  recoverSession,
 }) => {
   if (!protocol || !Array.isArray(protocol.steps) || !protocol.steps.length) {
     return;
@@ -99,8 +105,37 @@ const executeProtocolPlan = async ({
   await fs.mkdir(protocolDir, { recursive: true });
   await assertPathSafeForArtifacts(runDir, protocolDir);
 
-  for (let index = 0; index < protocol.steps.length; index++) {
-    const step = protocol.steps[index];
+  const fuseSteps = !(settings && settings.nodeTreeApplyMode === 'reconcile');
+  // Fused groups memoize their bridge call, so a resumed plan needs fresh ones.
+  const planSteps = () => {
+    const planned = [];
+    for (const group of compileProtocolPlan(protocol, { fuseSteps })) {
+      const fusedGroup = group.fused ? createFusedStepGroup(group.entries) : null;
+      for (const entry of group.entries) {
+        planned.push({ ...entry, fusedGroup });
+      }
+    }
+    return planned;
+  };
+  // Checkpoints are only reported after a whole fused group (one bridge call covers all of its
+  // steps), so the position after the snapshot's step always starts a fresh group. Resolves -1
+  // when the snapshot belongs to another run or to no step of this plan.
+  const runId = run && run.id ? String(run.id) : null;
+  const resumePosition = (planned, snapshot) => {
+    if (runId && snapshot.runId !== runId) {
+      return -1;
+    }
+    const matches = (entry) =>
+      (Number.isInteger(snapshot.stepIndex) && entry.index === snapshot.stepIndex) ||
+      (snapshot.stepId && entry.step.id === snapshot.stepId);
+    const found = planned.findIndex(matches);
+    return found < 0 ? -1 : found + 1;
+  };
+
+  let plannedSteps = planSteps();
+  let recoveries = 0;
+  for (let position = 0; position < plannedSteps.length; position += 1) {
+    const { step, index, fusedGroup } = plannedSteps[position];
     const stepId = assertStepIdSafe(step.id || `protocol_step_${index + 1}`);
     const stepName = step.description || `${step.type} step`;
     await startStep(run, stepId, stepName);
@@ -135,6 +170,27 @@ const executeProtocolPlan = async ({
       addArtifact: artifactRecorder,
       registerCancelHandler,
     };
+    // Bridge calls made by the executor carry the executor span as their W3C parent; the spans
+    // the bridge sends back are recorded after the executor span itself.
+    const executorSpanId = createSpanId();
+    const bridgeSpans = [];
+    const traceparent = buildTraceparent(run && run.trace && run.trace.traceId, executorSpanId);
+    if (traceparent && typeof traceSpanRecorder === 'function') {
+      context.trace = {
+        traceparent,
+        onTrace: (bridgeTrace) => {
+          bridgeSpans.push(...bridgeTraceToSpans(bridgeTrace, { parentSpanId: executorSpanId, stepId }));
+        },
+      };
+    }
+    const recordBridgeSpans = async () => {
+      for (const span of bridgeSpans.splice(0)) {
+        await traceSpanRecorder(span);
+      }
+    };
+    if (fusedGroup) {
+      context.runBridgeStep = (bridgeContext) => fusedGroup.runStep(index, bridgeContext);
+    }
 
     let executor = null;
 
@@ -158,6 +214,7 @@ const executeProtocolPlan = async ({
           });
           if (typeof traceSpanRecorder === 'function') {
             await traceSpanRecorder({
+              spanId: executorSpanId,
               name: `executor.${String(step.type || '').toLowerCase()}.run`,
               component: 'executor',
               stepId,
@@ -167,6 +224,7 @@ const executeProtocolPlan = async ({
                 executorType: step.type,
               },
             });
+            await recordBridgeSpans();
           }
         } catch (error) {
           const runDurationMs = Math.max(0, Date.parse(new Date().toISOString()) - Date.parse(executorRunStartedAt));
@@ -178,6 +236,7 @@ const executeProtocolPlan = async ({
           });
           if (typeof traceSpanRecorder === 'function') {
             await traceSpanRecorder({
+              spanId: executorSpanId,
               name: `executor.${String(step.type || '').toLowerCase()}.run`,
               component: 'executor',
               stepId,
@@ -188,12 +247,16 @@ const executeProtocolPlan = async ({
               },
               error: error && error.message ? error.message : String(error),
             });
+            await recordBridgeSpans();
           }
           throw error;
         }
       }
 
       await completeStep(run, stepId, stepName, { type: step.type });
+      if (!fusedGroup || fusedGroup.stepIds[fusedGroup.stepIds.length - 1] === stepId) {
+        await checkpointProtocolStep({ runId, stepId, index, settings, logEvent });
+      }
     } catch (error) {
       if (executor && typeof executor.cancel === 'function') {
         try {
@@ -202,6 +265,35 @@ const executeProtocolPlan = async ({
           // best effort cancel
         }
       }
+      // Only a lost session is worth relaunching; ordinary step errors fail the step directly.
+      const recovery = typeof recoverSession === 'function'
+        && isSessionLostError(error)
+        && recoveries < MAX_SESSION_RECOVERIES
+        && !(run && run.cancelRequested)
+        ? await recoverSession({ stepId, error }).catch(() => null)
+        : null;
+      // A recovery without a snapshot is a blank session: the run starts over from its first step.
+      const resumeAt = !recovery ? -1 : recovery.snapshot ? resumePosition(plannedSteps, recovery.snapshot) : 0;
+      if (recovery && recovery.snapshot && resumeAt < 0) {
+        await logEvent('protocol_resume_unmatched', {
+          failedStepId: stepId,
+          snapshotRunId: recovery.snapshot.runId || null,
+          snapshotStepId: recovery.snapshot.stepId || null,
+        });
+      }
+      if (resumeAt >= 0) {
+        recoveries += 1;
+        plannedSteps = planSteps();
+        await logEvent('protocol_resumed', {
+          failedStepId: stepId,
+          error: String(error && error.message ? error.message : error),
+          snapshotStepId: recovery.snapshot ? recovery.snapshot.stepId || null : null,
+          resumeStepId: plannedSteps[resumeAt] ? plannedSteps[resumeAt].step.id || null : null,
+          sessionId: recovery.session && recovery.session.id ? recovery.session.id : null,
+        });
+        position = resumeAt - 1;
+        continue;
+      }
       failStep(run, stepId, error);
       throw error;
     } finally {
@@ -0,0 +1,47 @@
+const FUSIBLE_STEP_TYPES = new Set(['NODE_TREE', 'GN_OPS']);
+
+const fusionTargetKey = (step) => {
+  if (!step || !FUSIBLE_STEP_TYPES.has(step.type)) {
+    return null;
+  }
+  const target = step.payload && step.payload.target;
+  if (!target || typeof target !== 'object') {
+    return null;
+  }
+  const objectName = String(target.object_name || '').trim();
+  const modifierName = String(target.modifier_name || '').trim();
+  if (!objectName || !modifierName) {
+    return null;
+  }
+  return `${objectName}:${modifierName}`;
+};
+
+const compileProtocolPlan = (protocol, options = {}) => {
+  const steps = protocol && Array.isArray(protocol.steps) ? protocol.steps : [];
+  const fuseSteps = options.fuseSteps !== false;
+  const groups = [];
+
+  steps.forEach((step, index) => {
+    const targetKey = fuseSteps ? fusionTargetKey(step) : null;
+    const previous = groups[groups.length - 1];
+    if (targetKey && previous && previous.targetKey === targetKey) {
+      previous.entries.push({ step, index });
+      return;
+    }
+    groups.push({
+      targetKey,
+      entries: [{ step, index }],
+    });
+  });
+
+  return groups.map((group) => ({
+    ...group,
+    fused: group.entries.length > 1,
+  }));
+};
+
+module.exports = {
+  FUSIBLE_STEP_TYPES,
+  fusionTargetKey,
+  compileProtocolPlan,
+};
@@ -1,3 +1,5 @@
+const { getSharedSafeModeLinter } = require('./safeModeLinter');
+
 const DEFAULT_MAX_STEPS = 25;
 const DEFAULT_MAX_PYTHON_CODE_LENGTH = 20000;
 const STEP_ID_SAFE_PATTERN = /^[A-Za-z0-9][A-Za-z0-9._-]{0,79}$/;
@@ -409,7 +411,7 @@ const validateGnOpsPayload = (payload) => {
   payload.ops.forEach((operation, index) => validateGnOperation(operation, index));
 };
 
-const validatePythonPayload = (payload, maxPythonCodeLength) => {
+const validatePythonPayload = (payload, maxPythonCodeLength, pythonVerdicts) => {
   assertObject(payload, 'PROTOCOL_PAYLOAD_INVALID', 'PYTHON payload must be an object', 'steps[].payload');
   rejectUnknownFields(payload, new Set(['mode', 'code', 'timeout_ms']), 'steps[].payload');
 
@@ -441,6 +443,14 @@ const validatePythonPayload = (payload, maxPythonCodeLength) => {
       'steps[].payload.timeout_ms',
     );
   }
+  if (mode === 'safe' && typeof pythonVerdicts === 'function') {
+    // Only SAF-004 policy verdicts reject here; syntax is left to Blender's own interpreter.
+    const verdict = pythonVerdicts(payload.code);
+    if (verdict && verdict.ok === false && String(verdict.code || '').startsWith('SAF_004_')) {
+      const location = Number.isInteger(verdict.line) ? ` (line ${verdict.line})` : '';
+      throw createValidationError(verdict.code, `${verdict.message}${location}`, 'steps[].payload.code');
+    }
+  }
 
   return {
     ...payload,
@@ -448,7 +458,7 @@ const validatePythonPayload = (payload, maxPythonCodeLength) => {
   };
 };
 
-const validateStep = (step, maxPythonCodeLength, index) => {
+const validateStep = (step, maxPythonCodeLength, index, pythonVerdicts) => {
   const path = `steps[${index}]`;
   assertObject(step, 'PROTOCOL_STEP_INVALID', `Step at ${path} must be an object`, path);
   rejectUnknownFields(step, new Set(['id', 'type', 'description', 'payload']), path);
@@ -493,7 +503,7 @@ const validateStep = (step, maxPythonCodeLength, index) => {
 
   return {
     ...step,
-    payload: validatePythonPayload(step.payload, maxPythonCodeLength),
+    payload: validatePythonPayload(step.payload, maxPythonCodeLength, pythonVerdicts),
   };
 };
 
@@ -572,15 +582,47 @@ const validateProtocolPlan = (input, options = {}) => {
     );
   }
 
-  const steps = parsed.steps.map((step, index) => validateStep(step, maxPythonCodeLength, index));
+  const steps = parsed.steps.map((step, index) =>
+    validateStep(step, maxPythonCodeLength, index, options.pythonVerdicts));
   return {
     ...parsed,
     steps,
   };
 };
 
+// Structural validation plus an up-front SAF-004 lint of every safe-mode PYTHON step in one
+// linter round trip. A linter that cannot start (no standalone Python on the host) is reported
+// as a warning, and like a slow or confused worker lets the plan through, since Blender still
+// enforces SAF-004 at exec time.
+const validateProtocolPlanWithSafeLint = async (input, options = {}) => {
+  const plan = validateProtocolPlan(input, options);
+  const safeCodes = plan.steps
+    .filter((step) => step.type === 'PYTHON' && step.payload.mode === 'safe')
+    .map((step) => step.payload.code);
+  if (!safeCodes.length) {
+    return plan;
+  }
+
+  const linter = options.safeModeLinter || getSharedSafeModeLinter();
+  let verdicts;
+  try {
+    verdicts = await linter.lint(safeCodes);
+  } catch (error) {
+    if (error && error.code === 'SAFE_LINT_UNAVAILABLE') {
+      const warn = typeof options.onWarning === 'function' ? options.onWarning : process.emitWarning;
+      warn(`Safe-mode lint could not run; deferring SAF-004 checks to Blender: ${error.message}`, {
+        code: 'SAFE_LINT_UNAVAILABLE',
+      });
+    }
+    return plan;
+  }
+  const byCode = new Map(safeCodes.map((code, index) => [code, verdicts[index]]));
+  return validateProtocolPlan(plan, { ...options, pythonVerdicts: (code) => byCode.get(code) });
+};
+
 module.exports = {
   DEFAULT_MAX_STEPS,
   DEFAULT_MAX_PYTHON_CODE_LENGTH,
   validateProtocolPlan,
+  validateProtocolPlanWithSafeLint,
 };
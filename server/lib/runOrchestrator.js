@@ -9,17 +9,18 @@ const {
   checkBlenderExecutable,
 } = require('./settingsService');
 const { nowIso } = require('./utils');
+const { RUNS_DIR } = require('./constants');
 const { generateProtocolPlan, generateAddonSpec, pingProvider } = require('./llmService');
 const { runBlender } = require('./blenderRunner');
+const { runAddonPreflight, createPreflightError } = require('./addonPreflight');
 const blenderSessionManager = require('./blenderSessionManager');
 const { appendAuditRecord, AUDIT_EVENT_TYPES } = require('./auditLog');
 const { executeProtocolPlan } = require('./protocolExecutor');
-const { resolveEventTaxonomy, buildCorrelation } = require('./telemetry');
+const { resolveEventTaxonomy, buildCorrelation, createSpanId } = require('./telemetry');
 
 const REPO_ROOT = path.resolve(__dirname, '..', '..');
 const SCAFFOLD_DIR = path.join(REPO_ROOT, 'scaffold');
 const HARNESS_PATH = path.join(REPO_ROOT, 'test_harness.py');
-const RUNS_DIR = path.join(REPO_ROOT, 'generated_addons', 'runs');
 const FINAL_STATUSES = new Set(['completed', 'failed', 'cancelled']);
 
 const activeExecutions = new Map();
@@ -35,7 +36,6 @@ const createRunId = () => {
 
 const eventId = () => `evt_${crypto.randomBytes(4).toString('hex')}`;
 const traceId = () => `trace_${crypto.randomBytes(6).toString('hex')}`;
-const spanId = () => `span_${crypto.randomBytes(4).toString('hex')}`;
 
 const createRun = ({ prompt, model }) => {
   const createdAt = nowIso();
@@ -152,26 +152,31 @@ const appendEvent = async (run, type, payload) => {
 };
 
 const emitTraceSpan = async (run, {
+  spanId: fixedSpanId,
   name,
   component,
   stepId,
   parentSpanId = null,
   status = 'ok',
   startedAt,
+  endedAt,
+  durationMs: fixedDurationMs,
   attributes,
   error,
 } = {}) => {
+  // Spans recorded elsewhere (the bridge) arrive with their own id, end time and duration.
   const startIso = startedAt || nowIso();
-  const endIso = nowIso();
+  const endIso = endedAt || nowIso();
   const startMs = Date.parse(startIso);
   const endMs = Date.parse(endIso);
-  const durationMs = Number.isFinite(startMs) && Number.isFinite(endMs)
+  const measuredDurationMs = Number.isFinite(startMs) && Number.isFinite(endMs)
     ? Math.max(0, endMs - startMs)
     : 0;
+  const durationMs = Number.isFinite(fixedDurationMs) ? Math.max(0, fixedDurationMs) : measuredDurationMs;
 
   await appendEvent(run, 'trace_span', {
     traceId: run.trace && run.trace.traceId ? run.trace.traceId : null,
-    spanId: spanId(),
+    spanId: fixedSpanId || createSpanId(),
     parentSpanId: parentSpanId || null,
     name: String(name || 'span'),
     component: String(component || 'unknown'),
@@ -498,6 +503,11 @@ const executeRun = async (runId) => {
     }
   };
 
+  // Keeps a pending watchdog recycle from wiping the scene the protocol steps are building.
+  const releaseSession = typeof blenderSessionManager.holdSession === 'function'
+    ? blenderSessionManager.holdSession()
+    : null;
+
   try {
     assertNotCancelled(run);
 
@@ -585,6 +595,9 @@ const executeRun = async (runId) => {
         executeWithCancellation,
         registerCancelHandler: (handler) => registerCancelHandler(run, handler),
         traceSpanRecorder: (span) => emitTraceSpan(run, span),
+        recoverSession: typeof blenderSessionManager.recoverFromSnapshot === 'function'
+          ? () => blenderSessionManager.recoverFromSnapshot({ runId: run.id })
+          : undefined,
       });
     }
 
@@ -592,6 +605,26 @@ const executeRun = async (runId) => {
 
     await startStep(run, 'validation', 'Run Blender validation');
 
+    const preflight = await executeWithCancellation(
+      run,
+      runAddonPreflight({ addonPath: runAddonPath, writePycs: true }),
+    );
+    await appendEvent(run, 'addon_preflight', {
+      ok: Boolean(preflight.ok),
+      unavailable: Boolean(preflight.unavailable),
+      reason: preflight.reason || '',
+      durationMs: Number.isFinite(preflight.ms) ? preflight.ms : null,
+      compiled: preflight.compiled || 0,
+      cacheHits: preflight.cacheHits || 0,
+      compileMs: Number.isFinite(preflight.compileMs) ? preflight.compileMs : null,
+      pycsWritten: preflight.pycs ? preflight.pycs.written : 0,
+      pycCacheTag: preflight.pycs ? preflight.pycs.cacheTag : null,
+      problems: (preflight.problems || []).slice(0, 10),
+    });
+    if (!preflight.ok) {
+      throw createPreflightError(preflight);
+    }
+
     const activeSession =
       typeof blenderSessionManager.getActiveSession === 'function'
         ? blenderSessionManager.getActiveSession()
@@ -647,9 +680,12 @@ const executeRun = async (runId) => {
           command: 'validate_addon',
           ok: true,
         });
+        const validation = rpcResponse && rpcResponse.result ? rpcResponse.result : {};
         await completeStep(run, 'validation', 'Run Blender validation', {
           mode: 'rpc_session',
           sessionId: resolvedSessionId,
+          compileMs: Number.isFinite(preflight.compileMs) ? preflight.compileMs : null,
+          timingsMs: validation.timingsMs || null,
         });
       } catch (error) {
         await appendEvent(run, 'blender_rpc_result', {
@@ -701,11 +737,23 @@ const executeRun = async (runId) => {
       assertNotCancelled(run);
 
       if (!result.ok) {
-        throw result.error || new Error(`Blender exited with code ${result.code}`);
+        const failedAddon = result.report && Array.isArray(result.report.addons)
+          ? result.report.addons.find((addon) => !addon.ok && addon.error)
+          : null;
+        throw result.error || new Error(
+          failedAddon
+            ? `Addon validation failed during ${failedAddon.stage}: ${failedAddon.error.message}`
+            : `Blender exited with code ${result.code}`,
+        );
       }
 
       await completeStep(run, 'validation', 'Run Blender validation', {
         exitCode: result.code,
+        harnessDurationMs: result.report ? result.report.durationMs : null,
+        compileMs: Number.isFinite(preflight.compileMs) ? preflight.compileMs : null,
+        timingsMs: result.report && result.report.addons && result.report.addons[0]
+          ? result.report.addons[0].timingsMs
+          : null,
       });
     }
 
@@ -772,6 +820,9 @@ const executeRun = async (runId) => {
       String(error && error.message ? error.message : error),
     );
   } finally {
+    if (typeof releaseSession === 'function') {
+      releaseSession();
+    }
     activeExecutions.delete(run.id);
     await syncRun(run);
   }
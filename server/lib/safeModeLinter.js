@@ -0,0 +1,185 @@
+const crypto = require('crypto');
+const path = require('path');
+const { spawn } = require('child_process');
+const { PYTHON_BIN } = require('./constants');
+
+const SERVER_DIR = path.resolve(__dirname, '..');
+const DEFAULT_CACHE_ENTRIES = 4096;
+const DEFAULT_LINT_TIMEOUT_MS = 5000;
+
+const codeHash = (code) => crypto.createHash('sha256').update(String(code), 'utf8').digest('hex');
+
+const createLinterError = (code, message) => {
+  const error = new Error(message);
+  error.code = code;
+  return error;
+};
+
+// Long-running `python -m aether_bridge.safe_policy --serve` worker with a verdict cache keyed by
+// code hash, so repeated snippets never cross the pipe. The worker is unref'd while idle so it
+// never keeps the server (or a test run) alive on its own.
+const createSafeModeLinter = ({
+  pythonBin = PYTHON_BIN,
+  cacheEntries = DEFAULT_CACHE_ENTRIES,
+  timeoutMs = DEFAULT_LINT_TIMEOUT_MS,
+} = {}) => {
+  const verdicts = new Map();
+  const pending = new Map();
+  const stats = { hits: 0, misses: 0, requests: 0, spawns: 0, failures: 0 };
+  let child = null;
+  let nextId = 1;
+  let stdoutBuffer = '';
+
+  const remember = (hash, verdict) => {
+    verdicts.delete(hash);
+    verdicts.set(hash, verdict);
+    while (verdicts.size > cacheEntries) {
+      verdicts.delete(verdicts.keys().next().value);
+    }
+  };
+
+  const setRef = () => {
+    if (!child) return;
+    const method = pending.size ? 'ref' : 'unref';
+    child[method]();
+    [child.stdin, child.stdout, child.stderr].forEach((stream) => {
+      if (stream && typeof stream[method] === 'function') stream[method]();
+    });
+  };
+
+  const failPending = (error) => {
+    for (const entry of pending.values()) {
+      clearTimeout(entry.timer);
+      entry.reject(error);
+    }
+    pending.clear();
+  };
+
+  const handleLine = (line) => {
+    let message;
+    try {
+      message = JSON.parse(line);
+    } catch {
+      return;
+    }
+    const entry = pending.get(message.id);
+    if (!entry) return;
+    pending.delete(message.id);
+    clearTimeout(entry.timer);
+    setRef();
+    if (message.error || !Array.isArray(message.verdicts)) {
+      entry.reject(createLinterError('SAFE_LINT_FAILED', message.error || 'Linter returned no verdicts'));
+      return;
+    }
+    entry.resolve(message.verdicts);
+  };
+
+  const ensureWorker = () => {
+    if (child) return child;
+    stats.spawns += 1;
+    const worker = spawn(pythonBin, ['-m', 'aether_bridge.safe_policy', '--serve'], {
+      cwd: SERVER_DIR,
+      stdio: ['pipe', 'pipe', 'pipe'],
+      windowsHide: true,
+    });
+    child = worker;
+    stdoutBuffer = '';
+    worker.stdout.setEncoding('utf8');
+    worker.stdout.on('data', (chunk) => {
+      stdoutBuffer += chunk;
+      let newline = stdoutBuffer.indexOf('\n');
+      while (newline >= 0) {
+        const line = stdoutBuffer.slice(0, newline).trim();
+        stdoutBuffer = stdoutBuffer.slice(newline + 1);
+        if (line) handleLine(line);
+        newline = stdoutBuffer.indexOf('\n');
+      }
+    });
+    worker.stderr.on('data', () => {});
+    worker.stdin.on('error', () => {});
+    const onGone = (error) => {
+      if (child !== worker) return;
+      child = null;
+      stats.failures += 1;
+      failPending(createLinterError('SAFE_LINT_UNAVAILABLE', error ? error.message : 'Linter worker exited'));
+    };
+    worker.on('error', onGone);
+    worker.on('exit', () => onGone(null));
+    setRef();
+    return worker;
+  };
+
+  const request = (snippets) =>
+    new Promise((resolve, reject) => {
+      const worker = ensureWorker();
+      const id = nextId;
+      nextId += 1;
+      const timer = setTimeout(() => {
+        pending.delete(id);
+        setRef();
+        reject(createLinterError('SAFE_LINT_TIMEOUT', `Safe-mode lint timed out after ${timeoutMs}ms`));
+      }, timeoutMs);
+      pending.set(id, { resolve, reject, timer });
+      setRef();
+      worker.stdin.write(`${JSON.stringify({ id, snippets })}\n`);
+    });
+
+  // Resolves one verdict per snippet, in order: { hash, ok, code?, message?, line?, col? }.
+  const lint = async (snippets) => {
+    const list = Array.isArray(snippets) ? snippets.map((code) => String(code)) : [];
+    const hashes = list.map(codeHash);
+    const missing = new Map();
+    hashes.forEach((hash, index) => {
+      if (verdicts.has(hash) || missing.has(hash)) {
+        stats.hits += 1;
+      } else {
+        stats.misses += 1;
+        missing.set(hash, list[index]);
+      }
+    });
+
+    if (missing.size) {
+      stats.requests += 1;
+      const fresh = await request([...missing.values()]);
+      [...missing.keys()].forEach((hash, index) => {
+        const { cached, ...verdict } = fresh[index] || {};
+        remember(hash, { ...verdict, hash });
+      });
+    }
+    return hashes.map((hash) => verdicts.get(hash));
+  };
+
+  const peek = (code) => verdicts.get(codeHash(code)) || null;
+
+  const close = () => {
+    const worker = child;
+    child = null;
+    failPending(createLinterError('SAFE_LINT_UNAVAILABLE', 'Linter closed'));
+    if (worker) {
+      worker.stdin.end();
+      worker.kill();
+    }
+  };
+
+  return {
+    lint,
+    peek,
+    close,
+    stats: () => ({ ...stats, entries: verdicts.size, running: Boolean(child) }),
+  };
+};
+
+let sharedLinter = null;
+
+const getSharedSafeModeLinter = () => {
+  if (!sharedLinter) {
+    sharedLinter = createSafeModeLinter();
+  }
+  return sharedLinter;
+};
+
+module.exports = {
+  codeHash,
+  createSafeModeLinter,
+  getSharedSafeModeLinter,
+};
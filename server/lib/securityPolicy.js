@@ -1,4 +1,15 @@
-const ALLOWED_RPC_COMMANDS = new Set(['ping', 'get_context', 'validate_addon', 'exec_python']);
+const ALLOWED_RPC_COMMANDS = new Set([
+  'ping',
+  'get_context',
+  'validate_addon',
+  'exec_python',
+  'reconcile_node_tree',
+  'export_node_tree_ir',
+  'create_objects',
+  'register_template',
+  'list_templates',
+  'instantiate_template',
+]);
 const ALLOWED_EXEC_PYTHON_MODES = new Set(['safe', 'trusted']);
 
 const normalizeCommand = (value) => String(value || '').trim().toLowerCase();
@@ -166,10 +166,41 @@ const normalizeIncomingSettings = (input, currentSettings) => {
   merged.logVerbosity = ['quiet', 'normal', 'verbose'].includes(merged.logVerbosity)
     ? merged.logVerbosity
     : 'normal';
+  merged.nodeTreeApplyMode = merged.nodeTreeApplyMode === 'reconcile' ? 'reconcile' : 'replay';
+  merged.nodeTreeBatchEdit = merged.nodeTreeBatchEdit !== false;
+  merged.bridgeServerMode = merged.bridgeServerMode === 'asyncio' ? 'asyncio' : 'threaded';
+  merged.bridgeLogLevel = ['debug', 'info', 'warning', 'error'].includes(merged.bridgeLogLevel)
+    ? merged.bridgeLogLevel
+    : DEFAULT_SETTINGS.bridgeLogLevel;
+  const accessLogSampleRate = Number(merged.bridgeAccessLogSampleRate);
+  merged.bridgeAccessLogSampleRate = Number.isFinite(accessLogSampleRate)
+    ? Math.min(1, Math.max(0, accessLogSampleRate))
+    : DEFAULT_SETTINGS.bridgeAccessLogSampleRate;
+  merged.sessionMemoryCeilingMb = Math.max(
+    0,
+    safeParseInt(merged.sessionMemoryCeilingMb, DEFAULT_SETTINGS.sessionMemoryCeilingMb),
+  );
+  merged.sessionOrphanPurgeEvery = Math.max(
+    0,
+    safeParseInt(merged.sessionOrphanPurgeEvery, DEFAULT_SETTINGS.sessionOrphanPurgeEvery),
+  );
+  merged.sessionSnapshotEvery = Math.max(
+    0,
+    safeParseInt(merged.sessionSnapshotEvery, DEFAULT_SETTINGS.sessionSnapshotEvery),
+  );
+  const snapshotIdleSeconds = Number(merged.sessionSnapshotIdleSeconds);
+  merged.sessionSnapshotIdleSeconds = Number.isFinite(snapshotIdleSeconds)
+    ? Math.max(0, snapshotIdleSeconds)
+    : DEFAULT_SETTINGS.sessionSnapshotIdleSeconds;
+  merged.execOutputInlineBytes = Math.max(
+    0,
+    safeParseInt(merged.execOutputInlineBytes, DEFAULT_SETTINGS.execOutputInlineBytes),
+  );
   merged.allowTrustedPythonExecution = merged.allowTrustedPythonExecution === true;
   merged.apiKeySourceMode = merged.apiKeySourceMode === 'server-managed' ? 'server-managed' : 'env';
   merged.workspacePath = path.resolve(merged.workspacePath);
   merged.addonOutputPath = path.resolve(merged.addonOutputPath);
+  merged.templateLibraryPath = path.resolve(merged.templateLibraryPath || DEFAULT_SETTINGS.templateLibraryPath);
   return merged;
 };
 
@@ -1,3 +1,5 @@
+const crypto = require('crypto');
+
 const EVENT_TAXONOMY = Object.freeze({
   run_started: 'run.lifecycle.started',
   run_completed: 'run.lifecycle.completed',
@@ -16,6 +18,7 @@ const EVENT_TAXONOMY = Object.freeze({
   protocol_rpc_error: 'protocol.rpc.error',
   protocol_rpc_cancel_escalated: 'protocol.rpc.cancel_escalated',
   protocol_rpc_cancel_error: 'protocol.rpc.cancel_error',
+  protocol_rpc_fused: 'protocol.rpc.fused',
   trace_span: 'trace.span',
 });
 
@@ -39,8 +42,78 @@ const buildCorrelation = ({ runId, stepId }) => {
   };
 };
 
+const createSpanId = () => `span_${crypto.randomBytes(4).toString('hex')}`;
+
+// Run trace ids (`trace_<hex>`) and span ids (`span_<hex>`) are shorter than W3C ids, so the hex
+// part is left-padded; all-zero ids are invalid in W3C trace context.
+const toW3cId = (value, length) => {
+  const hex = String(value || '').trim().toLowerCase().replace(/^(trace|span)_/, '');
+  if (!/^[0-9a-f]+$/.test(hex) || /^0+$/.test(hex)) {
+    return null;
+  }
+  return hex.slice(-length).padStart(length, '0');
+};
+
+const buildTraceparent = (traceId, spanId) => {
+  const w3cTraceId = toW3cId(traceId, 32);
+  const w3cSpanId = toW3cId(spanId, 16);
+  return w3cTraceId && w3cSpanId ? `00-${w3cTraceId}-${w3cSpanId}-01` : null;
+};
+
+const offsetIso = (baseMs, offsetMs) => new Date(Math.round(baseMs + (Number(offsetMs) || 0))).toISOString();
+
+// Converts the `trace` member of a bridge response into trace_span records parented under
+// `parentSpanId` (the span whose id went out in the traceparent header).
+const bridgeTraceToSpans = (trace, { parentSpanId = null, stepId = null, attributes = {} } = {}) => {
+  if (!trace || typeof trace !== 'object' || typeof trace.spanId !== 'string') {
+    return [];
+  }
+  const baseMs = Number(trace.startedAtUnixMs);
+  if (!Number.isFinite(baseMs)) {
+    return [];
+  }
+  const toSpanId = (hex) => `span_${hex}`;
+  const rootDurationMs = Math.max(0, Number(trace.durationMs) || 0);
+  const children = Array.isArray(trace.spans) ? trace.spans : [];
+  const root = {
+    spanId: toSpanId(trace.spanId),
+    parentSpanId,
+    name: String(trace.name || 'bridge.rpc'),
+    component: 'bridge',
+    stepId,
+    status: children.some((span) => span && span.status === 'error') ? 'error' : 'ok',
+    startedAt: offsetIso(baseMs, 0),
+    endedAt: offsetIso(baseMs, rootDurationMs),
+    durationMs: rootDurationMs,
+    attributes,
+  };
+  return [
+    root,
+    ...children
+      .filter((span) => span && typeof span.spanId === 'string')
+      .map((span) => {
+        const durationMs = Math.max(0, Number(span.durationMs) || 0);
+        return {
+          spanId: toSpanId(span.spanId),
+          parentSpanId: span.parentSpanId ? toSpanId(span.parentSpanId) : root.spanId,
+          name: String(span.name || 'bridge.span'),
+          component: 'bridge',
+          stepId,
+          status: span.status === 'error' ? 'error' : 'ok',
+          startedAt: offsetIso(baseMs, span.startOffsetMs),
+          endedAt: offsetIso(baseMs, (Number(span.startOffsetMs) || 0) + durationMs),
+          durationMs,
+          attributes: span.attributes && typeof span.attributes === 'object' ? span.attributes : {},
+        };
+      }),
+  ];
+};
+
 module.exports = {
   EVENT_TAXONOMY,
   resolveEventTaxonomy,
   buildCorrelation,
+  createSpanId,
+  buildTraceparent,
+  bridgeTraceToSpans,
 };
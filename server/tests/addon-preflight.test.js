@@ -0,0 +1,129 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const fs = require('node:fs/promises');
+const os = require('node:os');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const { runAddonPreflight } = require('../lib/addonPreflight');
+
+const PYTHON_BIN = process.env.PYTHON || 'python';
+const SCAFFOLD_DIR = path.resolve(__dirname, '..', '..', 'scaffold');
+const HARNESS_PATH = path.resolve(__dirname, '..', '..', 'test_harness.py');
+
+const pythonAvailable = () => !spawnSync(PYTHON_BIN, ['--version']).error;
+
+const copyScaffold = async (root, name) => {
+  const target = path.join(root, name);
+  await fs.mkdir(target, { recursive: true });
+  for (const file of await fs.readdir(SCAFFOLD_DIR)) {
+    if (file.endsWith('.py')) {
+      await fs.copyFile(path.join(SCAFFOLD_DIR, file), path.join(target, file));
+    }
+  }
+  return target;
+};
+
+test('addon preflight passes the scaffold and serves unchanged files from the hash cache', async (t) => {
+  if (!pythonAvailable()) {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return;
+  }
+  const root = await fs.mkdtemp(path.join(os.tmpdir(), 'aether-preflight-'));
+  try {
+    const cachePath = path.join(root, 'cache.json');
+    const addonPath = await copyScaffold(root, 'addon');
+
+    const first = await runAddonPreflight({ addonPath, pythonBin: PYTHON_BIN, cachePath });
+    assert.equal(first.ok, true, JSON.stringify(first.problems));
+    assert.equal(first.compiled, 3);
+    assert.equal(first.cacheHits, 0);
+
+    await fs.appendFile(path.join(addonPath, 'panels.py'), '\ndef broken(:\n    pass\n');
+    const second = await runAddonPreflight({ addonPath, pythonBin: PYTHON_BIN, cachePath });
+    assert.equal(second.ok, false);
+    assert.equal(second.compiled, 1);
+    assert.equal(second.cacheHits, 2);
+    assert.equal(second.problems[0].code, 'ADDON_SYNTAX_ERROR');
+    assert.equal(path.basename(second.problems[0].path), 'panels.py');
+  } finally {
+    await fs.rm(root, { recursive: true, force: true });
+  }
+});
+
+test('addon preflight flags missing bl_info and register/unregister and compiles large addons in a pool', async (t) => {
+  if (!pythonAvailable()) {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return;
+  }
+  const root = await fs.mkdtemp(path.join(os.tmpdir(), 'aether-preflight-'));
+  try {
+    const addonPath = path.join(root, 'addon');
+    await fs.mkdir(addonPath);
+    await fs.writeFile(path.join(addonPath, '__init__.py'), 'def register():\n    pass\n');
+    for (let index = 0; index < 10; index += 1) {
+      await fs.writeFile(path.join(addonPath, `module_${index}.py`), `VALUE = ${index}\n`);
+    }
+
+    const report = await runAddonPreflight({ addonPath, pythonBin: PYTHON_BIN, cachePath: '' });
+    assert.equal(report.ok, false);
+    assert.equal(report.compiled, 11);
+    assert.ok(report.files.every((file) => file.ok));
+    assert.deepEqual(
+      report.problems.map((problem) => problem.code),
+      ['ADDON_BL_INFO_MISSING', 'ADDON_REGISTER_MISSING'],
+    );
+    assert.match(report.problems[1].message, /unregister/);
+  } finally {
+    await fs.rm(root, { recursive: true, force: true });
+  }
+});
+
+test('addon preflight writes checked-hash pycs that the harness then imports warm', async (t) => {
+  if (!pythonAvailable()) {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return;
+  }
+  const root = await fs.mkdtemp(path.join(os.tmpdir(), 'aether-preflight-'));
+  try {
+    const addonPath = await copyScaffold(root, 'scaffold');
+    const report = await runAddonPreflight({ addonPath, pythonBin: PYTHON_BIN, cachePath: '', writePycs: true });
+    assert.equal(report.ok, true, JSON.stringify(report.problems));
+    assert.equal(report.pycs.written, 3);
+    assert.equal(typeof report.compileMs, 'number');
+
+    const pycs = await fs.readdir(path.join(addonPath, '__pycache__'));
+    assert.equal(pycs.length, 3);
+    assert.ok(pycs.every((name) => name.includes(report.pycs.cacheTag)));
+    const header = await fs.readFile(path.join(addonPath, '__pycache__', pycs[0]));
+    assert.equal(header.readUInt32LE(4), 0b11, 'pyc should be checked-hash');
+
+    const harness = spawnSync(PYTHON_BIN, [HARNESS_PATH, '--', addonPath], {
+      encoding: 'utf8',
+      env: { ...process.env, AETHER_RPC_FAKE_BPY: '1' },
+    });
+    assert.equal(harness.status, 0, harness.stderr || harness.stdout);
+    const reportLine = harness.stdout.split(/\r?\n/).find((line) => line.startsWith('[AETHER_HARNESS_REPORT]'));
+    const [addon] = JSON.parse(reportLine.slice('[AETHER_HARNESS_REPORT]'.length)).addons;
+    assert.deepEqual(
+      { files: addon.bytecode.files, current: addon.bytecode.current, compiled: addon.bytecode.compiled },
+      { files: 3, current: 3, compiled: 0 },
+    );
+    assert.equal(typeof addon.timingsMs.bytecode, 'number');
+    assert.equal(typeof addon.timingsMs.import, 'number');
+  } finally {
+    await fs.rm(root, { recursive: true, force: true });
+  }
+});
+
+test('addon preflight fails as unavailable when the interpreter cannot be spawned', async () => {
+  const report = await runAddonPreflight({
+    addonPath: SCAFFOLD_DIR,
+    pythonBin: path.join(__dirname, 'missing-python-interpreter'),
+    cachePath: null,
+  });
+  assert.equal(report.ok, false);
+  assert.equal(report.unavailable, true);
+  assert.match(report.reason, /ENOENT/);
+  assert.equal(report.problems[0].code, 'ADDON_PREFLIGHT_UNAVAILABLE');
+});
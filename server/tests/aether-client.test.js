@@ -0,0 +1,195 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const SERVER_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const runPython = (source) => {
+  const result = spawnSync(PYTHON_BIN, ['-c', source], { encoding: 'utf8' });
+  assert.equal(result.status, 0, result.stderr);
+  return JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+};
+
+test('BridgeClient calls, batches and measures RPCs against both bridge servers, reusing keep-alive connections', () => {
+  const outcome = runPython(`
+import asyncio
+import json
+import os
+import sys
+import threading
+os.environ['AETHER_RPC_FAKE_BPY'] = '1'
+sys.path.insert(0, r"${SERVER_DIR}")
+import blender_rpc_bridge as bridge
+from aether_bridge import async_server
+from aether_client import AsyncBridgeClient, BridgeClient, BridgeError
+
+outcome = {}
+threaded = bridge.admission.BoundedHTTPServer(('127.0.0.1', 0), bridge.Handler, bridge.OverloadHandler, workers=2)
+threading.Thread(target=threaded.serve_forever, daemon=True).start()
+with BridgeClient(port=threaded.server_address[1], token='') as client:
+    outcome['ping'] = client.call('ping')['ok']
+    outcome['health'] = client.health()['ok']
+    outcome['blockedStatus'] = client.send('exec_python', {'code': 'import os', 'mode': 'safe'})[0]
+    try:
+        client.call('exec_python', {'code': 'import os', 'mode': 'safe'})
+    except BridgeError as exc:
+        outcome['blocked'] = {'code': exc.code, 'status': exc.status_code, 'command': exc.command}
+    outcome['batch'] = client.batch([
+        ('exec_python', {'code': 'print("first")', 'mode': 'safe'}),
+        {'command': 'nope'},
+        ('exec_python', {'code': 'print("third")', 'mode': 'safe'}),
+    ], stop_on_error=True)
+    outcome['parallel'] = client.batch([('get_context', {})] * 6, parallel=True)
+    outcome['threadedConnections'] = client.connections_opened
+    outcome['metrics'] = client.metrics.report()
+threaded.shutdown()
+
+executor = async_server.MainThreadExecutor()
+server = async_server.AsyncBridgeServer(bridge._handle_rpc, executor).start_in_thread('127.0.0.1', 0)
+
+async def drive():
+    async with AsyncBridgeClient(port=server.port, token='', pool_size=2) as client:
+        pings = [await client.call('ping') for _ in range(5)]
+        outcome['asyncSequentialConnections'] = client.connections_opened
+        outcome['asyncParallel'] = await client.batch([('get_context', {})] * 4, parallel=True)
+        outcome['asyncConnections'] = client.connections_opened
+        outcome['asyncPings'] = sum(1 for ping in pings if ping['ok'])
+        outcome['asyncMetrics'] = client.metrics.report()
+    with BridgeClient(port=server.port, token='') as client:
+        for _ in range(5):
+            await asyncio.to_thread(client.call, 'ping')
+        outcome['syncKeepAliveConnections'] = client.connections_opened
+
+def client_thread():
+    try:
+        asyncio.run(drive())
+    finally:
+        executor.stop()
+
+threading.Thread(target=client_thread).start()
+executor.run_forever(poll_interval=0.02)
+server.close()
+print(json.dumps(outcome))
+`);
+
+  assert.equal(outcome.ping, true);
+  assert.equal(outcome.health, true);
+  assert.equal(outcome.blockedStatus, 403);
+  assert.deepEqual(outcome.blocked, { code: 'SAF_004_BLOCKED_IMPORT', status: 403, command: 'exec_python' });
+
+  // A failed entry stops the ordered batch; the third call never runs.
+  assert.equal(outcome.batch.length, 2);
+  assert.equal(outcome.batch[0].ok, true);
+  assert.match(outcome.batch[0].result.stdout, /first/);
+  assert.equal(outcome.batch[1].ok, false);
+  assert.equal(outcome.batch[1].status, 500);
+  assert.match(outcome.batch[1].error, /Unknown command/);
+  assert.equal(outcome.parallel.length, 6);
+  assert.ok(outcome.parallel.every((entry) => entry.ok && entry.result.ok));
+  // The threaded server answers HTTP/1.0, so every call needs a new connection.
+  assert.equal(outcome.threadedConnections, 12);
+
+  assert.equal(outcome.metrics.get_context.calls, 6);
+  assert.equal(outcome.metrics.exec_python.calls, 3);
+  assert.equal(outcome.metrics.exec_python.errors, 2);
+  assert.equal(outcome.metrics.nope.errors, 1);
+  assert.ok(outcome.metrics.ping.p50 > 0);
+  assert.ok(outcome.metrics.get_context.p99 >= outcome.metrics.get_context.p50);
+
+  assert.equal(outcome.asyncPings, 5);
+  assert.equal(outcome.asyncSequentialConnections, 1);
+  assert.ok(outcome.asyncParallel.every((entry) => entry.ok));
+  assert.ok(outcome.asyncConnections <= 2);
+  assert.equal(outcome.asyncMetrics.ping.calls, 5);
+  assert.equal(outcome.syncKeepAliveConnections, 1);
+});
+
+test('BridgeClient retries 503s and timeouts with one idempotency key and gives up after the last attempt', () => {
+  const outcome = runPython(`
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, r"${SERVER_DIR}")
+from aether_client import AsyncBridgeClient, BridgeClient, BridgeError, BridgeTimeout, RetryPolicy
+
+script = []
+seen = []
+
+class Stub(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', '0')))
+        seen.append({'key': self.headers.get('X-Aether-Idempotency-Key'), 'token': self.headers.get('X-Aether-Token')})
+        action = script.pop(0) if script else 'ok'
+        if action == 'slow':
+            time.sleep(0.3)
+        status, body = (503, {'ok': False, 'code': 'RPC_OVERLOADED', 'retryAfterMs': 1}) if action == 'busy' else (200, {'ok': True, 'result': {'ok': True}})
+        raw = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+stub = ThreadingHTTPServer(('127.0.0.1', 0), Stub)
+threading.Thread(target=stub.serve_forever, daemon=True).start()
+port = stub.server_address[1]
+fast = dict(backoff_s=0.001, max_backoff_s=0.01)
+outcome = {}
+
+client = BridgeClient(port=port, token='secret', timeout=0.1, retry=RetryPolicy(attempts=4, **fast))
+script[:] = ['busy', 'slow', 'busy']
+outcome['retried'] = client.call('exec_python', {'code': 'pass'})
+outcome['keys'] = [entry['key'] for entry in seen]
+outcome['tokens'] = sorted({entry['token'] for entry in seen})
+seen.clear()
+client.call('ping')
+outcome['readOnlyKey'] = seen[0]['key']
+script[:] = ['busy'] * 4
+try:
+    client.call('exec_python', {'code': 'pass'})
+except BridgeError as exc:
+    outcome['exhausted'] = {'status': exc.status_code, 'code': exc.code}
+outcome['metrics'] = client.metrics.report()['exec_python']
+
+no_retry = BridgeClient(port=port, token='secret', timeout=0.1, retry=RetryPolicy.disabled())
+script[:] = ['slow']
+try:
+    no_retry.call('exec_python', {'code': 'pass'})
+except BridgeTimeout as exc:
+    outcome['timeout'] = exc.code
+script[:] = ['busy']
+outcome['noRetryStatus'] = no_retry.send('ping')[0]
+time.sleep(0.4)
+
+async def drive():
+    async with AsyncBridgeClient(port=port, token='secret', timeout=0.1, retry=RetryPolicy(attempts=3, **fast)) as aclient:
+        script[:] = ['slow', 'busy']
+        result = await aclient.call('exec_python', {'code': 'pass'})
+        return result['ok'], aclient.metrics.report()['exec_python']['retries']
+
+outcome['async'] = asyncio.run(drive())
+stub.shutdown()
+print(json.dumps(outcome))
+`);
+
+  assert.deepEqual(outcome.retried, { ok: true });
+  assert.equal(outcome.keys.length, 4);
+  assert.equal(new Set(outcome.keys).size, 1);
+  assert.match(outcome.keys[0], /^[0-9a-f]{32}$/);
+  assert.deepEqual(outcome.tokens, ['secret']);
+  assert.equal(outcome.readOnlyKey, null);
+  assert.deepEqual(outcome.exhausted, { status: 503, code: 'RPC_OVERLOADED' });
+  assert.equal(outcome.metrics.calls, 2);
+  assert.equal(outcome.metrics.retries, 6);
+  assert.equal(outcome.metrics.errors, 1);
+  assert.equal(outcome.timeout, 'RPC_TIMEOUT');
+  assert.equal(outcome.noRetryStatus, 503);
+  assert.deepEqual(outcome.async, [true, 2]);
+});
@@ -0,0 +1,48 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BENCH_PATH = path.resolve(__dirname, '../../tools/bench_blender_rpc.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+test('bench tool measures the fake-bpy bridge and fails on a regressed baseline', (t) => {
+  const benchDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-bench-'));
+  t.after(() => fs.rmSync(benchDir, { recursive: true, force: true }));
+  const baselinePath = path.join(benchDir, 'baseline.json');
+  const commonArgs = [
+    BENCH_PATH,
+    '--suite', 'ping',
+    '--suite', 'nodes',
+    '--iterations', '3',
+    '--node-iterations', '1',
+    '--node-counts', '5',
+  ];
+
+  const recorded = spawnSync(PYTHON_BIN, [...commonArgs, '--write-baseline', baselinePath], { encoding: 'utf8' });
+  assert.equal(recorded.status, 0, recorded.stderr);
+  const report = JSON.parse(recorded.stdout);
+  assert.equal(report.backend, 'fake');
+  assert.deepEqual(Object.keys(report.metrics).sort(), ['node_tree.5', 'ping']);
+  assert.equal(report.metrics.ping.n, 3);
+  assert.ok(report.metrics['node_tree.5'].scriptBytes > 0);
+
+  const baseline = JSON.parse(fs.readFileSync(baselinePath, 'utf8'));
+  assert.equal(baseline.backend, 'fake');
+  assert.equal(baseline.metrics.ping.p50, report.metrics.ping.p50);
+
+  // Only the deliberately tightened metric is compared, so timing noise cannot flip the result.
+  baseline.metrics = { ping: { p50: 0.001, maxRatio: 1.01 } };
+  fs.writeFileSync(baselinePath, JSON.stringify(baseline));
+  const regressed = spawnSync(
+    PYTHON_BIN,
+    [...commonArgs, '--baseline', baselinePath, '--min-delta-ms', '0'],
+    { encoding: 'utf8' },
+  );
+  assert.equal(regressed.status, 1, regressed.stderr);
+  const regressions = JSON.parse(regressed.stdout).regressions;
+  assert.deepEqual(regressions.map((entry) => entry.metric), ['ping']);
+  assert.equal(regressions[0].baselineP50, 0.001);
+});
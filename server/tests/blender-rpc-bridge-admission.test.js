@@ -0,0 +1,137 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_PATH = path.resolve(__dirname, '../blender_rpc_bridge.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+test('bounded bridge server queues up to its limit and sheds the rest with 503', () => {
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import importlib.util
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+spec = importlib.util.spec_from_file_location("aether_blender_rpc_bridge", r"${BRIDGE_PATH}")
+bridge = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bridge)
+
+release = threading.Event()
+
+class SlowHandler(bridge.Handler):
+    def do_POST(self):
+        release.wait(10)
+        bridge.Handler.do_POST(self)
+
+server = bridge.admission.BoundedHTTPServer(('127.0.0.1', 0), SlowHandler, bridge.OverloadHandler, workers=1, queue_size=1)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base = "http://127.0.0.1:%d" % server.server_address[1]
+
+def post(results, index):
+    request = urllib.request.Request(
+        base + "/rpc",
+        data=json.dumps({"command": "ping", "payload": {}}).encode("utf-8"),
+        method="POST",
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            results[index] = {"status": response.status}
+    except urllib.error.HTTPError as exc:
+        results[index] = {
+            "status": exc.code,
+            "retryAfter": exc.headers.get("Retry-After"),
+            "body": json.loads(exc.read().decode("utf-8")),
+        }
+
+results = {}
+threads = []
+for index in range(3):
+    thread = threading.Thread(target=post, args=(results, index))
+    thread.start()
+    threads.append(thread)
+    time.sleep(0.2)
+
+threads[2].join(5)
+with urllib.request.urlopen(base + "/health", timeout=5) as response:
+    health = json.loads(response.read().decode("utf-8"))
+release.set()
+for thread in threads:
+    thread.join(10)
+
+print(json.dumps({"statuses": sorted(entry["status"] for entry in results.values()), "shed": results[2], "health": health, "stats": server.stats()}))
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+  assert.equal(result.status, 0, result.stderr);
+  const payload = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+  assert.deepEqual(payload.statuses, [200, 200, 503]);
+  assert.equal(payload.shed.retryAfter, '1');
+  assert.equal(payload.shed.body.code, 'RPC_OVERLOADED');
+  assert.equal(payload.shed.body.retryAfterMs, 250);
+  assert.equal(payload.health.ok, true);
+  assert.equal(payload.health.admission.workers, 1);
+  assert.equal(payload.stats.accepted, 2);
+  assert.equal(payload.stats.rejected, 2);
+  assert.equal(payload.stats.dropped, 0);
+});
+
+test('bounded bridge server times out an idle connection so it cannot hold a worker', () => {
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import importlib.util
+import json
+import socket
+import threading
+import time
+import urllib.request
+
+spec = importlib.util.spec_from_file_location("aether_blender_rpc_bridge", r"${BRIDGE_PATH}")
+bridge = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bridge)
+
+server = bridge.admission.BoundedHTTPServer(
+    ('127.0.0.1', 0), bridge.Handler, bridge.OverloadHandler, workers=1, queue_size=4, idle_timeout=0.3,
+)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+port = server.server_address[1]
+
+idle = socket.create_connection(('127.0.0.1', port))
+# Start a request and never finish it: the only worker is now waiting on this socket.
+idle.sendall(b"POST /rpc HTTP/1.1\\r\\nHost: x\\r\\nContent-Length: 100\\r\\n\\r\\n{")
+time.sleep(0.1)
+
+started = time.perf_counter()
+request = urllib.request.Request(
+    "http://127.0.0.1:%d/rpc" % port,
+    data=json.dumps({"command": "ping", "payload": {}}).encode("utf-8"),
+    method="POST",
+    headers={"Content-Type": "application/json"},
+)
+with urllib.request.urlopen(request, timeout=5) as response:
+    status = response.status
+elapsed = time.perf_counter() - started
+idle.close()
+print(json.dumps({"status": status, "elapsed": elapsed}))
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+  assert.equal(result.status, 0, result.stderr);
+  const payload = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+  assert.equal(payload.status, 200);
+  assert.ok(payload.elapsed < 3, `second request waited ${payload.elapsed}s`);
+});
@@ -0,0 +1,154 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_PATH = path.resolve(__dirname, '../blender_rpc_bridge.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+test('asyncio bridge server keeps the /health and /rpc contract and runs RPCs on the executor thread', () => {
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import http.client
+import importlib.util
+import json
+import socket
+import threading
+
+spec = importlib.util.spec_from_file_location("aether_blender_rpc_bridge", r"${BRIDGE_PATH}")
+bridge = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bridge)
+from aether_bridge import async_server
+
+executor_threads = set()
+
+def handle_rpc(payload, idempotency_key=None):
+    executor_threads.add(threading.current_thread().name)
+    return bridge._handle_rpc(payload, idempotency_key)
+
+executor = async_server.MainThreadExecutor()
+server = async_server.AsyncBridgeServer(handle_rpc, executor, token="secret").start_in_thread("127.0.0.1", 0)
+outcome = {}
+
+def client():
+    try:
+        idle = [socket.create_connection(("127.0.0.1", server.port)) for _ in range(200)]
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+
+        def call(method, path, body=None, headers=None):
+            connection.request(method, path, body=body, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, json.loads(response.read().decode("utf-8")), response.getheader("Connection")
+
+        auth = {"X-Aether-Token": "secret", "Content-Type": "application/json"}
+        outcome["health"] = call("GET", "/health")
+        outcome["ping"] = call("POST", "/rpc", json.dumps({"command": "ping", "payload": {}}), auth)
+        outcome["unauthorized"] = call("POST", "/rpc", "{}", {"X-Aether-Token": "wrong"})
+        outcome["invalid"] = call("POST", "/rpc", "{not json", auth)
+        outcome["missing"] = call("GET", "/nope")
+        outcome["threads"] = threading.active_count()
+        for sock in idle:
+            sock.close()
+    except Exception as exc:
+        outcome["error"] = repr(exc)
+    finally:
+        executor.stop()
+
+threading.Thread(target=client, name="client").start()
+executor.run_forever(poll_interval=0.05)
+server.close()
+print(json.dumps({"outcome": outcome, "executorThreads": sorted(executor_threads)}))
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+  assert.equal(result.status, 0, result.stderr);
+  const payload = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+  const { outcome } = payload;
+  assert.equal(outcome.error, undefined);
+
+  const [healthStatus, health, healthConnection] = outcome.health;
+  assert.equal(healthStatus, 200);
+  assert.equal(health.ok, true);
+  assert.equal(health.admission.mode, 'asyncio');
+  assert.ok(health.admission.connections >= 200);
+  assert.equal(healthConnection, 'keep-alive');
+
+  assert.equal(outcome.ping[0], 200);
+  assert.equal(outcome.ping[1].result.ok, true);
+  assert.deepEqual(outcome.unauthorized.slice(0, 2), [401, { ok: false, error: 'Unauthorized' }]);
+  assert.equal(outcome.invalid[0], 400);
+  assert.equal(outcome.invalid[1].code, 'RPC_INVALID_JSON');
+  assert.deepEqual(outcome.missing.slice(0, 2), [404, { ok: false, error: 'Not found' }]);
+  assert.ok(outcome.threads < 10, `expected idle connections not to cost threads, saw ${outcome.threads}`);
+  assert.deepEqual(payload.executorThreads, ['MainThread']);
+});
+
+test('both bridge servers answer a malformed Content-Length with a 400 JSON error', () => {
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import importlib.util
+import json
+import socket
+import threading
+
+spec = importlib.util.spec_from_file_location("aether_blender_rpc_bridge", r"${BRIDGE_PATH}")
+bridge = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bridge)
+from aether_bridge import async_server
+
+def raw_post(port, length):
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+        sock.sendall(("POST /rpc HTTP/1.1\\r\\nHost: x\\r\\nContent-Length: %s\\r\\n\\r\\n{}" % length).encode("latin-1"))
+        data = b""
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    head, _, body = data.partition(b"\\r\\n\\r\\n")
+    return int(head.split()[1]), json.loads(body.decode("utf-8"))
+
+outcome = {}
+threaded = bridge._start_server(0)
+outcome["threaded"] = [raw_post(threaded.server_address[1], value) for value in ("abc", "-5")]
+threaded.shutdown()
+
+executor = async_server.MainThreadExecutor()
+server = async_server.AsyncBridgeServer(bridge._handle_rpc, executor).start_in_thread("127.0.0.1", 0)
+
+def client():
+    try:
+        outcome["asyncio"] = [raw_post(server.port, value) for value in ("abc", "-5")]
+    except Exception as exc:
+        outcome["error"] = repr(exc)
+    finally:
+        executor.stop()
+
+threading.Thread(target=client).start()
+executor.run_forever(poll_interval=0.05)
+server.close()
+print(json.dumps(outcome))
+`,
+    ],
+    { encoding: 'utf8', env: { ...process.env, AETHER_RPC_TOKEN: '' } },
+  );
+
+  assert.equal(result.status, 0, result.stderr);
+  const outcome = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+  assert.equal(outcome.error, undefined);
+  for (const mode of ['threaded', 'asyncio']) {
+    for (const [status, body] of outcome[mode]) {
+      assert.equal(status, 400, mode);
+      assert.equal(body.ok, false);
+      assert.equal(body.code, 'RPC_INVALID_LENGTH');
+    }
+  }
+});
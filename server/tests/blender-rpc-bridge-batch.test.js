@@ -0,0 +1,178 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const runBatchSnippet = (snippet) =>
+  spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import json
+import sys
+import types
+sys.path.insert(0, r"${BRIDGE_DIR}")
+from aether_bridge import batch
+
+class FakeViewLayer:
+    def __init__(self):
+        self.updates = 0
+    def update(self):
+        self.updates += 1
+
+class FakeModifier:
+    def __init__(self):
+        self.show_viewport = True
+
+def make_bpy():
+    handlers = types.SimpleNamespace(depsgraph_update_pre=[], depsgraph_update_post=[lambda *args: None])
+    return types.SimpleNamespace(
+        app=types.SimpleNamespace(handlers=handlers),
+        context=types.SimpleNamespace(view_layer=FakeViewLayer()),
+    )
+
+${snippet}
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+const requireJson = (result, t) => {
+  if (result.error && result.error.code === 'ENOENT') {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return null;
+  }
+  if (result.status !== 0) {
+    assert.fail(`Python exited with status ${result.status}: ${result.stderr || result.stdout}`);
+  }
+  const lines = String(result.stdout || '').trim().split(/\r?\n/);
+  return JSON.parse(lines[lines.length - 1]);
+};
+
+test('batch_edit defers modifiers and handlers and evaluates once for nested batches', (t) => {
+  const parsed = requireJson(
+    runBatchSnippet(`
+bpy = make_bpy()
+modifier = FakeModifier()
+batch.defer_modifier(modifier)
+outside_hidden = modifier.show_viewport is False
+with batch.batch_edit(bpy) as outer:
+    batch.defer_modifier(modifier)
+    with batch.batch_edit(bpy) as inner:
+        batch.defer_modifier(modifier)
+        hidden = modifier.show_viewport
+        parked = len(bpy.app.handlers.depsgraph_update_post)
+        same = inner is outer
+    updates_inside = bpy.context.view_layer.updates
+report = outer.report()
+print(json.dumps({
+    'outsideHidden': outside_hidden,
+    'hidden': hidden,
+    'parked': parked,
+    'same': same,
+    'updatesInside': updates_inside,
+    'updates': bpy.context.view_layer.updates,
+    'restored': modifier.show_viewport,
+    'handlers': len(bpy.app.handlers.depsgraph_update_post),
+    'deferred': report['deferredModifiers'],
+    'hasTimings': report['mutationMs'] >= 0 and report['evaluationMs'] >= 0,
+    'active': batch.active_batch() is None,
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.outsideHidden, false);
+  assert.equal(parsed.hidden, false);
+  assert.equal(parsed.parked, 0);
+  assert.equal(parsed.same, true);
+  assert.equal(parsed.updatesInside, 0);
+  assert.equal(parsed.updates, 1);
+  assert.equal(parsed.restored, true);
+  assert.equal(parsed.handlers, 1);
+  assert.equal(parsed.deferred, 1);
+  assert.equal(parsed.hasTimings, true);
+  assert.equal(parsed.active, true);
+});
+
+test('batch_edit restores state when the batch body raises', (t) => {
+  const parsed = requireJson(
+    runBatchSnippet(`
+bpy = make_bpy()
+modifier = FakeModifier()
+try:
+    with batch.batch_edit(bpy):
+        batch.defer_modifier(modifier)
+        raise RuntimeError('boom')
+except RuntimeError:
+    pass
+print(json.dumps({
+    'restored': modifier.show_viewport,
+    'handlers': len(bpy.app.handlers.depsgraph_update_post),
+    'updates': bpy.context.view_layer.updates,
+    'active': batch.active_batch() is None,
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.deepEqual(parsed, { restored: true, handlers: 1, updates: 1, active: true });
+});
+
+test('batch_edit keeps batches per thread and does not let another thread join an open batch', (t) => {
+  const parsed = requireJson(
+    runBatchSnippet(`
+import threading
+import time
+
+bpy = make_bpy()
+events = []
+opened = threading.Event()
+release = threading.Event()
+stray = FakeModifier()
+
+def first():
+    with batch.batch_edit(bpy):
+        events.append('first_open')
+        opened.set()
+        release.wait(5)
+        events.append('first_close')
+
+def second():
+    opened.wait(5)
+    # Outside any batch of its own, this thread must not defer into the first thread's batch.
+    batch.defer_modifier(stray)
+    events.append('second_outside:%s' % (batch.active_batch() is None))
+    with batch.batch_edit(bpy) as owned:
+        events.append('second_open:%d' % owned.depth)
+
+threads = [threading.Thread(target=first), threading.Thread(target=second)]
+for thread in threads:
+    thread.start()
+opened.wait(5)
+time.sleep(0.2)
+release.set()
+for thread in threads:
+    thread.join(5)
+print(json.dumps({
+    'events': events,
+    'strayVisible': stray.show_viewport,
+    'updates': bpy.context.view_layer.updates,
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.deepEqual(parsed.events, [
+    'first_open',
+    'second_outside:True',
+    'first_close',
+    'second_open:1',
+  ]);
+  assert.equal(parsed.strayVisible, true);
+  assert.equal(parsed.updates, 2);
+});
@@ -0,0 +1,139 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_PATH = path.resolve(__dirname, '../blender_rpc_bridge.py');
+const REPLAY_PATH = path.resolve(__dirname, '../../tools/replay_blender_rpc.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+test('bridge capture records requests and replay reports latency and result mismatches', (t) => {
+  const captureDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-capture-'));
+  const capturePath = path.join(captureDir, 'capture.jsonl');
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import importlib.util
+import json
+
+def load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+bridge = load("aether_blender_rpc_bridge", r"${BRIDGE_PATH}")
+replay_tool = load("aether_replay_blender_rpc", r"${REPLAY_PATH}")
+
+bridge._handle_rpc({"command": "ping", "payload": {}})
+bridge._handle_rpc({"command": "exec_python", "payload": {"code": "print(6 * 7)", "mode": "safe"}})
+bridge._handle_rpc({"command": "exec_python", "payload": {"code": "import os", "mode": "safe"}})
+bridge.RECORDER.close()
+
+server = bridge._start_server(0)
+url = "http://127.0.0.1:%d/rpc" % server.server_address[1]
+records = list(replay_tool.read_capture(r"${capturePath}"))
+samples, mismatches = replay_tool.replay(records, url, "", speed=0)
+clean = replay_tool.summarize(samples, mismatches)
+
+records[1]["hash"] = "0" * 32
+samples, mismatches = replay_tool.replay(records, url, "", speed=0)
+tampered = replay_tool.summarize(samples, mismatches)
+server.shutdown()
+print(json.dumps({
+    "records": [[record["seq"], record["cmd"], record["status"]] for record in records],
+    "clean": {"requests": clean["requests"], "mismatches": clean["mismatches"], "commands": sorted(clean["commands"])},
+    "tampered": [detail["seq"] for detail in tampered["mismatchDetails"]],
+    "hasDelta": "deltaP50Ms" in clean["commands"]["exec_python"],
+}))
+`,
+    ],
+    {
+      encoding: 'utf8',
+      env: { ...process.env, AETHER_RPC_CAPTURE_PATH: capturePath, AETHER_RPC_TOKEN: '' },
+    },
+  );
+
+  if (result.error && result.error.code === 'ENOENT') {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return;
+  }
+  if (result.status !== 0) {
+    assert.fail(`Python exited with status ${result.status}: ${result.stderr || result.stdout}`);
+  }
+  const lines = String(result.stdout || '').trim().split(/\r?\n/);
+  const parsed = JSON.parse(lines[lines.length - 1]);
+
+  assert.deepEqual(parsed.records, [
+    [1, 'ping', 200],
+    [2, 'exec_python', 200],
+    [3, 'exec_python', 403],
+  ]);
+  assert.deepEqual(parsed.clean, { requests: 3, mismatches: 0, commands: ['exec_python', 'ping'] });
+  assert.deepEqual(parsed.tampered, [2]);
+  assert.equal(parsed.hasDelta, true);
+});
+
+test('paced replay sends each record on schedule even while an earlier one is still running', (t) => {
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import importlib.util
+import json
+import threading
+import time
+
+spec = importlib.util.spec_from_file_location("aether_replay_blender_rpc", r"${REPLAY_PATH}")
+replay_tool = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(replay_tool)
+
+ok_hash = replay_tool.result_hash(200, {"ok": True})
+records = [
+    {"seq": 1, "cmd": "exec_python", "at": 100.0, "ms": 5.0, "status": 200, "hash": ok_hash},
+    {"seq": 2, "cmd": "ping", "at": 100.05, "ms": 1.0, "status": 200, "hash": ok_hash},
+    {"seq": 3, "cmd": "ping", "at": 100.1, "ms": 1.0, "status": 200, "hash": ok_hash},
+]
+origin = time.perf_counter()
+sent = {}
+lock = threading.Lock()
+
+def send(url, token, command, payload, timeout):
+    with lock:
+        sent[len(sent)] = (command, time.perf_counter() - origin)
+    if command == "exec_python":
+        time.sleep(0.6)
+    return 200, {"ok": True}, 1.0
+
+samples, mismatches = replay_tool.replay(records, "http://unused/rpc", "", speed=1.0, send=send)
+report = replay_tool.summarize(samples, mismatches)
+print(json.dumps({
+    "pingSentBy": max(at for command, at in sent.values() if command == "ping"),
+    "mismatches": report["mismatches"],
+    "lagMax": report["sendLag"]["maxMs"],
+    "order": [sample["cmd"] for sample in samples],
+    "hasCommandLag": "lagP95Ms" in report["commands"]["ping"],
+}))
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+  if (result.error && result.error.code === 'ENOENT') {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return;
+  }
+  assert.equal(result.status, 0, result.stderr);
+  const parsed = JSON.parse(String(result.stdout).trim().split(/\r?\n/).pop());
+  // Open loop: the pings go out at their captured offsets, not after the slow exec_python answers.
+  assert.ok(parsed.pingSentBy < 0.5, `ping sent at ${parsed.pingSentBy}s`);
+  assert.ok(parsed.lagMax < 400);
+  assert.equal(parsed.mismatches, 0);
+  assert.deepEqual(parsed.order, ['exec_python', 'ping', 'ping']);
+  assert.equal(parsed.hasCommandLag, true);
+});
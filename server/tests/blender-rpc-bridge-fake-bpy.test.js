@@ -0,0 +1,161 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const {
+  buildGnOpsScript,
+  buildNodeTreeScript,
+} = require('../lib/executorBridge');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const runFakeBridgeSnippet = (snippet, input) =>
+  spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import json
+import os
+import sys
+os.environ['AETHER_RPC_FAKE_BPY'] = '1'
+sys.path.insert(0, r"${BRIDGE_DIR}")
+import blender_rpc_bridge as bridge
+import bpy
+
+STDIN = json.loads(sys.stdin.read() or 'null')
+
+def rpc(command, payload):
+    return bridge._handle_rpc({'command': command, 'payload': payload})
+
+def seed_cube():
+    mesh = bpy.data.meshes.new('Cube')
+    obj = bpy.data.objects.new('Cube', mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+${snippet}
+`,
+    ],
+    { encoding: 'utf8', input: JSON.stringify(input || null) },
+  );
+
+const lastJsonLine = (stdout) => JSON.parse(stdout.trim().split(/\r?\n/).pop());
+
+test('fake bpy backend runs generated NODE_TREE and GN_OPS scripts through exec_python', () => {
+  const target = { object_name: 'Cube', modifier_name: 'GN' };
+  const nodeTreeStep = {
+    id: 'step_nodes',
+    type: 'NODE_TREE',
+    payload: {
+      target,
+      operations: [
+        { op: 'set_group_io', action: 'add_output', socket: 'Geometry', socket_type: 'NodeSocketGeometry' },
+        { op: 'create_node', node_id: 'cube', bl_idname: 'GeometryNodeMeshCube', location: [0, 0] },
+        { op: 'create_node', node_id: 'math', bl_idname: 'ShaderNodeMath', location: [0, 200] },
+        { op: 'set_property', node_id: 'math', property: 'operation', value: 'MULTIPLY' },
+        { op: 'create_node', node_id: 'setpos', bl_idname: 'GeometryNodeSetPosition', location: [200, 0] },
+        { op: 'set_input_default', node_id: 'cube', socket: 'Size', value: [2, 2, 2] },
+        { op: 'link', from: { node_id: 'cube', socket: 'Mesh' }, to: { node_id: 'setpos', socket: 'Geometry' } },
+        { op: 'link', from: { node_id: 'setpos', socket: 'Geometry' }, to: { node_id: 'group_output', socket: 'Geometry' } },
+      ],
+    },
+  };
+  const gnOpsStep = {
+    id: 'step_ops',
+    type: 'GN_OPS',
+    payload: {
+      target,
+      ops: [
+        { op: 'ensure_target', allow_create_modifier: true },
+        { op: 'ensure_single_group_io' },
+        { op: 'add_node', id: 'join', bl_idname: 'GeometryNodeJoinGeometry', x: 400, y: 0 },
+        { op: 'link', from: { node_id: 'setpos', socket_name: 'Geometry' }, to: { node_id: 'join', socket_name: 'Geometry' } },
+        { op: 'link', from: { node_id: 'join', socket_name: 'Geometry' }, to: { node_id: 'group_output', socket_name: 'Geometry' } },
+        { op: 'cleanup_unused' },
+      ],
+    },
+  };
+
+  const result = runFakeBridgeSnippet(`
+obj = seed_cube()
+statuses = []
+for code in STDIN:
+    status, response = rpc('exec_python', {'code': code, 'mode': 'safe', 'batch': True})
+    statuses.append([status, response.get('error')])
+tree = obj.modifiers['GN'].node_group
+cube = next(node for node in tree.nodes if node.bl_idname == 'GeometryNodeMeshCube')
+status, exported = rpc('export_node_tree_ir', {'target': {'object_name': 'Cube', 'modifier_name': 'GN'}})
+print(json.dumps({
+    'statuses': statuses,
+    'nodes': sorted(node.bl_idname for node in tree.nodes),
+    'links': sorted([link.from_node.bl_idname, link.to_node.bl_idname] for link in tree.links),
+    'size': list(cube.inputs['Size'].default_value),
+    'irStatus': status,
+    'irNodes': len(exported['result']['ir']['nodes']),
+    'viewportRestored': obj.modifiers['GN'].show_viewport,
+}))
+`, [buildNodeTreeScript(nodeTreeStep), buildGnOpsScript(gnOpsStep)]);
+
+  assert.equal(result.status, 0, result.stderr);
+  const payload = lastJsonLine(result.stdout);
+  assert.deepEqual(payload.statuses, [[200, null], [200, null]]);
+  assert.deepEqual(payload.nodes, [
+    'GeometryNodeJoinGeometry',
+    'GeometryNodeMeshCube',
+    'GeometryNodeSetPosition',
+    'NodeGroupInput',
+    'NodeGroupOutput',
+  ]);
+  assert.deepEqual(payload.links, [
+    ['GeometryNodeJoinGeometry', 'NodeGroupOutput'],
+    ['GeometryNodeMeshCube', 'GeometryNodeSetPosition'],
+    ['GeometryNodeSetPosition', 'GeometryNodeJoinGeometry'],
+  ]);
+  assert.deepEqual(payload.size, [2, 2, 2]);
+  assert.equal(payload.irStatus, 200);
+  assert.equal(payload.irNodes, 5);
+  assert.equal(payload.viewportRestored, true);
+});
+
+test('fake bpy mesh collections support foreach_get/foreach_set and datablock bookkeeping', () => {
+  const result = runFakeBridgeSnippet(`
+obj = seed_cube()
+mesh = obj.data
+mesh.from_pydata([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [], [(0, 1, 2, 3)])
+coords = [0.0] * (len(mesh.vertices) * 3)
+mesh.vertices.foreach_get('co', coords)
+mesh.vertices.foreach_set('co', [value * 2 for value in coords])
+try:
+    mesh.vertices.foreach_set('co', [0.0])
+    mismatch = None
+except RuntimeError as exc:
+    mismatch = str(exc)
+status, created = rpc('create_objects', {'count': 3, 'name_prefix': 'Scatter', 'data': 'Cube'})
+orphan = bpy.data.meshes.new('Orphan')
+purged = bpy.data.orphans_purge(do_recursive=True)
+print(json.dumps({
+    'second': list(mesh.vertices[2].co),
+    'mismatch': mismatch,
+    'createStatus': status,
+    'created': created['result'].get('created'),
+    'meshUsers': mesh.users,
+    'duplicateName': bpy.data.objects.new('Cube', None).name,
+    'purged': purged,
+    'hasOrphan': 'Orphan' in bpy.data.meshes,
+}))
+`);
+
+  assert.equal(result.status, 0, result.stderr);
+  const payload = lastJsonLine(result.stdout);
+  assert.deepEqual(payload.second, [2, 2, 0]);
+  assert.match(payload.mismatch, /length mismatch/);
+  assert.equal(payload.createStatus, 200);
+  assert.equal(payload.created, 3);
+  assert.equal(payload.meshUsers, 4);
+  assert.equal(payload.duplicateName, 'Cube.001');
+  assert.equal(payload.hasOrphan, false);
+  assert.ok(payload.purged >= 1);
+});
@@ -0,0 +1,112 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_PATH = path.resolve(__dirname, '../blender_rpc_bridge.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const runBridgeSnippet = (snippet) =>
+  spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import importlib.util
+import json
+import threading
+import time
+
+spec = importlib.util.spec_from_file_location("aether_blender_rpc_bridge", r"${BRIDGE_PATH}")
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+idempotency = module.idempotency
+
+${snippet}
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+const requireJson = (result, t) => {
+  if (result.error && result.error.code === 'ENOENT') {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return null;
+  }
+  if (result.status !== 0) {
+    assert.fail(`Python exited with status ${result.status}: ${result.stderr || result.stdout}`);
+  }
+  const lines = String(result.stdout || '').trim().split(/\r?\n/);
+  return JSON.parse(lines[lines.length - 1]);
+};
+
+test('idempotency cache attaches duplicates to the in-flight execution and expires after the TTL', (t) => {
+  const parsed = requireJson(
+    runBridgeSnippet(`
+now = [0.0]
+cache = idempotency.IdempotencyCache(ttl_seconds=10, clock=lambda: now[0])
+release = threading.Event()
+calls = []
+
+def slow():
+    calls.append(1)
+    release.wait(5)
+    return 'done-%d' % len(calls)
+
+outcomes = []
+threads = [threading.Thread(target=lambda: outcomes.append(cache.run('k', 'fp', slow))) for _ in range(3)]
+for thread in threads:
+    thread.start()
+time.sleep(0.2)
+release.set()
+for thread in threads:
+    thread.join()
+
+cached = cache.run('k', 'fp', slow)
+try:
+    cache.run('k', 'other', slow)
+    reused = None
+except idempotency.IdempotencyKeyError as exc:
+    reused = [exc.code, exc.status_code]
+now[0] = 11.0
+expired = cache.run('k', 'fp', slow)
+print(json.dumps({
+    'sources': sorted(source for _outcome, source in outcomes),
+    'results': sorted(set(outcome for outcome, _source in outcomes)),
+    'cached': list(cached),
+    'reused': reused,
+    'expired': list(expired),
+    'calls': len(calls),
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.deepEqual(parsed.sources, ['attached', 'attached', 'executed']);
+  assert.deepEqual(parsed.results, ['done-1']);
+  assert.deepEqual(parsed.cached, ['done-1', 'cached']);
+  assert.deepEqual(parsed.reused, ['RPC_IDEMPOTENCY_KEY_REUSED', 422]);
+  assert.deepEqual(parsed.expired, ['done-2', 'executed']);
+  assert.equal(parsed.calls, 2);
+});
+
+test('bridge returns the cached response for a repeated idempotency key', (t) => {
+  const parsed = requireJson(
+    runBridgeSnippet(`
+body = {'command': 'exec_python', 'payload': {'code': 'print(1)', 'mode': 'safe'}, 'idempotency_key': 'step-1'}
+first_status, first = module._handle_rpc(body)
+second_status, second = module._handle_rpc(dict(body))
+header_status, header = module._handle_rpc({'command': 'exec_python', 'payload': {'code': 'print(2)'}}, 'step-1')
+print(json.dumps({
+    'first': [first_status, 'idempotency' in first],
+    'second': [second_status, second.get('idempotency'), second['result']['stdout']],
+    'header': [header_status, header.get('code')],
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.deepEqual(parsed.first, [200, false]);
+  assert.deepEqual(parsed.second, [200, { key: 'step-1', source: 'cached' }, '1\n']);
+  assert.deepEqual(parsed.header, [422, 'RPC_IDEMPOTENCY_KEY_REUSED']);
+});
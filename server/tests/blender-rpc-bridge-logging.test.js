@@ -0,0 +1,121 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const BRIDGE_PATH = path.join(BRIDGE_DIR, 'blender_rpc_bridge.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const readJsonLines = (file) =>
+  fs.readFileSync(file, 'utf8').split(/\r?\n/).filter(Boolean).map((line) => JSON.parse(line));
+
+test('bridge keeps stdout to lifecycle markers and writes structured records to the log file', (t) => {
+  const logDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-bridge-log-'));
+  t.after(() => fs.rmSync(logDir, { recursive: true, force: true }));
+  const logPath = path.join(logDir, 'bridge.jsonl');
+
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import importlib.util
+import json
+import urllib.request
+
+spec = importlib.util.spec_from_file_location("aether_blender_rpc_bridge", r"${BRIDGE_PATH}")
+bridge = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bridge)
+
+server = bridge._start_server(0)
+url = "http://127.0.0.1:%d/rpc" % server.server_address[1]
+for command, payload in (("ping", {}), ("exec_python", {"code": "print(1)", "mode": "safe"})):
+    request = urllib.request.Request(url, data=json.dumps({"command": command, "payload": payload}).encode("utf-8"), method="POST")
+    urllib.request.urlopen(request, timeout=10).read()
+bridge._handle_rpc({"command": "exec_python", "payload": {"code": "import os", "mode": "safe"}})
+bridge.LOG.lifecycle("[AETHER_RPC_READY]", port=1, pid=2)
+bridge.LOG.close()
+`,
+    ],
+    {
+      encoding: 'utf8',
+      env: { ...process.env, AETHER_RPC_LOG_PATH: logPath, AETHER_RPC_LOG_LEVEL: 'info' },
+    },
+  );
+
+  assert.equal(result.status, 0, result.stderr);
+  assert.equal(result.stdout.trim(), '[AETHER_RPC_READY] port=1 pid=2');
+  assert.equal(result.stderr.trim(), '');
+
+  const records = readJsonLines(logPath);
+  const events = records.map((record) => record.event);
+  assert.equal(events.filter((event) => event === 'http.access').length, 2);
+  assert.ok(events.includes('exec_python.end'));
+  assert.ok(events.includes('lifecycle'));
+  const failure = records.find((record) => record.event === 'rpc.error');
+  assert.equal(failure.level, 'error');
+  assert.equal(failure.code, 'SAF_004_BLOCKED_IMPORT');
+  assert.match(failure.traceback, /Traceback/);
+  const access = records.find((record) => record.event === 'http.access');
+  assert.equal(access.method, 'POST');
+  assert.equal(access.path, '/rpc');
+  assert.equal(access.status, 200);
+  assert.equal(typeof access.ms, 'number');
+});
+
+test('bridge log samples successful access records, rotates files and filters by level', (t) => {
+  const logDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-bridge-log-'));
+  t.after(() => fs.rmSync(logDir, { recursive: true, force: true }));
+  const logPath = path.join(logDir, 'bridge.jsonl');
+
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import io
+import json
+import random
+import sys
+sys.path.insert(0, r"${BRIDGE_DIR}")
+from aether_bridge import bridge_log
+
+sink = bridge_log.RotatingJsonLog(r"${logPath}", max_bytes=2048, backups=2, flush_interval=0)
+log = bridge_log.BridgeLogger(level="info", sink=sink, access_sample=0.25, rng=random.Random(3))
+for index in range(400):
+    log.access("POST", "/rpc", 200, 1.0)
+for index in range(5):
+    log.access("POST", "/rpc", 503, 1.0)
+log.debug("hidden")
+log.close()
+
+stderr = io.StringIO()
+fallback = bridge_log.BridgeLogger(level="debug", stream=stderr)
+fallback.info("dropped_without_sink")
+fallback.error("kept", detail="x")
+print(json.dumps({"sampledOut": log.sampled_out, "stderr": stderr.getvalue()}))
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+  assert.equal(result.status, 0, result.stderr);
+  const payload = JSON.parse(result.stdout.trim());
+  assert.ok(payload.sampledOut > 250 && payload.sampledOut < 350);
+  const stderrRecords = payload.stderr.trim().split('\n').map((line) => JSON.parse(line));
+  assert.deepEqual(stderrRecords.map((record) => record.event), ['kept']);
+
+  const files = fs.readdirSync(logDir).sort();
+  assert.deepEqual(files, ['bridge.jsonl', 'bridge.jsonl.1', 'bridge.jsonl.2']);
+  for (const file of files) {
+    assert.ok(fs.statSync(path.join(logDir, file)).size <= 2048);
+  }
+  const records = files.flatMap((file) => readJsonLines(path.join(logDir, file)));
+  assert.ok(records.every((record) => record.event === 'http.access'));
+  const errors = records.filter((record) => record.status === 503);
+  assert.ok(errors.length >= 1);
+  assert.ok(errors.every((record) => record.level === 'warning'));
+});
@@ -0,0 +1,418 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const createGnOpsExecutor = require('../lib/executors/gnOpsExecutor');
+const { buildReconcilePayload } = require('../lib/executorBridge');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const FAKE_TREE_SOURCE = `
+class FakeSocket:
+    def __init__(self, node, name, is_output):
+        self.node = node
+        self.name = name
+        self.is_output = is_output
+        self.is_multi_input = False
+        self.default_value = 0.0
+
+class FakeNode(dict):
+    def __init__(self, bl_idname):
+        super().__init__()
+        self.bl_idname = bl_idname
+        self.name = bl_idname
+        self.location = (0.0, 0.0)
+        self.inputs = [FakeSocket(self, 'Geometry', False), FakeSocket(self, 'Value', False)]
+        self.outputs = [FakeSocket(self, 'Geometry', True)]
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
+
+class FakeLink:
+    def __init__(self, from_socket, to_socket):
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+        self.from_node = from_socket.node
+        self.to_node = to_socket.node
+
+class FakeNodes(list):
+    def new(self, type):
+        node = FakeNode(type)
+        self.append(node)
+        return node
+
+class FakeLinks(list):
+    def __init__(self, tree):
+        super().__init__()
+        self.tree = tree
+        self.new_calls = 0
+    def new(self, from_socket, to_socket):
+        self.new_calls += 1
+        for link in list(self):
+            if link.to_socket is to_socket:
+                self.remove(link)
+        link = FakeLink(from_socket, to_socket)
+        self.append(link)
+        return link
+
+class FakeTree:
+    bl_idname = 'GeometryNodeTree'
+
+    def __init__(self, name='Tree'):
+        self.name = name
+        self.nodes = FakeNodes()
+        self.links = FakeLinks(self)
+        self.nodes.remove = self.remove_node
+    def remove_node(self, node):
+        for link in [link for link in self.links if link.from_node is node or link.to_node is node]:
+            list.remove(self.links, link)
+        list.remove(self.nodes, node)
+
+def _patch_remove(tree):
+    return tree
+
+class FakeModifier:
+    type = 'NODES'
+    def __init__(self, name):
+        self.name = name
+        self.node_group = None
+
+class FakeModifiers(dict):
+    def new(self, name, type):
+        self[name] = FakeModifier(name)
+        return self[name]
+
+class FakeObject:
+    def __init__(self):
+        self.modifiers = FakeModifiers()
+
+class FakeNodeGroups(dict):
+    def new(self, name, type):
+        self[name] = FakeTree(name)
+        return self[name]
+
+class FakeData:
+    def __init__(self):
+        self.objects = {'Cube': FakeObject()}
+        self.node_groups = FakeNodeGroups()
+
+class FakeBpy:
+    def __init__(self):
+        self.data = FakeData()
+`;
+
+const runIndexSnippet = (snippet) =>
+  spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import json
+import sys
+sys.path.insert(0, r"${BRIDGE_DIR}")
+from aether_bridge import node_tree_ir, node_trees
+${FAKE_TREE_SOURCE}
+${snippet}
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+const requireJson = (result, t) => {
+  if (result.error && result.error.code === 'ENOENT') {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return null;
+  }
+  if (result.status !== 0) {
+    assert.fail(`Python exited with status ${result.status}: ${result.stderr || result.stdout}`);
+  }
+  const lines = String(result.stdout || '').trim().split(/\r?\n/);
+  return JSON.parse(lines[lines.length - 1]);
+};
+
+test('node tree index is reused across acquisitions and tracks ops incrementally', (t) => {
+  const parsed = requireJson(
+    runIndexSnippet(`
+tree = _patch_remove(FakeTree())
+tree.nodes.new('NodeGroupInput')
+tree.nodes.new('NodeGroupOutput')
+index = node_trees.node_tree_index(tree)
+previous = None
+for i in range(2000):
+    node = index.new_node('n%d' % i, 'GeometryNodeSetPosition')
+    source = index.get('group_input') if previous is None else previous
+    index.link(index.socket(source, 'Geometry', True), index.socket(node, 'Geometry', False))
+    index.link(index.socket(source, 'Geometry', True), index.socket(node, 'Geometry', False))
+    previous = node
+again = node_trees.node_tree_index(tree)
+print(json.dumps({
+    'same': again is index,
+    'rebuilds': again.rebuilds,
+    'links': len(tree.links),
+    'linkNewCalls': tree.links.new_calls,
+    'hasLast': 'n1999' in again,
+    'missingSocket': again.socket(previous, 'Nope', False),
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.same, true);
+  assert.equal(parsed.rebuilds, 0);
+  assert.equal(parsed.links, 2000);
+  assert.equal(parsed.linkNewCalls, 2000);
+  assert.equal(parsed.hasLast, true);
+  assert.equal(parsed.missingSocket, null);
+});
+
+test('node tree index rebuilds when the tree drifts outside the index', (t) => {
+  const parsed = requireJson(
+    runIndexSnippet(`
+tree = _patch_remove(FakeTree())
+index = node_trees.node_tree_index(tree)
+external = tree.nodes.new('GeometryNodeMeshCube')
+external['_aether_node_id'] = 'external'
+rebuilt = node_trees.node_tree_index(tree)
+print(json.dumps({'same': rebuilt is index, 'found': rebuilt.get('external') is external}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.same, false);
+  assert.equal(parsed.found, true);
+});
+
+test('node tree index removes nodes with their links and replaces single-input links', (t) => {
+  const parsed = requireJson(
+    runIndexSnippet(`
+tree = _patch_remove(FakeTree())
+index = node_trees.node_tree_index(tree)
+a = index.new_node('a', 'X')
+b = index.new_node('b', 'X')
+c = index.new_node('c', 'X')
+index.link(index.socket(a, 'Geometry', True), index.socket(c, 'Geometry', False))
+index.link(index.socket(b, 'Geometry', True), index.socket(c, 'Geometry', False))
+replaced_links = len(tree.links)
+index.link(index.socket(a, 'Geometry', True), index.socket(b, 'Value', False))
+index.remove_node(a)
+print(json.dumps({
+    'replacedLinks': replaced_links,
+    'linksAfterRemove': len(tree.links),
+    'current': index.is_current(),
+    'hasA': 'a' in index,
+    'bLinked': index.is_linked(b),
+    'unlinked': index.unlink(index.socket(b, 'Geometry', True), index.socket(c, 'Geometry', False)),
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.replacedLinks, 1);
+  assert.equal(parsed.linksAfterRemove, 1);
+  assert.equal(parsed.current, true);
+  assert.equal(parsed.hasA, false);
+  assert.equal(parsed.bLinked, true);
+  assert.equal(parsed.unlinked, true);
+});
+
+test('node tree index rebuilds when nodes are swapped or the tree is replaced in place', (t) => {
+  const parsed = requireJson(
+    runIndexSnippet(`
+tree = _patch_remove(FakeTree())
+tree.session_uid = 1
+index = node_trees.node_tree_index(tree)
+index.new_node('a', 'X')
+tree.nodes[0].name = 'Renamed'
+renamed = node_trees.node_tree_index(tree)
+tree.session_uid = 2
+reloaded = node_trees.node_tree_index(tree)
+print(json.dumps({
+    'renamedRebuilt': renamed is not index,
+    'reloadedRebuilt': reloaded is not renamed,
+    'reusedAfter': node_trees.node_tree_index(tree) is reloaded,
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.renamedRebuilt, true);
+  assert.equal(parsed.reloadedRebuilt, true);
+  assert.equal(parsed.reusedAfter, true);
+});
+
+test('bridge drops node tree indexes on file load and undo', (t) => {
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import json
+import os
+import sys
+os.environ['AETHER_RPC_FAKE_BPY'] = '1'
+sys.path.insert(0, r"${BRIDGE_DIR}")
+import blender_rpc_bridge as bridge
+import bpy
+from aether_bridge import node_trees
+${FAKE_TREE_SOURCE}
+handlers = bpy.app.handlers
+counts = {}
+for name in ('load_post', 'undo_post', 'redo_post'):
+    node_trees.node_tree_index(FakeTree())
+    for callback in getattr(handlers, name):
+        callback(None)
+    counts[name] = node_trees.clear_node_tree_indexes()
+print(json.dumps({
+    'registered': [len(getattr(handlers, name)) for name in ('load_post', 'undo_post', 'redo_post')],
+    'remaining': counts,
+}))
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+  const parsed = requireJson(result, t);
+  if (!parsed) return;
+  assert.deepEqual(parsed.registered, [1, 1, 1]);
+  assert.deepEqual(parsed.remaining, { load_post: 0, undo_post: 0, redo_post: 0 });
+});
+
+test('reconcile_node_tree applies only the diff and is idempotent on re-run', (t) => {
+  const parsed = requireJson(
+    runIndexSnippet(`
+bpy = FakeBpy()
+desired = {
+    'target': {'object_name': 'Cube', 'modifier_name': 'GeometryNodes', 'node_group_name': 'GN'},
+    'nodes': {
+        'a': {'id': 'a', 'bl_idname': 'GeometryNodeMeshCube', 'location': [0, 0], 'properties': {}, 'inputs': {'Value': {'default': 2.5}}},
+        'b': {'id': 'b', 'bl_idname': 'GeometryNodeSetPosition', 'position': {'x': 200, 'y': 0}, 'inputs': {}},
+    },
+    'links': [
+        {'from': {'node_id': 'a', 'socket': 'Geometry'}, 'to': {'node_id': 'b', 'socket': 'Geometry'}},
+        {'from': {'node_id': 'b', 'socket_name': 'Geometry'}, 'to': {'node_id': 'group_output', 'socket_name': 'Geometry'}},
+    ],
+}
+first = node_trees.reconcile_node_tree(bpy, desired)
+second = node_trees.reconcile_node_tree(bpy, desired)
+desired['nodes'].pop('b')
+desired['links'] = []
+desired['prune'] = True
+third = node_trees.reconcile_node_tree(bpy, desired)
+tree = bpy.data.node_groups['GN']
+print(json.dumps({
+    'first': first['summary'],
+    'secondChanged': second['changed'],
+    'secondUnchanged': second['summary']['unchangedNodes'],
+    'third': third['summary'],
+    'nodes': sorted(node.bl_idname for node in tree.nodes),
+    'links': len(tree.links),
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.first.created, 2);
+  assert.equal(parsed.first.linked, 2);
+  assert.equal(parsed.first.inputsChanged, 1);
+  assert.equal(parsed.secondChanged, false);
+  assert.equal(parsed.secondUnchanged, 2);
+  assert.equal(parsed.third.deleted, 1);
+  assert.equal(parsed.third.created, 0);
+  assert.deepEqual(parsed.nodes, ['GeometryNodeMeshCube', 'NodeGroupInput', 'NodeGroupOutput']);
+  assert.equal(parsed.links, 0);
+});
+
+test('reconcile_node_tree skips replayed inputs for a node removed later in the same GN_OPS step', (t) => {
+  const step = {
+    id: 'gn',
+    type: 'GN_OPS',
+    payload: {
+      target: { object_name: 'Cube', modifier_name: 'GeometryNodes' },
+      ops: [
+        { op: 'ensure_target', allow_create_modifier: true },
+        { op: 'add_node', id: 'keep', bl_idname: 'GeometryNodeMeshCube' },
+        { op: 'add_node', id: 'gone', bl_idname: 'GeometryNodeSetPosition' },
+        { op: 'set_input', node_id: 'gone', socket_name: 'Value', value: 4 },
+        { op: 'remove_node', id: 'gone' },
+      ],
+    },
+  };
+  const executor = createGnOpsExecutor();
+  const state = executor.createState(step.payload.target);
+  executor.applyOperations(state, step.payload.ops);
+  const payload = buildReconcilePayload(step, executor.serializeState(state));
+
+  const parsed = requireJson(
+    runIndexSnippet(`
+bpy = FakeBpy()
+payload = json.loads(r'''${JSON.stringify(payload)}''')
+result = node_trees.reconcile_node_tree(bpy, payload)
+tree = bpy.data.objects['Cube'].modifiers['GeometryNodes'].node_group
+print(json.dumps({
+    'inputs': len(payload['inputs']),
+    'created': result['summary']['created'],
+    'nodes': sorted(node.bl_idname for node in tree.nodes),
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.inputs, 1);
+  assert.equal(parsed.created, 1);
+  assert.ok(parsed.nodes.includes('GeometryNodeMeshCube'));
+  assert.equal(parsed.nodes.includes('GeometryNodeSetPosition'), false);
+});
+
+test('node tree IR interns names, indexes links by node, and caches its hash until invalidated', (t) => {
+  const parsed = requireJson(
+    runIndexSnippet(`
+bpy = FakeBpy()
+desired = {
+    'target': {'object_name': 'Cube', 'modifier_name': 'GeometryNodes', 'node_group_name': 'GN'},
+    'nodes': {
+        'a': {'id': 'a', 'bl_idname': 'GeometryNodeMeshCube', 'location': [0, 0]},
+        'b': {'id': 'b', 'bl_idname': 'GeometryNodeSetPosition', 'location': [200, 0]},
+    },
+    'links': [{'from': {'node_id': 'a', 'socket': 'Geometry'}, 'to': {'node_id': 'b', 'socket': 'Geometry'}}],
+}
+node_trees.reconcile_node_tree(bpy, desired)
+target = {'node_group_name': 'GN'}
+first = node_tree_ir.export_node_tree_ir(bpy, {'target': target})
+second = node_tree_ir.export_node_tree_ir(bpy, {'target': target, 'known_hash': first['hash']})
+tree = bpy.data.node_groups['GN']
+node_trees.node_tree_index(tree).get('a').inputs[1].default_value = 3.0
+stale = node_tree_ir.export_node_tree_ir(bpy, {'target': target})
+node_tree_ir.invalidate_node_tree_ir(tree)
+fresh = node_tree_ir.export_node_tree_ir(bpy, {'target': target})
+ir = first['ir']
+print(json.dumps({
+    'types': ir['types'],
+    'links': ir['links'],
+    'nodeIds': [node[1] for node in ir['nodes']],
+    'secondCached': second['cached'],
+    'secondUnchanged': second['unchanged'],
+    'secondHasIr': 'ir' in second,
+    'staleSame': stale['hash'] == first['hash'],
+    'freshChanged': fresh['hash'] != first['hash'],
+    'freshCached': fresh['cached'],
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.deepEqual(parsed.types, [
+    'NodeGroupInput',
+    'NodeGroupOutput',
+    'GeometryNodeMeshCube',
+    'GeometryNodeSetPosition',
+  ]);
+  assert.deepEqual(parsed.nodeIds, ['NodeGroupInput', 'NodeGroupOutput', 'a', 'b']);
+  assert.equal(parsed.links.length, 1);
+  assert.equal(parsed.links[0][0], 2);
+  assert.equal(parsed.links[0][2], 3);
+  assert.equal(parsed.secondCached, true);
+  assert.equal(parsed.secondUnchanged, true);
+  assert.equal(parsed.secondHasIr, false);
+  assert.equal(parsed.staleSame, true);
+  assert.equal(parsed.freshChanged, true);
+  assert.equal(parsed.freshCached, false);
+});
@@ -0,0 +1,180 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const runObjectsSnippet = (snippet) =>
+  spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import json
+import sys
+import types
+sys.path.insert(0, r"${BRIDGE_DIR}")
+from aether_bridge import objects
+
+class FakeObject:
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+        self.location = (0.0, 0.0, 0.0)
+        self.rotation_euler = (0.0, 0.0, 0.0)
+        self.scale = (1.0, 1.0, 1.0)
+        self.instance_type = 'NONE'
+        self.instance_collection = None
+
+class FakeObjects(dict):
+    def new(self, name, data):
+        unique = name
+        suffix = 0
+        while unique in self:
+            suffix += 1
+            unique = '%s.%03d' % (name, suffix)
+        self[unique] = FakeObject(unique, data)
+        return self[unique]
+
+class FakeCollection:
+    def __init__(self, name):
+        self.name = name
+        self.objects = types.SimpleNamespace(linked=[])
+        self.objects.link = self.objects.linked.append
+        self.children = types.SimpleNamespace(link=lambda child: None)
+
+class FakeCollections(dict):
+    def new(self, name):
+        self[name] = FakeCollection(name)
+        return self[name]
+
+def make_bpy():
+    scene = types.SimpleNamespace(collection=FakeCollection('Scene Collection'))
+    collections = FakeCollections()
+    collections['Rock'] = FakeCollection('Rock')
+    data = types.SimpleNamespace(
+        objects=FakeObjects(),
+        meshes={'Cube': types.SimpleNamespace(name='Cube')},
+        collections=collections,
+    )
+    return types.SimpleNamespace(data=data, context=types.SimpleNamespace(scene=scene))
+
+${snippet}
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+const requireJson = (result, t) => {
+  if (result.error && result.error.code === 'ENOENT') {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return null;
+  }
+  if (result.status !== 0) {
+    assert.fail(`Python exited with status ${result.status}: ${result.stderr || result.stdout}`);
+  }
+  const lines = String(result.stdout || '').trim().split(/\r?\n/);
+  return JSON.parse(lines[lines.length - 1]);
+};
+
+test('create_objects builds collection instances from flat transform arrays in one pass', (t) => {
+  const parsed = requireJson(
+    runObjectsSnippet(`
+bpy = make_bpy()
+count = 20000
+result = objects.create_objects(bpy, {
+    'count': count,
+    'name_prefix': 'Scatter',
+    'instance_collection': 'Rock',
+    'collection': 'Scatter',
+    'locations': [float(i % 7) for i in range(count * 3)],
+    'scales': [[1.0, 1.0, 2.0]] * count,
+    'return_names': False,
+})
+last = bpy.data.objects['Scatter.19999']
+print(json.dumps({
+    'created': result['created'],
+    'collection': result['collection'],
+    'linked': len(bpy.data.collections['Scatter'].objects.linked),
+    'instanceType': last.instance_type,
+    'instance': last.instance_collection.name,
+    'location': list(last.location),
+    'scale': list(last.scale),
+    'hasNames': 'names' in result,
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.created, 20000);
+  assert.equal(parsed.collection, 'Scatter');
+  assert.equal(parsed.linked, 20000);
+  assert.equal(parsed.instanceType, 'COLLECTION');
+  assert.equal(parsed.instance, 'Rock');
+  assert.equal(parsed.location.length, 3);
+  assert.deepEqual(parsed.scale, [1, 1, 2]);
+  assert.equal(parsed.hasNames, false);
+});
+
+test('create_objects shares mesh data, reports renamed objects, and rejects mismatched arrays', (t) => {
+  const parsed = requireJson(
+    runObjectsSnippet(`
+bpy = make_bpy()
+result = objects.create_objects(bpy, {'names': ['A', 'A'], 'data': 'Cube'})
+errors = []
+for bad in (
+    {'names': ['B'], 'locations': [[0, 0]]},
+    {'names': ['C'], 'data': 'Missing'},
+    {'names': ['D'], 'matrices': [[1] * 16], 'locations': [[0, 0, 0]]},
+):
+    try:
+        objects.create_objects(bpy, bad)
+    except objects.ObjectBatchError as exc:
+        errors.append(exc.code)
+print(json.dumps({
+    'names': result['names'],
+    'collection': result['collection'],
+    'shared': bpy.data.objects['A'].data is bpy.data.objects['A.001'].data,
+    'errors': errors,
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.deepEqual(parsed.names, ['A', 'A.001']);
+  assert.equal(parsed.collection, 'Scene Collection');
+  assert.equal(parsed.shared, true);
+  assert.deepEqual(parsed.errors, ['OBJECT_BATCH_INVALID', 'OBJECT_BATCH_INVALID', 'OBJECT_BATCH_INVALID']);
+});
+
+test('create_objects checks every reference and the size limit before creating anything', (t) => {
+  const parsed = requireJson(
+    runObjectsSnippet(`
+bpy = make_bpy()
+errors = []
+for bad in (
+    {'names': ['E', 'F', 'G'], 'data': ['Cube', 'Cube', 'Missing'], 'copy_data': True, 'collection': 'Bulk'},
+    {'names': ['H', 'I'], 'instance_collection': ['Rock', 'Nope']},
+    {'count': objects.MAX_BULK_OBJECTS + 1},
+):
+    try:
+        objects.create_objects(bpy, bad)
+    except objects.ObjectBatchError as exc:
+        errors.append(str(exc))
+print(json.dumps({
+    'errors': errors,
+    'objects': sorted(bpy.data.objects),
+    'collectionCreated': 'Bulk' in bpy.data.collections,
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.match(parsed.errors[0], /data not found: Missing/);
+  assert.match(parsed.errors[1], /instance_collection not found: Nope/);
+  assert.match(parsed.errors[2], /limited to/);
+  assert.deepEqual(parsed.objects, []);
+  assert.equal(parsed.collectionCreated, false);
+});
@@ -0,0 +1,86 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const crypto = require('node:crypto');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+test('bridge spills oversized exec_python output to the artifact dir and returns a preview with path, size and hash', () => {
+  const outputRoot = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-output-'));
+  const stepDir = path.join(outputRoot, 'run_1', 'protocol_steps', 'step_1');
+  const outsideDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-outside-'));
+  try {
+    const result = spawnSync(
+      PYTHON_BIN,
+      [
+        '-c',
+        `
+import json
+import os
+import sys
+os.environ['AETHER_RPC_FAKE_BPY'] = '1'
+os.environ['AETHER_RPC_OUTPUT_ROOT'] = r"${outputRoot}"
+os.environ['AETHER_RPC_OUTPUT_INLINE_BYTES'] = '4096'
+sys.path.insert(0, r"${BRIDGE_DIR}")
+import blender_rpc_bridge as bridge
+
+def rpc(payload):
+    return bridge._handle_rpc({'command': 'exec_python', 'payload': payload})[1]['result']
+
+LOUD = "print('HEAD')\\nfor i in range(2000):\\n    print('line', i)\\nprint('TAIL')"
+outcome = {
+    'small': rpc({'code': "print('hello')", 'mode': 'safe'}),
+    'large': rpc({'code': LOUD, 'mode': 'safe', 'output_dir': r"${stepDir}"}),
+    'outside': rpc({'code': LOUD, 'mode': 'safe', 'output_dir': r"${outsideDir}"}),
+}
+from aether_bridge.output_spill import OutputSpiller
+unrooted = OutputSpiller(inline_bytes=8)
+streams = {'stdout': 'x' * 64}
+outcome['unrooted'] = unrooted.spill(streams, output_dir=r"${outsideDir}")['stdoutSpill']['path']
+outcome['unrootedFallback'] = unrooted.fallback_dir
+bridge.OUTPUT_SPILL.inline_bytes = 0
+outcome['disabled'] = len(rpc({'code': LOUD, 'mode': 'safe', 'output_dir': r"${stepDir}"})['stdout'])
+print(json.dumps(outcome))
+`,
+      ],
+      { encoding: 'utf8' },
+    );
+
+    assert.equal(result.status, 0, result.stderr);
+    const outcome = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+
+    assert.equal(outcome.small.stdout, 'hello\n');
+    assert.equal(outcome.small.stdoutSpill, undefined);
+
+    const { large } = outcome;
+    const spill = large.stdoutSpill;
+    assert.equal(path.dirname(spill.path), fs.realpathSync(stepDir));
+    const written = fs.readFileSync(spill.path);
+    assert.equal(spill.bytes, written.length);
+    assert.equal(spill.sha256, crypto.createHash('sha256').update(written).digest('hex'));
+    assert.match(written.toString('utf8'), /^HEAD\nline 0\n[\s\S]*line 1999\nTAIL\n$/);
+    assert.ok(large.stdout.length < 4096);
+    assert.match(large.stdout, /^HEAD\n/);
+    assert.match(large.stdout, /TAIL\n$/);
+    assert.ok(large.stdout.includes(`[${spill.bytes} bytes; full output in ${spill.path}]`));
+    assert.equal(large.stderr, '');
+    assert.equal(large.stderrSpill, undefined);
+
+    // Directories outside the configured root fall back to the bridge's own temp dir.
+    assert.ok(!outcome.outside.stdoutSpill.path.startsWith(fs.realpathSync(outsideDir)));
+    assert.ok(fs.existsSync(outcome.outside.stdoutSpill.path));
+    fs.rmSync(outcome.outside.stdoutSpill.path, { force: true });
+    // Without a configured root the bridge ignores output_dir entirely.
+    assert.equal(path.dirname(outcome.unrooted), outcome.unrootedFallback);
+    assert.deepEqual(fs.readdirSync(outsideDir), []);
+    fs.rmSync(outcome.unrooted, { force: true });
+    assert.equal(outcome.disabled, spill.bytes);
+  } finally {
+    fs.rmSync(outputRoot, { recursive: true, force: true });
+    fs.rmSync(outsideDir, { recursive: true, force: true });
+  }
+});
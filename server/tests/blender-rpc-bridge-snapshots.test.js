@@ -0,0 +1,132 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+test('bridge snapshots every N reported steps, skips idle saves after unreported edits and prunes old files', () => {
+  const snapshotDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-snapshots-'));
+  try {
+    const result = spawnSync(
+      PYTHON_BIN,
+      [
+        '-c',
+        `
+import json
+import os
+import sys
+import time
+os.environ['AETHER_RPC_FAKE_BPY'] = '1'
+os.environ['AETHER_RPC_SNAPSHOT_DIR'] = r"${snapshotDir}"
+os.environ['AETHER_RPC_SNAPSHOT_EVERY'] = '2'
+os.environ['AETHER_RPC_SNAPSHOT_IDLE_S'] = '0.05'
+sys.path.insert(0, r"${BRIDGE_DIR}")
+import blender_rpc_bridge as bridge
+
+def fake_save(filepath):
+    # The fake bpy has no operators; stand in for wm.save_as_mainfile(copy=True).
+    with open(filepath, 'wb') as handle:
+        handle.write(b'BLENDER-v' + str(len(os.listdir(os.path.dirname(filepath)))).encode())
+
+bridge.SNAPSHOTS.saver = fake_save
+
+def rpc(command, payload):
+    return bridge._handle_rpc({'command': command, 'payload': payload})[1]['result']
+
+outcome = {}
+outcome['first'] = rpc('snapshot_step', {'step_id': 'step_1', 'step_index': 0})
+outcome['second'] = rpc('snapshot_step', {'step_id': 'step_2', 'step_index': 1})
+outcome['third'] = rpc('snapshot_step', {'step_id': 'step_3', 'step_index': 2})
+rpc('exec_python', {'code': 'value = 1', 'mode': 'safe'})
+time.sleep(0.1)
+outcome['idleAfterEdit'] = bridge.SNAPSHOTS.idle_tick()
+outcome['fourth'] = rpc('snapshot_step', {'step_id': 'step_4', 'step_index': 3})
+rpc('ping', {})
+time.sleep(0.1)
+outcome['idle'] = bridge.SNAPSHOTS.idle_tick()
+outcome['forced'] = rpc('snapshot_step', {'step_id': 'step_5', 'step_index': 4, 'force': True, 'run_id': 'run_7'})
+with open(os.path.join(r"${snapshotDir}", 'latest.json'), 'r', encoding='utf-8') as handle:
+    outcome['manifest'] = json.load(handle)
+outcome['files'] = sorted(name for name in os.listdir(r"${snapshotDir}") if name.endswith('.blend'))
+print(json.dumps(outcome))
+`,
+      ],
+      { encoding: 'utf8' },
+    );
+
+    assert.equal(result.status, 0, result.stderr);
+    const outcome = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+
+    assert.equal(outcome.first.saved, false);
+    assert.equal(outcome.first.stepsSinceSnapshot, 1);
+    assert.equal(outcome.second.saved, true);
+    assert.equal(outcome.second.snapshot.stepId, 'step_2');
+    assert.equal(outcome.second.snapshot.sequence, 1);
+    assert.equal(outcome.third.saved, false);
+
+    // An RPC after step_3 changed the scene, so an idle save would mislabel it.
+    assert.equal(outcome.idleAfterEdit, null);
+    assert.equal(outcome.fourth.saved, true);
+    assert.equal(outcome.fourth.snapshot.stepId, 'step_4');
+    // Nothing new since step_4's snapshot; read-only commands keep it current.
+    assert.equal(outcome.idle, null);
+
+    assert.equal(outcome.forced.saved, true);
+    assert.equal(outcome.manifest.runId, 'run_7');
+    assert.equal(outcome.manifest.stepId, 'step_5');
+    assert.equal(outcome.manifest.stepIndex, 4);
+    assert.equal(outcome.manifest.sequence, 3);
+    assert.equal(outcome.manifest.reason, 'step');
+    assert.ok(outcome.manifest.bytes > 0);
+    assert.deepEqual(outcome.files, ['snapshot_00002.blend', 'snapshot_00003.blend']);
+  } finally {
+    fs.rmSync(snapshotDir, { recursive: true, force: true });
+  }
+});
+
+test('bridge takes an idle snapshot once reported steps are followed by a quiet period', () => {
+  const snapshotDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-snapshots-'));
+  try {
+    const result = spawnSync(
+      PYTHON_BIN,
+      [
+        '-c',
+        `
+import json
+import os
+import sys
+import time
+sys.path.insert(0, r"${BRIDGE_DIR}")
+from aether_bridge import snapshots
+
+def fake_save(filepath):
+    with open(filepath, 'wb') as handle:
+        handle.write(b'BLENDER')
+
+manager = snapshots.SnapshotManager(r"${snapshotDir}", every_steps=0, idle_seconds=0.05, saver=fake_save)
+report = manager.step_completed('step_1', 0)
+early = manager.idle_tick()
+manager.start_idle_thread()
+deadline = time.time() + 5
+while manager.latest is None and time.time() < deadline:
+    time.sleep(0.02)
+print(json.dumps({'report': report, 'early': early, 'latest': manager.latest}))
+`,
+      ],
+      { encoding: 'utf8' },
+    );
+
+    assert.equal(result.status, 0, result.stderr);
+    const outcome = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+    assert.equal(outcome.report.saved, false);
+    assert.equal(outcome.early, null);
+    assert.equal(outcome.latest.reason, 'idle');
+    assert.equal(outcome.latest.stepId, 'step_1');
+  } finally {
+    fs.rmSync(snapshotDir, { recursive: true, force: true });
+  }
+});
@@ -0,0 +1,161 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+test('bridge loads a registered template once and instantiates it by linking or copying', () => {
+  const templateRoot = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-templates-'));
+  const outsideRoot = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-outside-'));
+  fs.writeFileSync(path.join(templateRoot, 'studio.blend'), 'BLENDER');
+  fs.writeFileSync(path.join(outsideRoot, 'stray.blend'), 'BLENDER');
+  try {
+    const result = spawnSync(
+      PYTHON_BIN,
+      [
+        '-c',
+        `
+import contextlib
+import json
+import os
+import sys
+import types
+os.environ['AETHER_RPC_FAKE_BPY'] = '1'
+os.environ['AETHER_TEMPLATE_ROOT'] = r"${templateRoot}"
+sys.path.insert(0, r"${BRIDGE_DIR}")
+import blender_rpc_bridge as bridge
+import bpy
+
+loads = []
+
+@contextlib.contextmanager
+def load(filepath, link=False):
+    # The fake bpy has no libraries; stand in for appending studio.blend's datablocks.
+    loads.append(os.path.basename(filepath))
+    data_from = types.SimpleNamespace(
+        collections=['Studio', 'Lights'], objects=['Floor', 'Key', 'Backdrop'],
+        meshes=['FloorMesh'], materials=['Paint'], node_groups=[],
+    )
+    data_to = types.SimpleNamespace()
+    yield data_from, data_to
+    mesh = bpy.data.meshes.new('FloorMesh')
+    blocks = {
+        'Floor': bpy.data.objects.new('Floor', mesh),
+        'Key': bpy.data.objects.new('Key', None),
+        'Backdrop': bpy.data.objects.new('Backdrop', None),
+        'Studio': bpy.data.collections.new('Studio'),
+        'Lights': bpy.data.collections.new('Lights'),
+        'FloorMesh': mesh,
+        'Paint': bpy.data.materials.new('Paint'),
+    }
+    blocks['Studio'].objects.link(blocks['Floor'])
+    blocks['Studio'].children.link(blocks['Lights'])
+    blocks['Lights'].objects.link(blocks['Key'])
+    blocks['Key'].parent = blocks['Floor']
+    for kind in ('collections', 'objects', 'meshes', 'materials', 'node_groups'):
+        setattr(data_to, kind, [blocks[name] for name in getattr(data_to, kind)])
+
+bpy.data.libraries = types.SimpleNamespace(load=load)
+
+def rpc(command, payload):
+    status, response = bridge._handle_rpc({'command': command, 'payload': payload})
+    return status, response.get('result') or response
+
+outcome = {}
+outcome['outside'] = rpc('register_template', {'name': 'stray', 'path': r"${path.join(outsideRoot, 'stray.blend')}"})
+outcome['missing'] = rpc('register_template', {'name': 'gone', 'path': 'gone.blend'})
+outcome['register'] = rpc('register_template', {'name': 'studio', 'path': 'studio.blend'})
+outcome['reregister'] = rpc('register_template', {'name': 'studio', 'path': 'studio.blend'})
+outcome['linked'] = rpc('instantiate_template', {'name': 'studio', 'scene': 'Shot_A'})
+shot_a = bpy.data.scenes['Shot_A']
+outcome['linkedNames'] = sorted(obj.name for obj in shot_a.objects)
+outcome['headlessActive'] = bpy.context.scene.name
+outcome['sharesTemplate'] = next(iter(shot_a.collection.children)) is bpy.data.collections['Studio']
+
+bpy.data.orphans_purge(do_recursive=True)
+outcome['copied'] = rpc('instantiate_template', {'name': 'studio', 'scene': 'Shot_B', 'mode': 'copy', 'copy_data': True})
+shot_b = bpy.data.scenes['Shot_B']
+copies = {obj.name: obj for obj in shot_b.objects}
+outcome['copiedNames'] = sorted(copies)
+outcome['copyOwnsMesh'] = copies['Floor.001'].data is not bpy.data.objects['Floor'].data
+outcome['copyParent'] = copies['Key.001'].parent.name
+
+bpy.data.objects.remove(bpy.data.objects['Backdrop'])
+outcome['reloaded'] = rpc('instantiate_template', {'name': 'studio', 'into_current_scene': True})
+outcome['helper'] = rpc('exec_python', {'code': "aether.instantiate_template('studio', scene='Shot_C')", 'mode': 'safe'})
+outcome['helperScene'] = 'Shot_C' in bpy.data.scenes
+outcome['unknown'] = rpc('instantiate_template', {'name': 'nope'})
+outcome['badMode'] = rpc('instantiate_template', {'name': 'studio', 'mode': 'move'})
+outcome['list'] = rpc('list_templates', {})
+outcome['loads'] = loads
+window = types.SimpleNamespace(scene=bpy.context.scene)
+bpy.context.window_manager = types.SimpleNamespace(windows=[window])
+outcome['windowed'] = rpc('instantiate_template', {'name': 'studio', 'scene': 'Shot_W'})
+outcome['windowScene'] = window.scene.name
+print(json.dumps(outcome))
+`,
+      ],
+      { encoding: 'utf8' },
+    );
+
+    assert.equal(result.status, 0, result.stderr);
+    const outcome = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+
+    assert.equal(outcome.outside[0], 400);
+    assert.equal(outcome.outside[1].code, 'TEMPLATE_INVALID');
+    assert.equal(outcome.missing[0], 404);
+    assert.equal(outcome.missing[1].code, 'TEMPLATE_NOT_FOUND');
+
+    const [, registered] = outcome.register;
+    assert.equal(registered.cache, 'miss');
+    assert.equal(registered.loads, 1);
+    assert.deepEqual(registered.datablocks, { collections: 2, objects: 3, meshes: 1, materials: 1, node_groups: 0 });
+    assert.equal(outcome.reregister[1].cache, 'hit');
+    assert.equal(outcome.reregister[1].loads, 1);
+
+    const [linkedStatus, linked] = outcome.linked;
+    assert.equal(linkedStatus, 200);
+    assert.equal(linked.scene, 'Shot_A');
+    // Background Blender has no window to show the scene in, so callers target it by name.
+    assert.equal(linked.activated, false);
+    assert.equal(outcome.headlessActive, 'Scene');
+    assert.equal(linked.mode, 'link');
+    assert.equal(linked.cache, 'hit');
+    assert.deepEqual(linked.collections, ['Studio']);
+    assert.equal(linked.objects, 3);
+    assert.deepEqual(outcome.linkedNames, ['Backdrop', 'Floor', 'Key']);
+    assert.equal(outcome.sharesTemplate, true);
+
+    // Fake users kept the appended datablocks through the orphan purge.
+    const [, copied] = outcome.copied;
+    assert.equal(copied.cache, 'hit');
+    assert.equal(copied.objects, 3);
+    assert.deepEqual(outcome.copiedNames, ['Backdrop.001', 'Floor.001', 'Key.001']);
+    assert.equal(outcome.copyOwnsMesh, true);
+    assert.equal(outcome.copyParent, 'Floor.001');
+
+    // A removed template datablock forces a reload on the next instantiation.
+    assert.equal(outcome.reloaded[1].cache, 'miss');
+    assert.equal(outcome.reloaded[1].scene, 'Scene');
+    assert.equal(outcome.reloaded[1].activated, true);
+    assert.equal(outcome.helper[0], 200);
+    assert.equal(outcome.helperScene, true);
+
+    assert.equal(outcome.unknown[0], 404);
+    assert.equal(outcome.badMode[1].code, 'TEMPLATE_INVALID');
+    const [listed] = outcome.list[1].templates;
+    assert.equal(listed.name, 'studio');
+    assert.equal(listed.loads, 2);
+    assert.equal(listed.instantiations, 4);
+    assert.deepEqual(outcome.loads, ['studio.blend', 'studio.blend']);
+    assert.equal(outcome.windowed[1].activated, true);
+    assert.equal(outcome.windowScene, 'Shot_W');
+  } finally {
+    fs.rmSync(templateRoot, { recursive: true, force: true });
+    fs.rmSync(outsideRoot, { recursive: true, force: true });
+  }
+});
@@ -0,0 +1,93 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const TRACE_ID = '000000000000000000000123456789ab';
+const PARENT_ID = '00000000deadbeef';
+
+test('bridge returns decode, queue wait, safety, exec and encode spans for a traced RPC on both servers', () => {
+  const result = spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import http.client
+import json
+import os
+import sys
+import threading
+os.environ['AETHER_RPC_FAKE_BPY'] = '1'
+sys.path.insert(0, r"${BRIDGE_DIR}")
+import blender_rpc_bridge as bridge
+from aether_bridge import async_server
+
+TRACEPARENT = '00-${TRACE_ID}-${PARENT_ID}-01'
+BODY = json.dumps({'command': 'exec_python', 'payload': {'code': 'value = 1', 'mode': 'safe'}})
+
+def call(port, headers):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    connection.request('POST', '/rpc', body=BODY, headers={'Content-Type': 'application/json', **headers})
+    response = connection.getresponse()
+    payload = json.loads(response.read().decode('utf-8'))
+    connection.close()
+    return payload
+
+threaded = bridge.admission.BoundedHTTPServer(('127.0.0.1', 0), bridge.Handler, bridge.OverloadHandler, workers=1)
+threading.Thread(target=threaded.serve_forever, daemon=True).start()
+outcome = {
+    'threaded': call(threaded.server_address[1], {'traceparent': TRACEPARENT}),
+    'unsampled': call(threaded.server_address[1], {'traceparent': TRACEPARENT[:-2] + '00'}),
+    'untraced': call(threaded.server_address[1], {}),
+}
+threaded.shutdown()
+
+executor = async_server.MainThreadExecutor()
+server = async_server.AsyncBridgeServer(bridge._handle_rpc, executor).start_in_thread('127.0.0.1', 0)
+
+def client():
+    try:
+        outcome['asyncio'] = call(server.port, {'traceparent': TRACEPARENT})
+    finally:
+        executor.stop()
+
+threading.Thread(target=client).start()
+executor.run_forever(poll_interval=0.05)
+server.close()
+print(json.dumps(outcome))
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+  assert.equal(result.status, 0, result.stderr);
+  const outcome = JSON.parse(result.stdout.trim().split(/\r?\n/).pop());
+  assert.equal(outcome.untraced.ok, true);
+  assert.equal(outcome.untraced.trace, undefined);
+  assert.equal(outcome.unsampled.trace, undefined);
+
+  for (const mode of ['threaded', 'asyncio']) {
+    const { ok, trace } = outcome[mode];
+    assert.equal(ok, true, mode);
+    assert.equal(trace.traceId, TRACE_ID);
+    assert.equal(trace.parentSpanId, PARENT_ID);
+    assert.match(trace.spanId, /^[0-9a-f]{16}$/);
+    assert.ok(trace.durationMs >= 0);
+
+    const byName = Object.fromEntries(trace.spans.map((span) => [span.name, span]));
+    assert.deepEqual(
+      Object.keys(byName).sort(),
+      ['bridge.decode', 'bridge.encode', 'bridge.exec', 'bridge.queue_wait', 'bridge.safety'],
+      mode,
+    );
+    for (const name of ['bridge.decode', 'bridge.queue_wait', 'bridge.exec', 'bridge.encode']) {
+      assert.equal(byName[name].parentSpanId, trace.spanId, `${mode} ${name}`);
+    }
+    assert.equal(byName['bridge.safety'].parentSpanId, byName['bridge.exec'].spanId);
+    assert.equal(byName['bridge.exec'].attributes.command, 'exec_python');
+    assert.ok(byName['bridge.encode'].startOffsetMs >= byName['bridge.exec'].startOffsetMs);
+  }
+});
@@ -0,0 +1,134 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const BRIDGE_DIR = path.resolve(__dirname, '..');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const runWatchdogSnippet = (snippet) =>
+  spawnSync(
+    PYTHON_BIN,
+    [
+      '-c',
+      `
+import json
+import sys
+import types
+sys.path.insert(0, r"${BRIDGE_DIR}")
+from aether_bridge import watchdog
+
+class FakeBlock:
+    def __init__(self, users):
+        self.users = users
+        self.use_fake_user = False
+
+class FakeCollection(list):
+    def remove(self, block):
+        list.remove(self, block)
+
+def make_bpy(orphans, used):
+    meshes = FakeCollection([FakeBlock(0) for _ in range(orphans)] + [FakeBlock(1) for _ in range(used)])
+    return types.SimpleNamespace(data=types.SimpleNamespace(meshes=meshes, node_groups=FakeCollection()))
+
+${snippet}
+`,
+    ],
+    { encoding: 'utf8' },
+  );
+
+const requireJson = (result, t) => {
+  if (result.error && result.error.code === 'ENOENT') {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return null;
+  }
+  if (result.status !== 0) {
+    assert.fail(`Python exited with status ${result.status}: ${result.stderr || result.stdout}`);
+  }
+  const lines = String(result.stdout || '').trim().split(/\r?\n/);
+  return JSON.parse(lines[lines.length - 1]);
+};
+
+test('watchdog purges orphans on cadence and reports per-type counts', (t) => {
+  const parsed = requireJson(
+    runWatchdogSnippet(`
+bpy = make_bpy(orphans=5, used=2)
+dog = watchdog.Watchdog(purge_every=2, purge_growth=0)
+ping = dog.after_command('ping', bpy)
+first = dog.after_command('exec_python', bpy)
+second = dog.after_command('exec_python', bpy)
+print(json.dumps({
+    'pingCommands': ping['commands'],
+    'firstPurged': first['purged'],
+    'secondPurged': second['purged'],
+    'meshes': second['datablocks']['meshes'],
+    'hasRss': 'rssBytes' in second,
+    'recycle': second['recycle'],
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.pingCommands, 0);
+  assert.equal(parsed.firstPurged, 0);
+  assert.equal(parsed.secondPurged, 5);
+  assert.equal(parsed.meshes, 2);
+  assert.equal(parsed.hasRss, true);
+  assert.equal(parsed.recycle, false);
+});
+
+test('watchdog purges on datablock growth and requests recycling past the memory ceiling', (t) => {
+  const parsed = requireJson(
+    runWatchdogSnippet(`
+bpy = make_bpy(orphans=0, used=1)
+dog = watchdog.Watchdog(purge_every=0, purge_growth=3)
+dog.after_command('exec_python', bpy)
+bpy.data.meshes.extend([FakeBlock(0) for _ in range(3)])
+grown = dog.after_command('exec_python', bpy)
+watchdog.rss_bytes = lambda: 10 * 1024 * 1024
+dog.memory_ceiling_bytes = 5 * 1024 * 1024
+over = dog.after_command('get_context', bpy)
+watchdog.rss_bytes = lambda: 1
+sticky = dog.after_command('get_context', bpy)
+print(json.dumps({
+    'grownPurged': grown['purged'],
+    'recycle': over['recycle'],
+    'reason': over.get('recycleReason'),
+    'sticky': sticky['recycle'],
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.equal(parsed.grownPurged, 3);
+  assert.equal(parsed.recycle, true);
+  assert.equal(parsed.reason, 'memory_ceiling');
+  assert.equal(parsed.sticky, true);
+});
+
+test('watchdog prunes the oldest addon modules and their path entries past the limit', (t) => {
+  const parsed = requireJson(
+    runWatchdogSnippet(`
+dog = watchdog.Watchdog(addon_module_limit=1)
+sys.modules['addon_old'] = types.ModuleType('addon_old')
+sys.modules['addon_old.ops'] = types.ModuleType('addon_old.ops')
+sys.modules['addon_new'] = types.ModuleType('addon_new')
+sys.path.insert(0, '/tmp/aether_old_parent')
+dog.track_addon('addon_old', '/tmp/aether_old_parent')
+dog.track_addon('addon_new', '/tmp/aether_new_parent')
+report = dog.after_command('validate_addon')
+print(json.dumps({
+    'pruned': report['prunedModules'],
+    'oldGone': 'addon_old' not in sys.modules and 'addon_old.ops' not in sys.modules,
+    'newKept': 'addon_new' in sys.modules,
+    'pathGone': '/tmp/aether_old_parent' not in sys.path,
+}))
+`),
+    t,
+  );
+  if (!parsed) return;
+  assert.deepEqual(parsed.pruned, ['addon_old']);
+  assert.equal(parsed.oldGone, true);
+  assert.equal(parsed.newKept, true);
+  assert.equal(parsed.pathGone, true);
+});
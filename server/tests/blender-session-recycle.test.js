@@ -0,0 +1,318 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const fs = require('node:fs');
+const os = require('node:os');
+const path = require('node:path');
+const Module = require('node:module');
+const { EventEmitter } = require('node:events');
+
+const SESSION_PATH = path.resolve(__dirname, '../lib/blenderSessionManager.js');
+
+const withMockedSessionManager = async (mocks, run) => {
+  const originalLoad = Module._load;
+  delete require.cache[SESSION_PATH];
+
+  Module._load = function patchedLoader(request, parent, isMain) {
+    if (parent && parent.filename === SESSION_PATH && Object.prototype.hasOwnProperty.call(mocks, request)) {
+      return mocks[request];
+    }
+    return originalLoad.call(this, request, parent, isMain);
+  };
+
+  try {
+    const mod = require(SESSION_PATH);
+    return await run(mod);
+  } finally {
+    Module._load = originalLoad;
+    delete require.cache[SESSION_PATH];
+  }
+};
+
+test('executeOnActive rotates a session whose bridge watchdog requested recycling', async () => {
+  const children = [];
+  const spawnEnvs = [];
+  const bridgeCalls = [];
+
+  const spawnStub = (_bin, _args, options) => {
+    const child = new EventEmitter();
+    child.stdout = new EventEmitter();
+    child.stderr = new EventEmitter();
+    child.pid = 20000 + children.length;
+    child.kill = () => true;
+    children.push(child);
+    spawnEnvs.push(options.env);
+    setImmediate(() => child.stdout.emit('data', '[AETHER_RPC_READY] port=9999\n'));
+    return child;
+  };
+
+  const mocks = {
+    'child_process': { spawn: spawnStub },
+    './runStore': {
+      getSettings: async () => ({
+        blenderPath: 'blender',
+        addonOutputPath: path.resolve(__dirname, '..', '..', 'generated_addons'),
+        sessionMemoryCeilingMb: 2048,
+        sessionOrphanPurgeEvery: 10,
+      }),
+    },
+    './blenderRpcClient': {
+      callBridge: async ({ command }) => {
+        bridgeCalls.push(command);
+        return {
+          ok: true,
+          watchdog: bridgeCalls.length === 1
+            ? { recycle: true, recycleReason: 'memory_ceiling', rssBytes: 3 * 1024 * 1024 * 1024 }
+            : { recycle: false, rssBytes: 1024 },
+        };
+      },
+    },
+    './utils': {
+      killProcessTree: async () => {},
+      nowIso: () => new Date().toISOString(),
+    },
+    './auditLog': {
+      AUDIT_EVENT_TYPES: {},
+      appendAuditRecord: async () => {},
+    },
+  };
+
+  await withMockedSessionManager(mocks, async (manager) => {
+    const first = await manager.launchSession({ mode: 'headless' });
+    await new Promise((resolve) => setImmediate(resolve));
+
+    const initial = await manager.executeOnActive('get_context', {}, 1000);
+    assert.equal(initial.sessionId, first.id);
+    assert.equal(manager.getActiveSession().recycleRequested, true);
+
+    const rotated = await manager.executeOnActive('get_context', {}, 1000);
+    assert.notEqual(rotated.sessionId, first.id);
+    assert.equal(manager.getSession(first.id).status, 'stopped');
+    assert.ok(
+      manager.getSession(first.id).events.some((event) => event.type === 'blender_recycle_requested'),
+    );
+    const recycled = manager.getSession(rotated.sessionId).events.find((event) => event.type === 'blender_recycled');
+    assert.ok(recycled);
+    assert.equal(recycled.previousSessionId, first.id);
+    assert.equal(recycled.reason, 'memory_ceiling');
+  });
+
+  assert.equal(children.length, 2);
+  assert.equal(spawnEnvs[0].AETHER_RPC_MEMORY_CEILING_MB, '2048');
+  assert.equal(spawnEnvs[0].AETHER_RPC_PURGE_EVERY, '10');
+  assert.equal(spawnEnvs[0].AETHER_RPC_PURGE_GROWTH, '');
+  assert.equal(spawnEnvs[0].AETHER_RPC_SERVER, 'threaded');
+  assert.match(spawnEnvs[0].AETHER_RPC_LOG_PATH, /bridge_logs[\\/]blender_.+\.jsonl$/);
+  assert.equal(spawnEnvs[0].AETHER_RPC_ACCESS_LOG_SAMPLE, '0.1');
+});
+
+test('executeOnActive defers a requested recycle while a run holds the session', async () => {
+  const children = [];
+  const spawnEnvs = [];
+
+  const spawnStub = (_bin, _args, options) => {
+    const child = new EventEmitter();
+    child.stdout = new EventEmitter();
+    child.stderr = new EventEmitter();
+    child.pid = 25000 + children.length;
+    child.kill = () => true;
+    children.push(child);
+    spawnEnvs.push(options.env);
+    setImmediate(() => child.stdout.emit('data', '[AETHER_RPC_READY] port=9999\n'));
+    return child;
+  };
+
+  const mocks = {
+    'child_process': { spawn: spawnStub },
+    './runStore': {
+      getSettings: async () => ({
+        blenderPath: 'blender',
+        addonOutputPath: path.resolve(__dirname, '..', '..', 'generated_addons'),
+        sessionMemoryCeilingMb: 2048,
+        sessionOrphanPurgeEvery: 0,
+      }),
+    },
+    './blenderRpcClient': {
+      callBridge: async () => ({
+        ok: true,
+        watchdog: { recycle: true, recycleReason: 'memory_ceiling', rssBytes: 3 * 1024 * 1024 * 1024 },
+      }),
+    },
+    './utils': {
+      killProcessTree: async () => {},
+      nowIso: () => new Date().toISOString(),
+    },
+    './auditLog': {
+      AUDIT_EVENT_TYPES: {},
+      appendAuditRecord: async () => {},
+    },
+  };
+
+  await withMockedSessionManager(mocks, async (manager) => {
+    const first = await manager.launchSession({ mode: 'headless' });
+    await new Promise((resolve) => setImmediate(resolve));
+
+    const release = manager.holdSession();
+    assert.equal(manager.isSessionHeld(), true);
+    await manager.executeOnActive('get_context', {}, 1000);
+    const during = await manager.executeOnActive('get_context', {}, 1000);
+    assert.equal(during.sessionId, first.id);
+    assert.equal(manager.getSession(first.id).status, 'running');
+
+    // Without snapshots there is nothing to resume, so recovery does not wait out the crash window.
+    const recoveryStarted = Date.now();
+    assert.equal(await manager.recoverFromSnapshot(), null);
+    assert.ok(Date.now() - recoveryStarted < 500);
+
+    release();
+    release();
+    assert.equal(manager.isSessionHeld(), false);
+    const after = await manager.executeOnActive('get_context', {}, 1000);
+    assert.notEqual(after.sessionId, first.id);
+  });
+
+  assert.equal(children.length, 2);
+  assert.equal(spawnEnvs[0].AETHER_RPC_PURGE_EVERY, '0');
+  assert.equal(spawnEnvs[0].AETHER_RPC_PURGE_GROWTH, '0');
+});
+
+test('recoverFromSnapshot relaunches a crashed session on its latest snapshot', async () => {
+  const dataDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-session-snapshots-'));
+  const snapshotRoot = path.join(dataDir, 'session_snapshots');
+  const children = [];
+  const spawnCalls = [];
+  let snapshotPath = null;
+
+  const spawnStub = (_bin, args, options) => {
+    const child = new EventEmitter();
+    child.stdout = new EventEmitter();
+    child.stderr = new EventEmitter();
+    child.pid = 30000 + children.length;
+    children.push(child);
+    spawnCalls.push({ args, env: options.env });
+    setImmediate(() => child.stdout.emit('data', '[AETHER_RPC_READY] port=9999\n'));
+    return child;
+  };
+
+  const mocks = {
+    'child_process': { spawn: spawnStub },
+    './constants': { BRIDGE_LOG_DIR: path.join(dataDir, 'bridge_logs'), SESSION_SNAPSHOT_DIR: snapshotRoot },
+    './runStore': {
+      getSettings: async () => ({
+        blenderPath: 'blender',
+        addonOutputPath: path.resolve(__dirname, '..', '..', 'generated_addons'),
+        sessionSnapshotEvery: 3,
+      }),
+    },
+    './blenderRpcClient': { callBridge: async () => ({ ok: true }) },
+    './utils': {
+      killProcessTree: async () => {},
+      nowIso: () => new Date().toISOString(),
+    },
+    './auditLog': {
+      AUDIT_EVENT_TYPES: {},
+      appendAuditRecord: async () => {},
+    },
+  };
+
+  try {
+    await withMockedSessionManager(mocks, async (manager) => {
+      const first = await manager.launchSession({ mode: 'headless' });
+      await new Promise((resolve) => setImmediate(resolve));
+      assert.equal(await manager.recoverFromSnapshot(), null, 'a healthy session is not recovered');
+
+      const snapshotDir = path.join(snapshotRoot, first.id);
+      snapshotPath = path.join(snapshotDir, 'snapshot_00001.blend');
+      fs.mkdirSync(snapshotDir, { recursive: true });
+      fs.writeFileSync(snapshotPath, 'BLENDER');
+      fs.writeFileSync(
+        path.join(snapshotDir, 'latest.json'),
+        JSON.stringify({ sequence: 1, path: snapshotPath, runId: 'run_1', stepId: 'step_3', stepIndex: 2 }),
+      );
+      children[0].emit('close', null, 'SIGSEGV');
+
+      const recovery = await manager.recoverFromSnapshot({ runId: 'run_1' });
+      assert.equal(recovery.snapshot.stepId, 'step_3');
+      assert.notEqual(recovery.session.id, first.id);
+      assert.deepEqual(recovery.session.resumedFrom, recovery.snapshot);
+      const resumed = manager.getSession(recovery.session.id).events.find((event) => event.type === 'blender_resumed');
+      assert.equal(resumed.previousSessionId, first.id);
+
+      await manager.stopSession(recovery.session.id);
+      assert.equal(fs.existsSync(snapshotDir), false, 'a deliberate stop discards the lineage snapshots');
+    });
+
+    assert.equal(spawnCalls.length, 2);
+    assert.deepEqual(spawnCalls[1].args.slice(0, 2), ['-b', snapshotPath]);
+    assert.equal(path.dirname(snapshotPath), spawnCalls[0].env.AETHER_RPC_SNAPSHOT_DIR);
+    assert.equal(spawnCalls[0].env.AETHER_RPC_SNAPSHOT_EVERY, '3');
+    assert.equal(spawnCalls[0].env.AETHER_RPC_SNAPSHOT_IDLE_S, '0');
+  } finally {
+    fs.rmSync(dataDir, { recursive: true, force: true });
+  }
+});
+
+test('recoverFromSnapshot relaunches a blank session when the run has no snapshot yet', async () => {
+  const dataDir = fs.mkdtempSync(path.join(os.tmpdir(), 'aether-session-snapshots-'));
+  const snapshotRoot = path.join(dataDir, 'session_snapshots');
+  const children = [];
+  const spawnCalls = [];
+
+  const spawnStub = (_bin, args, options) => {
+    const child = new EventEmitter();
+    child.stdout = new EventEmitter();
+    child.stderr = new EventEmitter();
+    child.pid = 31000 + children.length;
+    children.push(child);
+    spawnCalls.push({ args, env: options.env });
+    setImmediate(() => child.stdout.emit('data', '[AETHER_RPC_READY] port=9999\n'));
+    return child;
+  };
+
+  const mocks = {
+    'child_process': { spawn: spawnStub },
+    './constants': { BRIDGE_LOG_DIR: path.join(dataDir, 'bridge_logs'), SESSION_SNAPSHOT_DIR: snapshotRoot },
+    './runStore': {
+      getSettings: async () => ({
+        blenderPath: 'blender',
+        addonOutputPath: path.resolve(__dirname, '..', '..', 'generated_addons'),
+        sessionSnapshotEvery: 3,
+      }),
+    },
+    './blenderRpcClient': { callBridge: async () => ({ ok: true }) },
+    './utils': {
+      killProcessTree: async () => {},
+      nowIso: () => new Date().toISOString(),
+    },
+    './auditLog': {
+      AUDIT_EVENT_TYPES: {},
+      appendAuditRecord: async () => {},
+    },
+  };
+
+  try {
+    await withMockedSessionManager(mocks, async (manager) => {
+      const first = await manager.launchSession({ mode: 'headless' });
+      await new Promise((resolve) => setImmediate(resolve));
+
+      // The only snapshot belongs to an earlier run, so run_2 cannot resume from it.
+      const snapshotDir = path.join(snapshotRoot, first.id);
+      const snapshotPath = path.join(snapshotDir, 'snapshot_00001.blend');
+      fs.mkdirSync(snapshotDir, { recursive: true });
+      fs.writeFileSync(snapshotPath, 'BLENDER');
+      fs.writeFileSync(
+        path.join(snapshotDir, 'latest.json'),
+        JSON.stringify({ sequence: 1, path: snapshotPath, runId: 'run_1', stepId: 'step_3', stepIndex: 2 }),
+      );
+      children[0].emit('close', null, 'SIGSEGV');
+
+      const recovery = await manager.recoverFromSnapshot({ runId: 'run_2' });
+      assert.equal(recovery.snapshot, null);
+      assert.notEqual(recovery.session.id, first.id);
+      assert.equal(recovery.session.resumedFrom, null);
+      assert.equal(spawnCalls[1].args.includes(snapshotPath), false);
+      await manager.stopSession(recovery.session.id);
+    });
+  } finally {
+    fs.rmSync(dataDir, { recursive: true, force: true });
+  }
+});
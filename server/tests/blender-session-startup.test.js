@@ -0,0 +1,202 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const net = require('node:net');
+const path = require('node:path');
+const Module = require('node:module');
+const { EventEmitter } = require('node:events');
+const { spawn } = require('node:child_process');
+
+const SESSION_PATH = path.resolve(__dirname, '../lib/blenderSessionManager.js');
+const BRIDGE_PATH = path.resolve(__dirname, '../blender_rpc_bridge.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const withMockedSessionManager = async (mocks, run) => {
+  const originalLoad = Module._load;
+  delete require.cache[SESSION_PATH];
+
+  Module._load = function patchedLoader(request, parent, isMain) {
+    if (parent && parent.filename === SESSION_PATH && Object.prototype.hasOwnProperty.call(mocks, request)) {
+      return mocks[request];
+    }
+    return originalLoad.call(this, request, parent, isMain);
+  };
+
+  try {
+    const mod = require(SESSION_PATH);
+    return await run(mod);
+  } finally {
+    Module._load = originalLoad;
+    delete require.cache[SESSION_PATH];
+  }
+};
+
+const freePort = () =>
+  new Promise((resolve, reject) => {
+    const server = net.createServer();
+    server.once('error', reject);
+    server.listen(0, '127.0.0.1', () => {
+      const { port } = server.address();
+      server.close(() => resolve(port));
+    });
+  });
+
+test('bridge reports startup phases over the readiness pipe and in the stdout marker', { skip: process.platform === 'win32' }, async () => {
+  const port = await freePort();
+  const child = spawn(PYTHON_BIN, [BRIDGE_PATH], {
+    stdio: ['ignore', 'pipe', 'pipe', 'pipe'],
+    env: {
+      ...process.env,
+      AETHER_RPC_FAKE_BPY: '1',
+      AETHER_RPC_PORT: String(port),
+      AETHER_RPC_READY_FD: '3',
+    },
+  });
+
+  try {
+    const readyLine = await new Promise((resolve, reject) => {
+      let raw = '';
+      child.stdio[3].on('data', (chunk) => {
+        raw += chunk;
+        if (raw.includes('\n')) resolve(raw.split('\n')[0]);
+      });
+      child.once('exit', (code) => reject(new Error(`bridge exited early with ${code}`)));
+    });
+    const marker = await new Promise((resolve) => {
+      let raw = '';
+      child.stdout.on('data', (chunk) => {
+        raw += chunk;
+        if (raw.includes('\n')) resolve(raw.split('\n')[0]);
+      });
+    });
+
+    const ready = JSON.parse(readyLine);
+    assert.equal(ready.ok, true);
+    assert.equal(ready.port, port);
+    assert.equal(ready.server, 'threaded');
+    const phases = ready.startup.phasesMs;
+    assert.deepEqual(
+      Object.keys(phases),
+      ['bridgeImportStart', 'bridgeImported', 'serverBound', 'firstBpyAccess', 'ready'],
+    );
+    assert.ok(phases.bridgeImportStart <= phases.bridgeImported && phases.bridgeImported <= phases.ready);
+
+    assert.match(marker, /^\[AETHER_RPC_READY\] port=\d+ pid=\d+ server=threaded startup=\{/);
+    assert.deepEqual(
+      Object.keys(JSON.parse(marker.slice(marker.indexOf('startup=') + 8)).phasesMs),
+      Object.keys(phases),
+    );
+  } finally {
+    child.kill();
+  }
+});
+
+test('session becomes RPC-ready from the readiness pipe without a stdout marker', async () => {
+  const children = [];
+  const spawnStub = (_bin, _args, options) => {
+    const child = new EventEmitter();
+    child.stdout = new EventEmitter();
+    child.stderr = new EventEmitter();
+    child.stdio = [null, child.stdout, child.stderr, new EventEmitter()];
+    child.pid = 31000;
+    child.options = options;
+    children.push(child);
+    return child;
+  };
+
+  const mocks = {
+    'child_process': { spawn: spawnStub },
+    './runStore': {
+      getSettings: async () => ({ blenderPath: 'blender' }),
+    },
+    './utils': {
+      killProcessTree: async () => {},
+      nowIso: () => new Date().toISOString(),
+    },
+    './auditLog': {
+      AUDIT_EVENT_TYPES: {},
+      appendAuditRecord: async () => {},
+    },
+  };
+
+  await withMockedSessionManager(mocks, async (manager) => {
+    const session = await manager.launchSession({ mode: 'headless' });
+    const [child] = children;
+    if (process.platform === 'win32') {
+      assert.equal(child.options.env.AETHER_RPC_READY_FD, '');
+      return;
+    }
+    assert.equal(child.options.stdio.length, 4);
+    assert.equal(child.options.env.AETHER_RPC_READY_FD, '3');
+
+    const waiting = manager.waitForRpcReady(session.id, 5000);
+    const startup = { processStartedAt: 1, phasesMs: { bridgeImported: 40, ready: 55 } };
+    child.stdio[3].emit('data', `${JSON.stringify({ ok: true, port: 1, startup })}\n`);
+    const ready = await waiting;
+
+    assert.equal(ready.rpcReady, true);
+    assert.deepEqual(ready.startup, startup);
+    const readyEvents = manager.getSession(session.id).events.filter((event) => event.type === 'blender_rpc_ready');
+    assert.equal(readyEvents.length, 1);
+    assert.equal(readyEvents[0].via, 'pipe');
+  });
+});
+
+test('session surfaces a real bridge start failure from its lifecycle marker and stderr log record', async () => {
+  const blocker = net.createServer();
+  await new Promise((resolve) => blocker.listen(0, '127.0.0.1', resolve));
+  const { port } = blocker.address();
+  const bridgeOutput = { stdout: '', stderr: '' };
+  try {
+    const bridge = spawn(PYTHON_BIN, [BRIDGE_PATH], {
+      stdio: ['ignore', 'pipe', 'pipe'],
+      env: { ...process.env, AETHER_RPC_FAKE_BPY: '1', AETHER_RPC_PORT: String(port), AETHER_RPC_LOG_PATH: '' },
+    });
+    bridge.stdout.on('data', (chunk) => { bridgeOutput.stdout += chunk; });
+    bridge.stderr.on('data', (chunk) => { bridgeOutput.stderr += chunk; });
+    await new Promise((resolve) => bridge.once('close', resolve));
+  } finally {
+    blocker.close();
+  }
+  assert.match(bridgeOutput.stdout, /^\[AETHER_RPC_ERROR\] reason=server_start_failed/m);
+
+  const children = [];
+  const mocks = {
+    'child_process': {
+      spawn: () => {
+        const child = new EventEmitter();
+        child.stdout = new EventEmitter();
+        child.stderr = new EventEmitter();
+        child.pid = 32000 + children.length;
+        children.push(child);
+        return child;
+      },
+    },
+    './runStore': {
+      getSettings: async () => ({ blenderPath: 'blender' }),
+    },
+    './utils': {
+      killProcessTree: async () => {},
+      nowIso: () => new Date().toISOString(),
+    },
+    './auditLog': {
+      AUDIT_EVENT_TYPES: {},
+      appendAuditRecord: async () => {},
+    },
+  };
+
+  await withMockedSessionManager(mocks, async (manager) => {
+    const fromStdout = await manager.launchSession({ mode: 'headless' });
+    children[0].stdout.emit('data', bridgeOutput.stdout);
+    const stdoutSession = manager.getSession(fromStdout.id);
+    assert.match(stdoutSession.bridgeError, /^\[AETHER_RPC_ERROR\] reason=server_start_failed port=\d+ error=/);
+    assert.equal(stdoutSession.events.filter((event) => event.type === 'blender_rpc_error').length, 1);
+
+    const fromStderr = await manager.launchSession({ mode: 'headless' });
+    children[1].stderr.emit('data', bridgeOutput.stderr);
+    assert.match(manager.getSession(fromStderr.id).bridgeError, /^server\.start_failed: /);
+
+    const quiet = await manager.launchSession({ mode: 'headless' });
+    children[2].stdout.emit('data', '{"level":"info","event":"lifecycle","marker":"[AETHER_RPC_READY]"}\nplain output\n');
+    assert.equal(manager.getSession(quiet.id).bridgeError, null);
+  });
+});
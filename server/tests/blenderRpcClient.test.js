@@ -157,3 +157,162 @@ test('callBridge rejects when the HTTP request errors out', async () => {
     restore();
   }
 });
+
+test('callBridge retries transport failures with the same idempotency key', async () => {
+  const bodies = [];
+  const headers = [];
+  const restore = stubHttpRequest((options) => {
+    headers.push(options.headers['X-Aether-Idempotency-Key']);
+    const mock = bodies.length === 0
+      ? createMockRequest({ error: Object.assign(new Error('socket hang up'), { code: 'ECONNRESET' }) })
+      : createMockRequest({ response: JSON.stringify({ ok: true, result: 'ready' }) });
+    bodies.push(mock.req);
+    return mock;
+  });
+
+  try {
+    const result = await callBridge({ port: 2222, command: 'exec_python', idempotencyKey: 'key-1', retries: 1 });
+    assert.equal(result, 'ready');
+    assert.deepEqual(headers, ['key-1', 'key-1']);
+    assert.ok(bodies.every((req) => req.getBody().includes('"idempotency_key":"key-1"')));
+  } finally {
+    restore();
+  }
+});
+
+test('callBridge does not retry without an idempotency key or after an HTTP error', async () => {
+  let calls = 0;
+  const restore = stubHttpRequest(() => {
+    calls += 1;
+    return calls === 1
+      ? createMockRequest({ error: Object.assign(new Error('socket hang up'), { code: 'ECONNRESET' }) })
+      : createMockRequest({ statusCode: 500, response: JSON.stringify({ ok: false, error: 'boom' }) });
+  });
+
+  try {
+    await assert.rejects(callBridge({ port: 1, command: 'exec_python', retries: 3 }), { message: 'socket hang up' });
+    await assert.rejects(
+      callBridge({ port: 1, command: 'exec_python', idempotencyKey: 'k', retries: 3 }),
+      { message: 'boom' },
+    );
+    assert.equal(calls, 2);
+  } finally {
+    restore();
+  }
+});
+
+test('callBridge does not resend a timed-out request and bounds retries by one deadline', async () => {
+  const timeouts = [];
+  const restore = stubHttpRequest(() => {
+    const mock = createMockRequest({ response: JSON.stringify({ ok: true, result: 'late' }) });
+    mock.req.end = () => {
+      queueMicrotask(() => mock.req._timeoutCallback());
+    };
+    const originalSetTimeout = mock.req.setTimeout;
+    mock.req.setTimeout = (ms, cb) => {
+      timeouts.push(ms);
+      originalSetTimeout(ms, cb);
+    };
+    return mock;
+  });
+
+  try {
+    await assert.rejects(
+      callBridge({ port: 1, command: 'exec_python', idempotencyKey: 'k', retries: 3, timeoutMs: 1000 }),
+      { code: 'RPC_TIMEOUT' },
+    );
+    assert.equal(timeouts.length, 1);
+  } finally {
+    restore();
+  }
+
+  const refusedTimeouts = [];
+  let calls = 0;
+  const restoreRefused = stubHttpRequest(() => {
+    calls += 1;
+    const mock = calls === 1
+      ? createMockRequest({ error: Object.assign(new Error('connect ECONNREFUSED'), { code: 'ECONNREFUSED' }) })
+      : createMockRequest({ response: JSON.stringify({ ok: true, result: 'ready' }) });
+    const originalSetTimeout = mock.req.setTimeout;
+    mock.req.setTimeout = (ms, cb) => {
+      refusedTimeouts.push(ms);
+      originalSetTimeout(ms, cb);
+    };
+    return mock;
+  });
+
+  try {
+    const result = await callBridge({ port: 1, command: 'exec_python', idempotencyKey: 'k', retries: 1, timeoutMs: 1000 });
+    assert.equal(result, 'ready');
+    assert.equal(refusedTimeouts.length, 2);
+    assert.ok(refusedTimeouts[1] <= refusedTimeouts[0]);
+    assert.ok(refusedTimeouts.every((ms) => ms <= 1000));
+  } finally {
+    restoreRefused();
+  }
+});
+
+test('callBridge backs off and resends when the bridge sheds a request as overloaded', async () => {
+  let calls = 0;
+  const overloaded = JSON.stringify({ ok: false, error: 'busy', code: 'RPC_OVERLOADED', retryAfterMs: 1 });
+  const restore = stubHttpRequest(() => {
+    calls += 1;
+    return calls < 3
+      ? createMockRequest({ statusCode: 503, response: overloaded })
+      : createMockRequest({ response: JSON.stringify({ ok: true, result: 'ran' }) });
+  });
+
+  try {
+    const result = await callBridge({ port: 1, command: 'exec_python' });
+    assert.equal(result, 'ran');
+    assert.equal(calls, 3);
+  } finally {
+    restore();
+  }
+});
+
+test('callBridge surfaces RPC_OVERLOADED once overload retries are exhausted', async () => {
+  let calls = 0;
+  const restore = stubHttpRequest(() => {
+    calls += 1;
+    return createMockRequest({
+      statusCode: 503,
+      response: JSON.stringify({ ok: false, error: 'busy', code: 'RPC_OVERLOADED', retryAfterMs: 1 }),
+    });
+  });
+
+  try {
+    await assert.rejects(
+      callBridge({ port: 1, command: 'ping', overloadRetries: 1 }),
+      { statusCode: 503, code: 'RPC_OVERLOADED' },
+    );
+    assert.equal(calls, 2);
+  } finally {
+    restore();
+  }
+});
+
+test('callBridge sends the traceparent header and hands the bridge trace to onTrace', async () => {
+  const traceparent = '00-0000000000000000000000abcdef0123-00000000deadbeef-01';
+  const bridgeTrace = { traceId: '0000000000000000000000abcdef0123', spanId: '1111111111111111', spans: [] };
+  let capturedOptions;
+  const restore = stubHttpRequest((options) => {
+    capturedOptions = options;
+    return createMockRequest({
+      response: JSON.stringify({ ok: false, error: 'rpc-error', trace: bridgeTrace }),
+      statusCode: 500,
+    });
+  });
+
+  const traces = [];
+  try {
+    await assert.rejects(
+      callBridge({ port: 1111, command: 'bad', traceparent, onTrace: (trace) => traces.push(trace) }),
+      { message: 'rpc-error' },
+    );
+    assert.equal(capturedOptions.headers.traceparent, traceparent);
+    assert.deepEqual(traces, [bridgeTrace]);
+  } finally {
+    restore();
+  }
+});
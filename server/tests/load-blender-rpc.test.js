@@ -0,0 +1,37 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const LOAD_PATH = path.resolve(__dirname, '../../tools/load_blender_rpc.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const runLoad = (args) => {
+  const result = spawnSync(PYTHON_BIN, [LOAD_PATH, '--launch', '--seed', '7', ...args], { encoding: 'utf8' });
+  assert.equal(result.status, 0, result.stderr);
+  return JSON.parse(result.stdout);
+};
+
+test('load generator drives concurrent closed-loop callers with a weighted command mix', () => {
+  const report = runLoad(['--concurrency', '8', '--requests', '40', '--duration', '30', '--mix', 'ping=3,get_context=1']);
+
+  assert.equal(report.mode, 'closed');
+  assert.equal(report.requests, 40);
+  assert.equal(report.ok, 40);
+  assert.deepEqual(report.outcomes, { 200: 40 });
+  assert.deepEqual(Object.keys(report.commands).sort(), ['get_context', 'ping']);
+  assert.ok(report.peakInFlight > 1 && report.peakInFlight <= 8);
+  assert.ok(report.latencyMs.p50 <= report.latencyMs.p99);
+  assert.ok(report.timeline.length >= 1);
+  assert.equal(report.timeline.reduce((total, bucket) => total + bucket.completed, 0), 40);
+});
+
+test('load generator open loop reports offered rate and per-second start lag', () => {
+  const report = runLoad(['--rate', '100', '--requests', '20', '--duration', '30']);
+
+  assert.equal(report.mode, 'open');
+  assert.equal(report.offeredRps, 100);
+  assert.equal(report.requests, 20);
+  assert.equal(report.droppedByClient, 0);
+  assert.ok(report.timeline.every((bucket) => typeof bucket.maxStartLagMs === 'number'));
+});
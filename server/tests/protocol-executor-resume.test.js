@@ -0,0 +1,219 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const Module = require('node:module');
+const path = require('node:path');
+
+const EXECUTOR_PATH = path.resolve(__dirname, '../lib/protocolExecutor.js');
+const { createFusedStepGroup } = require('../lib/executorBridge');
+
+const withMockedProtocolExecutor = async (mocks, run) => {
+  const originalLoad = Module._load;
+  delete require.cache[EXECUTOR_PATH];
+
+  Module._load = function patchedLoader(request, parent, isMain) {
+    if (parent && parent.filename === EXECUTOR_PATH && Object.prototype.hasOwnProperty.call(mocks, request)) {
+      return mocks[request];
+    }
+    return originalLoad.call(this, request, parent, isMain);
+  };
+
+  try {
+    const mod = require(EXECUTOR_PATH);
+    return await run(mod);
+  } finally {
+    Module._load = originalLoad;
+    delete require.cache[EXECUTOR_PATH];
+  }
+};
+
+const runPlan = async ({ steps, runStep, recoverSession, run = { id: 'run_1' } }) => {
+  const started = [];
+  const failed = [];
+  const checkpoints = [];
+  const events = [];
+  let error = null;
+
+  await withMockedProtocolExecutor(
+    {
+      './executors/registry': {
+        getExecutorForStep: () => ({ run: async (context) => runStep(context.step) }),
+      },
+      './metricsExporter': { recordExecutorCall: () => {} },
+      './executorBridge': {
+        createFusedStepGroup,
+        checkpointProtocolStep: async ({ stepId, index }) => {
+          checkpoints.push({ stepId, index });
+        },
+      },
+    },
+    async ({ executeProtocolPlan }) => {
+      try {
+        await executeProtocolPlan({
+          protocol: { steps },
+          run,
+          runDir: __dirname,
+          repoRoot: __dirname,
+          settings: {},
+          startStep: async (_run, stepId) => started.push(stepId),
+          completeStep: async () => {},
+          failStep: (_run, stepId) => failed.push(stepId),
+          appendEvent: async (_run, type, payload) => events.push({ type, payload }),
+          addArtifact: async () => {},
+          executeWithCancellation: async (_run, promise) => promise,
+          registerCancelHandler: () => () => {},
+          recoverSession,
+        });
+      } catch (caught) {
+        error = caught;
+      }
+    },
+  );
+  return { started, failed, checkpoints, events, error };
+};
+
+const sessionLost = (message) => Object.assign(new Error(message), { code: 'ECONNRESET' });
+
+const pythonStep = (id) => ({ id, type: 'PYTHON', description: id, payload: { code: 'pass' } });
+
+test('executeProtocolPlan resumes after the snapshot step when the session is recovered', async () => {
+  let crashed = false;
+  const recoveries = [];
+  const outcome = await runPlan({
+    steps: ['step_1', 'step_2', 'step_3', 'step_4'].map(pythonStep),
+    runStep: async (step) => {
+      if (step.id === 'step_3' && !crashed) {
+        crashed = true;
+        throw sessionLost('socket hang up');
+      }
+    },
+    recoverSession: async (info) => {
+      recoveries.push(info.stepId);
+      return { session: { id: 'blender_2' }, snapshot: { runId: 'run_1', stepId: 'step_1', stepIndex: 0 } };
+    },
+  });
+
+  assert.equal(outcome.error, null);
+  assert.deepEqual(recoveries, ['step_3']);
+  assert.deepEqual(outcome.started, ['step_1', 'step_2', 'step_3', 'step_2', 'step_3', 'step_4']);
+  assert.deepEqual(outcome.failed, []);
+  assert.deepEqual(
+    outcome.checkpoints.map((checkpoint) => checkpoint.stepId),
+    ['step_1', 'step_2', 'step_2', 'step_3', 'step_4'],
+  );
+  const resumed = outcome.events.find((event) => event.type === 'protocol_resumed');
+  assert.equal(resumed.payload.failedStepId, 'step_3');
+  assert.equal(resumed.payload.snapshotStepId, 'step_1');
+  assert.equal(resumed.payload.resumeStepId, 'step_2');
+  assert.equal(resumed.payload.sessionId, 'blender_2');
+});
+
+test('executeProtocolPlan fails the step when there is nothing to recover or recoveries run out', async () => {
+  const unrecovered = await runPlan({
+    steps: ['step_1', 'step_2'].map(pythonStep),
+    runStep: async (step) => {
+      if (step.id === 'step_2') throw new Error('boom');
+    },
+    recoverSession: async () => null,
+  });
+  assert.equal(unrecovered.error.message, 'boom');
+  assert.deepEqual(unrecovered.failed, ['step_2']);
+
+  let consulted = false;
+  const stepError = await runPlan({
+    steps: ['step_1', 'step_2'].map(pythonStep),
+    runStep: async (step) => {
+      if (step.id === 'step_2') throw new Error('NameError: name bpy_obj is not defined');
+    },
+    recoverSession: async () => {
+      consulted = true;
+      return { session: { id: 'blender_2' }, snapshot: { runId: 'run_1', stepId: 'step_1', stepIndex: 0 } };
+    },
+  });
+  assert.equal(consulted, false);
+  assert.deepEqual(stepError.started, ['step_1', 'step_2']);
+  assert.deepEqual(stepError.failed, ['step_2']);
+
+  let attempts = 0;
+  const exhausted = await runPlan({
+    steps: ['step_1', 'step_2'].map(pythonStep),
+    runStep: async (step) => {
+      if (step.id === 'step_2') throw sessionLost('crash');
+    },
+    recoverSession: async () => {
+      attempts += 1;
+      return { session: { id: `blender_${attempts}` }, snapshot: { runId: 'run_1', stepId: 'step_1', stepIndex: 0 } };
+    },
+  });
+  assert.equal(exhausted.error.message, 'crash');
+  assert.equal(attempts, 2);
+  assert.deepEqual(exhausted.started, ['step_1', 'step_2', 'step_2', 'step_2']);
+
+  const cancelled = await runPlan({
+    steps: [pythonStep('step_1')],
+    run: { id: 'run_1', cancelRequested: true },
+    runStep: async () => {
+      throw new Error('cancelled');
+    },
+    recoverSession: async () => {
+      throw new Error('should not be called');
+    },
+  });
+  assert.equal(cancelled.error.message, 'cancelled');
+});
+
+test('executeProtocolPlan starts over from the first step when the session was lost before any snapshot', async () => {
+  let crashed = false;
+  const outcome = await runPlan({
+    steps: ['step_1', 'step_2', 'step_3'].map(pythonStep),
+    runStep: async (step) => {
+      if (step.id === 'step_2' && !crashed) {
+        crashed = true;
+        throw sessionLost('socket hang up');
+      }
+    },
+    recoverSession: async () => ({ session: { id: 'blender_2' }, snapshot: null }),
+  });
+
+  assert.equal(outcome.error, null);
+  assert.deepEqual(outcome.started, ['step_1', 'step_2', 'step_1', 'step_2', 'step_3']);
+  assert.deepEqual(outcome.failed, []);
+  const resumed = outcome.events.find((event) => event.type === 'protocol_resumed');
+  assert.equal(resumed.payload.snapshotStepId, null);
+  assert.equal(resumed.payload.resumeStepId, 'step_1');
+});
+
+test('executeProtocolPlan fails the step when the recovered snapshot matches no step of this run', async () => {
+  for (const snapshot of [
+    { runId: 'run_0', stepId: 'step_1', stepIndex: 0 },
+    { runId: 'run_1', stepId: 'other_step', stepIndex: 7 },
+  ]) {
+    const outcome = await runPlan({
+      steps: ['step_1', 'step_2', 'step_3'].map(pythonStep),
+      runStep: async (step) => {
+        if (step.id === 'step_2') throw sessionLost('socket hang up');
+      },
+      recoverSession: async () => ({ session: { id: 'blender_2' }, snapshot }),
+    });
+    assert.equal(outcome.error.message, 'socket hang up');
+    assert.deepEqual(outcome.started, ['step_1', 'step_2']);
+    assert.deepEqual(outcome.failed, ['step_2']);
+    const unmatched = outcome.events.find((event) => event.type === 'protocol_resume_unmatched');
+    assert.equal(unmatched.payload.snapshotRunId, snapshot.runId);
+    assert.equal(outcome.events.some((event) => event.type === 'protocol_resumed'), false);
+  }
+});
+
+test('executeProtocolPlan only checkpoints fused groups after their last step', async () => {
+  const target = { object_name: 'Cube', modifier_name: 'GN' };
+  const nodeStep = (id) => ({ id, type: 'NODE_TREE', description: id, payload: { target, operations: [] } });
+  const outcome = await runPlan({
+    steps: [nodeStep('nodes_1'), nodeStep('nodes_2'), pythonStep('step_3')],
+    runStep: async () => {},
+  });
+
+  assert.equal(outcome.error, null);
+  assert.deepEqual(outcome.checkpoints, [
+    { stepId: 'nodes_2', index: 1 },
+    { stepId: 'step_3', index: 2 },
+  ]);
+});
@@ -70,3 +70,62 @@ test('executeProtocolPlan records executor metrics and trace spans', async () =>
   assert.equal(traceSpans[0].stepId, 'step_1');
   assert.equal(events.length, 0);
 });
+
+test('executeProtocolPlan sends a traceparent for the executor span and records bridge spans under it', async () => {
+  const traceSpans = [];
+  let seenTrace = null;
+
+  await withMockedProtocolExecutor(
+    {
+      './executors/registry': {
+        getExecutorForStep: () => ({
+          run: async (context) => {
+            seenTrace = context.trace;
+            context.trace.onTrace({
+              traceId: context.trace.traceparent.split('-')[1],
+              parentSpanId: context.trace.traceparent.split('-')[2],
+              spanId: '1234567890abcdef',
+              name: 'bridge.rpc',
+              startedAtUnixMs: Date.now(),
+              durationMs: 4,
+              spans: [
+                { spanId: 'fedcba0987654321', parentSpanId: '1234567890abcdef', name: 'bridge.exec', startOffsetMs: 1, durationMs: 2 },
+              ],
+            });
+          },
+        }),
+      },
+      './metricsExporter': {
+        recordExecutorCall: () => {},
+      },
+    },
+    async ({ executeProtocolPlan }) => {
+      await executeProtocolPlan({
+        protocol: {
+          steps: [{ id: 'step_1', type: 'PYTHON', description: 'Run code', payload: {} }],
+        },
+        run: { id: 'run_1', trace: { traceId: 'trace_0123456789ab' } },
+        runDir: __dirname,
+        repoRoot: __dirname,
+        settings: {},
+        startStep: async () => {},
+        completeStep: async () => {},
+        failStep: () => {},
+        appendEvent: async () => {},
+        addArtifact: async () => {},
+        executeWithCancellation: async (_run, promise) => promise,
+        registerCancelHandler: () => () => {},
+        traceSpanRecorder: async (span) => traceSpans.push(span),
+      });
+    },
+  );
+
+  const [executorSpan, bridgeRoot, bridgeExec] = traceSpans;
+  assert.equal(traceSpans.length, 3);
+  assert.match(seenTrace.traceparent, /^00-000000000000000000000123456789ab-[0-9a-f]{16}-01$/);
+  assert.equal(seenTrace.traceparent.split('-')[2], executorSpan.spanId.replace('span_', '').padStart(16, '0'));
+  assert.equal(executorSpan.name, 'executor.python.run');
+  assert.equal(bridgeRoot.parentSpanId, executorSpan.spanId);
+  assert.equal(bridgeExec.parentSpanId, bridgeRoot.spanId);
+  assert.equal(bridgeExec.stepId, 'step_1');
+});
@@ -0,0 +1,116 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const Module = require('node:module');
+const os = require('node:os');
+const path = require('node:path');
+const fs = require('node:fs/promises');
+
+const LIB_DIR = path.resolve(__dirname, '../lib');
+const EXECUTOR_PATH = path.join(LIB_DIR, 'protocolExecutor.js');
+const BRIDGE_PATH = path.join(LIB_DIR, 'executorBridge.js');
+
+const clearLibCache = () => {
+  for (const key of Object.keys(require.cache)) {
+    if (key.startsWith(LIB_DIR)) {
+      delete require.cache[key];
+    }
+  }
+};
+
+const withMockedSessionManager = async (sessionManager, run) => {
+  const originalLoad = Module._load;
+  clearLibCache();
+
+  Module._load = function patchedLoader(request, parent, isMain) {
+    if (parent && parent.filename === BRIDGE_PATH && request === './blenderSessionManager') {
+      return sessionManager;
+    }
+    return originalLoad.call(this, request, parent, isMain);
+  };
+
+  try {
+    return await run(require(EXECUTOR_PATH), require(BRIDGE_PATH));
+  } finally {
+    Module._load = originalLoad;
+    clearLibCache();
+  }
+};
+
+const nodeTreeStep = (id, operations) => ({
+  id,
+  type: 'NODE_TREE',
+  description: `node tree ${id}`,
+  payload: {
+    target: { object_name: 'Cube', modifier_name: 'GeometryNodes', node_group_name: 'GN' },
+    operations,
+  },
+});
+
+test('buildReconcilePayload keeps explicit deletions and unlinks absent from the desired state', () => {
+  const { buildReconcilePayload } = require(BRIDGE_PATH);
+  const step = nodeTreeStep('a', [
+    { op: 'delete_node', node_id: 'old' },
+    { op: 'unlink', from: { node_id: 'x', socket: 'Geometry' }, to: { node_id: 'y', socket: 'Geometry' } },
+  ]);
+  const payload = buildReconcilePayload(step, {
+    target: step.payload.target,
+    nodes: { keep: { id: 'keep', bl_idname: 'GeometryNodeMeshCube' } },
+    links: [],
+  });
+
+  assert.deepEqual(payload.remove_nodes, ['old']);
+  assert.equal(payload.remove_links.length, 1);
+  assert.deepEqual(Object.keys(payload.nodes), ['keep']);
+  assert.equal(payload.allow_create_modifier, true);
+});
+
+test('executeProtocolPlan sends reconcile_node_tree per step when nodeTreeApplyMode is reconcile', async () => {
+  const runDir = await fs.mkdtemp(path.join(os.tmpdir(), 'reconcile-'));
+  const bridgeCalls = [];
+  const completed = [];
+
+  await withMockedSessionManager(
+    {
+      getActiveSession: () => ({ id: 'session_rpc' }),
+      executeOnActive: async (command, payload) => {
+        bridgeCalls.push({ command, payload });
+        return { sessionId: 'session_rpc', result: { ok: true, changed: true, summary: {} } };
+      },
+      stopSession: async () => {},
+    },
+    ({ executeProtocolPlan }) =>
+      executeProtocolPlan({
+        protocol: {
+          steps: [
+            nodeTreeStep('a', [
+              { op: 'create_node', node_id: 'cube', bl_idname: 'GeometryNodeMeshCube', location: [0, 0] },
+            ]),
+            nodeTreeStep('b', [
+              { op: 'create_node', node_id: 'cube', bl_idname: 'GeometryNodeMeshCube', location: [0, 0] },
+              { op: 'delete_node', node_id: 'cube' },
+            ]),
+          ],
+        },
+        run: { id: 'run_reconcile' },
+        runDir,
+        repoRoot: runDir,
+        settings: { nodeTreeApplyMode: 'reconcile' },
+        startStep: async () => {},
+        completeStep: async (_run, stepId) => completed.push(stepId),
+        failStep: () => {},
+        appendEvent: async () => {},
+        addArtifact: async () => {},
+        executeWithCancellation: async (_run, promise) => promise,
+        registerCancelHandler: () => () => {},
+      }),
+  );
+
+  assert.deepEqual(
+    bridgeCalls.map((call) => call.command),
+    ['reconcile_node_tree', 'reconcile_node_tree'],
+  );
+  assert.ok(bridgeCalls[0].payload.nodes.cube);
+  assert.deepEqual(bridgeCalls[1].payload.nodes, {});
+  assert.deepEqual(bridgeCalls[1].payload.remove_nodes, ['cube']);
+  assert.deepEqual(completed, ['a', 'b']);
+});
@@ -0,0 +1,263 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const Module = require('node:module');
+const os = require('node:os');
+const path = require('node:path');
+const fs = require('node:fs/promises');
+
+const { compileProtocolPlan } = require('../lib/protocolPlanCompiler');
+
+const LIB_DIR = path.resolve(__dirname, '../lib');
+const EXECUTOR_PATH = path.join(LIB_DIR, 'protocolExecutor.js');
+const BRIDGE_PATH = path.join(LIB_DIR, 'executorBridge.js');
+
+const clearLibCache = () => {
+  for (const key of Object.keys(require.cache)) {
+    if (key.startsWith(LIB_DIR)) {
+      delete require.cache[key];
+    }
+  }
+};
+
+const withMockedSessionManager = async (sessionManager, run) => {
+  const originalLoad = Module._load;
+  clearLibCache();
+
+  Module._load = function patchedLoader(request, parent, isMain) {
+    if (parent && parent.filename === BRIDGE_PATH && request === './blenderSessionManager') {
+      return sessionManager;
+    }
+    return originalLoad.call(this, request, parent, isMain);
+  };
+
+  try {
+    return await run(require(EXECUTOR_PATH));
+  } finally {
+    Module._load = originalLoad;
+    clearLibCache();
+  }
+};
+
+const nodeTreeStep = (id, objectName = 'Cube') => ({
+  id,
+  type: 'NODE_TREE',
+  description: `node tree ${id}`,
+  payload: {
+    target: { object_name: objectName, modifier_name: 'GeometryNodes', node_group_name: 'GN' },
+    operations: [
+      { op: 'create_node', node_id: `${id}_node`, bl_idname: 'GeometryNodeMeshCube', location: [0, 0] },
+    ],
+  },
+});
+
+const gnOpsStep = (id, objectName = 'Cube') => ({
+  id,
+  type: 'GN_OPS',
+  description: `gn ops ${id}`,
+  payload: {
+    v: 1,
+    target: { object_name: objectName, modifier_name: 'GeometryNodes' },
+    ops: [{ op: 'add_node', id: `${id}_node`, bl_idname: 'GeometryNodeMeshCube', x: 0, y: 0 }],
+  },
+});
+
+const createPlanHarness = async () => {
+  const runDir = await fs.mkdtemp(path.join(os.tmpdir(), 'step-fusion-'));
+  const calls = { started: [], completed: [], failed: [], events: [], artifacts: [] };
+  return {
+    calls,
+    options: (steps) => ({
+      protocol: { steps },
+      run: { id: 'run_fusion' },
+      runDir,
+      repoRoot: runDir,
+      settings: {},
+      startStep: async (_run, stepId) => calls.started.push(stepId),
+      completeStep: async (_run, stepId) => calls.completed.push(stepId),
+      failStep: (_run, stepId, error) => calls.failed.push({ stepId, error: error.message }),
+      appendEvent: async (_run, type, payload) => calls.events.push({ type, payload }),
+      addArtifact: async (_run, artifact) => calls.artifacts.push(artifact),
+      executeWithCancellation: async (_run, promise) => promise,
+      registerCancelHandler: () => () => {},
+    }),
+  };
+};
+
+const fusedStdout = (results) => `[AETHER_FUSED_STEPS] ${JSON.stringify(results)}\n`;
+
+test('compileProtocolPlan fuses consecutive steps that share object and modifier', () => {
+  const groups = compileProtocolPlan({
+    steps: [
+      nodeTreeStep('a'),
+      gnOpsStep('b'),
+      { id: 'py', type: 'PYTHON', description: 'py', payload: { code: 'x = 1' } },
+      nodeTreeStep('c'),
+      nodeTreeStep('d', 'Sphere'),
+      gnOpsStep('e', 'Sphere'),
+    ],
+  });
+
+  assert.deepEqual(
+    groups.map((group) => ({ fused: group.fused, indexes: group.entries.map((entry) => entry.index) })),
+    [
+      { fused: true, indexes: [0, 1] },
+      { fused: false, indexes: [2] },
+      { fused: false, indexes: [3] },
+      { fused: true, indexes: [4, 5] },
+    ],
+  );
+});
+
+test('compileProtocolPlan leaves steps unfused when fusion is disabled', () => {
+  const groups = compileProtocolPlan({ steps: [nodeTreeStep('a'), nodeTreeStep('b')] }, { fuseSteps: false });
+  assert.equal(groups.length, 2);
+  assert.equal(groups.every((group) => group.fused === false), true);
+});
+
+test('executeProtocolPlan sends a fused group as one bridge call with per-step artifacts', async () => {
+  const harness = await createPlanHarness();
+  const bridgeCalls = [];
+
+  await withMockedSessionManager(
+    {
+      getActiveSession: () => ({ id: 'session_rpc' }),
+      executeOnActive: async (command, payload, timeoutMs) => {
+        bridgeCalls.push({ command, payload, timeoutMs });
+        return {
+          sessionId: 'session_rpc',
+          result: {
+            ok: true,
+            stdout: fusedStdout([
+              { index: 0, stepId: 'a', ok: true },
+              { index: 1, stepId: 'b', ok: true },
+            ]),
+          },
+        };
+      },
+      stopSession: async () => {},
+    },
+    ({ executeProtocolPlan }) => executeProtocolPlan(harness.options([nodeTreeStep('a'), gnOpsStep('b')])),
+  );
+
+  assert.equal(bridgeCalls.length, 1);
+  // Neither step sets timeout_ms, so each contributes the default per-call budget.
+  assert.equal(bridgeCalls[0].timeoutMs, 240000);
+  assert.equal(bridgeCalls[0].command, 'exec_python');
+  assert.match(bridgeCalls[0].payload.code, /_apply_node_tree_step/);
+  assert.match(bridgeCalls[0].payload.code, /_apply_gn_ops_step/);
+  assert.equal(bridgeCalls[0].payload.batch, true);
+  assert.deepEqual(harness.calls.completed, ['a', 'b']);
+  assert.deepEqual(harness.calls.failed, []);
+  assert.deepEqual(
+    harness.calls.artifacts.map((artifact) => [artifact.stepId, artifact.kind]),
+    [
+      ['a', 'node_tree'],
+      ['b', 'gn_ops'],
+    ],
+  );
+  const fusedEvent = harness.calls.events.find((event) => event.type === 'protocol_rpc_fused');
+  assert.ok(fusedEvent);
+  assert.deepEqual(fusedEvent.payload.stepIds, ['a', 'b']);
+});
+
+test('executeProtocolPlan budgets a fused call with explicit timeouts plus the default for the rest', async () => {
+  const harness = await createPlanHarness();
+  const timeouts = [];
+  const timed = nodeTreeStep('a');
+  timed.payload.timeout_ms = 5000;
+
+  await withMockedSessionManager(
+    {
+      getActiveSession: () => ({ id: 'session_rpc' }),
+      executeOnActive: async (_command, _payload, timeoutMs) => {
+        timeouts.push(timeoutMs);
+        return {
+          sessionId: 'session_rpc',
+          result: {
+            ok: true,
+            stdout: fusedStdout([
+              { index: 0, stepId: 'a', ok: true },
+              { index: 1, stepId: 'b', ok: true },
+            ]),
+          },
+        };
+      },
+      stopSession: async () => {},
+    },
+    ({ executeProtocolPlan }) => executeProtocolPlan(harness.options([timed, gnOpsStep('b')])),
+  );
+
+  assert.deepEqual(timeouts, [125000]);
+});
+
+test('executeProtocolPlan attributes a fused failure to the failing step only', async () => {
+  const harness = await createPlanHarness();
+
+  await assert.rejects(
+    withMockedSessionManager(
+      {
+        getActiveSession: () => ({ id: 'session_rpc' }),
+        executeOnActive: async () => ({
+          sessionId: 'session_rpc',
+          result: {
+            ok: true,
+            stdout: fusedStdout([
+              { index: 0, stepId: 'a', ok: true },
+              { index: 1, stepId: 'b', ok: false, error: 'Socket not found: Mesh' },
+            ]),
+          },
+        }),
+        stopSession: async () => {},
+      },
+      ({ executeProtocolPlan }) =>
+        executeProtocolPlan(harness.options([nodeTreeStep('a'), nodeTreeStep('b'), nodeTreeStep('c')])),
+    ),
+    /Socket not found: Mesh/,
+  );
+
+  assert.deepEqual(harness.calls.started, ['a', 'b']);
+  assert.deepEqual(harness.calls.completed, ['a']);
+  assert.deepEqual(harness.calls.failed, [{ stepId: 'b', error: 'Socket not found: Mesh' }]);
+});
+
+test('executeProtocolPlan reads fused results from spilled stdout written to the step artifact dir', async () => {
+  const harness = await createPlanHarness();
+  const bridgeCalls = [];
+
+  await withMockedSessionManager(
+    {
+      getActiveSession: () => ({ id: 'session_rpc' }),
+      executeOnActive: async (command, payload) => {
+        bridgeCalls.push({ command, payload });
+        const spillPath = path.join(payload.output_dir, 'exec_1_00001.stdout.log');
+        const stdout = `${'diagnostics\n'.repeat(10000)}${fusedStdout([
+          { index: 0, stepId: 'a', ok: true },
+          { index: 1, stepId: 'b', ok: true },
+        ])}`;
+        await fs.writeFile(spillPath, stdout, 'utf8');
+        return {
+          sessionId: 'session_rpc',
+          result: {
+            ok: true,
+            stdout: 'diagnostics\n... [120054 bytes] ...\n[AETHER_FUSED',
+            stdoutSpill: { path: spillPath, bytes: Buffer.byteLength(stdout), sha256: 'f'.repeat(64) },
+          },
+        };
+      },
+      stopSession: async () => {},
+    },
+    ({ executeProtocolPlan }) => executeProtocolPlan(harness.options([nodeTreeStep('a'), gnOpsStep('b')])),
+  );
+
+  assert.equal(bridgeCalls.length, 1);
+  assert.match(bridgeCalls[0].payload.output_dir, /protocol_steps[\\/]a$/);
+  assert.deepEqual(harness.calls.completed, ['a', 'b']);
+  const spilled = harness.calls.artifacts.filter((artifact) => artifact.kind === 'exec_output');
+  assert.equal(spilled.length, 1);
+  assert.equal(spilled[0].stepId, 'a');
+  assert.equal(spilled[0].path, path.join('protocol_steps', 'a', 'exec_1_00001.stdout.log'));
+  assert.equal(spilled[0].sha256, 'f'.repeat(64));
+  assert.deepEqual(harness.calls.failed, []);
+  const resultEvent = harness.calls.events.find((event) => event.type === 'protocol_rpc_result');
+  assert.ok(JSON.stringify(resultEvent.payload).length < 1024);
+});
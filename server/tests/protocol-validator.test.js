@@ -3,6 +3,7 @@ const assert = require('node:assert/strict');
 
 const {
   validateProtocolPlan,
+  validateProtocolPlanWithSafeLint,
   DEFAULT_MAX_STEPS,
   DEFAULT_MAX_PYTHON_CODE_LENGTH,
 } = require('../lib/protocolValidator');
@@ -219,3 +220,55 @@ test('validateProtocolPlan enforces default python code length limit (20k)', ()
   protocol.steps[0].payload.code = 'a'.repeat(DEFAULT_MAX_PYTHON_CODE_LENGTH + 1);
   assertValidationError(protocol, 'PROTOCOL_PYTHON_CODE_LENGTH_EXCEEDED', 'steps[].payload.code');
 });
+
+test('validateProtocolPlanWithSafeLint rejects SAF-004 violations in one lint call', async () => {
+  const protocol = buildValidProtocol();
+  protocol.steps.push(
+    { id: 'step_2', type: 'PYTHON', description: 'Trusted', payload: { mode: 'trusted', code: 'import os' } },
+    { id: 'step_3', type: 'PYTHON', description: 'Blocked', payload: { code: 'x = 1\nimport subprocess' } },
+  );
+  const calls = [];
+  const safeModeLinter = {
+    lint: async (snippets) => {
+      calls.push(snippets);
+      return snippets.map((code) => (code.includes('subprocess')
+        ? { ok: false, code: 'SAF_004_BLOCKED_IMPORT', message: 'SAF-004 blocked module import in safe mode: subprocess', line: 2 }
+        : { ok: true }));
+    },
+  };
+
+  await assert.rejects(
+    validateProtocolPlanWithSafeLint(protocol, { safeModeLinter }),
+    (error) => error.code === 'SAF_004_BLOCKED_IMPORT' && /line 2/.test(error.message) && error.path === 'steps[].payload.code',
+  );
+  assert.deepEqual(calls, [["print('ok')", 'x = 1\nimport subprocess']]);
+});
+
+test('validateProtocolPlanWithSafeLint warns and passes plans through when the linter cannot start', async () => {
+  const protocol = buildValidProtocol();
+  const safeModeLinter = {
+    lint: async () => {
+      throw Object.assign(new Error('spawn python3 ENOENT'), { code: 'SAFE_LINT_UNAVAILABLE' });
+    },
+  };
+  const warnings = [];
+  const validated = await validateProtocolPlanWithSafeLint(protocol, {
+    safeModeLinter,
+    onWarning: (message, options) => warnings.push({ message, code: options.code }),
+  });
+  assert.equal(validated.steps[0].payload.mode, 'safe');
+  assert.equal(warnings.length, 1);
+  assert.equal(warnings[0].code, 'SAFE_LINT_UNAVAILABLE');
+  assert.match(warnings[0].message, /ENOENT/);
+});
+
+test('validateProtocolPlanWithSafeLint passes plans through when the linter times out', async () => {
+  const protocol = buildValidProtocol();
+  const safeModeLinter = {
+    lint: async () => {
+      throw Object.assign(new Error('Safe-mode lint timed out after 5000ms'), { code: 'SAFE_LINT_TIMEOUT' });
+    },
+  };
+  const validated = await validateProtocolPlanWithSafeLint(protocol, { safeModeLinter });
+  assert.equal(validated.steps[0].payload.mode, 'safe');
+});
@@ -60,6 +60,7 @@ const createTestContext = ({
   executeOnActiveImpl,
   runBlenderImpl,
   protocolPlanImpl,
+  preflightImpl,
 } = {}) => {
   let tick = 0;
   const nowIso = () => new Date(1700000000000 + tick++ * 1000).toISOString();
@@ -77,6 +78,7 @@ const createTestContext = ({
   };
 
   const runBlenderCalls = [];
+  const preflightCalls = [];
   const runBlender = runBlenderImpl
     ? (...args) => runBlenderImpl(runBlenderCalls, ...args)
     : (...args) => {
@@ -155,6 +157,15 @@ const createTestContext = ({
       pingProvider: async () => ({ ok: true }),
     },
     './blenderRunner': { runBlender },
+    './addonPreflight': {
+      runAddonPreflight: async (options) => {
+        preflightCalls.push(clone(options));
+        return preflightImpl
+          ? preflightImpl(options)
+          : { ok: true, problems: [], compiled: 3, cacheHits: 0, compileMs: 1.2, ms: 1.5, pycs: { written: 3 } };
+      },
+      createPreflightError: require('../lib/addonPreflight').createPreflightError,
+    },
     './blenderSessionManager': blenderSessionManager,
     './auditLog': {
       AUDIT_EVENT_TYPES: {
@@ -172,6 +183,7 @@ const createTestContext = ({
     nowIso,
     mocks,
     runBlenderCalls,
+    preflightCalls,
     blenderSessionManager,
     auditEvents,
     stopSessionCalls,
@@ -249,6 +261,11 @@ test('runOrchestrator prefers active ready Blender RPC session for validation',
       timeoutMs: 4321,
     });
     assert.equal(ctx.runBlenderCalls.length, 0);
+    assert.deepEqual(ctx.preflightCalls, [{ addonPath: executeCall.payload.addonPath, writePycs: true }]);
+    const preflightEvent = run.events.find((evt) => evt.type === 'addon_preflight');
+    assert.equal(preflightEvent.pycsWritten, 3);
+    const validated = run.events.find((evt) => evt.type === 'step_completed' && evt.stepId === 'validation');
+    assert.equal(validated.compileMs, 1.2);
 
     const rpcStarted = run.events.find((evt) => evt.type === 'blender_started' && evt.mode === 'rpc_session');
     assert.ok(rpcStarted);
@@ -431,3 +448,37 @@ test('runOrchestrator emits BLENDER_VALIDATION gate envelope when validation ste
     assert.match(String(gateEvent.messages && gateEvent.messages[0]), /Blender validation exploded/i);
   });
 });
+
+test('runOrchestrator fails validation on addon preflight problems without launching Blender', async () => {
+  const ctx = createTestContext({
+    preflightImpl: async ({ addonPath }) => ({
+      ok: false,
+      addonPath,
+      compiled: 3,
+      cacheHits: 0,
+      ms: 2.1,
+      problems: [
+        {
+          code: 'ADDON_SYNTAX_ERROR',
+          message: 'invalid syntax',
+          path: path.join(addonPath, 'panels.py'),
+          line: 12,
+        },
+      ],
+    }),
+  });
+
+  await withMockedOrchestrator(ctx.mocks, async (orchestrator) => {
+    const started = await orchestrator.startRun({ prompt: 'test prompt', model: 'GLM 4.7' });
+    const run = await waitForFinalRun(orchestrator, started.id);
+
+    assert.equal(run.status, 'failed');
+    assert.equal(ctx.runBlenderCalls.length, 0);
+    assert.match(run.error, /Addon preflight failed: invalid syntax \(panels\.py:12\)/);
+    const preflightEvent = run.events.find((evt) => evt.type === 'addon_preflight');
+    assert.ok(preflightEvent);
+    assert.equal(preflightEvent.ok, false);
+    assert.equal(preflightEvent.problems[0].code, 'ADDON_SYNTAX_ERROR');
+    assert.equal(run.steps.validation.status, 'failed');
+  });
+});
@@ -0,0 +1,78 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const { codeHash, createSafeModeLinter } = require('../lib/safeModeLinter');
+
+const PYTHON_BIN = process.env.PYTHON || 'python';
+const SERVER_DIR = path.resolve(__dirname, '..');
+
+const pythonAvailable = () => !spawnSync(PYTHON_BIN, ['--version']).error;
+
+test('safe-mode linter worker returns per-snippet verdicts and caches by code hash', async (t) => {
+  if (!pythonAvailable()) {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return;
+  }
+  const linter = createSafeModeLinter({ pythonBin: PYTHON_BIN });
+  try {
+    const snippets = [
+      'x = 1',
+      'from os import path',
+      'values = [1]\nresult = eval("1")',
+      'def broken(:\n  pass',
+      'x = 1',
+    ];
+    const verdicts = await linter.lint(snippets);
+    assert.equal(verdicts.length, 5);
+    assert.equal(verdicts[0].ok, true);
+    assert.equal(verdicts[0].hash, codeHash('x = 1'));
+    assert.equal(verdicts[1].code, 'SAF_004_BLOCKED_IMPORT');
+    assert.equal(verdicts[1].name, 'os');
+    assert.equal(verdicts[2].code, 'SAF_004_BLOCKED_BUILTIN');
+    assert.equal(verdicts[2].line, 2);
+    assert.equal(verdicts[3].code, 'PYTHON_SYNTAX_ERROR');
+    assert.deepEqual(verdicts[4], verdicts[0]);
+
+    const again = await linter.lint(['from os import path', 'x = 1']);
+    assert.equal(again[0].code, 'SAF_004_BLOCKED_IMPORT');
+    const stats = linter.stats();
+    assert.equal(stats.requests, 1);
+    assert.equal(stats.spawns, 1);
+    assert.equal(stats.misses, 4);
+    assert.equal(stats.hits, 3);
+    assert.equal(linter.peek('x = 1').ok, true);
+  } finally {
+    linter.close();
+  }
+});
+
+test('safe_policy CLI lints a JSON array of snippets from stdin', (t) => {
+  const result = spawnSync(PYTHON_BIN, ['-m', 'aether_bridge.safe_policy', '--stdin'], {
+    cwd: SERVER_DIR,
+    input: JSON.stringify(['print(1)', 'import ctypes.util']),
+    encoding: 'utf8',
+  });
+  if (result.error && result.error.code === 'ENOENT') {
+    t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+    return;
+  }
+  assert.equal(result.status, 1, result.stderr);
+  const report = JSON.parse(result.stdout);
+  assert.equal(report.ok, false);
+  assert.equal(report.verdicts[0].ok, true);
+  assert.equal(report.verdicts[1].code, 'SAF_004_BLOCKED_IMPORT');
+  assert.equal(report.verdicts[1].hash, codeHash('import ctypes.util'));
+});
+
+test('safe-mode linter rejects with SAFE_LINT_UNAVAILABLE when the interpreter cannot be spawned', async () => {
+  const linter = createSafeModeLinter({ pythonBin: path.join(SERVER_DIR, 'missing-python-interpreter') });
+  try {
+    await assert.rejects(linter.lint(['x = 1']), (error) => error.code === 'SAFE_LINT_UNAVAILABLE');
+    assert.equal(linter.peek('x = 1'), null);
+    assert.equal(linter.stats().failures, 1);
+  } finally {
+    linter.close();
+  }
+});
@@ -24,6 +24,12 @@ test('assertRpcCommandAllowed allows exec_python command verb', () => {
   assert.equal(assertRpcCommandAllowed('exec_python'), 'exec_python');
 });
 
+test('assertRpcCommandAllowed allows template library commands', () => {
+  assert.equal(assertRpcCommandAllowed('register_template'), 'register_template');
+  assert.equal(assertRpcCommandAllowed('list_templates'), 'list_templates');
+  assert.equal(assertRpcCommandAllowed('instantiate_template'), 'instantiate_template');
+});
+
 test('assertExecPythonPayloadAllowed defaults to safe mode', () => {
   const normalized = assertExecPythonPayloadAllowed({}, { allowTrustedPythonExecution: false });
   assert.equal(normalized.mode, 'safe');
@@ -1,7 +1,12 @@
 const test = require('node:test');
 const assert = require('node:assert/strict');
 
-const { resolveEventTaxonomy, buildCorrelation } = require('../lib/telemetry');
+const {
+  resolveEventTaxonomy,
+  buildCorrelation,
+  buildTraceparent,
+  bridgeTraceToSpans,
+} = require('../lib/telemetry');
 
 test('resolveEventTaxonomy maps known run lifecycle events', () => {
   assert.equal(resolveEventTaxonomy('run_started'), 'run.lifecycle.started');
@@ -14,3 +19,42 @@ test('buildCorrelation returns run and step correlation ids', () => {
   assert.equal(correlation.runCorrelationId, 'run:run_1');
   assert.equal(correlation.stepCorrelationId, 'run:run_1:step:step_2');
 });
+
+test('buildTraceparent pads run trace and span ids to W3C widths', () => {
+  assert.equal(
+    buildTraceparent('trace_0123456789ab', 'span_deadbeef'),
+    '00-000000000000000000000123456789ab-00000000deadbeef-01',
+  );
+  assert.equal(buildTraceparent('trace_000000000000', 'span_deadbeef'), null);
+  assert.equal(buildTraceparent('', 'span_deadbeef'), null);
+});
+
+test('bridgeTraceToSpans parents the bridge root under the caller span and keeps bridge nesting', () => {
+  const spans = bridgeTraceToSpans(
+    {
+      traceId: '000000000000000000000123456789ab',
+      parentSpanId: '00000000deadbeef',
+      spanId: 'aaaaaaaaaaaaaaaa',
+      name: 'bridge.rpc',
+      startedAtUnixMs: Date.parse('2026-01-01T00:00:00.000Z'),
+      durationMs: 12.5,
+      spans: [
+        { spanId: 'bbbbbbbbbbbbbbbb', parentSpanId: 'aaaaaaaaaaaaaaaa', name: 'bridge.exec', startOffsetMs: 2, durationMs: 8 },
+        { spanId: 'cccccccccccccccc', parentSpanId: 'bbbbbbbbbbbbbbbb', name: 'bridge.safety', startOffsetMs: 3, durationMs: 1, status: 'error' },
+      ],
+    },
+    { parentSpanId: 'span_deadbeef', stepId: 'step_1' },
+  );
+
+  assert.deepEqual(spans.map((span) => [span.name, span.spanId, span.parentSpanId]), [
+    ['bridge.rpc', 'span_aaaaaaaaaaaaaaaa', 'span_deadbeef'],
+    ['bridge.exec', 'span_bbbbbbbbbbbbbbbb', 'span_aaaaaaaaaaaaaaaa'],
+    ['bridge.safety', 'span_cccccccccccccccc', 'span_bbbbbbbbbbbbbbbb'],
+  ]);
+  assert.equal(spans[0].status, 'error');
+  assert.equal(spans[1].startedAt, '2026-01-01T00:00:00.002Z');
+  assert.equal(spans[1].endedAt, '2026-01-01T00:00:00.010Z');
+  assert.equal(spans[2].durationMs, 1);
+  assert.ok(spans.every((span) => span.component === 'bridge' && span.stepId === 'step_1'));
+  assert.deepEqual(bridgeTraceToSpans(null), []);
+});
@@ -0,0 +1,112 @@
+const test = require('node:test');
+const assert = require('node:assert/strict');
+const fs = require('node:fs/promises');
+const os = require('node:os');
+const path = require('node:path');
+const { spawnSync } = require('node:child_process');
+
+const { buildArgs, parseHarnessReport } = require('../lib/blenderRunner');
+
+const HARNESS_PATH = path.resolve(__dirname, '..', '..', 'test_harness.py');
+const PYTHON_BIN = process.env.PYTHON || 'python';
+
+const writeAddon = async (dir, { name, register = 'pass' }) => {
+  await fs.mkdir(dir, { recursive: true });
+  await fs.writeFile(path.join(dir, 'helpers.py'), `LABEL = ${JSON.stringify(name)}\n`);
+  await fs.writeFile(
+    path.join(dir, '__init__.py'),
+    [
+      `bl_info = {"name": ${JSON.stringify(name)}, "blender": (4, 0, 0)}`,
+      'import bpy',
+      'from . import helpers',
+      '',
+      'class AETHER_OT_probe(bpy.types.Operator):',
+      '    bl_idname = "aether.probe"',
+      '    bl_label = helpers.LABEL',
+      '',
+      'def register():',
+      '    bpy.utils.register_class(AETHER_OT_probe)',
+      '    print("LABEL=" + helpers.LABEL)',
+      `    ${register}`,
+      '',
+      'def unregister():',
+      '    bpy.utils.unregister_class(AETHER_OT_probe)',
+      '',
+    ].join('\n'),
+  );
+};
+
+test('buildArgs passes many addons, a manifest and a report path to one harness launch', () => {
+  const args = buildArgs({
+    mode: 'headless',
+    harnessPath: 'test_harness.py',
+    addonPaths: ['a', 'b'],
+    manifestPath: 'batch.json',
+    reportPath: 'report.json',
+  });
+  assert.deepEqual(args, [
+    '-b',
+    '-P',
+    path.resolve('test_harness.py'),
+    '--',
+    path.resolve('a'),
+    path.resolve('b'),
+    '--manifest',
+    path.resolve('batch.json'),
+    '--report',
+    path.resolve('report.json'),
+  ]);
+  assert.deepEqual(buildArgs({ mode: 'gui', harnessPath: 'h.py', addonPath: 'x' }), [
+    '-P',
+    path.resolve('h.py'),
+    '--',
+    path.resolve('x'),
+  ]);
+});
+
+test('test_harness validates a batch of same-named addons in one process with isolated modules', async (t) => {
+  const root = await fs.mkdtemp(path.join(os.tmpdir(), 'aether-harness-'));
+  try {
+    // Generated variants all live in folders called "scaffold"; each must import its own helpers.
+    await writeAddon(path.join(root, 'v1', 'scaffold'), { name: 'Variant One' });
+    await writeAddon(path.join(root, 'v2', 'scaffold'), { name: 'Variant Two', register: 'raise RuntimeError("boom")' });
+    await writeAddon(path.join(root, 'v3', 'scaffold'), { name: 'Variant Three' });
+    const manifestPath = path.join(root, 'batch.json');
+    await fs.writeFile(
+      manifestPath,
+      JSON.stringify({ addons: [{ id: 'two', path: 'v2/scaffold' }, 'v3/scaffold'] }),
+    );
+    const reportPath = path.join(root, 'report.json');
+
+    const result = spawnSync(
+      PYTHON_BIN,
+      [HARNESS_PATH, '--', path.join(root, 'v1', 'scaffold'), '--manifest', manifestPath, '--report', reportPath],
+      { encoding: 'utf8', env: { ...process.env, AETHER_RPC_FAKE_BPY: '1' } },
+    );
+    if (result.error && result.error.code === 'ENOENT') {
+      t.skip(`Python interpreter not found: ${PYTHON_BIN}`);
+      return;
+    }
+    assert.equal(result.status, 1, result.stderr);
+
+    const reportLine = result.stdout.split(/\r?\n/).find((line) => parseHarnessReport(line));
+    const report = parseHarnessReport(reportLine);
+    assert.deepEqual(report, JSON.parse(await fs.readFile(reportPath, 'utf8')));
+    assert.equal(report.count, 3);
+    assert.equal(report.failed, 1);
+    assert.deepEqual(report.addons.map((addon) => [addon.id, addon.ok, addon.stage]), [
+      ['scaffold', true, 'done'],
+      ['two', false, 'register'],
+      ['scaffold', true, 'done'],
+    ]);
+    assert.equal(report.addons[1].error.message, 'boom');
+    // The failed register() was unwound, so the third variant registers the same operator cleanly.
+    assert.equal(report.addons[1].cleanupError, undefined);
+    assert.match(result.stdout, /LABEL=Variant One[\s\S]*LABEL=Variant Two[\s\S]*LABEL=Variant Three/);
+    for (const key of ['import', 'register', 'unregister', 'total']) {
+      assert.equal(typeof report.addons[0].timingsMs[key], 'number');
+    }
+  } finally {
+    await fs.rm(root, { recursive: true, force: true });
+  }
+});
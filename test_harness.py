@@ -1,41 +1,205 @@
-import bpy
-import sys
+"""Validate one or more Blender addons in a single Blender launch.
+
+    blender -b -P test_harness.py -- ADDON_FOLDER [ADDON_FOLDER ...]
+    blender -b -P test_harness.py -- --manifest addons.json [--report report.json]
+
+A manifest is a JSON list of paths (or {"id": ..., "path": ...} objects), or an object with an
+"addons" list. Each addon is imported with isolated sys.path/sys.modules state, then register()
+and unregister() are run; stale modules get checked-hash pycs first, timed separately from the
+import. One JSON report with per-addon timings is printed after the
+REPORT_MARKER line prefix (and written to --report when given); the exit code is 1 if any addon
+fails.
+"""
+import json
 import os
+import sys
+import time
+import traceback
+
+REPORT_MARKER = '[AETHER_HARNESS_REPORT]'
+HARNESS_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_DIR = os.path.join(HARNESS_DIR, 'server')
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
+
+from aether_bridge import bytecode  # noqa: E402
+
+if os.environ.get('AETHER_RPC_FAKE_BPY', '').strip().lower() in ('1', 'true', 'yes'):
+    # Plain-Python test mode: validate against the bridge's in-process bpy stand-in.
+    from aether_bridge import fake_bpy
+
+    fake_bpy.install()
+
+import bpy  # noqa: E402,F401
+
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000.0, 3)
+
+
+def _error_info(exc):
+    return {
+        'type': type(exc).__name__,
+        'message': str(exc),
+        'traceback': traceback.format_exc(limit=8),
+    }
+
+
+def _addon_modules(module_name, addon_path):
+    """Names in sys.modules that belong to the addon: its package tree or files under its folder."""
+    owned = []
+    root = os.path.normcase(os.path.abspath(addon_path))
+    for name, module in list(sys.modules.items()):
+        if name == module_name or name.startswith(module_name + '.'):
+            owned.append(name)
+            continue
+        module_file = getattr(module, '__file__', None)
+        if module_file and os.path.normcase(os.path.abspath(module_file)).startswith(root + os.sep):
+            owned.append(name)
+    return owned
+
+
+def validate_addon(addon_path, addon_id=None):
+    import importlib
 
-def validate_addon(addon_path):
-    print(f"--- AETHER TEST HARNESS ---")
-    print(f"Target: {addon_path}")
-    
     abs_path = os.path.abspath(addon_path)
-    if not os.path.exists(abs_path):
-        print(f"FAILURE: Path not found: {abs_path}")
-        sys.exit(1)
+    module_name = os.path.splitext(os.path.basename(abs_path))[0]
+    result = {
+        'id': addon_id or module_name,
+        'path': abs_path,
+        'module': module_name,
+        'ok': False,
+        'stage': 'resolve',
+        'timingsMs': {},
+    }
+    started = time.perf_counter()
+    print(f'--- AETHER TEST HARNESS: {result["id"]} ---')
 
-    sys.path.append(os.path.dirname(abs_path))
-    module_name = os.path.basename(abs_path)
+    if not os.path.exists(abs_path):
+        result['error'] = {'type': 'FileNotFoundError', 'message': f'Path not found: {abs_path}'}
+        print(f'FAILURE: Path not found: {abs_path}')
+        result['timingsMs']['total'] = _elapsed_ms(started)
+        return result
 
+    saved_path = list(sys.path)
+    # Variants often share a folder name, so stale modules from a previous addon must not leak in.
+    for name in _addon_modules(module_name, abs_path):
+        sys.modules.pop(name, None)
+    sys.path.insert(0, os.path.dirname(abs_path))
+    module = None
+    registered = False
     try:
-        print(f"Attempting import: {module_name}")
-        __import__(module_name)
-        
-        print(f"Attempting register...")
-        # In a real swarm, we might try bpy.ops.preferences.addon_enable(module=module_name)
-        # But for headless verification without installing to user scripts, import is often enough to catch syntax/registry errors.
-        
-        print("SUCCESS: Syntax valid and import successful.")
-    except Exception as e:
-        print(f"FAILURE: {e}")
-        sys.exit(1)
-
-if __name__ == "__main__":
-    # Get the addon path from args (after '--')
-    argv = sys.argv
-    if "--" in argv:
-        target = argv[argv.index("--") + 1]
-        validate_addon(target)
+        # Usually a hash check: the server's preflight already wrote checked-hash pycs.
+        result['stage'] = 'bytecode'
+        result['bytecode'] = bytecode.ensure_bytecode(abs_path)
+        result['timingsMs']['bytecode'] = result['bytecode']['ms']
+
+        result['stage'] = 'import'
+        phase = time.perf_counter()
+        importlib.invalidate_caches()
+        module = importlib.import_module(module_name)
+        result['timingsMs']['import'] = _elapsed_ms(phase)
+
+        for hook in ('register', 'unregister'):
+            if not callable(getattr(module, hook, None)):
+                raise AttributeError(f'{module_name}.{hook}() is not defined')
+
+        result['stage'] = 'register'
+        phase = time.perf_counter()
+        registered = True
+        module.register()
+        result['timingsMs']['register'] = _elapsed_ms(phase)
+
+        result['stage'] = 'unregister'
+        phase = time.perf_counter()
+        module.unregister()
+        registered = False
+        result['timingsMs']['unregister'] = _elapsed_ms(phase)
+
+        result['ok'] = True
+        result['stage'] = 'done'
+        print(f'SUCCESS: {result["id"]} imported, registered and unregistered.')
+    except Exception as exc:
+        result['error'] = _error_info(exc)
+        print(f'FAILURE: {result["id"]} ({result["stage"]}): {exc}')
+        if registered and module is not None:
+            # Leave Blender clean for the next addon even when register() failed half way.
+            try:
+                module.unregister()
+            except Exception as cleanup_exc:
+                result['cleanupError'] = _error_info(cleanup_exc)
+    finally:
+        for name in _addon_modules(module_name, abs_path):
+            sys.modules.pop(name, None)
+        sys.path[:] = saved_path
+        result['timingsMs']['total'] = _elapsed_ms(started)
+    return result
+
+
+def load_manifest(manifest_path):
+    with open(manifest_path, 'r', encoding='utf-8') as handle:
+        manifest = json.load(handle)
+    entries = manifest.get('addons', []) if isinstance(manifest, dict) else manifest
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    addons = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'path': entry}
+        addon_path = str(entry.get('path') or '')
+        if addon_path and not os.path.isabs(addon_path):
+            addon_path = os.path.join(base_dir, addon_path)
+        addons.append({'id': entry.get('id'), 'path': addon_path})
+    return addons
+
+
+def parse_args(argv):
+    addons = []
+    report_path = None
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        if arg == '--manifest' and index + 1 < len(argv):
+            addons.extend(load_manifest(argv[index + 1]))
+            index += 2
+        elif arg == '--report' and index + 1 < len(argv):
+            report_path = argv[index + 1]
+            index += 2
+        else:
+            addons.append({'id': None, 'path': arg})
+            index += 1
+    return addons, report_path
+
+
+def run(addons, report_path=None):
+    started = time.perf_counter()
+    results = [validate_addon(addon['path'], addon.get('id')) for addon in addons]
+    report = {
+        'ok': bool(results) and all(result['ok'] for result in results),
+        'count': len(results),
+        'failed': sum(1 for result in results if not result['ok']),
+        'durationMs': _elapsed_ms(started),
+        'blenderVersion': getattr(getattr(bpy, 'app', None), 'version_string', None),
+        'addons': results,
+    }
+    encoded = json.dumps(report, separators=(',', ':'))
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as handle:
+            handle.write(encoded + '\n')
+    print(f'{REPORT_MARKER} {encoded}', flush=True)
+    return report
+
+
+if __name__ == '__main__':
+    # Blender passes script arguments after '--'.
+    if '--' in sys.argv:
+        argv = sys.argv[sys.argv.index('--') + 1:]
+    elif len(sys.argv) > 1 and not sys.argv[-1].endswith('.py'):
+        # Fallback for manual running outside Blender's argument parsing.
+        argv = [sys.argv[-1]]
     else:
-        # Fallback for manual running
-        print("Usage: blender -b -P test_harness.py -- [ADDON_FOLDER]")
-        # Check if a path was passed directly (not via blender arg parsing)
-        if len(sys.argv) > 1 and not sys.argv[-1].endswith(".py"):
-             validate_addon(sys.argv[-1])
\ No newline at end of file
+        argv = []
+    targets, report_file = parse_args(argv)
+    if not targets:
+        print('Usage: blender -b -P test_harness.py -- ADDON_FOLDER [...] [--manifest FILE] [--report FILE]')
+        sys.exit(2)
+    sys.exit(0 if run(targets, report_file)['ok'] else 1)
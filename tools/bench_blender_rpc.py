@@ -0,0 +1,371 @@
+"""Benchmark the Blender RPC bridge and fail on regressions against a stored baseline.
+
+By default the bridge runs under plain Python with the fake bpy backend (AETHER_RPC_FAKE_BPY),
+which isolates the RPC path; pass --backend blender to measure a real Blender:
+
+    python tools/bench_blender_rpc.py --output bench.json
+    python tools/bench_blender_rpc.py --baseline tools/bench_baseline.json
+    python tools/bench_blender_rpc.py --write-baseline tools/bench_baseline.json
+
+Every metric is a latency distribution in milliseconds; regressions compare p50 values.
+"""
+import argparse
+import json
+import os
+import platform
+import secrets
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOLS_DIR = os.path.join(REPO_ROOT, 'tools')
+SERVER_DIR = os.path.join(REPO_ROOT, 'server')
+BRIDGE_SCRIPT = os.path.join(SERVER_DIR, 'blender_rpc_bridge.py')
+SCAFFOLD_PATH = os.path.join(REPO_ROOT, 'scaffold')
+DEFAULT_BASELINE = os.path.join(TOOLS_DIR, 'bench_baseline.json')
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from replay_blender_rpc import percentile, send_rpc  # noqa: E402
+
+DEFAULT_NODE_COUNTS = (10, 100, 1000, 10000)
+DEFAULT_CONTEXT_SIZES = (1024, 16384, 262144)
+DEFAULT_CONTEXT_BUDGETS = (4096, 32768)
+DEFAULT_MAX_RATIO = 1.5
+DEFAULT_MIN_DELTA_MS = 2.0
+READY_MARKER = '[AETHER_RPC_READY]'
+
+# Builds the generated NODE_TREE script exactly as the protocol executor would send it.
+NODE_SCRIPT_BUILDER = (
+    "const { buildNodeTreeScript } = require(process.argv[1]);"
+    "let raw = '';"
+    "process.stdin.on('data', (chunk) => { raw += chunk; });"
+    "process.stdin.on('end', () => { process.stdout.write(buildNodeTreeScript(JSON.parse(raw))); });"
+)
+
+
+class BenchError(Exception):
+    pass
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+class BridgeProcess:
+    """Launches a bridge and waits for its readiness marker."""
+
+    def __init__(self, backend='fake', blender_bin='blender', port=0, extra_env=None, ready_timeout=60.0):
+        self.backend = backend
+        self.port = port or _free_port()
+        self.token = secrets.token_hex(16)
+        self.url = f'http://127.0.0.1:{self.port}/rpc'
+        env = os.environ.copy()
+        env.update({
+            'AETHER_RPC_PORT': str(self.port),
+            'AETHER_RPC_TOKEN': self.token,
+            'PYTHONUNBUFFERED': '1',
+        })
+        if backend == 'fake':
+            env['AETHER_RPC_FAKE_BPY'] = '1'
+            argv = [sys.executable, BRIDGE_SCRIPT]
+        else:
+            argv = [blender_bin, '-b', '--factory-startup', '--python', BRIDGE_SCRIPT]
+        env.update(extra_env or {})
+        self.output = []
+        self.process = subprocess.Popen(
+            argv,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+        )
+        ready = threading.Event()
+
+        def pump():
+            for line in self.process.stdout:
+                if len(self.output) < 200:
+                    self.output.append(line.rstrip())
+                if READY_MARKER in line:
+                    ready.set()
+
+        threading.Thread(target=pump, name='bridge-output', daemon=True).start()
+        deadline = time.monotonic() + ready_timeout
+        while not ready.wait(0.05):
+            if self.process.poll() is not None or time.monotonic() > deadline:
+                self.close()
+                raise BenchError('Bridge did not become ready:\n' + '\n'.join(self.output[-20:]))
+
+    def rpc(self, command, payload=None, timeout=300.0):
+        status, body, elapsed_ms = send_rpc(self.url, self.token, command, payload or {}, timeout)
+        if status != 200:
+            error = body.get('error') if isinstance(body, dict) else body
+            raise BenchError(f'{command} failed with HTTP {status}: {error}')
+        return body, elapsed_ms
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+def summarize_samples(samples, **extra):
+    ordered = sorted(samples)
+    return {
+        'unit': 'ms',
+        'n': len(ordered),
+        'p50': percentile(ordered, 0.5),
+        'p90': percentile(ordered, 0.9),
+        'p99': percentile(ordered, 0.99),
+        'min': round(ordered[0], 3) if ordered else None,
+        'max': round(ordered[-1], 3) if ordered else None,
+        'mean': round(sum(ordered) / len(ordered), 3) if ordered else None,
+        **extra,
+    }
+
+
+def _timed(bridge, command, payload, iterations):
+    return [bridge.rpc(command, payload)[1] for _ in range(iterations)]
+
+
+def bench_ping(bridge, iterations):
+    bridge.rpc('ping')
+    return {'ping': summarize_samples(_timed(bridge, 'ping', {}, iterations))}
+
+
+def bench_exec_python(bridge, iterations):
+    # Cold: every script is new source, so parse, safety scan and compile all run.
+    cold = [
+        bridge.rpc('exec_python', {'code': f'value = {index} * 2\nprint(value)', 'mode': 'safe'})[1]
+        for index in range(iterations)
+    ]
+    warm_payload = {'code': 'value = 21 * 2\nprint(value)', 'mode': 'safe'}
+    bridge.rpc('exec_python', warm_payload)
+    warm = _timed(bridge, 'exec_python', warm_payload, iterations)
+    return {
+        'exec_python.cold': summarize_samples(cold),
+        'exec_python.warm': summarize_samples(warm),
+    }
+
+
+def _context_slice(size_bytes):
+    entry = {'name': 'Modifier', 'type': 'NODES', 'show_viewport': True}
+    per_entry = len(json.dumps(entry, separators=(',', ':'))) + 1
+    return [dict(entry, name=f'Modifier_{index}') for index in range(max(1, size_bytes // per_entry))]
+
+
+def bench_get_context(bridge, iterations, sizes, budgets):
+    metrics = {}
+    for size in sizes:
+        modifier_stack = _context_slice(size)
+        for budget in budgets:
+            payload = {
+                'slices': ['runtime', 'modifier_stack', 'scene'],
+                'modifier_stack': modifier_stack,
+                'scene': {'name': 'Scene', 'frame': 1},
+                'max_bytes': budget,
+            }
+            body, _ = bridge.rpc('get_context', payload)
+            slicing = body['result'].get('slicing') or {}
+            metrics[f'get_context.{size}b.budget{budget}'] = summarize_samples(
+                _timed(bridge, 'get_context', payload, iterations),
+                sourceBytes=slicing.get('sourceBytes'),
+                payloadBytes=slicing.get('payloadBytes'),
+            )
+    return metrics
+
+
+def node_tree_step(object_name, node_count):
+    operations = [{
+        'op': 'set_group_io',
+        'action': 'add_output',
+        'socket': 'Geometry',
+        'socket_type': 'NodeSocketGeometry',
+    }]
+    for index in range(node_count):
+        operations.append({
+            'op': 'create_node',
+            'node_id': f'n{index}',
+            'bl_idname': 'ShaderNodeMath',
+            'location': [(index % 100) * 200, (index // 100) * 200],
+        })
+        operations.append({'op': 'set_input_default', 'node_id': f'n{index}', 'socket': 'Value', 'value': float(index)})
+        if index:
+            operations.append({
+                'op': 'link',
+                'from': {'node_id': f'n{index - 1}', 'socket': 'Value'},
+                'to': {'node_id': f'n{index}', 'socket': 'Value'},
+            })
+    return {
+        'id': f'bench_nodes_{node_count}',
+        'type': 'NODE_TREE',
+        'payload': {
+            'target': {'object_name': object_name, 'modifier_name': 'Bench', 'node_group_name': object_name},
+            'operations': operations,
+        },
+    }
+
+
+def build_node_tree_script(step, node_bin='node'):
+    completed = subprocess.run(
+        [node_bin, '-e', NODE_SCRIPT_BUILDER, os.path.join(SERVER_DIR, 'lib', 'executorBridge.js')],
+        input=json.dumps(step),
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise BenchError(f'Could not build NODE_TREE script: {completed.stderr.strip()}')
+    return completed.stdout
+
+
+def bench_node_tree(bridge, iterations, node_counts, node_bin='node'):
+    metrics = {}
+    for node_count in node_counts:
+        samples = []
+        script_bytes = 0
+        for iteration in range(iterations):
+            # A fresh object per run so every sample applies the full tree from scratch.
+            object_name = f'Bench_{node_count}_{iteration}'
+            bridge.rpc('create_objects', {'names': [object_name]})
+            code = build_node_tree_script(node_tree_step(object_name, node_count), node_bin)
+            script_bytes = len(code.encode('utf-8'))
+            samples.append(bridge.rpc('exec_python', {'code': code, 'mode': 'safe', 'batch': True})[1])
+        metrics[f'node_tree.{node_count}'] = summarize_samples(samples, scriptBytes=script_bytes)
+    return metrics
+
+
+def bench_validate_addon(bridge, iterations, addon_path):
+    first = bridge.rpc('validate_addon', {'addonPath': addon_path})[1]
+    reloads = _timed(bridge, 'validate_addon', {'addonPath': addon_path}, iterations)
+    return {
+        'validate_addon.first': summarize_samples([first]),
+        'validate_addon.reload': summarize_samples(reloads),
+    }
+
+
+def run_benchmarks(bridge, args):
+    metrics = {}
+    suites = set(args.suites)
+    if 'ping' in suites:
+        metrics.update(bench_ping(bridge, args.iterations))
+    if 'exec' in suites:
+        metrics.update(bench_exec_python(bridge, args.iterations))
+    if 'context' in suites:
+        metrics.update(bench_get_context(bridge, args.iterations, args.context_sizes, args.context_budgets))
+    if 'nodes' in suites:
+        metrics.update(bench_node_tree(bridge, args.node_iterations, args.node_counts, args.node_bin))
+    if 'addon' in suites:
+        metrics.update(bench_validate_addon(bridge, args.iterations, args.addon_path))
+    return metrics
+
+
+def compare_to_baseline(metrics, baseline, max_ratio=None, min_delta_ms=None):
+    """Return regressions where current p50 exceeds the baseline p50 by both ratio and slack."""
+    defaults = baseline.get('defaults') or {}
+    max_ratio = float(max_ratio if max_ratio is not None else defaults.get('maxRatio', DEFAULT_MAX_RATIO))
+    min_delta_ms = float(min_delta_ms if min_delta_ms is not None else defaults.get('minDeltaMs', DEFAULT_MIN_DELTA_MS))
+    regressions = []
+    for name, reference in sorted((baseline.get('metrics') or {}).items()):
+        current = metrics.get(name)
+        if current is None or current.get('p50') is None or reference.get('p50') is None:
+            continue
+        ratio = float(reference.get('maxRatio', max_ratio))
+        limit = max(reference['p50'] * ratio, reference['p50'] + min_delta_ms)
+        if current['p50'] > limit:
+            regressions.append({
+                'metric': name,
+                'baselineP50': reference['p50'],
+                'currentP50': current['p50'],
+                'limit': round(limit, 3),
+                'ratio': round(current['p50'] / reference['p50'], 3) if reference['p50'] else None,
+            })
+    return regressions
+
+
+def baseline_from_metrics(metrics, backend):
+    return {
+        'backend': backend,
+        'recordedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'defaults': {'maxRatio': DEFAULT_MAX_RATIO, 'minDeltaMs': DEFAULT_MIN_DELTA_MS},
+        'metrics': {name: {'p50': metric['p50']} for name, metric in sorted(metrics.items())},
+    }
+
+
+def _int_list(text):
+    return tuple(int(part) for part in str(text).split(',') if part.strip())
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Benchmark the Blender RPC bridge.')
+    parser.add_argument('--backend', choices=('fake', 'blender'), default='fake')
+    parser.add_argument('--blender', dest='blender_bin', default=shutil.which('blender') or 'blender')
+    parser.add_argument('--node', dest='node_bin', default=shutil.which('node') or 'node')
+    parser.add_argument('--suite', dest='suites', action='append', choices=('ping', 'exec', 'context', 'nodes', 'addon'))
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--node-iterations', type=int, default=3)
+    parser.add_argument('--node-counts', type=_int_list, default=DEFAULT_NODE_COUNTS)
+    parser.add_argument('--context-sizes', type=_int_list, default=DEFAULT_CONTEXT_SIZES)
+    parser.add_argument('--context-budgets', type=_int_list, default=DEFAULT_CONTEXT_BUDGETS)
+    parser.add_argument('--addon-path', default=SCAFFOLD_PATH)
+    parser.add_argument('--baseline', help='Fail when a metric regresses against this baseline file')
+    parser.add_argument('--max-ratio', type=float, help='Override the baseline regression ratio')
+    parser.add_argument('--min-delta-ms', type=float, help='Override the absolute slack in milliseconds')
+    parser.add_argument('--write-baseline', help='Record the results as a new baseline file')
+    parser.add_argument('--output', help='Write the JSON report here as well as stdout')
+    args = parser.parse_args(argv)
+    args.suites = args.suites or ['ping', 'exec', 'context', 'nodes', 'addon']
+    args.iterations = max(1, args.iterations)
+    args.node_iterations = max(1, args.node_iterations)
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    bridge = BridgeProcess(backend=args.backend, blender_bin=args.blender_bin)
+    try:
+        started = time.perf_counter()
+        metrics = run_benchmarks(bridge, args)
+        duration_s = time.perf_counter() - started
+    finally:
+        bridge.close()
+
+    report = {
+        'backend': args.backend,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'durationS': round(duration_s, 3),
+        'metrics': metrics,
+    }
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        if baseline.get('backend') not in (None, args.backend):
+            raise BenchError(f"Baseline was recorded with backend={baseline['backend']}, not {args.backend}")
+        report['regressions'] = compare_to_baseline(metrics, baseline, args.max_ratio, args.min_delta_ms)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            handle.write(text + '\n')
+    if args.write_baseline:
+        with open(args.write_baseline, 'w', encoding='utf-8') as handle:
+            handle.write(json.dumps(baseline_from_metrics(metrics, args.backend), indent=2) + '\n')
+    return 1 if report.get('regressions') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
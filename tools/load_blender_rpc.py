@@ -0,0 +1,290 @@
+"""Drive a Blender RPC bridge with many concurrent callers and report tail latency over time.
+
+Closed loop (N callers, each sending back-to-back):
+
+    python tools/load_blender_rpc.py --port 8123 --token <token> --concurrency 64 --duration 30
+
+Open loop (Poisson arrivals at a fixed rate, independent of how fast the bridge answers):
+
+    python tools/load_blender_rpc.py --launch --rate 200 --duration 30 --mix ping=8,get_context=2
+
+`--launch` starts a fake-bpy bridge (see bench_blender_rpc.py) instead of targeting a running one.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TOOLS_DIR not in sys.path:
+    sys.path.insert(0, TOOLS_DIR)
+
+from replay_blender_rpc import percentile  # noqa: E402
+
+DEFAULT_MIX = 'ping=1'
+COMMAND_PAYLOADS = {
+    'ping': {},
+    'get_context': {'slices': ['runtime']},
+    'exec_python': {'code': 'value = sum(range(100))', 'mode': 'safe'},
+}
+
+
+def parse_mix(text):
+    """Parse `ping=8,exec_python=1` into a list of (command, weight)."""
+    mix = []
+    for part in str(text or '').split(','):
+        if not part.strip():
+            continue
+        command, _, weight = part.partition('=')
+        command = command.strip().lower()
+        if command not in COMMAND_PAYLOADS:
+            raise ValueError(f'Unsupported command in mix: {command}')
+        mix.append((command, float(weight) if weight.strip() else 1.0))
+    if not mix or sum(weight for _, weight in mix) <= 0:
+        raise ValueError('Command mix must contain at least one positive weight')
+    return mix
+
+
+async def send_rpc(host, port, token, command, payload, timeout):
+    """POST one /rpc request on a fresh connection; returns (status, body, elapsed_ms)."""
+    body = json.dumps({'command': command, 'payload': payload}).encode('utf-8')
+    head = (
+        f'POST /rpc HTTP/1.1\r\n'
+        f'Host: {host}:{port}\r\n'
+        f'Content-Type: application/json\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        f'X-Aether-Token: {token or ""}\r\n'
+        f'Connection: close\r\n\r\n'
+    ).encode('ascii')
+    started = time.perf_counter()
+
+    async def exchange():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(head + body)
+            await writer.drain()
+            raw = await reader.read()
+        finally:
+            writer.close()
+        return raw
+
+    raw = await asyncio.wait_for(exchange(), timeout)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    header_blob, _, response_body = raw.partition(b'\r\n\r\n')
+    status_line = header_blob.split(b'\r\n', 1)[0].decode('latin-1')
+    try:
+        status = int(status_line.split()[1])
+    except (IndexError, ValueError):
+        raise ConnectionError(f'Malformed HTTP response: {status_line!r}') from None
+    try:
+        parsed = json.loads(response_body.decode('utf-8'))
+    except ValueError:
+        parsed = {}
+    return status, parsed, elapsed_ms
+
+
+class LoadRecorder:
+    """Collects per-request outcomes and per-second buckets of queueing behaviour."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.samples = []
+        self.outcomes = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.buckets = {}
+
+    def _bucket(self, now):
+        second = int(now - self.origin)
+        bucket = self.buckets.get(second)
+        if bucket is None:
+            bucket = {'second': second, 'sent': 0, 'completed': 0, 'errors': 0, 'latencies': [], 'lags': [], 'peakInFlight': 0}
+            self.buckets[second] = bucket
+        return bucket
+
+    def started(self, lag_ms=0.0):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        bucket = self._bucket(time.perf_counter())
+        bucket['sent'] += 1
+        bucket['lags'].append(lag_ms)
+        bucket['peakInFlight'] = max(bucket['peakInFlight'], self.in_flight)
+
+    def finished(self, command, outcome, elapsed_ms, ok):
+        self.in_flight -= 1
+        self.samples.append((command, elapsed_ms, ok))
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        bucket = self._bucket(time.perf_counter())
+        bucket['completed'] += 1
+        bucket['latencies'].append(elapsed_ms)
+        if not ok:
+            bucket['errors'] += 1
+
+    def report(self, duration_s):
+        latencies = [elapsed for _, elapsed, _ in self.samples]
+        ok_count = sum(1 for _, _, ok in self.samples if ok)
+        commands = {}
+        for command, elapsed, _ in self.samples:
+            commands.setdefault(command, []).append(elapsed)
+        timeline = []
+        for second in sorted(self.buckets):
+            bucket = self.buckets[second]
+            timeline.append({
+                'second': second,
+                'sent': bucket['sent'],
+                'completed': bucket['completed'],
+                'errors': bucket['errors'],
+                'peakInFlight': bucket['peakInFlight'],
+                'p50Ms': percentile(bucket['latencies'], 0.5),
+                'p99Ms': percentile(bucket['latencies'], 0.99),
+                'maxStartLagMs': round(max(bucket['lags']), 3) if bucket['lags'] else None,
+            })
+        return {
+            'requests': len(self.samples),
+            'ok': ok_count,
+            'durationS': round(duration_s, 3),
+            'throughputRps': round(len(self.samples) / duration_s, 2) if duration_s > 0 else None,
+            'latencyMs': {
+                'p50': percentile(latencies, 0.5),
+                'p90': percentile(latencies, 0.9),
+                'p99': percentile(latencies, 0.99),
+                'max': round(max(latencies), 3) if latencies else None,
+            },
+            'peakInFlight': self.peak_in_flight,
+            'outcomes': dict(sorted(self.outcomes.items())),
+            'commands': {
+                command: {'count': len(values), 'p50Ms': percentile(values, 0.5), 'p99Ms': percentile(values, 0.99)}
+                for command, values in sorted(commands.items())
+            },
+            'timeline': timeline,
+        }
+
+
+def _outcome_label(status, body):
+    if status == 200:
+        return '200'
+    code = body.get('code') if isinstance(body, dict) else None
+    return f'{status}:{code}' if code else str(status)
+
+
+async def _issue(target, recorder, command, lag_ms=0.0):
+    host, port, token, timeout = target
+    recorder.started(lag_ms)
+    started = time.perf_counter()
+    try:
+        status, body, elapsed_ms = await send_rpc(host, port, token, command, COMMAND_PAYLOADS[command], timeout)
+    except asyncio.TimeoutError:
+        recorder.finished(command, 'timeout', (time.perf_counter() - started) * 1000.0, False)
+        return
+    except OSError as exc:
+        label = f'transport:{type(exc).__name__}'
+        recorder.finished(command, label, (time.perf_counter() - started) * 1000.0, False)
+        return
+    recorder.finished(command, _outcome_label(status, body), elapsed_ms, status == 200)
+
+
+async def run_closed_loop(target, mix, concurrency, duration_s, max_requests, rng):
+    recorder = LoadRecorder()
+    commands = [command for command, _ in mix]
+    weights = [weight for _, weight in mix]
+    deadline = time.perf_counter() + duration_s
+    issued = 0
+
+    async def caller():
+        nonlocal issued
+        while time.perf_counter() < deadline and (not max_requests or issued < max_requests):
+            issued += 1
+            await _issue(target, recorder, rng.choices(commands, weights)[0])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return recorder.report(time.perf_counter() - started)
+
+
+async def run_open_loop(target, mix, rate, duration_s, max_requests, max_in_flight, rng):
+    """Poisson arrivals; start lag shows when the client (not the bridge) fell behind."""
+    recorder = LoadRecorder()
+    commands = [command for command, _ in mix]
+    weights = [weight for _, weight in mix]
+    pending = set()
+    started = time.perf_counter()
+    due = started
+    issued = 0
+    dropped = 0
+    while due - started < duration_s and (not max_requests or issued < max_requests):
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if max_in_flight and len(pending) >= max_in_flight:
+            dropped += 1
+        else:
+            lag_ms = max(0.0, (time.perf_counter() - due) * 1000.0)
+            task = asyncio.ensure_future(_issue(target, recorder, rng.choices(commands, weights)[0], lag_ms))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            issued += 1
+        due += rng.expovariate(rate)
+    if pending:
+        await asyncio.gather(*pending)
+    report = recorder.report(time.perf_counter() - started)
+    report['offeredRps'] = rate
+    report['droppedByClient'] = dropped
+    return report
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Concurrent load generator for the Blender RPC bridge.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('AETHER_RPC_PORT', '8123') or '8123'))
+    parser.add_argument('--token', default=os.environ.get('AETHER_RPC_TOKEN', ''))
+    parser.add_argument('--launch', action='store_true', help='Start a fake-bpy bridge for the run')
+    parser.add_argument('--concurrency', type=int, default=50, help='Closed-loop callers')
+    parser.add_argument('--rate', type=float, default=0.0, help='Open-loop arrivals per second (overrides --concurrency)')
+    parser.add_argument('--max-in-flight', type=int, default=0, help='Open-loop cap on outstanding requests (0 = none)')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to generate load')
+    parser.add_argument('--requests', type=int, default=0, help='Stop after this many requests')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='Weighted command mix, e.g. ping=8,get_context=1,exec_python=1')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--output', help='Write the JSON report here as well as stdout')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    mix = parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    bridge = None
+    host, port, token = args.host, args.port, args.token
+    if args.launch:
+        from bench_blender_rpc import BridgeProcess
+
+        bridge = BridgeProcess(backend='fake')
+        host, port, token = '127.0.0.1', bridge.port, bridge.token
+    target = (host, port, token, args.timeout)
+    try:
+        if args.rate > 0:
+            report = asyncio.run(run_open_loop(target, mix, args.rate, args.duration, args.requests, args.max_in_flight, rng))
+            report['mode'] = 'open'
+        else:
+            report = asyncio.run(run_closed_loop(target, mix, max(1, args.concurrency), args.duration, args.requests, rng))
+            report['mode'] = 'closed'
+            report['concurrency'] = max(1, args.concurrency)
+    finally:
+        if bridge is not None:
+            bridge.close()
+
+    report['mix'] = dict(mix)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            handle.write(text + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Re-drive a bridge traffic capture against a running Blender RPC bridge.
+
+Record traffic by launching the bridge with AETHER_RPC_CAPTURE_PATH set, then:
+
+    python tools/replay_blender_rpc.py capture.jsonl --port 8123 --token <token> --speed 0
+
+Paced replays (`--speed` > 0) are open loop: every record goes out at its captured offset on a
+worker pool, whether or not earlier requests have answered, so captured concurrency and slow
+commands reproduce. `--speed 0` sends one request at a time for result checking.
+
+Reports per-command latency deltas (captured vs replayed), how late each send started against its
+schedule, and any result mismatches.
+"""
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'server'))
+
+from aether_bridge.capture import read_capture, result_hash  # noqa: E402
+from aether_client import BridgeClient, RetryPolicy  # noqa: E402
+from aether_client.core import percentile  # noqa: E402
+
+
+DEFAULT_CONCURRENCY = 32
+
+_CLIENTS = {}
+
+
+def send_rpc(url, token, command, payload, timeout, pool_size=DEFAULT_CONCURRENCY):
+    """POST one /rpc over a pooled connection; returns (status, body, elapsed_ms).
+
+    Retries are off so replayed statuses and latencies match what the bridge did.
+    """
+    key = (url, token, pool_size)
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = _CLIENTS[key] = BridgeClient.from_url(
+            url, token=token or '', pool_size=pool_size, retry=RetryPolicy.disabled(),
+        )
+    return client.send(command, payload, timeout=timeout)
+
+
+def schedule(records, speed):
+    """Seconds after replay start at which each record is due, with gaps scaled by `speed`."""
+    offsets = []
+    capture_origin = None
+    segment_start = 0.0
+    previous_at = None
+    offset = 0.0
+    for record in records:
+        at = float(record.get('at') or 0.0)
+        if previous_at is not None and at < previous_at:
+            # A new capture segment (bridge restart); re-anchor the schedule.
+            capture_origin = None
+        previous_at = at
+        if capture_origin is None:
+            capture_origin = at
+            segment_start = offset
+        offset = segment_start + (at - capture_origin) / speed
+        offsets.append(offset)
+    return offsets
+
+
+def replay(records, url, token, speed=1.0, timeout=120.0, send=None, concurrency=DEFAULT_CONCURRENCY):
+    """Replay records; `speed` scales original gaps (0 sends back-to-back, one at a time).
+
+    A paced replay dispatches each record at its scheduled offset on up to `concurrency`
+    threads; `lagMs` records how late each send started against that schedule.
+    """
+    concurrency = max(1, int(concurrency))
+    if send is None:
+        send = functools.partial(send_rpc, pool_size=concurrency)
+    outcomes = [None] * len(records)
+
+    def run(position, due):
+        started = time.perf_counter()
+        record = records[position]
+        status, body, elapsed_ms = send(url, token, record['cmd'], record.get('payload') or {}, timeout)
+        outcomes[position] = (status, body, elapsed_ms, (started - due) * 1000.0)
+
+    if speed > 0:
+        offsets = schedule(records, speed)
+        origin = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='aether-replay') as pool:
+            futures = []
+            for position, offset in enumerate(offsets):
+                due = origin + offset
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(run, position, due))
+            for future in futures:
+                future.result()
+    else:
+        for position in range(len(records)):
+            run(position, time.perf_counter())
+
+    samples = []
+    mismatches = []
+    for record, (status, body, elapsed_ms, lag_ms) in zip(records, outcomes):
+        replay_hash = result_hash(status, body)
+        samples.append({
+            'cmd': record['cmd'],
+            'capturedMs': float(record.get('ms') or 0.0),
+            'replayMs': elapsed_ms,
+            'lagMs': round(lag_ms, 3),
+        })
+        if status != record.get('status') or replay_hash != record.get('hash'):
+            mismatches.append({
+                'seq': record.get('seq'),
+                'cmd': record['cmd'],
+                'capturedStatus': record.get('status'),
+                'replayStatus': status,
+                'capturedHash': record.get('hash'),
+                'replayHash': replay_hash,
+                'error': body.get('error') if isinstance(body, dict) else None,
+            })
+    return samples, mismatches
+
+
+def summarize(samples, mismatches):
+    commands = {}
+    for sample in samples:
+        commands.setdefault(sample['cmd'], []).append(sample)
+
+    summary = {}
+    for command, entries in sorted(commands.items()):
+        captured = [entry['capturedMs'] for entry in entries]
+        replayed = [entry['replayMs'] for entry in entries]
+        lags = [entry['lagMs'] for entry in entries]
+        captured_p50 = percentile(captured, 0.5)
+        replay_p50 = percentile(replayed, 0.5)
+        summary[command] = {
+            'count': len(entries),
+            'capturedP50Ms': captured_p50,
+            'capturedP95Ms': percentile(captured, 0.95),
+            'replayP50Ms': replay_p50,
+            'replayP95Ms': percentile(replayed, 0.95),
+            'deltaP50Ms': round(replay_p50 - captured_p50, 3),
+            'lagP95Ms': percentile(lags, 0.95),
+        }
+
+    lags = [sample['lagMs'] for sample in samples]
+    return {
+        'requests': len(samples),
+        'mismatches': len(mismatches),
+        'sendLag': {
+            'p50Ms': percentile(lags, 0.5),
+            'p95Ms': percentile(lags, 0.95),
+            'maxMs': max(lags) if lags else None,
+        },
+        'commands': summary,
+        'mismatchDetails': mismatches,
+    }
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Replay a Blender RPC bridge traffic capture.')
+    parser.add_argument('capture', help='Capture file written via AETHER_RPC_CAPTURE_PATH')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('AETHER_RPC_PORT', '8123') or '8123'))
+    parser.add_argument('--token', default=os.environ.get('AETHER_RPC_TOKEN', ''))
+    parser.add_argument('--speed', type=float, default=1.0, help='Pace multiplier; 0 replays back-to-back')
+    parser.add_argument(
+        '--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+        help='Most requests in flight during a paced replay',
+    )
+    parser.add_argument('--command', action='append', dest='commands', help='Only replay these commands')
+    parser.add_argument('--limit', type=int, default=0, help='Stop after this many requests')
+    parser.add_argument('--timeout', type=float, default=120.0, help='Per-request timeout in seconds')
+    parser.add_argument('--output', help='Write the JSON report here as well as stdout')
+    parser.add_argument('--fail-on-mismatch', action='store_true')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    records = list(read_capture(args.capture))
+    if args.commands:
+        wanted = {command.strip().lower() for command in args.commands}
+        records = [record for record in records if record['cmd'] in wanted]
+    if args.limit > 0:
+        records = records[:args.limit]
+
+    url = f'http://{args.host}:{args.port}/rpc'
+    samples, mismatches = replay(
+        records, url, args.token, speed=args.speed, timeout=args.timeout, concurrency=args.concurrency,
+    )
+    report = summarize(samples, mismatches)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            handle.write(text + '\n')
+    return 1 if args.fail_on_mismatch and mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,11 +2,13 @@ import subprocess
 import os
 import sys
 import time
-import urllib.request
-import urllib.error
 import json
 import secrets
 
+sys.path.insert(0, os.path.abspath("server"))
+
+from aether_client import BridgeClient, BridgeError, RetryPolicy  # noqa: E402
+
 # Configuration
 RPC_PORT = 8123
 RPC_TOKEN = secrets.token_hex(16)
@@ -31,30 +33,7 @@ process = subprocess.Popen(
     text=True
 )
 
-def make_request(method, endpoint, data=None, headers=None, timeout=5):
-    url = f"http://127.0.0.1:{RPC_PORT}{endpoint}"
-    if headers is None:
-        headers = {}
-    
-    req = urllib.request.Request(url, method=method, headers=headers)
-    if data:
-        json_data = json.dumps(data).encode('utf-8')
-        req.data = json_data
-        req.add_header('Content-Type', 'application/json')
-    
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return {
-                'status': response.status,
-                'body': json.loads(response.read().decode('utf-8'))
-            }
-    except urllib.error.HTTPError as e:
-        return {
-            'status': e.code,
-            'body': json.loads(e.read().decode('utf-8'))
-        }
-    except Exception as e:
-        return {'error': str(e)}
+client = BridgeClient(port=RPC_PORT, token=RPC_TOKEN, timeout=5, pool_size=1, retry=RetryPolicy.disabled())
 
 def wait_for_ready():
     print("[TEST] Waiting for bridge to be ready...")
@@ -64,43 +43,40 @@ def wait_for_ready():
             stdout, stderr = process.communicate()
             print(f"[TEST] Blender process exited unexpectedly.\nStdout: {stdout}\nStderr: {stderr}")
             return False
-        
+
         try:
-            res = make_request("GET", "/health", timeout=1)
-            if res.get('status') == 200:
-                print("[TEST] Bridge is ready!")
-                return True
-        except:
+            client.health(timeout=1)
+            print("[TEST] Bridge is ready!")
+            return True
+        except BridgeError:
             pass
         time.sleep(1)
-    
+
     print("[TEST] Timed out waiting for bridge.")
     return False
 
 def run_test(name, command, payload, expected_status=200, checks=None):
     print(f"\n[TEST] Running: {name}")
-    headers = {"X-Aether-Token": RPC_TOKEN}
-    data = {"command": command, "payload": payload}
-    
-    res = make_request("POST", "/rpc", data=data, headers=headers)
-    
-    if 'error' in res:
-        print(f"  FAIL: Exception {res['error']}")
+
+    try:
+        status, body, _elapsed_ms = client.send(command, payload)
+    except BridgeError as e:
+        print(f"  FAIL: Exception {e}")
         return False
 
-    print(f"  Status: {res['status']}")
-    print(f"  Response: {json.dumps(res['body'])}")
-    
-    if res['status'] != expected_status:
-        print(f"  FAIL: Expected status {expected_status}, got {res['status']}")
+    print(f"  Status: {status}")
+    print(f"  Response: {json.dumps(body)}")
+
+    if status != expected_status:
+        print(f"  FAIL: Expected status {expected_status}, got {status}")
         return False
-        
+
     if checks:
         for check_name, check_func in checks.items():
-            if not check_func(res['body']):
+            if not check_func(body):
                 print(f"  FAIL: Check '{check_name}' failed.")
                 return False
-    
+
     print("  PASS")
     return True
 
@@ -146,6 +122,7 @@ try:
         })
 
 finally:
+    client.close()
     print("\n[TEST] Terminating Blender process...")
     process.terminate()
     try: